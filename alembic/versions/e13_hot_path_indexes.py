@@ -0,0 +1,53 @@
+"""index secondaires des requêtes chaudes par artiste (perf chargement)
+
+Revision ID: e13_hot_path_indexes
+Revises: e12_drop_audio_columns
+Create Date: 2026-10-16
+
+Toutes les lectures chaudes filtrent sur `tracks.artist_id`
+(`get_artist_tracks`, `get_albums_for_artist`, `get_artist_details`,
+`_observations_by_artist`), or le seul index de `tracks` est
+`UNIQUE(title, artist_id)` — `title` en tête, donc inutilisable : SCAN complet de
+la table à chaque ouverture d'artiste, coût qui croît avec le catalogue TOTAL.
+
+  tracks       : ix_tracks_artist_id_title (artist_id, title) — filtre + ORDER BY
+                 title ; couvrant pour la jointure observations (id = rowid)
+  credits      : ix_credits_track_id (track_id)
+  observations : ix_observations_field_source (field, source) — requêtes
+                 transverses par champ (contrôles, stats, backfills)
+  albums       : ix_albums_artist_id (artist_id)
+
+Aucune donnée touchée (CREATE INDEX seul). Déclarés à l'identique dans
+`src/persistence/schema.py` (`create_all` ≡ `upgrade head`). Preuve des plans
+avant/après : `python scripts/bench_db.py plans`.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e13_hot_path_indexes"
+down_revision: str | Sequence[str] | None = "e12_drop_audio_columns"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (nom, table, colonnes) — mêmes noms que schema.py.
+_INDEXES = (
+    ("ix_tracks_artist_id_title", "tracks", ["artist_id", "title"]),
+    ("ix_credits_track_id", "credits", ["track_id"]),
+    ("ix_observations_field_source", "observations", ["field", "source"]),
+    ("ix_albums_artist_id", "albums", ["artist_id"]),
+)
+
+
+def upgrade() -> None:
+    """Crée les index secondaires (idempotent : IF NOT EXISTS)."""
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop des index (les tables restent intactes)."""
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,48 @@
+"""reconcile_cache : verdict de réconciliation matérialisé par morceau
+
+Revision ID: e14_reconcile_cache
+Revises: e13_hot_path_indexes
+Create Date: 2026-10-16
+
+Depuis E6, `get_artist_tracks` re-vote les observations de chaque morceau à
+chaque chargement. La table `reconcile_cache` garde le verdict de `reconcile()`
+(JSON, hors `lyrics_synced`) avec l'empreinte des observations qui l'ont
+produit :
+
+  reconcile_cache : track_id (PK, FK tracks.id), obs_hash, resolutions, built_at
+
+Créée VIDE : elle se remplit au fil des chargements (entrée absente ou périmée
+= vote puis écriture) ou d'un coup par `python scripts/rebuild_reconcile_cache.py`.
+Donnée dérivée — le downgrade la droppe sans perte. Déclarée à l'identique dans
+`src/persistence/schema.py` (`create_all` ≡ `upgrade head`).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e14_reconcile_cache"
+down_revision: str | Sequence[str] | None = "e13_hot_path_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Crée la table du cache (vide)."""
+    op.create_table(
+        "reconcile_cache",
+        sa.Column("track_id", sa.Integer(), nullable=False),
+        sa.Column("obs_hash", sa.Text(), nullable=False),
+        sa.Column("resolutions", sa.Text(), nullable=False),
+        sa.Column("built_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["track_id"], ["tracks.id"]),
+        sa.PrimaryKeyConstraint("track_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop de la table (donnée dérivée, reconstructible)."""
+    op.drop_table("reconcile_cache")
@@ -0,0 +1,85 @@
+"""compression des paroles / LRC existants (tracks + observations lyrics_synced)
+
+Revision ID: e15_compress_lyrics
+Revises: e14_reconcile_cache
+Create Date: 2026-10-16
+
+Migration de DONNÉES, sans changement de schéma : les valeurs TEXT déjà en base
+sont réécrites au format compressé de `src/persistence/text_codec.py` (BLOB
+marqué, zstd ou zlib selon `DB_TEXT_COMPRESSION`) :
+
+  tracks       : lyrics, lyrics_synced
+  observations : value des lignes field='lyrics_synced' (un LRC brut par source)
+
+Par lots de `_BATCH` lignes (curseur sur l'id) pour borner la mémoire. Les
+textes courts ou sans gain restent en clair (mêmes règles que l'écriture) ;
+`DB_TEXT_COMPRESSION=none` (défaut, la compression est opt-in) → no-op.
+Idempotente : seules les valeurs encore TEXT sont lues. La place libérée n'est rendue au disque qu'après un VACUUM
+(`python scripts/text_compression_stats.py --vacuum`).
+
+Downgrade : décompression de toutes les valeurs BLOB marquées (retour au TEXT).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.persistence.text_codec import decode_text, encode_text, is_compressed
+
+# revision identifiers, used by Alembic.
+revision: str = "e15_compress_lyrics"
+down_revision: str | Sequence[str] | None = "e14_reconcile_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BATCH = 500
+
+# (table, colonne, filtre additionnel)
+_TARGETS = (
+    ("tracks", "lyrics", ""),
+    ("tracks", "lyrics_synced", ""),
+    ("observations", "value", " AND field = 'lyrics_synced'"),
+)
+
+
+def _rewrite(conn, table: str, column: str, extra: str, stored_type: str, convert) -> None:
+    """Réécrit par lots les valeurs `column` de type SQLite `stored_type`."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                f"SELECT id, {column} FROM {table} "
+                f"WHERE id > :last AND typeof({column}) = '{stored_type}'{extra} "
+                f"ORDER BY id LIMIT {_BATCH}"
+            ),
+            {"last": last_id},
+        ).all()
+        if not rows:
+            return
+        updates = []
+        for row_id, value in rows:
+            converted = convert(value)
+            if converted is not value and converted is not None:
+                updates.append({"id": row_id, "value": converted})
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET {column} = :value WHERE id = :id"), updates)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Compresse les paroles / LRC stockés en clair."""
+    conn = op.get_bind()
+    for table, column, extra in _TARGETS:
+        _rewrite(conn, table, column, extra, "text", encode_text)
+
+
+def downgrade() -> None:
+    """Décompresse les valeurs BLOB marquées (retour au TEXT en clair)."""
+    conn = op.get_bind()
+
+    def _decode(value):
+        return decode_text(value) if is_compressed(value) else value
+
+    for table, column, extra in _TARGETS:
+        _rewrite(conn, table, column, extra, "blob", _decode)
@@ -0,0 +1,43 @@
+"""track_search : index plein texte FTS5 (titre, paroles, anecdotes, crédits)
+
+Revision ID: e16_track_search_fts
+Revises: e15_compress_lyrics
+Create Date: 2026-10-16
+
+Table virtuelle FTS5, une ligne par morceau (`rowid = tracks.id`) :
+
+  track_search : title, lyrics, anecdotes, credits
+                 (tokenize unicode61 remove_diacritics 2)
+
+Peuplée ici depuis la base existante (paroles décodées, noms crédités agrégés),
+puis tenue à jour par le repository (`src/persistence/search_index.py`) — pas
+de trigger : les paroles sont compressées depuis e15. Hors `schema.py` (une
+table virtuelle n'est pas déclarable en MetaData) ; le garde-fou
+`test_schema_reflects_db` l'exclut avec ses tables fantômes. Donnée dérivée —
+le downgrade la droppe sans perte.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.persistence.search_index import CREATE_SQL, SEARCH_TABLE, rebuild
+
+# revision identifiers, used by Alembic.
+revision: str = "e16_track_search_fts"
+down_revision: str | Sequence[str] | None = "e15_compress_lyrics"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Crée l'index FTS5 et l'alimente avec le catalogue existant."""
+    conn = op.get_bind()
+    conn.execute(sa.text(CREATE_SQL))
+    rebuild(conn)
+
+
+def downgrade() -> None:
+    """Drop de l'index (tables fantômes FTS5 comprises)."""
+    op.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
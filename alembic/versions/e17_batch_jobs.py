@@ -0,0 +1,69 @@
+"""batch_jobs / batch_job_items : file de travaux de batch reprenables
+
+Revision ID: e17_batch_jobs
+Revises: e16_track_search_fts
+Create Date: 2026-10-16
+
+Un batch interrompu (fermeture, crash, budget de 8 s de `shutdown_workers`
+dépassé) repartait de zéro et re-sollicitait toutes les sources. Le job et ses
+paires (morceau, provider) sont désormais persistés, au fil des sauvegardes :
+
+  batch_jobs      : id, kind, artist_id, options (JSON), status, created_at,
+                    checkpoint_at  (+ ix_batch_jobs_status)
+  batch_job_items : id, job_id, track_id (NULL = étape artiste), provider,
+                    status, updated_at  (UNIQUE job_id, track_id, provider)
+
+Créées VIDES. Déclarées à l'identique dans `src/persistence/schema.py`
+(`create_all` ≡ `upgrade head`). Le downgrade les droppe : seuls les jobs en
+cours sont perdus (les données enrichies sont déjà en base).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e17_batch_jobs"
+down_revision: str | Sequence[str] | None = "e16_track_search_fts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Crée les deux tables (vides) et l'index de statut."""
+    op.create_table(
+        "batch_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("artist_id", sa.Integer(), nullable=False),
+        sa.Column("options", sa.Text(), nullable=True),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("checkpoint_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["artist_id"], ["artists.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_batch_jobs_status", "batch_jobs", ["status"])
+    op.create_table(
+        "batch_job_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("track_id", sa.Integer(), nullable=True),
+        sa.Column("provider", sa.Text(), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["batch_jobs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "track_id", "provider"),
+        sqlite_autoincrement=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop des tables (jobs en cours perdus, données enrichies intactes)."""
+    op.drop_table("batch_job_items")
+    op.drop_index("ix_batch_jobs_status", table_name="batch_jobs")
+    op.drop_table("batch_jobs")
@@ -0,0 +1,207 @@
+"""Banc de performance du CertMatcher : index + `match_tracks` vs anciens masques pandas.
+
+Charge le magasin RÉEL de certifications (data/certifications/), fabrique un
+artiste SYNTHÉTIQUE de N morceaux (défaut 1000) à partir des certifs de
+l'artiste le plus certifié — titres exacts, « feat. », titres rallongés (S4),
+titres absents — puis chronomètre `apply_certifications` sur ces morceaux avec
+le matcher indexé (toute la discographie en un `match_tracks`) et avec
+l'ancien chemin (masques pandas, un appel par morceau, `iterrows` — copie
+figée ci-dessous), et vérifie que les certifications posées sont identiques.
+
+    python scripts/bench_cert_matcher.py
+    python scripts/bench_cert_matcher.py --tracks 3000 --runs 5
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.models import Artist, Track
+from src.utils.cert_matcher import _FEAT_RE, CertMatcher
+from src.utils.certification_enricher import apply_certifications
+
+
+class _LegacyMatcher(CertMatcher):
+    """Même magasin, anciens chemins : masques sur tout le DataFrame, un appel
+    par morceau, `_format` par `iterrows` (copie figée d'avant l'index)."""
+
+    def __init__(self, base: CertMatcher):  # pas de rechargement des CSV
+        self._norm, self.df = base._norm, base.df
+        self._title_len = self.df["title_clean"].str.len()
+
+    def _track_match_indices(self, a: str, t: str) -> list[int]:
+        df = self.df
+        if df.empty or not a:
+            return []
+        seen: list[int] = []
+        sset = set()
+
+        def add(sub):
+            for idx in sub.index:
+                if idx not in sset:
+                    sset.add(idx)
+                    seen.append(idx)
+
+        ac, tc = df["artist_clean"], df["title_clean"]
+        if not t:
+            add(df[(ac == a) & (tc == "")])
+            return seen
+        s1 = df[(ac == a) & (tc == t)]
+        if s1.empty:
+            s1 = df[
+                ac.str.contains(a, regex=False, na=False)
+                & tc.str.contains(t, regex=False, na=False)
+            ]
+        add(s1)
+        m = _FEAT_RE.match(t)
+        if m:
+            main = m.group(1).strip()
+            s2 = df[(ac == a) & (tc == main)]
+            if s2.empty and main:
+                s2 = df[
+                    ac.str.contains(a, regex=False, na=False)
+                    & tc.str.contains(main, regex=False, na=False)
+                ]
+            add(s2)
+        add(
+            df[
+                ac.str.contains(a, regex=False, na=False)
+                & tc.str.contains(t, regex=False, na=False)
+            ]
+        )
+        if not seen and len(t) >= 8:
+            cand = df[(ac == a) & self._title_len.between(8, len(t) - 1)]
+            if not cand.empty:
+                add(cand[cand["title_clean"].apply(lambda x: t.startswith(x))])
+        return seen
+
+    def match_tracks(self, artist, tracks):
+        return [self.get_track_certifications(artist, t, extra) for t, extra in tracks]
+
+    def get_track_certifications(self, artist, title, extra_artists=None):
+        t = self._norm(title)
+        candidates = [self._norm(artist)]
+        for x in extra_artists or []:
+            nx = self._norm(x)
+            if nx and nx not in candidates:
+                candidates.append(nx)
+        idx = list(dict.fromkeys(i for a in candidates for i in self._track_match_indices(a, t)))
+        return self._legacy_format(self.df.loc[idx]) if idx else []
+
+    def get_album_certifications(self, artist, album):
+        a, t, df = self._norm(artist), self._norm(album), self.df
+        if df.empty or not a or not t:
+            return []
+        alb = df[df["cat"] == "album"]
+        exact = alb[(alb["artist_clean"] == a) & (alb["title_clean"] == t)]
+        if exact.empty:
+            exact = alb[
+                alb["artist_clean"].str.contains(a, regex=False, na=False)
+                & alb["title_clean"].str.contains(t, regex=False, na=False)
+            ]
+        return self._legacy_format(exact)
+
+    def _legacy_format(self, rows):
+        out = [
+            {
+                "certification": r["level"],
+                "title": r["title"],
+                "artist_name": r["artist_name"],
+                "category": r["cat"],
+                "certification_date": r["date"],
+                "release_date": r.get("release_date", ""),
+                "publisher": r.get("publisher", ""),
+                "detail_url": r.get("detail_url", ""),
+                "country": r["country"],
+                "body": r["body"],
+                "flag": r["flag"],
+            }
+            for _, r in rows.iterrows()
+        ]
+        order = {"FR": 0, "BE": 1, "US": 2}
+        out.sort(
+            key=lambda c: (
+                order.get(c["country"], 9),
+                self._level_rank(c["certification"]),
+                c["certification_date"] or "",
+            )
+        )
+        return out
+
+
+def synthetic_artist(matcher: CertMatcher, size: int, seed: int = 7) -> Artist:
+    """Artiste de `size` morceaux bâti sur l'artiste le plus certifié du magasin."""
+    rng = random.Random(seed)
+    df = matcher.df
+    name = df[df["artist_name"] != "COMPILATION"]["artist_name"].value_counts().index[0]
+    titles = df[df["artist_name"] == name]["title"].tolist()
+    albums = df[(df["artist_name"] == name) & (df["cat"] == "album")]["title"].tolist()
+    artist = Artist(name=name)
+    tracks = []
+    for i in range(size):
+        base = rng.choice(titles)
+        kind = i % 4
+        title = (
+            base,
+            f"{base} feat. Invité {i}",
+            f"{base} (version longue)",
+            f"Inédit {i}",
+        )[kind]
+        album = rng.choice(albums) if albums and rng.random() < 0.5 else None
+        tracks.append(Track(title=title, artist=artist, album=album))
+    artist.tracks = tracks
+    return artist
+
+
+def _run(artist: Artist, matcher: CertMatcher, runs: int) -> tuple[float, list]:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        apply_certifications(artist, artist.tracks, matcher)
+        samples.append((time.perf_counter() - t0) * 1000)
+    entries = [(t.certs.entries, t.certs.album_entries) for t in artist.tracks]
+    return statistics.median(samples), entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Banc CertMatcher : index vs masques pandas")
+    parser.add_argument("--tracks", type=int, default=1000, help="morceaux (défaut 1000)")
+    parser.add_argument("--runs", type=int, default=3, help="répétitions par chrono")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    t0 = time.perf_counter()
+    matcher = CertMatcher()
+    load_ms = (time.perf_counter() - t0) * 1000
+    if matcher.df.empty:
+        print("Aucune certification dans data/certifications/ : rien à mesurer")
+        return 1
+    artist = synthetic_artist(matcher, args.tracks)
+    print(
+        f"Magasin : {len(matcher.df)} certifs (chargement + index {load_ms:.0f}ms) — "
+        f"artiste « {artist.name} » × {len(artist.tracks)} morceaux\n"
+    )
+
+    index_ms, index_entries = _run(artist, matcher, args.runs)
+    legacy_ms, legacy_entries = _run(artist, _LegacyMatcher(matcher), args.runs)
+    matched = sum(1 for entries, _ in index_entries if entries)
+
+    print(f"{'moteur':22} {'temps':>10} {'par morceau':>12}")
+    print("-" * 46)
+    for label, ms in (("match_tracks + index", index_ms), ("masques pandas", legacy_ms)):
+        print(f"{label:22} {ms:>8.0f}ms {ms / len(artist.tracks):>10.2f}ms")
+    print(
+        f"\nGain ×{legacy_ms / index_ms:.1f} — {matched} morceau(x) certifié(s), "
+        f"résultats {'IDENTIQUES' if index_entries == legacy_entries else '⚠️ DIFFÉRENTS'}"
+    )
+    return 0 if index_entries == legacy_entries else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,547 @@
+"""Banc de performance de la couche persistance, sur une base SYNTHÉTIQUE.
+
+Construit une base temporaire au head Alembic (même chemin que l'app :
+`Database` → `upgrade_to_head`), la remplit d'un catalogue factice
+multi-artistes (morceaux, crédits, observations dont des LRC, albums), puis
+mesure les requêtes chaudes des repositories. Ne touche JAMAIS la base réelle.
+
+    python scripts/bench_db.py plans                  # 50k morceaux, plans + chronos
+    python scripts/bench_db.py plans --without-indexes  # « avant » e13 (index droppés)
+    python scripts/bench_db.py plans --tracks 10000 --runs 10
+    python scripts/bench_db.py profiles               # legacy vs performance (WAL+pool)
+    python scripts/bench_db.py lazy                   # projection (E7d) vs SELECT *
+    python scripts/bench_db.py search                 # index FTS5 (e16) vs LIKE '%…%'
+    python scripts/bench_db.py duplicates             # doublons : moteur ensembliste vs par titre
+
+`plans` : pour chaque requête, `EXPLAIN QUERY PLAN` (un `SCAN tracks` = table
+entière lue ; attendu après e13 : `SEARCH … USING INDEX`) puis le temps médian
+de l'appel repository correspondant sur l'artiste le plus fourni.
+
+`profiles` : latence PAR APPEL de `save_track` (mise à jour et insertion, une
+transaction chacun) et de `get_artist_tracks`, pour chaque profil de connexion
+de `Database` — même base de départ copiée pour chaque profil.
+
+`lazy` : `get_artist_tracks` de l'artiste le plus fourni en chargement complet
+puis par projection (colonnes lourdes différées) — temps médian et pic mémoire
+Python (tracemalloc) des morceaux chargés, puis coût d'un accès à TOUTES les
+paroles (chargement différé par lots).
+
+`search` : reconstruction de l'index plein texte (e16 ; la base synthétique est
+remplie en SQL brut, hors hooks du repository) puis, pour quelques requêtes
+tous artistes confondus, `TrackRepository.search` contre le balayage
+`LIKE '%…%'` équivalent.
+
+`duplicates` : doublons INJECTÉS dans la base synthétique (variantes de casse,
+ponctuation, « feat. », identifiant partagé ; plus des leurres « (Remix) »),
+puis `find_duplicate_candidates` sur tout le catalogue — temps, précision et
+rappel — contre l'ancien scan `GROUP BY LOWER(title)` + une requête par titre.
+"""
+
+import argparse
+import logging
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.models import Track
+from src.utils.artist_repository import ArtistRepository
+from src.utils.db import Database
+from src.utils.track_repository import TrackRepository
+
+# Index posés par la révision e13 (droppés par --without-indexes).
+_E13_INDEXES = (
+    "ix_tracks_artist_id_title",
+    "ix_credits_track_id",
+    "ix_observations_field_source",
+    "ix_albums_artist_id",
+)
+
+_ROLES = ("Producer", "Writer", "Featuring", "Mixing Engineer", "Mastering Engineer")
+_LRC_LINE = "[{m:02d}:{s:02d}.00] ligne de paroles synchronisée numéro {i}\n"
+
+
+class _BenchRepository(ArtistRepository, TrackRepository):
+    """Repositories branchés sur un moteur quelconque (sans la façade DataManager,
+    dont le constructeur vise la base de la config)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+
+def _fake_lrc(rng: random.Random) -> str:
+    return "".join(
+        _LRC_LINE.format(m=i // 60, s=i % 60, i=i) for i in range(0, rng.randint(40, 90) * 3, 3)
+    )
+
+
+def build_synthetic_db(
+    path: Path,
+    n_tracks: int = 50_000,
+    n_artists: int = 100,
+    seed: int = 42,
+    profile: str = "legacy",
+) -> Database:
+    """Crée `path` au head Alembic et y insère un catalogue factice reproductible.
+
+    Répartition volontairement inégale (quelques gros artistes, une longue
+    traîne) pour que l'artiste le plus fourni représente une vraie discographie.
+    """
+    rng = random.Random(seed)
+    db = Database(str(path), profile=profile)
+
+    weights = [1 / (rank + 1) for rank in range(n_artists)]
+    artist_of = rng.choices(range(1, n_artists + 1), weights=weights, k=n_tracks)
+
+    conn = sqlite3.connect(db.db_path)
+    try:
+        conn.executemany(
+            "INSERT INTO artists (id, name, created_at, updated_at) "
+            "VALUES (?, ?, '2026-01-01 00:00:00', '2026-01-01 00:00:00')",
+            [(a, f"Artiste {a:04d}") for a in range(1, n_artists + 1)],
+        )
+        conn.executemany(
+            "INSERT INTO tracks (id, title, artist_id, album, release_date, duration, "
+            "genius_id, has_lyrics, lyrics, certifications, album_certifications, "
+            "relationships, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, '2020-01-01', ?, ?, 1, ?, '[]', '[]', '[]', "
+            "'2026-01-01 00:00:00', ?)",
+            [
+                (
+                    tid,
+                    f"Morceau {tid:06d}",
+                    artist_of[tid - 1],
+                    f"Album {artist_of[tid - 1]}-{tid % 12}",
+                    rng.randint(90, 300),
+                    1_000_000 + tid,
+                    "Couplet\n" * rng.randint(20, 60),
+                    f"2026-01-{1 + tid % 28:02d} 00:00:00",
+                )
+                for tid in range(1, n_tracks + 1)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO credits (track_id, name, role, role_detail, source) "
+            "VALUES (?, ?, ?, NULL, 'genius')",
+            [
+                (tid, f"Crédité {rng.randint(1, 5000)}", role)
+                for tid in range(1, n_tracks + 1)
+                for role in rng.sample(_ROLES, rng.randint(1, 4))
+            ],
+        )
+        obs_rows = []
+        for tid in range(1, n_tracks + 1):
+            bpm = rng.randint(70, 160)
+            for source in rng.sample(("reccobeats", "getsongbpm", "deezer", "songbpm"), 2):
+                obs_rows.append((tid, "bpm", str(bpm), source, 1.0))
+            obs_rows.append((tid, "key", str(rng.randint(0, 11)), "reccobeats", None))
+            obs_rows.append((tid, "mode", str(rng.randint(0, 1)), "reccobeats", None))
+            if tid % 3 == 0:
+                obs_rows.append((tid, "lyrics_synced", _fake_lrc(rng), "lrclib", None))
+        conn.executemany(
+            "INSERT INTO observations (track_id, field, value, source, confidence, seen_at) "
+            "VALUES (?, ?, ?, ?, ?, '2026-01-01 00:00:00')",
+            obs_rows,
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO albums (title, artist_id, spotify_streams) VALUES (?, ?, ?)",
+            [
+                (f"Album {a}-{n}", a, rng.randint(0, 10**8))
+                for a in range(1, n_artists + 1)
+                for n in range(12)
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return db
+
+
+def _biggest_artist(db_path: str) -> tuple[int, str, int]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT a.id, a.name, COUNT(*) FROM tracks t JOIN artists a ON a.id = t.artist_id "
+            "GROUP BY a.id ORDER BY 3 DESC LIMIT 1"
+        ).fetchone()
+
+
+def _samples(fn, runs: int) -> list[float]:
+    """Durées (ms) de `runs` appels à `fn()`."""
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _timed(fn, runs: int) -> float:
+    """Temps médian (ms) de `fn()` sur `runs` appels."""
+    return statistics.median(_samples(fn, runs))
+
+
+def _p95(samples: list[float]) -> float:
+    return sorted(samples)[int(0.95 * (len(samples) - 1))]
+
+
+def _print_plan(conn: sqlite3.Connection, sql: str, params: dict) -> None:
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+        marker = "⚠️ " if row[3].startswith("SCAN") else "   "
+        print(f"    {marker}{row[3]}")
+
+
+def cmd_plans(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        db = build_synthetic_db(Path(tmp) / "bench.db", args.tracks, args.artists)
+        print(
+            f"Base synthétique : {args.tracks} morceaux / {args.artists} artistes "
+            f"({time.perf_counter() - t0:.1f}s)"
+        )
+
+        if args.without_indexes:
+            with sqlite3.connect(db.db_path) as conn:
+                for name in _E13_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+            print("Index e13 DROPPÉS (mesure « avant »)")
+
+        aid, name, count = _biggest_artist(db.db_path)
+        print(f"Artiste mesuré : {name} (id {aid}, {count} morceaux)\n")
+
+        repo = _BenchRepository(db.engine)
+        p = {"aid": aid}
+        # (libellé, SQL représentatif du repository, appel chronométré)
+        queries = (
+            (
+                "get_artist_tracks — SELECT tracks",
+                "SELECT * FROM tracks WHERE artist_id = :aid ORDER BY title",
+                lambda: repo.get_artist_tracks(aid),
+            ),
+            (
+                "_observations_by_artist",
+                "SELECT o.track_id, o.field, o.value, o.source, o.confidence, o.seen_at "
+                "FROM observations o JOIN tracks t ON t.id = o.track_id "
+                "WHERE t.artist_id = :aid",
+                None,
+            ),
+            (
+                "crédits de l'artiste",
+                "SELECT c.* FROM credits c JOIN tracks t ON t.id = c.track_id "
+                "WHERE t.artist_id = :aid",
+                None,
+            ),
+            (
+                "get_albums_for_artist",
+                "SELECT title, spotify_streams, spotify_daily_streams, "
+                "spotify_streams_updated, ytm_streams FROM albums "
+                "WHERE artist_id = :aid ORDER BY spotify_streams DESC",
+                lambda: repo.get_albums_for_artist(aid),
+            ),
+            (
+                "get_artist_details — morceaux récents",
+                "SELECT t.title, t.album, t.release_date, COUNT(c.id) as credits_count "
+                "FROM tracks t LEFT JOIN credits c ON t.id = c.track_id "
+                "WHERE t.artist_id = :aid GROUP BY t.id, t.title, t.album, t.release_date "
+                "ORDER BY t.updated_at DESC LIMIT 20",
+                lambda: repo.get_artist_details(name),
+            ),
+            (
+                "observations par champ (contrôles/stats)",
+                "SELECT COUNT(*) FROM observations WHERE field = 'bpm' AND source = 'deezer'",
+                None,
+            ),
+        )
+        with sqlite3.connect(db.db_path) as conn:
+            for label, sql, call in queries:
+                print(f"■ {label}")
+                _print_plan(conn, sql, p)
+                if call is not None:
+                    print(f"    ⏱ {_timed(call, args.runs):.1f} ms (médiane sur {args.runs})")
+                print()
+        db.engine.dispose()
+    return 0
+
+
+def _artist_near(db_path: str, size: int) -> int:
+    """Artiste dont la discographie est la plus proche de `size` morceaux."""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT artist_id FROM tracks GROUP BY artist_id " "ORDER BY ABS(COUNT(*) - ?) LIMIT 1",
+            (size,),
+        ).fetchone()[0]
+
+
+def _measure_profile(path: Path, profile: str, aid: int, args) -> list[tuple[str, list[float]]]:
+    """Mesures (libellé, durées ms) d'un profil sur sa copie de la base."""
+    db = Database(str(path), profile=profile)
+    try:
+        repo = _BenchRepository(db.engine)
+        loaded = repo.get_artist_tracks(aid)
+        artist = loaded[0].artist
+        to_update = iter(loaded[: args.saves])
+        counter = iter(range(args.saves))
+        return [
+            ("get_artist_tracks", _samples(lambda: repo.get_artist_tracks(aid), args.runs)),
+            (
+                "save_track (update)",
+                _samples(lambda: repo.save_track(next(to_update)), min(args.saves, len(loaded))),
+            ),
+            (
+                "save_track (insert)",
+                _samples(
+                    lambda: repo.save_track(Track(title=f"Nouveau {next(counter)}", artist=artist)),
+                    args.saves,
+                ),
+            ),
+        ]
+    finally:
+        db.dispose()
+
+
+def cmd_profiles(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "base.db"
+        build_synthetic_db(base, args.tracks, args.artists).dispose()
+        aid = _artist_near(str(base), args.artist_size)
+        print(f"Base synthétique : {args.tracks} morceaux ; artiste mesuré id {aid}\n")
+        print(f"{'profil':12} {'opération':24} {'médiane':>9} {'p95':>9}")
+        print("-" * 58)
+        for profile in ("legacy", "performance"):
+            path = Path(tmp) / f"{profile}.db"
+            shutil.copy(base, path)
+            for label, samples in _measure_profile(path, profile, aid, args):
+                print(
+                    f"{profile:12} {label:24} {statistics.median(samples):>7.2f}ms "
+                    f"{_p95(samples):>7.2f}ms"
+                )
+    return 0
+
+
+def _peak_kib(fn) -> float:
+    """Pic mémoire Python (KiB) pendant `fn()`, résultat gardé en vie."""
+    tracemalloc.start()
+    try:
+        result = fn()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def cmd_lazy(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_synthetic_db(Path(tmp) / "bench.db", args.tracks, args.artists)
+        aid, name, count = _biggest_artist(db.db_path)
+        print(f"Base synthétique : {args.tracks} morceaux ; artiste {name} ({count} morceaux)\n")
+        repo = _BenchRepository(db.engine)
+        print(f"{'chargement':12} {'médiane':>9} {'pic mémoire':>13} {'+ toutes paroles':>17}")
+        print("-" * 55)
+        for label, lazy in (("complet", False), ("projection", True)):
+
+            def touch_all(lazy=lazy):
+                for track in repo.get_artist_tracks(aid, lazy=lazy):
+                    _ = (track.lyrics.text, track.lyrics.synced, track.anecdotes)
+
+            elapsed = _timed(lambda lazy=lazy: repo.get_artist_tracks(aid, lazy=lazy), args.runs)
+            peak = _peak_kib(lambda lazy=lazy: repo.get_artist_tracks(aid, lazy=lazy))
+            print(
+                f"{label:12} {elapsed:>7.1f}ms {peak / 1024:>10.1f} MiB "
+                f"{_timed(touch_all, args.runs):>14.1f}ms"
+            )
+        db.engine.dispose()
+    return 0
+
+
+# (libellé, requête search, colonne, balayage LIKE équivalent)
+_SEARCH_CASES = (
+    (
+        "crédit exact",
+        "Crédité 4242",
+        "credits",
+        "SELECT DISTINCT c.track_id FROM credits c WHERE c.name LIKE '%Crédité 4242%'",
+    ),
+    (
+        "paroles (absent)",
+        "refrain",
+        "lyrics",
+        "SELECT id FROM tracks WHERE lyrics LIKE '%refrain%'",
+    ),
+    (
+        "titre / préfixe",
+        "Morceau 00042",
+        None,
+        "SELECT id FROM tracks WHERE title LIKE '%Morceau 00042%' "
+        "OR lyrics LIKE '%Morceau 00042%' OR anecdotes LIKE '%Morceau 00042%'",
+    ),
+)
+
+
+def cmd_search(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_synthetic_db(Path(tmp) / "bench.db", args.tracks, args.artists)
+        repo = _BenchRepository(db.engine)
+        t0 = time.perf_counter()
+        indexed = repo.rebuild_search_index()
+        print(
+            f"Base synthétique : {args.tracks} morceaux ; index reconstruit "
+            f"({indexed} morceaux) en {time.perf_counter() - t0:.1f}s\n"
+        )
+        print(f"{'requête':18} {'résultats':>9} {'FTS5':>9} {'LIKE':>9}")
+        print("-" * 48)
+        with sqlite3.connect(db.db_path) as conn:
+            for label, query, column, like_sql in _SEARCH_CASES:
+                hits = repo.search(query, args.limit, column=column)
+                fts = _timed(
+                    lambda q=query, c=column: repo.search(q, args.limit, column=c), args.runs
+                )
+                like = _timed(lambda sql=like_sql: conn.execute(sql).fetchall(), args.runs)
+                print(f"{label:18} {len(hits):>9} {fts:>7.2f}ms {like:>7.2f}ms")
+        db.engine.dispose()
+    return 0
+
+
+_TITLE_VARIANTS = (
+    str.upper,
+    lambda t: f"{t} (feat. Invité)",
+    lambda t: t.replace(" ", " - ", 1),
+    lambda t: f"{t.lower()}.",
+)
+
+
+def inject_duplicates(db_path: str, count: int, seed: int = 7) -> set[tuple[int, int]]:
+    """Ajoute `count` doublons (et autant de leurres « (Remix) ») ; renvoie les
+    paires attendues (original, copie)."""
+    rng = random.Random(seed)
+    expected = set()
+    with sqlite3.connect(db_path) as conn:
+        originals = conn.execute(
+            "SELECT id, title, artist_id, duration, genius_id FROM tracks ORDER BY id"
+        ).fetchall()
+        next_id = originals[-1][0] + 1
+        for tid, title, artist_id, duration, genius_id in rng.sample(originals, count * 2):
+            if len(expected) < count:
+                variant = rng.choice(_TITLE_VARIANTS)(title)
+                shared = genius_id if rng.random() < 0.5 else None
+                conn.execute(
+                    "INSERT INTO tracks (id, title, artist_id, duration, genius_id, "
+                    "certifications, album_certifications, relationships) "
+                    "VALUES (?, ?, ?, ?, ?, '[]', '[]', '[]')",
+                    (next_id, variant, artist_id, duration + rng.randint(-1, 1), shared),
+                )
+                expected.add((tid, next_id))
+            else:
+                conn.execute(
+                    "INSERT INTO tracks (id, title, artist_id, duration, "
+                    "certifications, album_certifications, relationships) "
+                    "VALUES (?, ?, ?, ?, '[]', '[]', '[]')",
+                    (next_id, f"{title} (Remix)", artist_id, duration + rng.randint(20, 60)),
+                )
+            next_id += 1
+        conn.commit()
+    return expected
+
+
+def _legacy_title_scan(db_path: str) -> int:
+    """Ancien `merge_duplicates --auto` : groupes LOWER(title), puis une requête
+    par groupe et une par version (crédits)."""
+    found = 0
+    with sqlite3.connect(db_path) as conn:
+        groups = conn.execute(
+            "SELECT LOWER(title) AS t, COUNT(*) AS n FROM tracks GROUP BY t HAVING n > 1"
+        ).fetchall()
+        for title_lower, _n in groups:
+            versions = conn.execute(
+                "SELECT id FROM tracks WHERE LOWER(title) = ? ORDER BY id", (title_lower,)
+            ).fetchall()
+            for (tid,) in versions:
+                conn.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (tid,)).fetchone()
+            found += len(versions) - 1
+    return found
+
+
+def cmd_duplicates(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_synthetic_db(Path(tmp) / "bench.db", args.tracks, args.artists)
+        expected = inject_duplicates(db.db_path, args.duplicates)
+        repo = _BenchRepository(db.engine)
+        print(
+            f"Base synthétique : {args.tracks} morceaux + {len(expected)} doublons "
+            f"injectés (+ autant de leurres Remix)\n"
+        )
+        proposals = repo.find_duplicate_candidates()
+        found = {(min(p.keep_id, p.delete_id), max(p.keep_id, p.delete_id)) for p in proposals}
+        hits = len(found & expected)
+        engine_ms = _timed(repo.find_duplicate_candidates, args.runs)
+        legacy_found = _legacy_title_scan(db.db_path)
+        legacy_ms = _timed(lambda: _legacy_title_scan(db.db_path), args.runs)
+        print(f"{'méthode':22} {'temps':>10} {'trouvés':>8} {'précision':>10} {'rappel':>7}")
+        print("-" * 62)
+        print(
+            f"{'moteur ensembliste':22} {engine_ms:>8.0f}ms {len(found):>8} "
+            f"{hits / len(found) if found else 1:>10.1%} {hits / len(expected):>7.1%}"
+        )
+        print(f"{'LOWER(title) par titre':22} {legacy_ms:>8.0f}ms {legacy_found:>8}")
+        db.engine.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Banc de perf persistance (base synthétique)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    plans = sub.add_parser("plans", help="EXPLAIN QUERY PLAN + chronos des requêtes chaudes")
+    plans.add_argument("--tracks", type=int, default=50_000, help="morceaux (défaut 50000)")
+    plans.add_argument("--artists", type=int, default=100, help="artistes (défaut 100)")
+    plans.add_argument("--runs", type=int, default=5, help="répétitions par chrono")
+    plans.add_argument(
+        "--without-indexes", action="store_true", help="dropper les index e13 (mesure avant)"
+    )
+    plans.set_defaults(func=cmd_plans)
+
+    profiles = sub.add_parser("profiles", help="latence save/get par profil de connexion")
+    profiles.add_argument("--tracks", type=int, default=20_000, help="morceaux (défaut 20000)")
+    profiles.add_argument("--artists", type=int, default=100, help="artistes (défaut 100)")
+    profiles.add_argument(
+        "--artist-size", type=int, default=600, help="taille visée de l'artiste mesuré"
+    )
+    profiles.add_argument("--saves", type=int, default=200, help="save_track par mesure")
+    profiles.add_argument("--runs", type=int, default=5, help="répétitions de get_artist_tracks")
+    profiles.set_defaults(func=cmd_profiles)
+
+    lazy = sub.add_parser("lazy", help="chargement complet vs projection (E7d)")
+    lazy.add_argument("--tracks", type=int, default=20_000, help="morceaux (défaut 20000)")
+    lazy.add_argument("--artists", type=int, default=20, help="artistes (défaut 20)")
+    lazy.add_argument("--runs", type=int, default=5, help="répétitions par chrono")
+    lazy.set_defaults(func=cmd_lazy)
+
+    search = sub.add_parser("search", help="recherche plein texte FTS5 vs LIKE (e16)")
+    search.add_argument("--tracks", type=int, default=20_000, help="morceaux (défaut 20000)")
+    search.add_argument("--artists", type=int, default=20, help="artistes (défaut 20)")
+    search.add_argument("--limit", type=int, default=50, help="résultats max par recherche")
+    search.add_argument("--runs", type=int, default=5, help="répétitions par chrono")
+    search.set_defaults(func=cmd_search)
+
+    duplicates = sub.add_parser("duplicates", help="détection des doublons sur tout le catalogue")
+    duplicates.add_argument("--tracks", type=int, default=50_000, help="morceaux (défaut 50000)")
+    duplicates.add_argument("--artists", type=int, default=100, help="artistes (défaut 100)")
+    duplicates.add_argument("--duplicates", type=int, default=1_000, help="doublons injectés")
+    duplicates.add_argument("--runs", type=int, default=3, help="répétitions par chrono")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    args = parser.parse_args()
+    # Les repositories loguent en INFO à chaque appel : bruit hors sujet ici.
+    logging.disable(logging.INFO)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
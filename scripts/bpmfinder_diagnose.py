@@ -27,7 +27,8 @@ except Exception:
     pass
 
 from src.config import DATA_DIR
-from src.scrapers.bpmfinder_scraper import _CACHE_FILE, _CARD_RE, BPMFinderScraper
+from src.persistence.kv_cache import default_kv_cache
+from src.scrapers.bpmfinder_scraper import _CARD_RE, BPMFinderScraper
 
 DIAG_DIR = DATA_DIR / "diagnostics"
 API_MARK = "audioaidynamics.com/api"
@@ -50,9 +51,8 @@ def decode_jwt_exp(token: str):
 def pick_default_url() -> str:
     """Un videoId du cache (analyse déjà réussie par le passé) sinon un défaut."""
     try:
-        cache = json.loads(Path(_CACHE_FILE).read_text(encoding="utf-8"))
-        if cache:
-            vid = sorted(cache)[0]
+        cache = default_kv_cache().namespace("bpmfinder")
+        for vid in cache:
             return f"https://www.youtube.com/watch?v={vid}"
     except Exception:
         pass
@@ -74,7 +74,7 @@ def main():
 
     scraper = BPMFinderScraper(headless=False)
     # bypass cache CIBLÉ : forcer une vraie analyse de CE videoId sans toucher
-    # aux autres entrées (vider tout le dict ferait réécrire un cache amputé)
+    # aux autres entrées (l'analyse réussie la réécrit)
     vid = BPMFinderScraper._video_id(url)
     if vid:
         scraper.cache.pop(vid, None)
@@ -0,0 +1,98 @@
+"""Maintenance du cache clé-valeur partagé (`data/cache.db`, `src/persistence/kv_cache.py`).
+
+Le batch n'évince jamais rien (écritures O(1), aucune passe de nettoyage en
+plein enrichissement) : le ménage se fait ici, hors batch.
+
+    python scripts/cache_maintenance.py stats                 # entrées par espace
+    python scripts/cache_maintenance.py import                # anciens caches JSON (une fois)
+    python scripts/cache_maintenance.py purge                 # entrées expirées
+    python scripts/cache_maintenance.py evict --max-age-days 180 --max-mb 200
+
+`import` relit les anciens fichiers JSON des clients (`reccobeats_cache.json`…)
+puis les renomme en `*.imported` : un second passage ne fait rien. Les
+entrées déjà présentes dans la base sont gardées (plus récentes).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.config import BASE_DIR, DATA_DIR
+from src.persistence.kv_cache import DAY, KVCache, default_kv_cache
+
+# Anciens caches JSON → espace de noms (cf. clients : ReccoBeats, GetSongBPM,
+# SpotifyIDScraper à la racine du projet, BPM Finder dans data/).
+LEGACY_JSON = {
+    "reccobeats": BASE_DIR / "reccobeats_cache.json",
+    "getsongbpm": BASE_DIR / "getsongbpm_cache.json",
+    "spotify_id": BASE_DIR / "spotify_ids_cache.json",
+    "bpmfinder": DATA_DIR / "bpmfinder_cache.json",
+}
+
+
+def import_legacy(cache: KVCache, files: dict[str, Path], *, keep: bool = False) -> int:
+    """Importe les fichiers JSON existants ; renvoie le nombre d'entrées importées."""
+    total = 0
+    for namespace, path in files.items():
+        if not path.exists():
+            continue
+        try:
+            imported = cache.namespace(namespace).import_json(path)
+        except ValueError as e:  # JSON illisible (fichier tronqué par un crash)
+            print(f"⚠️ {path.name} ignoré : {e}")
+            continue
+        total += imported
+        print(f"✅ {path.name} → « {namespace} » : {imported} entrée(s)")
+        if not keep:
+            path.rename(path.with_name(path.name + ".imported"))
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Maintenance du cache clé-valeur partagé")
+    parser.add_argument("--db", metavar="CHEMIN", help="base de cache (défaut : data/cache.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="entrées par espace de noms")
+    imp = sub.add_parser("import", help="importer les anciens caches JSON")
+    imp.add_argument("--keep", action="store_true", help="ne pas renommer les fichiers importés")
+    sub.add_parser("purge", help="supprimer les entrées expirées")
+    evict = sub.add_parser("evict", help="éviction par âge et/ou taille")
+    evict.add_argument("--max-age-days", type=float, help="supprimer au-delà de cet âge")
+    evict.add_argument(
+        "--max-mb", type=float, help="taille max des valeurs (plus anciennes d'abord)"
+    )
+    args = parser.parse_args()
+
+    cache = KVCache(args.db) if args.db else default_kv_cache()
+    try:
+        if args.command == "import":
+            total = import_legacy(cache, LEGACY_JSON, keep=args.keep)
+            print(f"{total} entrée(s) importée(s) dans {cache.path}")
+        elif args.command == "purge":
+            print(f"🧹 {cache.purge_expired()} entrée(s) expirée(s) supprimée(s)")
+            cache.vacuum()
+        elif args.command == "evict":
+            if args.max_age_days is None and args.max_mb is None:
+                parser.error("evict : --max-age-days et/ou --max-mb requis")
+            evicted = cache.evict(
+                max_age=None if args.max_age_days is None else args.max_age_days * DAY,
+                max_bytes=None if args.max_mb is None else int(args.max_mb * 1024 * 1024),
+            )
+            print(f"🧹 {evicted} entrée(s) évincée(s)")
+            cache.vacuum()
+        else:
+            for namespace, s in cache.stats().items():
+                print(
+                    f"{namespace:<12} {s['entries']:>7} entrée(s)  {s['negative']:>6} négative(s)"
+                    f"  {s['expired']:>6} expirée(s)  {s['bytes'] / 1024:>9.1f} Ko"
+                )
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
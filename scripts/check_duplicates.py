@@ -2,7 +2,6 @@
 Script de détection et analyse des doublons
 """
 
-import sqlite3
 import sys
 
 # Fix encodage Windows
@@ -10,138 +9,70 @@ sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 
 def analyze_specific_duplicate(title):
-    """Analyse un doublon spécifique"""
-    conn = sqlite3.connect("data/music_credits.db")
-    cursor = conn.cursor()
+    """Analyse un doublon spécifique : morceaux de même titre NORMALISÉ (casse,
+    accents, ponctuation), lus via `TrackRepository.get_duplicate_candidates`
+    (crédits comptés dans la même requête) ; fiche gardée = la plus complète,
+    comme le moteur de `merge_duplicates --find`."""
+    from merge_duplicates import DB_PATH, _DuplicatesRepository
+
+    from src.utils.db import Database
 
     print(f"\n{'='*60}")
     print(f"   ANALYSE DU DOUBLON: {title}")
     print(f"{'='*60}\n")
 
-    cursor.execute(
-        """
-        SELECT id, title, album, release_date, genius_id, duration, spotify_id, lyrics
-        FROM tracks
-        WHERE LOWER(title) = LOWER(?)
-        ORDER BY title
-    """,
-        (title,),
-    )
+    db = Database(DB_PATH)
+    try:
+        candidates = _DuplicatesRepository(db.engine).get_duplicate_candidates(title=title)
+    finally:
+        db.dispose()
 
-    rows = cursor.fetchall()
+    # Un doublon est toujours interne à un artiste (featuring ≠ doublon)
+    by_artist = {}
+    for c in sorted(candidates, key=lambda c: (c.artist_id, c.id)):
+        by_artist.setdefault(c.artist_id, []).append(c)
+    groups = [group for group in by_artist.values() if len(group) >= 2]
 
-    if len(rows) < 2:
+    if not groups:
         print(f"Aucun doublon trouvé pour '{title}'")
-        conn.close()
         return
 
-    print(f"Nombre de doublons: {len(rows)}\n")
-
-    for i, row in enumerate(rows, 1):
-        print(f"Version {i}:")
-        print(f"  ID: {row[0]}")
-        print(f"  Titre: '{row[1]}'")
-        print(f"  Album: {row[2] or 'N/A'}")
-        print(f"  Date: {row[3] or 'N/A'}")
-        print(f"  Genius ID: {row[4] or 'N/A'}")
-        print(f"  Duration: {row[5] or 'N/A'}")
-        print(f"  Spotify ID: {row[6] or 'N/A'}")
-        print(f"  Has Lyrics: {'Oui' if row[7] else 'Non'}")
-
-        # Compter les crédits
-        cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (row[0],))
-        credits_count = cursor.fetchone()[0]
-        print(f"  Credits: {credits_count}")
+    for group in groups:
+        print(f"Artiste {group[0].artist_id} — nombre de doublons: {len(group)}\n")
+
+        for i, c in enumerate(group, 1):
+            print(f"Version {i}:")
+            print(f"  ID: {c.id}")
+            print(f"  Titre: '{c.title}'")
+            print(f"  Album: {c.album or 'N/A'}")
+            print(f"  Genius ID: {c.genius_id or 'N/A'}")
+            print(f"  Duration: {c.duration or 'N/A'}")
+            print(f"  Spotify ID: {c.spotify_id or 'N/A'}")
+            print(f"  ISRC: {c.isrc or 'N/A'}")
+            print(f"  Has Lyrics: {'Oui' if c.has_lyrics else 'Non'}")
+            print(f"  Credits: {c.credit_count}")
+            print()
+
+        # Recommandation : la version la plus complète (à égalité, l'id le plus bas)
+        print("RECOMMANDATION:")
+        best = max(group, key=lambda c: (c.completeness, -c.id))
+        print(f"  Garder: ID {best.id} (score: {best.completeness})")
+        for c in group:
+            if c is not best:
+                print(f"  Supprimer: ID {c.id} (score: {c.completeness})")
+                print(
+                    f"    → python scripts/merge_duplicates.py --merge {best.id} {c.id} --execute"
+                )
         print()
 
-    # Recommandation
-    print("RECOMMANDATION:")
-    # Trouver la version la plus complète
-    scores = []
-    for row in rows:
-        score = 0
-        if row[2]:
-            score += 1  # album
-        if row[4]:
-            score += 2  # genius_id (important)
-        if row[5]:
-            score += 1  # duration
-        if row[6]:
-            score += 1  # spotify_id
-        if row[7]:
-            score += 1  # lyrics
-
-        # Credits
-        cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (row[0],))
-        credits_count = cursor.fetchone()[0]
-        if credits_count > 0:
-            score += 2
-
-        scores.append((row[0], score))
-
-    best = max(scores, key=lambda x: x[1])
-    worst = min(scores, key=lambda x: x[1])
-
-    print(f"  Garder: ID {best[0]} (score: {best[1]})")
-    print(f"  Supprimer: ID {worst[0]} (score: {worst[1]})")
-
-    conn.close()
-
 
 def find_all_duplicates():
-    """Trouve tous les doublons dans la base"""
-    conn = sqlite3.connect("data/music_credits.db")
-    cursor = conn.cursor()
-
-    print(f"\n{'='*60}")
-    print("   DETECTION DE TOUS LES DOUBLONS")
-    print(f"{'='*60}\n")
-
-    # Trouver les doublons par titre (insensible à la casse)
-    cursor.execute("""
-        SELECT LOWER(title) as title_lower, COUNT(*) as count
-        FROM tracks
-        GROUP BY title_lower
-        HAVING count > 1
-        ORDER BY count DESC, title_lower
-    """)
-
-    duplicates = cursor.fetchall()
-
-    if not duplicates:
-        print("Aucun doublon trouvé!")
-        conn.close()
-        return
-
-    print(f"Nombre de doublons: {len(duplicates)}\n")
-
-    for title_lower, count in duplicates:
-        # Récupérer les versions exactes
-        cursor.execute(
-            """
-            SELECT id, title, album, duration
-            FROM tracks
-            WHERE LOWER(title) = ?
-            ORDER BY id
-        """,
-            (title_lower,),
-        )
-
-        versions = cursor.fetchall()
-
-        print(f"'{versions[0][1]}' ({count} versions):")
-        for version in versions:
-            info = f"  ID {version[0]}"
-            if version[2]:
-                info += f" | Album: {version[2]}"
-            if version[3]:
-                info += f" | Duree: {version[3]}s"
-            print(info)
-        print()
-
-    conn.close()
+    """Trouve tous les doublons probables de la base, en UNE passe : moteur
+    ensembliste (titre normalisé, identifiants, durée) de `merge_duplicates --find`
+    plutôt que l'ancien GROUP BY LOWER(title) + une requête par titre."""
+    from merge_duplicates import find_normalized_duplicates
 
-    return duplicates
+    find_normalized_duplicates()
 
 
 def main():
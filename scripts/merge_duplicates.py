@@ -3,358 +3,232 @@ Script de fusion et suppression des doublons
 ATTENTION : Crée un backup avant toute modification
 """
 
-import sqlite3
 import sys
 
 # Fix encodage Windows
 sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 
+from sqlalchemy import text
+
 from src.utils.database_backup import get_backup_manager
-from src.utils.title_matching import normalize_title
+from src.utils.db import Database
+from src.utils.duplicate_detection import DEFAULT_MIN_SCORE
+from src.utils.track_repository import TrackRepository
 
+DB_PATH = "data/music_credits.db"
 
-def find_normalized_duplicates(artist_name=None):
-    """Liste les doublons par titre NORMALISÉ (≠ LOWER exact) : attrape les
-    variantes de ponctuation/casse (« My Love (Acoustic) » ≡ « My love [acoustic] »)
-    que l'auto-clean exact rate. NE FUSIONNE RIEN — affiche les groupes + les
-    commandes --merge à lancer (tu choisis keep/delete).
-    """
-    conn = sqlite3.connect("data/music_credits.db")
-    cur = conn.cursor()
+# Seuil de l'auto-clean (fusion sans revue) : identifiant commun ou titre
+# normalisé identique + durée concordante, sans marqueur de version.
+AUTO_MIN_SCORE = 0.8
 
-    sql = (
-        "SELECT t.id, t.title, t.album, t.release_date, t.spotify_id, a.name "
-        "FROM tracks t JOIN artists a ON a.id = t.artist_id"
-    )
-    params = ()
-    if artist_name:
-        sql += " WHERE a.name = ?"
-        params = (artist_name,)
-    rows = cur.execute(sql, params).fetchall()
-    conn.close()
-
-    groups = {}
-    for tid, title, album, rdate, sid, artist in rows:
-        key = (artist, normalize_title(title or ""))
-        groups.setdefault(key, []).append((tid, title, album, rdate, sid))
-
-    dups = {k: v for k, v in groups.items() if len(v) > 1}
-    if not dups:
-        print("Aucun doublon (titre normalisé) trouvé.")
+
+class _DuplicatesRepository(TrackRepository):
+    """Repository branché sur la base du script (sans la façade DataManager)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+
+def _artist_id(repo, artist_name):
+    with repo.engine.connect() as conn:
+        return conn.execute(
+            text("SELECT id FROM artists WHERE name = :name"), {"name": artist_name}
+        ).scalar()
+
+
+def find_normalized_duplicates(artist_name=None, min_score=DEFAULT_MIN_SCORE):
+    """Liste les fusions proposées par le moteur ensembliste (duplicate_detection :
+    titre NORMALISÉ, genius/spotify/ISRC, durée) — attrape les variantes de
+    ponctuation/casse (« My Love (Acoustic) » ≡ « My love [acoustic] ») que
+    l'auto-clean exact rate. NE FUSIONNE RIEN — affiche les propositions + les
+    commandes --merge à lancer (tu valides keep/delete).
+    """
+    db = Database(DB_PATH)
+    try:
+        repo = _DuplicatesRepository(db.engine)
+        artist_id = None
+        if artist_name:
+            artist_id = _artist_id(repo, artist_name)
+            if artist_id is None:
+                print(f"Artiste introuvable: {artist_name}")
+                return
+        proposals = repo.find_duplicate_candidates(artist_id, min_score=min_score)
+    finally:
+        db.dispose()
+
+    if not proposals:
+        print("Aucun doublon probable trouvé.")
         return
 
-    print(f"\n{'='*60}\n   DOUBLONS PAR TITRE NORMALISÉ ({len(dups)} groupe(s))\n{'='*60}")
+    print(f"\n{'='*60}\n   FUSIONS PROPOSÉES ({len(proposals)})\n{'='*60}")
     print(
         "⚠️ Vérifie : ce sont peut-être des VERSIONS distinctes (Acoustic/Remix/Live)\n"
         "   → dans ce cas NE PAS fusionner. Intro/Outro/Interlude = souvent le même.\n"
     )
-    for (artist, norm), items in sorted(dups.items(), key=lambda x: -len(x[1])):
-        print(f"[{artist}]  « {norm} »  ({len(items)} entrées)")
-        for tid, title, album, rdate, sid in items:
-            d = str(rdate)[:10] if rdate else "—"
-            print(
-                f"    #{tid:>4}  {title!r}  album={album or '—'}  date={d}  "
-                f"sid={'oui' if sid else 'non'}"
-            )
-        ids = [str(i[0]) for i in items]
+    for p in proposals:
+        print(f"[artiste {p.artist_id}]  score {p.score:.2f}  ({', '.join(p.reasons)})")
+        print(f"    garder    #{p.keep_id:>5}  {p.keep_title!r}")
+        print(f"    supprimer #{p.delete_id:>5}  {p.delete_title!r}")
         print(
-            f"    → fusion (garde le 1er) : python scripts/merge_duplicates.py "
-            f"--merge {ids[0]} {ids[1]} --execute\n"
+            f"    → python scripts/merge_duplicates.py --merge {p.keep_id} {p.delete_id} --execute\n"
         )
 
 
+def _describe_track(repo, label, track_id):
+    """Affiche titre/album/crédits d'un morceau ; False s'il n'existe pas."""
+    with repo.engine.connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT t.title, t.album, (SELECT COUNT(*) FROM credits c "
+                "WHERE c.track_id = t.id) FROM tracks t WHERE t.id = :tid"
+            ),
+            {"tid": track_id},
+        ).first()
+    if row is None:
+        return False
+    title, album, credits_count = row
+    print(f"Track a {label} (ID {track_id}):")
+    print(f"  Titre: {title}")
+    print(f"  Album: {album or 'N/A'}")
+    print(f"  Credits: {credits_count}")
+    return True
+
+
+def _backup_before_changes():
+    """Backup avant modification ; False si l'utilisateur annule faute de backup."""
+    print("\nCreation d'un backup...")
+    backup_manager = get_backup_manager()
+    backup_path = backup_manager.create_backup("before_merge_duplicates")
+    if backup_path:
+        print(f"Backup cree: {backup_path.name}")
+        return True
+    print("ATTENTION: Impossible de creer un backup!")
+    confirm = input("Continuer quand meme ? (oui/non): ").strip().lower()
+    if confirm not in ["oui", "o", "yes", "y"]:
+        print("Annule")
+        return False
+    return True
+
+
 def merge_duplicate_tracks(keep_id, delete_id, dry_run=True):
     """
-    Fusionne deux tracks en un seul
+    Fusionne deux tracks en un seul, via `TrackRepository.merge_tracks`
+    (crédits, erreurs, observations, index `track_search`, `reconcile_cache`).
 
     Args:
         keep_id: ID du track à conserver
         delete_id: ID du track à supprimer
         dry_run: Si True, simule sans modifier la base
     """
-    conn = sqlite3.connect("data/music_credits.db")
-    cursor = conn.cursor()
-
     print(f"\n{'='*60}")
     print("   FUSION DE DOUBLONS")
     print(f"{'='*60}\n")
 
-    # Récupérer les infos des deux tracks
-    cursor.execute("SELECT * FROM tracks WHERE id = ?", (keep_id,))
-    keep_track = cursor.fetchone()
-
-    cursor.execute("SELECT * FROM tracks WHERE id = ?", (delete_id,))
-    delete_track = cursor.fetchone()
-
-    if not keep_track or not delete_track:
-        print("Erreur: Un des IDs n'existe pas")
-        conn.close()
-        return False
-
-    print(f"Track a GARDER (ID {keep_id}):")
-    print(f"  Titre: {keep_track[1]}")
-    print(f"  Album: {keep_track[3] or 'N/A'}")
-
-    cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (keep_id,))
-    keep_credits = cursor.fetchone()[0]
-    print(f"  Credits: {keep_credits}")
-
-    print(f"\nTrack a SUPPRIMER (ID {delete_id}):")
-    print(f"  Titre: {delete_track[1]}")
-    print(f"  Album: {delete_track[3] or 'N/A'}")
-
-    cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (delete_id,))
-    delete_credits = cursor.fetchone()[0]
-    print(f"  Credits: {delete_credits}")
-
-    if dry_run:
-        print("\n[DRY RUN] Aucune modification effectuee")
-        conn.close()
-        return True
-
-    print("\nFusion en cours...")
-
+    db = Database(DB_PATH)
     try:
-        # 1. Transférer les crédits du track à supprimer vers celui à garder
-        if delete_credits > 0:
-            cursor.execute(
-                """
-                UPDATE credits
-                SET track_id = ?
-                WHERE track_id = ?
-            """,
-                (keep_id, delete_id),
-            )
-            print(f"  Credits transferes: {delete_credits}")
-
-        # 2. Transférer les erreurs de scraping
-        cursor.execute(
-            """
-            UPDATE scraping_errors
-            SET track_id = ?
-            WHERE track_id = ?
-        """,
-            (keep_id, delete_id),
-        )
-
-        # 3. Transférer les observations (audio = vérité depuis E7-D2) : dédup par
-        # la clé unique (field, source) — le keep gagne — puis réaffectation.
-        cursor.execute(
-            "DELETE FROM observations WHERE track_id = ? AND EXISTS ("
-            "SELECT 1 FROM observations k WHERE k.track_id = ? "
-            "AND k.field = observations.field AND k.source = observations.source)",
-            (delete_id, keep_id),
-        )
-        cursor.execute(
-            "UPDATE observations SET track_id = ? WHERE track_id = ?",
-            (keep_id, delete_id),
-        )
-
-        # 4. Supprimer le track en doublon
-        cursor.execute("DELETE FROM tracks WHERE id = ?", (delete_id,))
-
-        conn.commit()
+        repo = _DuplicatesRepository(db.engine)
+        if not _describe_track(repo, "GARDER", keep_id):
+            print(f"Erreur: Track ID {keep_id} n'existe pas")
+            return False
+        print()
+        if not _describe_track(repo, "SUPPRIMER", delete_id):
+            print(f"Erreur: Track ID {delete_id} n'existe pas")
+            return False
+
+        if dry_run:
+            print("\n[DRY RUN] Aucune modification effectuee")
+            return True
+        if not _backup_before_changes():
+            return False
+
+        print("\nFusion en cours...")
+        if not repo.merge_tracks(keep_id, delete_id):
+            print("\nERREUR: fusion annulee (voir les logs)")
+            return False
         print(f"\nSUCCES: Track {delete_id} fusionne dans {keep_id} et supprime")
-
-        conn.close()
         return True
-
-    except Exception as e:
-        conn.rollback()
-        print(f"\nERREUR: {e}")
-        conn.close()
-        return False
+    finally:
+        db.dispose()
 
 
 def delete_duplicate_track(track_id, dry_run=True):
     """
-    Supprime un track en doublon (sans fusion)
+    Supprime un track en doublon (sans fusion), via `TrackRepository.delete_track`
+    (crédits, erreurs, observations, index `track_search`, `reconcile_cache`).
 
     Args:
         track_id: ID du track à supprimer
         dry_run: Si True, simule sans modifier la base
     """
-    conn = sqlite3.connect("data/music_credits.db")
-    cursor = conn.cursor()
-
     print(f"\n{'='*60}")
     print("   SUPPRESSION DE DOUBLON")
     print(f"{'='*60}\n")
 
-    # Récupérer les infos du track
-    cursor.execute("SELECT * FROM tracks WHERE id = ?", (track_id,))
-    track = cursor.fetchone()
-
-    if not track:
-        print(f"Erreur: Track ID {track_id} n'existe pas")
-        conn.close()
-        return False
-
-    print(f"Track a SUPPRIMER (ID {track_id}):")
-    print(f"  Titre: {track[1]}")
-    print(f"  Album: {track[3] or 'N/A'}")
-
-    cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (track_id,))
-    credits_count = cursor.fetchone()[0]
-    print(f"  Credits: {credits_count}")
-
-    if dry_run:
-        print("\n[DRY RUN] Aucune modification effectuee")
-        conn.close()
-        return True
-
-    print("\nSuppression en cours...")
-
+    db = Database(DB_PATH)
     try:
-        # 1. Supprimer les crédits associés
-        cursor.execute("DELETE FROM credits WHERE track_id = ?", (track_id,))
-        print(f"  Credits supprimes: {credits_count}")
-
-        # 2. Supprimer les erreurs de scraping
-        cursor.execute("DELETE FROM scraping_errors WHERE track_id = ?", (track_id,))
-
-        # 3. Supprimer les observations (pas de cascade FK) — sinon orphelines.
-        cursor.execute("DELETE FROM observations WHERE track_id = ?", (track_id,))
-
-        # 4. Supprimer le track
-        cursor.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
-
-        conn.commit()
+        repo = _DuplicatesRepository(db.engine)
+        if not _describe_track(repo, "SUPPRIMER", track_id):
+            print(f"Erreur: Track ID {track_id} n'existe pas")
+            return False
+
+        if dry_run:
+            print("\n[DRY RUN] Aucune modification effectuee")
+            return True
+        if not _backup_before_changes():
+            return False
+
+        print("\nSuppression en cours...")
+        if not repo.delete_track(track_id):
+            print("\nERREUR: suppression annulee (voir les logs)")
+            return False
         print(f"\nSUCCES: Track {track_id} supprime")
-
-        conn.close()
         return True
-
-    except Exception as e:
-        conn.rollback()
-        print(f"\nERREUR: {e}")
-        conn.close()
-        return False
+    finally:
+        db.dispose()
 
 
 def auto_clean_duplicates(dry_run=True):
     """
-    Nettoie automatiquement tous les doublons en gardant le plus complet
+    Fusionne automatiquement les doublons SÛRS (score ≥ AUTO_MIN_SCORE) proposés
+    par le moteur ensembliste : la fiche la plus complète est gardée, l'autre y
+    est fusionnée (crédits, erreurs, observations) via `merge_tracks`.
 
     Args:
         dry_run: Si True, simule sans modifier la base
     """
-    conn = sqlite3.connect("data/music_credits.db")
-    cursor = conn.cursor()
-
     print(f"\n{'='*60}")
     print("   NETTOYAGE AUTOMATIQUE DES DOUBLONS")
     print(f"{'='*60}\n")
 
-    # Trouver tous les doublons
-    cursor.execute("""
-        SELECT LOWER(title) as title_lower, COUNT(*) as count
-        FROM tracks
-        GROUP BY title_lower
-        HAVING count > 1
-        ORDER BY count DESC, title_lower
-    """)
-
-    duplicates = cursor.fetchall()
-
-    if not duplicates:
-        print("Aucun doublon trouve!")
-        conn.close()
-        return
-
-    print(f"Nombre de groupes de doublons: {len(duplicates)}\n")
-
-    actions = []
-
-    for title_lower, count in duplicates:
-        # Récupérer toutes les versions
-        cursor.execute(
-            """
-            SELECT id, title, album, genius_id, duration, spotify_id, lyrics
-            FROM tracks
-            WHERE LOWER(title) = ?
-            ORDER BY id
-        """,
-            (title_lower,),
-        )
-
-        versions = cursor.fetchall()
-
-        # Calculer les scores (audio droppé E7-D2 : plus de bpm/musical_key ici).
-        scores = []
-        for version in versions:
-            score = 0
-            if version[2]:
-                score += 1  # album
-            if version[3]:
-                score += 2  # genius_id
-            if version[4]:
-                score += 1  # duration
-            if version[5]:
-                score += 1  # spotify_id
-            if version[6]:
-                score += 1  # lyrics
-
-            # Credits
-            cursor.execute("SELECT COUNT(*) FROM credits WHERE track_id = ?", (version[0],))
-            credits_count = cursor.fetchone()[0]
-            if credits_count > 0:
-                score += 2
-
-            scores.append((version[0], version[1], score))
-
-        # Trouver la meilleure version
-        best = max(scores, key=lambda x: x[2])
-
-        # Marquer les autres pour suppression
-        for track_id, track_title, _score in scores:
-            if track_id != best[0]:
-                actions.append(
-                    {
-                        "keep_id": best[0],
-                        "keep_title": best[1],
-                        "delete_id": track_id,
-                        "delete_title": track_title,
-                    }
-                )
-
-        print(f"'{best[1]}' ({count} versions):")
-        print(f"  Garder: ID {best[0]} (score: {best[2]})")
-        for track_id, _track_title, score in scores:
-            if track_id != best[0]:
-                print(f"  Supprimer: ID {track_id} (score: {score})")
-        print()
-
-    conn.close()
+    db = Database(DB_PATH)
+    try:
+        repo = _DuplicatesRepository(db.engine)
+        proposals = repo.find_duplicate_candidates(min_score=AUTO_MIN_SCORE)
+        if not proposals:
+            print("Aucun doublon sûr trouve!")
+            return
 
-    if dry_run:
-        print(f"\n[DRY RUN] {len(actions)} doublons seraient supprimes")
-        print("\nPour executer reellement:")
-        print("  python scripts/merge_duplicates.py --auto --execute")
-        return
+        for p in proposals:
+            print(f"'{p.keep_title}' (score {p.score:.2f}):")
+            print(f"  Garder: ID {p.keep_id}")
+            print(f"  Fusionner: ID {p.delete_id} '{p.delete_title}'")
+            print(f"  ({', '.join(p.reasons)})\n")
 
-    # Créer un backup avant modification
-    print("\nCreation d'un backup...")
-    backup_manager = get_backup_manager()
-    backup_path = backup_manager.create_backup("before_merge_duplicates")
-    if backup_path:
-        print(f"Backup cree: {backup_path.name}")
-    else:
-        print("ATTENTION: Impossible de creer un backup!")
-        confirm = input("Continuer quand meme ? (oui/non): ").strip().lower()
-        if confirm not in ["oui", "o", "yes", "y"]:
-            print("Annule")
+        if dry_run:
+            print(f"\n[DRY RUN] {len(proposals)} doublons seraient fusionnes")
+            print("\nPour executer reellement:")
+            print("  python scripts/merge_duplicates.py --auto --execute")
             return
 
-    # Exécuter les suppressions
-    print(f"\nSuppression de {len(actions)} doublons...")
-    success = 0
-    for action in actions:
-        if delete_duplicate_track(action["delete_id"], dry_run=False):
-            success += 1
+        if not _backup_before_changes():
+            return
 
-    print(f"\nTERMINE: {success}/{len(actions)} doublons supprimes")
+        print(f"\nFusion de {len(proposals)} doublons...")
+        success = sum(1 for p in proposals if repo.merge_tracks(p.keep_id, p.delete_id))
+        print(f"\nTERMINE: {success}/{len(proposals)} doublons fusionnes")
+    finally:
+        db.dispose()
 
 
 def main():
@@ -370,11 +244,11 @@ def main():
         print("  python scripts/merge_duplicates.py --auto [--execute]")
         print("")
         print("Options:")
-        print("  --find [ARTISTE] : Liste les doublons par titre NORMALISÉ (recommandé)")
+        print("  --find [ARTISTE] : Liste les fusions proposées (moteur ensembliste, recommandé)")
         print("  --check TITRE    : Analyse un doublon specifique")
         print("  --delete ID      : Supprime un track en doublon")
         print("  --merge K D      : Fusionne DELETE_ID dans KEEP_ID")
-        print("  --auto           : Nettoie automatiquement tous les doublons")
+        print("  --auto           : Fusionne automatiquement les doublons sûrs")
         print("  --execute        : Execute reellement (sinon dry-run)")
         return
 
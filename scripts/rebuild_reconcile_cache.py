@@ -0,0 +1,59 @@
+"""Reconstruit le cache de réconciliation (`reconcile_cache`, révision e14).
+
+Le cache se remplit tout seul au fil des chargements d'artistes ; ce script le
+recalcule d'un coup — après une évolution d'une stratégie de `reconcile.py`
+(avec `CACHE_VERSION` incrémenté), une restauration de backup ou des écritures
+d'observations hors application (scripts, SQL à la main).
+
+    python scripts/rebuild_reconcile_cache.py               # tous les artistes
+    python scripts/rebuild_reconcile_cache.py --artist 12   # un seul artiste
+    python scripts/rebuild_reconcile_cache.py --db X.db     # une autre base (copie)
+
+N'écrit QUE dans `reconcile_cache` (donnée dérivée) : aucune observation ni
+colonne de `tracks` n'est touchée.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.config import DATABASE_URL
+from src.utils.db import Database
+from src.utils.track_repository import TrackRepository
+
+
+class _CacheRepository(TrackRepository):
+    """Repository branché sur la base choisie (sans la façade DataManager,
+    dont le constructeur vise la base de la config)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconstruit le cache de réconciliation")
+    parser.add_argument("--db", metavar="CHEMIN", help="base à traiter (défaut : config)")
+    parser.add_argument("--artist", type=int, metavar="ID", help="un seul artiste (id)")
+    args = parser.parse_args()
+
+    db_path = args.db or DATABASE_URL.replace("sqlite:///", "")
+    if not Path(db_path).exists():
+        print(f"❌ Base introuvable : {db_path}")
+        return 1
+
+    db = Database(db_path)  # upgrade head : crée la table sur une base antérieure à e14
+    try:
+        t0 = time.perf_counter()
+        written = _CacheRepository(db.engine).rebuild_reconcile_cache(args.artist)
+        print(f"✅ {written} verdict(s) en cache ({time.perf_counter() - t0:.1f}s) : {db_path}")
+    finally:
+        db.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
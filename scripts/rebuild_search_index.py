@@ -0,0 +1,75 @@
+"""Reconstruit l'index plein texte du catalogue (`track_search`, révision e16).
+
+L'index suit les écritures de l'application (sauvegarde, suppression, fusion,
+renommage) ; ce script le recalcule d'un coup — après des écritures hors
+application (scripts, SQL à la main) ou une restauration de backup. `--query`
+interroge l'index (même API que l'app, `TrackRepository.search`).
+
+    python scripts/rebuild_search_index.py                      # reconstruction
+    python scripts/rebuild_search_index.py --db X.db            # une autre base (copie)
+    python scripts/rebuild_search_index.py --query "booba"      # recherche seule
+    python scripts/rebuild_search_index.py --query "Y" --column credits --artist 12
+
+N'écrit QUE dans `track_search` (donnée dérivée) : aucune colonne de `tracks`
+ni aucun crédit n'est touché.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.config import DATABASE_URL
+from src.persistence.search_index import SEARCH_COLUMNS
+from src.utils.db import Database
+from src.utils.track_repository import TrackRepository
+
+
+class _SearchRepository(TrackRepository):
+    """Repository branché sur la base choisie (sans la façade DataManager,
+    dont le constructeur vise la base de la config)."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconstruit / interroge l'index plein texte")
+    parser.add_argument("--db", metavar="CHEMIN", help="base à traiter (défaut : config)")
+    parser.add_argument("--query", metavar="TEXTE", help="rechercher au lieu de reconstruire")
+    parser.add_argument("--column", choices=SEARCH_COLUMNS, help="restreindre à une colonne")
+    parser.add_argument("--artist", type=int, metavar="ID", help="restreindre à un artiste (id)")
+    parser.add_argument("--limit", type=int, default=20, help="résultats max (défaut 20)")
+    args = parser.parse_args()
+
+    db_path = args.db or DATABASE_URL.replace("sqlite:///", "")
+    if not Path(db_path).exists():
+        print(f"❌ Base introuvable : {db_path}")
+        return 1
+
+    db = Database(db_path)  # upgrade head : crée (et remplit) l'index avant e16
+    try:
+        repo = _SearchRepository(db.engine)
+        t0 = time.perf_counter()
+        if args.query is None:
+            indexed = repo.rebuild_search_index()
+            print(
+                f"✅ {indexed} morceau(x) indexé(s) ({time.perf_counter() - t0:.1f}s) : {db_path}"
+            )
+            return 0
+        hits = repo.search(args.query, args.limit, args.artist, column=args.column)
+        elapsed = (time.perf_counter() - t0) * 1000
+        for hit in hits:
+            print(f"{hit['score']:>7.2f}  {hit['artist_name']} — {hit['title']}")
+            print(f"         {' '.join(hit['snippet'].split())}")
+        print(f"\n{len(hits)} résultat(s) en {elapsed:.1f} ms")
+    finally:
+        db.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
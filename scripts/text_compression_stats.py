@@ -0,0 +1,115 @@
+"""Gain de la compression des paroles / LRC en base (révision e15, text_codec).
+
+Pour chaque colonne compressible (`tracks.lyrics`, `tracks.lyrics_synced`,
+`observations.value` des `lyrics_synced`) : lignes, part compressée, octets
+STOCKÉS vs octets en clair (valeurs décompressées), ratio. Puis la taille du
+fichier et ses pages libres — la place rendue par la compression n'est restituée
+au disque qu'après VACUUM.
+
+    python scripts/text_compression_stats.py            # base réelle (config)
+    python scripts/text_compression_stats.py --db X.db  # une autre base (copie)
+    python scripts/text_compression_stats.py --vacuum   # + VACUUM (backup avant !)
+
+Sans `--vacuum`, READ-ONLY.
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+if "pytest" not in sys.modules:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+from src.config import DATABASE_URL
+from src.persistence.text_codec import decode_text, is_compressed
+
+# (libellé, table, colonne, filtre)
+_COLUMNS = (
+    ("tracks.lyrics", "tracks", "lyrics", ""),
+    ("tracks.lyrics_synced", "tracks", "lyrics_synced", ""),
+    ("obs lyrics_synced", "observations", "value", "AND field = 'lyrics_synced'"),
+)
+
+
+def column_stats(conn: sqlite3.Connection, table: str, column: str, extra: str) -> dict:
+    """Lignes non nulles, compressées, octets stockés et octets en clair d'une colonne."""
+    stats = {"rows": 0, "compressed": 0, "stored": 0, "plain": 0}
+    cursor = conn.execute(f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL {extra}")
+    for (value,) in cursor:
+        stats["rows"] += 1
+        if is_compressed(value):
+            stats["compressed"] += 1
+            stats["stored"] += len(value)
+            stats["plain"] += len((decode_text(value) or "").encode("utf-8"))
+        else:
+            size = len(value) if isinstance(value, bytes) else len(str(value).encode("utf-8"))
+            stats["stored"] += size
+            stats["plain"] += size
+    return stats
+
+
+def report(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        print(
+            f"{'colonne':22} {'lignes':>8} {'compr.':>8} {'stocké':>11} {'en clair':>11} {'ratio':>6}"
+        )
+        print("-" * 71)
+        stored_total = plain_total = 0
+        for label, table, column, extra in _COLUMNS:
+            s = column_stats(conn, table, column, extra)
+            stored_total += s["stored"]
+            plain_total += s["plain"]
+            ratio = s["plain"] / s["stored"] if s["stored"] else 1.0
+            print(
+                f"{label:22} {s['rows']:>8} {s['compressed']:>8} "
+                f"{s['stored'] / 1024:>9.1f}K {s['plain'] / 1024:>9.1f}K {ratio:>5.1f}x"
+            )
+        print("-" * 71)
+        saved = plain_total - stored_total
+        print(
+            f"{'TOTAL':22} {'':>8} {'':>8} {stored_total / 1024:>9.1f}K "
+            f"{plain_total / 1024:>9.1f}K  (-{saved / 1024:.1f}K)"
+        )
+
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        pages = conn.execute("PRAGMA page_count").fetchone()[0]
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        print(
+            f"\nFichier : {pages * page_size / 1024 / 1024:.1f} Mo, dont "
+            f"{free * page_size / 1024 / 1024:.1f} Mo de pages libres (rendues par VACUUM)"
+        )
+        return 0
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gain de la compression paroles/LRC en base")
+    parser.add_argument("--db", metavar="CHEMIN", help="base à analyser (défaut : config)")
+    parser.add_argument(
+        "--vacuum", action="store_true", help="VACUUM après le rapport (faire un backup avant)"
+    )
+    args = parser.parse_args()
+
+    db_path = args.db or DATABASE_URL.replace("sqlite:///", "")
+    if not Path(db_path).exists():
+        print(f"❌ Base introuvable : {db_path}")
+        return 1
+    print(f"Compression paroles/LRC sur : {db_path}\n")
+    code = report(db_path)
+    if args.vacuum:
+        before = Path(db_path).stat().st_size
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        after = Path(db_path).stat().st_size
+        print(f"VACUUM : {before / 1024 / 1024:.1f} → {after / 1024 / 1024:.1f} Mo")
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
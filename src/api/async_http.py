@@ -1,21 +1,33 @@
 """Session HTTP async PARTAGÉE des providers d'enrichissement (Phase F2).
 
 UN `httpx.AsyncClient` pour tous les appels API du flux async + le
-`DomainRateLimiter` de F1 : jamais deux requêtes simultanées vers le même
-domaine, délai mini `DELAY_BETWEEN_REQUESTS` entre deux requêtes d'un même
-domaine — remplace les limiteurs ad hoc des clients sync (fenêtre Deezer,
-sleeps GetSongBPM), en plus prudent. Deux domaines différents ne se gênent pas.
+`DomainRateLimiter` de F1, réglé par `DOMAIN_POLICIES` : budget propre à chaque
+domaine connu (Deezer 50 req / 5 s…), sinon une requête à la fois espacée de
+`DELAY_BETWEEN_REQUESTS` — remplace les limiteurs ad hoc des clients sync
+(fenêtre Deezer, sleeps GetSongBPM). Chaque statut de réponse est signalé au
+limiteur : un 429/503 ralentit le domaine et respecte son `Retry-After`. Deux
+domaines différents ne se gênent pas.
+
+Deux étages évitent le réseau, sous tous les jumeaux async sans qu'ils le
+sachent :
+  · COALESCENCE — deux GET identiques (URL + params + en-têtes) en vol en même
+    temps partagent UNE requête ;
+  · CACHE DISQUE optionnel (`ResponseCache`, src/api/http_cache.py) — réponse
+    fraîche servie sans requête, périmée revalidée en conditionnel (304).
 
 Le client est créé LAZY au premier `get()` (donc dans la boucle asyncio) et
 fermé par `aclose()` — appelé par le flux propriétaire en fin de batch
 (« qui crée ferme ») ; rouvert à la demande au batch suivant.
 """
 
+import asyncio
+from collections.abc import Callable
 from urllib.parse import urlsplit
 
 import httpx
 
-from src.concurrency.rate_limiter import DomainRateLimiter
+from src.api.http_cache import ResponseCache, request_key
+from src.concurrency.rate_limiter import DOMAIN_POLICIES, DomainRateLimiter
 
 
 class AsyncHttpSession:
@@ -28,13 +40,28 @@ class AsyncHttpSession:
         headers: dict | None = None,
         transport: httpx.AsyncBaseTransport | None = None,
         limiter: DomainRateLimiter | None = None,
+        cache: ResponseCache | Callable[[], ResponseCache | None] | None = None,
     ) -> None:
-        self._limiter = limiter if limiter is not None else DomainRateLimiter(min_delay)
+        """`cache` : cache disque, ou factory appelée au premier `get()` (ouverture
+        lazy, comme le client) ; None = pas de cache (la coalescence reste active).
+        """
+        self._limiter = (
+            limiter
+            if limiter is not None
+            else DomainRateLimiter(min_delay, policies=DOMAIN_POLICIES)
+        )
         self._headers = headers
         self._transport = transport  # tests : httpx.MockTransport
         self._client: httpx.AsyncClient | None = None
+        self._cache = cache if cache is None or isinstance(cache, ResponseCache) else None
+        self._cache_factory = None if self._cache is not None else cache
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.cache_stats = {"hits": 0, "revalidated": 0, "coalesced": 0, "network": 0}
 
     def _ensure_client(self) -> httpx.AsyncClient:
+        if self._cache_factory is not None:
+            factory, self._cache_factory = self._cache_factory, None
+            self._cache = factory()
         if self._client is None:
             # follow_redirects : requests suit les redirections par défaut,
             # httpx non — aligné sur le comportement des clients sync.
@@ -51,10 +78,61 @@ class AsyncHttpSession:
         headers: dict | None = None,
         timeout: float = 15.0,
     ) -> httpx.Response:
-        """GET rate-limité par domaine. Lève les erreurs httpx (frontière appelant)."""
+        """GET rate-limité par domaine. Lève les erreurs httpx (frontière appelant).
+
+        Un 429/503 est RENVOYÉ à l'appelant (ses propres retries) après avoir
+        ralenti le domaine. Les appelants d'une requête coalescée reçoivent la
+        MÊME réponse (corps déjà lu) ; annuler l'un n'annule pas les autres.
+        """
         client = self._ensure_client()
-        async with self._limiter.limit(urlsplit(url).netloc):
-            return await client.get(url, params=params, headers=headers, timeout=timeout)
+        request = client.build_request("GET", url, params=params, headers=headers, timeout=timeout)
+        key = request_key(request)
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._fetch(client, request, key))
+            self._inflight[key] = shared
+            shared.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.cache_stats["coalesced"] += 1
+        return await asyncio.shield(shared)
+
+    def _forget(self, key: str, done: asyncio.Future) -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+        if not done.cancelled():
+            done.exception()  # marquée « lue » : tous les appelants ont pu abandonner
+
+    async def _fetch(self, client: httpx.AsyncClient, request: httpx.Request, key: str):
+        """Cache (frais → servi ; périmé → conditionnel), sinon réseau rate-limité."""
+        cached = self._cache.lookup(key) if self._cache is not None else None
+        if cached is not None:
+            if cached.fresh:
+                self.cache_stats["hits"] += 1
+                return cached.to_response(request)
+            request.headers.update(cached.validators)
+
+        domain = urlsplit(str(request.url)).netloc
+        async with self._limiter.limit(domain):
+            self.cache_stats["network"] += 1
+            response = await client.send(request)
+            self._limiter.observe(domain, response.status_code, response.headers.get("Retry-After"))
+
+        if self._cache is not None:
+            if response.status_code == 304 and cached is not None:
+                self._cache.refresh(key, request.url.host)
+                self.cache_stats["revalidated"] += 1
+                return cached.to_response(request)
+            self._cache.store(key, response)
+        return response
+
+    def report_throttle(self, url: str, retry_after=None) -> None:
+        """Saturation signalée dans le CORPS d'une réponse (quota Deezer servi en
+        200) : ralentit et suspend le domaine de `url` comme un 429."""
+        self._limiter.observe(urlsplit(url).netloc, 429, retry_after)
+
+    def rate_stats(self) -> dict:
+        """Attentes et ralentissements par domaine (`DomainRateLimiter.stats`)."""
+        return self._limiter.stats()
 
     async def aclose(self) -> None:
         """Ferme le client (idempotent) ; recréé au prochain `get()`."""
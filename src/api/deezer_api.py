@@ -31,6 +31,8 @@ class DeezerAPI:
     BASE_URL = "https://api.deezer.com"
     RATE_LIMIT = 50  # 50 requêtes par 5 secondes
     RATE_LIMIT_WINDOW = 5  # secondes
+    QUOTA_ERROR_CODE = 4  # « Quota limit exceeded », servi en HTTP 200
+    QUOTA_RETRIES = 3  # essais (voie async) avant d'abandonner sur quota
 
     def __init__(self):
         """Initialise le client Deezer API"""
@@ -68,6 +70,11 @@ class DeezerAPI:
             return None
         return data
 
+    @classmethod
+    def _is_quota_error(cls, data) -> bool:
+        error = data.get("error") if isinstance(data, dict) else None
+        return isinstance(error, dict) and error.get("code") == cls.QUOTA_ERROR_CODE
+
     def _make_request(self, endpoint: str, params: dict | None = None) -> dict | None:
         """
         Effectue une requête à l'API Deezer avec gestion du rate limiting
@@ -99,18 +106,28 @@ class DeezerAPI:
         self, http: "AsyncHttpSession", endpoint: str, params: dict | None = None
     ) -> dict | None:
         """Jumeau async de `_make_request` — le rate-limit par fenêtre (50/5 s)
-        est remplacé par le limiteur par domaine de la session partagée."""
+        est remplacé par le limiteur par domaine de la session partagée.
+
+        Quota dépassé (code 4, en 200 : invisible pour `observe`) : signalé au
+        limiteur comme un 429 (ralentissement + pause du domaine) puis REDEMANDÉ,
+        au lieu d'être confondu avec un « introuvable »."""
         url = f"{self.BASE_URL}/{endpoint}"
-        try:
-            response = await http.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return self._payload_or_none(response.json())
-        except httpx.HTTPError as e:
-            logger.error(f"Erreur de requête: {e}")
-            return None
-        except ValueError as e:
-            logger.error(f"Erreur de parsing JSON: {e}")
-            return None
+        for attempt in range(1, self.QUOTA_RETRIES + 1):
+            try:
+                response = await http.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            except httpx.HTTPError as e:
+                logger.error(f"Erreur de requête: {e}")
+                return None
+            except ValueError as e:
+                logger.error(f"Erreur de parsing JSON: {e}")
+                return None
+            if not self._is_quota_error(data) or attempt == self.QUOTA_RETRIES:
+                return self._payload_or_none(data)
+            logger.warning(f"Quota Deezer atteint — nouvel essai ({attempt}/{self.QUOTA_RETRIES})")
+            http.report_throttle(url)
+        return None
 
     def search_track(self, artist: str, title: str, strict: bool = False) -> dict | None:
         """
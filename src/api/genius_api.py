@@ -1,16 +1,29 @@
-"""Interface avec l'API Genius - Version corrigée pour les erreurs de clés"""
-
+"""Interface avec l'API Genius - Version corrigée pour les erreurs de clés
+
+Voie async : `get_artist_songs_async` tape l'`AsyncHttpSession` partagée
+(budget du domaine api.genius.com dans `DOMAIN_POLICIES`). Les pages de
+`/artists/{id}/songs` sont demandées en avance (`GENIUS_PAGES_AHEAD`) et
+rendues page par page dès leur parse ; les appels détail (`/songs/{id}`) du
+prefill partent dès qu'une page est lue, en parallèle des pages suivantes.
+Filtrage, vérification des crédits et pose des métadonnées sont partagés
+avec la voie sync.
+"""
+
+import asyncio
 import re
 import time
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import requests
 from lyricsgenius import Genius
 
 from src.config import (
     DELAY_BETWEEN_REQUESTS,
     GENIUS_API_KEY,
+    GENIUS_PAGES_AHEAD,
     GENIUS_RETRIES,
     GENIUS_SLEEP_TIME,
     GENIUS_TIMEOUT,
@@ -18,8 +31,17 @@ from src.config import (
 from src.models import Artist, Track
 from src.utils.logger import get_logger, log_api
 
+if TYPE_CHECKING:
+    from src.api.async_http import AsyncHttpSession
+
 logger = get_logger(__name__)
 
+# Racine de l'API officielle (celle de lyricsgenius, `Sender.API_ROOT`)
+API_ROOT = "https://api.genius.com"
+
+# Taille de page max de /artists/{id}/songs
+_PER_PAGE = 50
+
 
 class GeniusAPI:
     """Gère les interactions avec l'API Genius"""
@@ -266,22 +288,27 @@ class GeniusAPI:
         except (requests.RequestException, AssertionError) as e:
             logger.warning(f"verify credit échec song {song_id}: {e}")
             return None
-        song = (data or {}).get("song") or {}
+        return self._credit_in_song((data or {}).get("song") or {}, artist_id)
+
+    @classmethod
+    def _credit_in_song(cls, song: dict, artist_id):
+        """Nature du crédit de `artist_id` dans un détail `/songs/{id}` (cf.
+        `_verify_artist_credit`) ; commun sync/async."""
         try:
             aid = int(artist_id)
         except (TypeError, ValueError):
             aid = artist_id
-        if aid in self._collect_artist_ids(song.get("primary_artists")):
+        if aid in cls._collect_artist_ids(song.get("primary_artists")):
             return ("primary", None)
-        if aid in self._collect_artist_ids(song.get("featured_artists")):
+        if aid in cls._collect_artist_ids(song.get("featured_artists")):
             return ("feat", None)
         # Rôles fins (chant additionnel, chœurs, etc.)
         for perf in song.get("custom_performances") or []:
-            if isinstance(perf, dict) and aid in self._collect_artist_ids(perf.get("artists")):
+            if isinstance(perf, dict) and aid in cls._collect_artist_ids(perf.get("artists")):
                 return ("secondary", perf.get("label") or "Contribution")
-        if aid in self._collect_artist_ids(song.get("producer_artists")):
+        if aid in cls._collect_artist_ids(song.get("producer_artists")):
             return ("secondary", "Producer")
-        if aid in self._collect_artist_ids(song.get("writer_artists")):
+        if aid in cls._collect_artist_ids(song.get("writer_artists")):
             return ("secondary", "Writer")
         return None
 
@@ -302,7 +329,7 @@ class GeniusAPI:
 
         try:
             page = 1
-            per_page = 50
+            per_page = _PER_PAGE
 
             while len(tracks) < max_songs:
                 response = self.genius.artist_songs(
@@ -317,97 +344,25 @@ class GeniusAPI:
                     break
 
                 for song in songs:
-                    primary = song.get("primary_artist") or {}
-                    is_feat = primary.get("id") != artist.genius_id
-                    if is_feat and not include_features:
-                        continue
-
-                    secondary_role = None  # rempli si contribution secondaire (Additional Voices…)
-
-                    if is_feat:
-                        # L'API renvoie aussi les morceaux où l'artiste a un rôle
-                        # secondaire (writer, producer...) ou est mal tagué.
-                        # Garder : 1) VRAIS feats (id dans featured_artists),
-                        # 2) co-primaires (id dans primary_artists), 3) collab par nom
-                        # ("Limsa d'Aulnay & Isha" — mais PAS "Vasjan & ISHA!").
-                        featured_ids = self._collect_artist_ids(song.get("featured_artists"))
-                        # primary_artists (pluriel) = co-artistes principaux (collab) ;
-                        # un co-primaire n'est PAS dans featured_artists → test par ID indispensable.
-                        primary_ids = self._collect_artist_ids(song.get("primary_artists"))
-                        try:
-                            aid = int(artist.genius_id)
-                        except (TypeError, ValueError):
-                            aid = artist.genius_id
-                        is_collab_page = self._primary_is_collab_with(
-                            primary.get("name", ""), artist.name
-                        )
-                        if (
-                            aid not in featured_ids
-                            and aid not in primary_ids
-                            and not is_collab_page
-                        ):
-                            if not include_secondary:
-                                logger.debug(
-                                    f"Ignoré (rôle secondaire/tag douteux): "
-                                    f"{song.get('title')} — primary='{primary.get('name')}' "
-                                    f"feat_ids={featured_ids} prim_ids={primary_ids} aid={aid}"
-                                )
-                                continue
-                            # Mode rôles secondaires : on VÉRIFIE au détail que c'est
-                            # bien NOTRE artiste (id exact) et on récupère son rôle.
-                            verdict = self._verify_artist_credit(song.get("id"), artist.genius_id)
-                            time.sleep(DELAY_BETWEEN_REQUESTS)
-                            if verdict is None:
-                                logger.debug(
-                                    f"Ignoré (non crédité au détail / id ≠): {song.get('title')} "
-                                    f"— primary='{primary.get('name')}'"
-                                )
-                                continue
-                            kind, role = verdict
-                            if kind == "primary":
-                                is_feat = False  # liste sous-déclarée → vrai primaire
-                            elif kind == "feat":
-                                is_feat = True  # vrai feat sous-déclaré par la liste
-                            else:  # 'secondary'
-                                is_feat = True
-                                secondary_role = role
-                                logger.info(
-                                    f"🎙️ Rôle secondaire gardé: {song.get('title')} "
-                                    f"— {artist.name} = {role}"
-                                )
-
-                    track = Track(
-                        title=song.get("title", ""),
-                        artist=artist,
-                        genius_id=song.get("id"),
-                        genius_url=song.get("url"),
-                        album=self._extract_album_from_song(song),
-                        release_date=self._extract_release_date_from_song(song),
-                        is_featuring=is_feat,
+                    kind = self._classify_listed_song(
+                        song, artist, include_features, include_secondary
                     )
-                    track.secondary_role = secondary_role
-                    # Chantier « Media » : pochettes (morceau + album) sur le
-                    # chemin réel. `album_cover_url` = transitoire (non persisté),
-                    # consommé par media_enricher en fallback de Deezer.
-                    art, album_cover = self._extract_song_art(song)
-                    if art:
-                        track.media.artwork_url = art
-                    if album_cover:
-                        track.album_cover_url = album_cover
-                    if is_feat and primary.get("name"):
-                        track.primary_artist_name = primary["name"]
-                        logger.debug(
-                            f"Featuring (fallback): {track.title} "
-                            f"(artiste principal: {primary['name']})"
-                        )
+                    if kind is None:
+                        continue
+                    if kind == "verify":
+                        verdict = self._verify_artist_credit(song.get("id"), artist.genius_id)
+                        time.sleep(DELAY_BETWEEN_REQUESTS)
+                        track = self._track_from_verdict(song, artist, verdict)
+                        if track is None:
+                            continue
+                    else:
+                        track = self._track_from_song(song, artist, is_feat=kind == "feat")
 
                     tracks.append(track)
 
                     if len(tracks) >= max_songs:
                         break
 
-                    time.sleep(DELAY_BETWEEN_REQUESTS)
-
                 page += 1
 
                 if len(songs) < per_page:
@@ -420,6 +375,90 @@ class GeniusAPI:
 
         return tracks
 
+    def _classify_listed_song(
+        self, song: dict, artist: Artist, include_features: bool, include_secondary: bool
+    ) -> str | None:
+        """Sort d'un morceau de la liste `/artists/{id}/songs` : 'primary' |
+        'feat' | 'verify' (à vérifier au détail, rôles secondaires) | None (jeté)."""
+        primary = song.get("primary_artist") or {}
+        if primary.get("id") == artist.genius_id:
+            return "primary"
+        if not include_features:
+            return None
+        # L'API renvoie aussi les morceaux où l'artiste a un rôle
+        # secondaire (writer, producer...) ou est mal tagué.
+        # Garder : 1) VRAIS feats (id dans featured_artists),
+        # 2) co-primaires (id dans primary_artists), 3) collab par nom
+        # ("Limsa d'Aulnay & Isha" — mais PAS "Vasjan & ISHA!").
+        featured_ids = self._collect_artist_ids(song.get("featured_artists"))
+        # primary_artists (pluriel) = co-artistes principaux (collab) ;
+        # un co-primaire n'est PAS dans featured_artists → test par ID indispensable.
+        primary_ids = self._collect_artist_ids(song.get("primary_artists"))
+        try:
+            aid = int(artist.genius_id)
+        except (TypeError, ValueError):
+            aid = artist.genius_id
+        is_collab_page = self._primary_is_collab_with(primary.get("name", ""), artist.name)
+        if aid in featured_ids or aid in primary_ids or is_collab_page:
+            return "feat"
+        if not include_secondary:
+            logger.debug(
+                f"Ignoré (rôle secondaire/tag douteux): "
+                f"{song.get('title')} — primary='{primary.get('name')}' "
+                f"feat_ids={featured_ids} prim_ids={primary_ids} aid={aid}"
+            )
+            return None
+        # Mode rôles secondaires : on VÉRIFIE au détail que c'est
+        # bien NOTRE artiste (id exact) et on récupère son rôle.
+        return "verify"
+
+    def _track_from_verdict(self, song: dict, artist: Artist, verdict) -> Track | None:
+        """Track d'un morceau vérifié au détail (`_credit_in_song`), None si non crédité."""
+        primary = song.get("primary_artist") or {}
+        if verdict is None:
+            logger.debug(
+                f"Ignoré (non crédité au détail / id ≠): {song.get('title')} "
+                f"— primary='{primary.get('name')}'"
+            )
+            return None
+        kind, role = verdict
+        if kind == "primary":
+            return self._track_from_song(song, artist, is_feat=False)  # liste sous-déclarée
+        if kind == "feat":
+            return self._track_from_song(song, artist, is_feat=True)  # feat sous-déclaré
+        logger.info(f"🎙️ Rôle secondaire gardé: {song.get('title')} — {artist.name} = {role}")
+        return self._track_from_song(song, artist, is_feat=True, secondary_role=role)
+
+    def _track_from_song(
+        self, song: dict, artist: Artist, *, is_feat: bool, secondary_role: str | None = None
+    ) -> Track:
+        """Track depuis une entrée de la liste `/artists/{id}/songs`."""
+        primary = song.get("primary_artist") or {}
+        track = Track(
+            title=song.get("title", ""),
+            artist=artist,
+            genius_id=song.get("id"),
+            genius_url=song.get("url"),
+            album=self._extract_album_from_song(song),
+            release_date=self._extract_release_date_from_song(song),
+            is_featuring=is_feat,
+        )
+        track.secondary_role = secondary_role
+        # Chantier « Media » : pochettes (morceau + album) sur le
+        # chemin réel. `album_cover_url` = transitoire (non persisté),
+        # consommé par media_enricher en fallback de Deezer.
+        art, album_cover = self._extract_song_art(song)
+        if art:
+            track.media.artwork_url = art
+        if album_cover:
+            track.album_cover_url = album_cover
+        if is_feat and primary.get("name"):
+            track.primary_artist_name = primary["name"]
+            logger.debug(
+                f"Featuring (fallback): {track.title} (artiste principal: {primary['name']})"
+            )
+        return track
+
     def _prefill_via_song_api(
         self, tracks: list[Track], known_genius_ids: set | None = None
     ) -> None:
@@ -435,14 +474,9 @@ class GeniusAPI:
         sont exclus → l'API media/album n'est appelée que pour les nouveaux titres
         et les connus incomplets.
         """
-        known = known_genius_ids or set()
-        # Feats INCLUS depuis 2026-07-02 : leur media (Spotify ID / lien YouTube)
-        # est nécessaire aux streams (étape feats YTM) et à l'affichage — les
-        # attendre jusqu'à l'enrichissement laissait p.ex. Bitume Caviar 2 sans
-        # lien YouTube. L'exclusion des "déjà complets" (mode MàJ) limite le coût.
-        targets = [t for t in tracks if self._needs_song_api(t) and t.genius_id not in known]
+        targets = self._prefill_targets(tracks, known_genius_ids)
         if not targets:
-            if known:
+            if known_genius_ids:
                 logger.info("🎫 Genius API : aucun nouveau morceau à enrichir (MàJ)")
             return
         n_feats = sum(1 for t in targets if t.is_featuring)
@@ -457,6 +491,16 @@ class GeniusAPI:
             time.sleep(DELAY_BETWEEN_REQUESTS)
         logger.info(f"🎫 Genius API : {n}/{len(targets)} morceau(x) enrichi(s)")
 
+    @classmethod
+    def _prefill_targets(cls, tracks: list[Track], known_genius_ids: set | None) -> list[Track]:
+        """Morceaux à passer à l'endpoint détail (commun sync/async)."""
+        known = known_genius_ids or set()
+        # Feats INCLUS depuis 2026-07-02 : leur media (Spotify ID / lien YouTube)
+        # est nécessaire aux streams (étape feats YTM) et à l'affichage — les
+        # attendre jusqu'à l'enrichissement laissait p.ex. Bitume Caviar 2 sans
+        # lien YouTube. L'exclusion des "déjà complets" (mode MàJ) limite le coût.
+        return [t for t in tracks if cls._needs_song_api(t) and t.genius_id not in known]
+
     @staticmethod
     def _needs_song_api(track: "Track") -> bool:
         """True si album/Spotify/YouTube/relations manquent (→ un appel détail utile).
@@ -518,7 +562,10 @@ class GeniusAPI:
         except (requests.RequestException, AssertionError) as e:
             logger.warning(f"genius.song échec '{track.title}': {e}")
             return False
-        song = (data or {}).get("song") or {}
+        return self._apply_song_payload(track, (data or {}).get("song") or {})
+
+    def _apply_song_payload(self, track: "Track", song: dict) -> bool:
+        """Pose sur `track` ce que fournit un détail `/songs/{id}` (commun sync/async)."""
         changed = False
 
         album = song.get("album")
@@ -558,6 +605,218 @@ class GeniusAPI:
 
         return changed
 
+    # ── Voie ASYNC : discographie + prefill sur l'AsyncHttpSession partagée ──
+
+    async def _api_get_async(
+        self, http: "AsyncHttpSession", path: str, params: dict | None = None
+    ) -> dict | None:
+        """Jumeau async de `Sender._make_request` (lyricsgenius) : GET authentifié,
+        contenu de `response`. Mêmes retries (GENIUS_RETRIES) sur 5xx/429/réseau ;
+        None en cas d'échec (frontière : l'appelant garde le partiel)."""
+        headers = {"Authorization": f"Bearer {GENIUS_API_KEY}"}
+        last_err = None
+        for attempt in range(GENIUS_RETRIES + 1):
+            try:
+                r = await http.get(
+                    f"{API_ROOT}/{path}", params=params, headers=headers, timeout=GENIUS_TIMEOUT
+                )
+                if r.status_code == 200:
+                    payload = r.json()
+                    return payload.get("response", payload)
+                last_err = f"HTTP {r.status_code}"
+                if r.status_code < 500 and r.status_code != 429:
+                    break  # 401/404… : inutile de réessayer
+            except (httpx.HTTPError, ValueError) as e:
+                last_err = str(e)
+            if attempt < GENIUS_RETRIES:
+                await asyncio.sleep(max(GENIUS_SLEEP_TIME, 0.5) * (attempt + 1))
+        logger.warning(f"Genius {path} échec ({last_err})")
+        return None
+
+    async def _song_async(self, http: "AsyncHttpSession", song_id) -> dict | None:
+        """Jumeau async de `genius.song` : détail `/songs/{id}` (None si échec)."""
+        data = await self._api_get_async(http, f"songs/{song_id}", {"text_format": "plain"})
+        return data.get("song") if data else None
+
+    async def _artist_songs_page_async(
+        self, http: "AsyncHttpSession", artist_id, page: int
+    ) -> list[dict] | None:
+        """Une page de `/artists/{id}/songs` (tri popularité, comme la voie sync)."""
+        data = await self._api_get_async(
+            http,
+            f"artists/{artist_id}/songs",
+            {"sort": "popularity", "per_page": _PER_PAGE, "page": page},
+        )
+        if data is None:
+            return None
+        return data.get("songs") or []
+
+    async def _tracks_from_page_async(
+        self,
+        http: "AsyncHttpSession",
+        songs: list[dict],
+        artist: Artist,
+        include_features: bool,
+        include_secondary: bool,
+    ) -> list[Track]:
+        """Tracks d'une page ; les vérifications au détail partent en parallèle."""
+        kinds = [
+            self._classify_listed_song(song, artist, include_features, include_secondary)
+            for song in songs
+        ]
+        to_verify = [song for song, kind in zip(songs, kinds, strict=True) if kind == "verify"]
+        details = await asyncio.gather(*(self._song_async(http, s.get("id")) for s in to_verify))
+        verdicts = {
+            id(song): self._credit_in_song(detail, artist.genius_id) if detail else None
+            for song, detail in zip(to_verify, details, strict=True)
+        }
+        tracks = []
+        for song, kind in zip(songs, kinds, strict=True):
+            if kind == "verify":
+                track = self._track_from_verdict(song, artist, verdicts[id(song)])
+            elif kind is not None:
+                track = self._track_from_song(song, artist, is_feat=kind == "feat")
+            else:
+                track = None
+            if track is not None:
+                tracks.append(track)
+        return tracks
+
+    async def iter_artist_songs_async(
+        self,
+        http: "AsyncHttpSession",
+        artist: Artist,
+        max_songs: int = 200,
+        include_features: bool = False,
+        include_secondary: bool = False,
+        pages_ahead: int = GENIUS_PAGES_AHEAD,
+    ) -> AsyncIterator[list[Track]]:
+        """Jumeau async de `_get_artist_songs_manual`, en flux : rend les Tracks
+        page par page, dans l'ordre, dès que chaque page est lue.
+
+        `pages_ahead` pages sont demandées d'avance (le nombre total n'est connu
+        qu'à la dernière, plus courte) ; celles devenues inutiles — fin de liste,
+        `max_songs` atteint, consommateur qui s'arrête — sont annulées.
+        """
+        if not artist.genius_id:
+            logger.error(f"Pas d'ID Genius pour {artist.name}")
+            return
+        # Pas plus d'avance que les pages nécessaires si rien n'était filtré
+        window = max(1, min(int(pages_ahead), -(-max_songs // _PER_PAGE)))
+        pending: dict[int, asyncio.Task] = {}
+        next_page, page, count = 1, 1, 0
+        try:
+            while count < max_songs:
+                while next_page < page + window:
+                    pending[next_page] = asyncio.ensure_future(
+                        self._artist_songs_page_async(http, artist.genius_id, next_page)
+                    )
+                    next_page += 1
+                songs = await pending.pop(page)
+                if not songs:
+                    break
+                tracks = await self._tracks_from_page_async(
+                    http, songs, artist, include_features, include_secondary
+                )
+                tracks = tracks[: max_songs - count]
+                count += len(tracks)
+                if tracks:
+                    yield tracks
+                if len(songs) < _PER_PAGE:
+                    break
+                page += 1
+        finally:
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    async def apply_song_metadata_async(self, http: "AsyncHttpSession", track: "Track") -> bool:
+        """Jumeau async d'`apply_song_metadata` (un `GET /songs/{id}`)."""
+        if not track.genius_id:
+            return False
+        song = await self._song_async(http, track.genius_id)
+        if song is None:
+            return False
+        return self._apply_song_payload(track, song)
+
+    async def prefill_track_async(self, http: "AsyncHttpSession", track: "Track") -> bool:
+        """Prefill d'UN morceau (pipeline d'import) : appel détail seulement si
+        album/Spotify/YouTube/relations manquent (`_needs_song_api`)."""
+        if not self._needs_song_api(track):
+            return False
+        return await self.apply_song_metadata_async(http, track)
+
+    async def get_artist_songs_async(
+        self,
+        http: "AsyncHttpSession",
+        artist: Artist,
+        max_songs: int = 200,
+        include_features: bool = False,
+        prefill: bool = True,
+        known_genius_ids: set | None = None,
+        include_secondary: bool = False,
+        on_tracks: Callable[[list[Track]], None] | None = None,
+    ) -> list[Track]:
+        """Jumeau async de `get_artist_songs` (mêmes options, même retour).
+
+        Le prefill (album/Spotify/YouTube/relations) des morceaux d'une page part
+        dès sa lecture, en parallèle des pages suivantes — seulement pour ceux
+        qui en ont besoin (`_prefill_targets`). `on_tracks(page)` est appelé à
+        chaque page reçue (progression), depuis la boucle.
+        """
+        tracks: list[Track] = []
+        targets: list[Track] = []
+        prefills: list[asyncio.Task] = []
+        logger.info(
+            f"Récupération des morceaux de {artist.name} "
+            f"(include_features={include_features}, async)"
+        )
+        try:
+            async for batch in self.iter_artist_songs_async(
+                http,
+                artist,
+                max_songs,
+                include_features=include_features,
+                include_secondary=include_secondary,
+            ):
+                tracks.extend(batch)
+                if prefill:
+                    batch_targets = self._prefill_targets(batch, known_genius_ids)
+                    targets.extend(batch_targets)
+                    prefills.extend(
+                        asyncio.ensure_future(self.apply_song_metadata_async(http, t))
+                        for t in batch_targets
+                    )
+                if on_tracks is not None:
+                    on_tracks(batch)
+            log_api("Genius", f"artist/{artist.genius_id}/songs", True)
+
+            if not prefill:
+                logger.info("⏭️ Prefill API (album/media) désactivé pour cette récupération")
+            elif prefills:
+                n_feats = sum(1 for t in targets if t.is_featuring)
+                logger.info(
+                    f"🎫 Genius API (album/Spotify/YouTube/relations) : "
+                    f"{len(prefills)} morceau(x) dont {n_feats} feat(s)…"
+                )
+                done = await asyncio.gather(*prefills)
+                logger.info(f"🎫 Genius API : {sum(done)}/{len(prefills)} morceau(x) enrichi(s)")
+            elif known_genius_ids:
+                logger.info("🎫 Genius API : aucun nouveau morceau à enrichir (MàJ)")
+
+            logger.info(f"{len(tracks)} morceaux récupérés pour {artist.name}")
+            return tracks
+
+        except Exception:
+            # Même dernier ressort que la voie sync : bug d'orchestration → trace
+            # complète, on rend les morceaux déjà collectés.
+            logger.exception("Erreur lors de la récupération des morceaux (async)")
+            log_api("Genius", "artist/songs", False)
+            return tracks
+        finally:
+            for task in prefills:
+                task.cancel()
+
     # ── Import d'album complet via l'API WEB genius.com ───────────────────────
     # /artists/{id}/songs OMET les morceaux aux paroles 'incomplete' (cas
     # "Vas-y chante" : 2/14 récupérés). La page album les liste tous →
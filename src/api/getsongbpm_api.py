@@ -7,7 +7,6 @@ IMPORTANT: Backlink obligatoire vers getsongbpm.com pour usage gratuit
 
 import asyncio
 import csv
-import json
 import os
 import sys
 import time
@@ -17,6 +16,8 @@ from typing import TYPE_CHECKING
 import httpx
 import requests
 
+from src.persistence.kv_cache import KVCache, default_kv_cache
+
 if TYPE_CHECKING:
     from src.api.async_http import AsyncHttpSession
 
@@ -64,13 +65,13 @@ class GetSongBPMFetcher:
     RATE_LIMIT_DELAY = 1.2  # ~1.2s entre requêtes = ~3000/heure max
     MAX_RETRIES = 3
 
-    def __init__(self, api_key: str | None = None, cache_file: str = "getsongbpm_cache.json"):
+    def __init__(self, api_key: str | None = None, cache: KVCache | None = None):
         """
         Initialise le client GetSongBPM
 
         Args:
             api_key: Clé API (optionnel si GETSONGBPM_API_KEY définie en variable d'environnement)
-            cache_file: Fichier de cache JSON
+            cache: Cache clé-valeur partagé (défaut : data/cache.db), espace « getsongbpm »
         """
         # Charger la clé API depuis l'environnement si non fournie
         self.api_key = api_key or os.getenv("GETSONGBPM_API_KEY")
@@ -81,8 +82,7 @@ class GetSongBPMFetcher:
                 "d'environnement ou passez api_key au constructeur. "
                 "Obtenez votre clé sur: https://getsongbpm.com/api"
             )
-        self.cache_file = cache_file
-        self.cache = self._load_cache()
+        self.cache = (cache or default_kv_cache()).namespace("getsongbpm")
         self.session = requests.Session()
 
         # NB : l'auth passe UNIQUEMENT par le paramètre d'URL `api_key` (vérifié).
@@ -104,22 +104,6 @@ class GetSongBPMFetcher:
         except (ValueError, TypeError):
             return None
 
-    def _load_cache(self) -> dict:
-        """Charge le cache depuis le fichier"""
-        try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
-    def _save_cache(self):
-        """Sauvegarde le cache dans le fichier"""
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            print(f"⚠ Erreur sauvegarde cache: {e}")
-
     def _get_cache_key(self, artist: str, title: str) -> str:
         """Génère une clé de cache unique"""
         return f"{artist.lower().strip()}::{title.lower().strip()}"
@@ -356,7 +340,6 @@ class GetSongBPMFetcher:
 
         # Mettre en cache
         self.cache[self._get_cache_key(artist, title)] = song.__dict__
-        self._save_cache()
 
         return song
 
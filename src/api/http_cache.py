@@ -0,0 +1,311 @@
+"""Cache disque des réponses HTTP de la session async (`AsyncHttpSession`).
+
+Un batch repose souvent la même question : recherche Deezer de l'invité d'un
+featuring, `/search` LRCLIB des titres d'un même album, relance après un crash.
+`ResponseCache` garde les réponses des domaines listés dans `CACHE_TTLS` dans
+une base SQLite (`data/http_cache.db`) :
+
+  · TTL par domaine, plus court pour les réponses NÉGATIVES (404, résultat
+    vide) — un morceau absent aujourd'hui peut apparaître demain ; les
+    erreurs applicatives servies en 200 (`{"error": …}` de Deezer : quota,
+    jeton) ne sont jamais stockées ;
+  · revalidation : une entrée périmée porteuse d'`ETag`/`Last-Modified` est
+    redemandée en conditionnel, un 304 la prolonge sans retélécharger ;
+  · taille bornée, éviction LRU (dernier accès).
+
+Les clés sont des empreintes SHA-256 (URL complète + en-têtes) : aucune clé
+d'API n'est écrite en clair. Seuls les corps décodés et quelques en-têtes
+utiles sont stockés. Accès SQLite synchrones et courts, depuis la boucle.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class CacheTTL:
+    """Durées de vie (s) d'une réponse positive et d'une réponse négative."""
+
+    ok: float
+    negative: float
+
+
+# Domaines mis en cache. Musixmatch est exclu : réponses liées au jeton de
+# session (et pages de captcha servies en 200).
+CACHE_TTLS: dict[str, CacheTTL] = {
+    "api.deezer.com": CacheTTL(ok=7 * DAY, negative=DAY),
+    "lrclib.net": CacheTTL(ok=30 * DAY, negative=3 * DAY),
+    "api.getsong.co": CacheTTL(ok=30 * DAY, negative=3 * DAY),
+    "api.reccobeats.com": CacheTTL(ok=7 * DAY, negative=DAY),
+}
+
+# En-têtes conservés avec le corps (le corps stocké est DÉCODÉ : surtout pas
+# de Content-Encoding, httpx le décompresserait une seconde fois).
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+_NEGATIVE_STATUSES = frozenset({404, 410})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    key TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_http_responses_accessed ON http_responses (accessed_at);
+"""
+
+
+def request_key(request: httpx.Request) -> str:
+    """Empreinte d'une requête : méthode, URL complète (params inclus), en-têtes."""
+    headers = "\n".join(f"{k}:{v}" for k, v in sorted(request.headers.items()))
+    raw = f"{request.method} {request.url}\n{headers}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _json_payload(response: httpx.Response):
+    """Corps JSON décodé, None si la réponse n'est pas du JSON valide."""
+    if "json" not in response.headers.get("content-type", ""):
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+def is_api_error(response: httpx.Response) -> bool:
+    """Erreur applicative servie en 200 : JSON porteur d'une clé `error`.
+
+    Deezer signale ainsi quota dépassé (code 4), jeton invalide… — une erreur
+    TRANSITOIRE : la mettre en cache la resservirait pendant tout le TTL.
+    """
+    payload = _json_payload(response)
+    return isinstance(payload, dict) and "error" in payload
+
+
+def is_negative(response: httpx.Response) -> bool:
+    """404/410, ou 200 dont le JSON est vide (`[]`, `{}`, `{"data": []…}`)."""
+    if response.status_code in _NEGATIVE_STATUSES:
+        return True
+    payload = _json_payload(response)
+    if isinstance(payload, dict) and payload and "data" in payload:
+        payload = payload["data"]
+    return payload in ([], {})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Réponse relue du cache (fraîche ou à revalider)."""
+
+    status: int
+    headers: dict
+    body: bytes
+    fresh: bool
+
+    @property
+    def validators(self) -> dict:
+        """En-têtes de requête conditionnelle (vide : rien à revalider)."""
+        conditional = {}
+        if "etag" in self.headers:
+            conditional["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            conditional["If-Modified-Since"] = self.headers["last-modified"]
+        return conditional
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status, headers=self.headers, content=self.body, request=request)
+
+
+class ResponseCache:
+    """Cache SQLite des réponses GET, TTL par domaine + LRU borné en octets."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttls: Mapping[str, CacheTTL] = CACHE_TTLS,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._ttls = {k.lower(): v for k, v in ttls.items()}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM http_responses"
+        ).fetchone()[0]
+
+    def ttl(self, host: str) -> CacheTTL | None:
+        """TTL d'un hôte (sous-domaines compris) ; None = domaine non mis en cache."""
+        host = host.lower()
+        while host:
+            if host in self._ttls:
+                return self._ttls[host]
+            host = host.partition(".")[2]
+        return None
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        """Entrée stockée (même périmée : l'appelant revalide) ; marque l'accès."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, expires_at FROM http_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_responses SET accessed_at = ? WHERE key = ?", (self._clock(), key)
+            )
+            self._conn.commit()
+        status, headers, body, expires_at = row
+        return CachedResponse(status, json.loads(headers), body, self._clock() < expires_at)
+
+    def store(self, key: str, response: httpx.Response) -> bool:
+        """Garde `response` si son domaine est cacheable ; renvoie True si stockée."""
+        ttl = self.ttl(response.request.url.host)
+        if ttl is None or "no-store" in response.headers.get("cache-control", ""):
+            return False
+        if response.status_code != 200 and response.status_code not in _NEGATIVE_STATUSES:
+            return False
+        if is_api_error(response):
+            return False
+        negative = is_negative(response)
+        lifetime = ttl.negative if negative else ttl.ok
+        headers = {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers}
+        body = response.content
+        now = self._clock()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM http_responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_responses "
+                "(key, domain, status, headers, body, size, negative, stored_at, expires_at, "
+                "accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.request.url.host,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    negative,
+                    now,
+                    now + lifetime,
+                    now,
+                ),
+            )
+            self._bytes += len(body) - (previous[0] if previous else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+        return True
+
+    def refresh(self, key: str, host: str) -> None:
+        """304 reçu : l'entrée repart pour un TTL complet (positif ou négatif)."""
+        ttl = self.ttl(host)
+        if ttl is None:
+            return
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_responses SET accessed_at = :now, expires_at = :now + "
+                "CASE WHEN negative THEN :negative ELSE :ok END WHERE key = :key",
+                {"now": now, "negative": ttl.negative, "ok": ttl.ok, "key": key},
+            )
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """LRU : supprime les entrées les moins récemment lues jusqu'à 90 % du plafond."""
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM http_responses ORDER BY accessed_at"
+        ).fetchall():
+            if self._bytes <= target:
+                break
+            self._conn.execute("DELETE FROM http_responses WHERE key = ?", (key,))
+            self._bytes -= size
+            evicted += 1
+        logger.debug(f"Cache HTTP : {evicted} réponse(s) évincée(s) (LRU)")
+
+    def purge_expired(self) -> int:
+        """Supprime les entrées périmées SANS validateur (rien à revalider)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, size, headers FROM http_responses WHERE expires_at <= ?",
+                (self._clock(),),
+            ).fetchall()
+            dead = [(key, size) for key, size, headers in rows if not _has_validator(headers)]
+            self._conn.executemany(
+                "DELETE FROM http_responses WHERE key = ?", [(key,) for key, _ in dead]
+            )
+            self._bytes -= sum(size for _, size in dead)
+            self._conn.commit()
+        return len(dead)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _has_validator(headers_json: str) -> bool:
+    headers = json.loads(headers_json)
+    return "etag" in headers or "last-modified" in headers
+
+
+_default_cache: ResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_response_cache() -> ResponseCache | None:
+    """Cache partagé de l'app (`data/http_cache.db`), None si désactivé.
+
+    Réglages : HTTP_CACHE_ENABLED, HTTP_CACHE_MAX_MB. Ouvert une fois par
+    processus, au premier appel.
+    """
+    global _default_cache
+    from src.config import DATA_DIR, HTTP_CACHE_ENABLED, HTTP_CACHE_MAX_MB
+
+    if not HTTP_CACHE_ENABLED:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = ResponseCache(
+                    DATA_DIR / "http_cache.db", max_bytes=HTTP_CACHE_MAX_MB * 1024 * 1024
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Cache HTTP indisponible: {e}")
+                return None
+    return _default_cache
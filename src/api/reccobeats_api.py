@@ -4,7 +4,6 @@ Responsabilité UNIQUE : Récupérer les données musicales (BPM, Key, Mode) dep
 Le scraping Spotify ID est géré par SpotifyIDScraper (module séparé)
 """
 
-import json
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -12,6 +11,8 @@ from typing import TYPE_CHECKING
 import httpx
 import requests
 
+from src.persistence.kv_cache import KVCache, default_kv_cache
+
 if TYPE_CHECKING:
     from src.api.async_http import AsyncHttpSession
 
@@ -26,16 +27,15 @@ _ASYNC_HEADERS = {"Accept": "application/json", "User-Agent": "ReccoBeats-Python
 class ReccoBeatsIntegratedClient:
     """Client ReccoBeats pour récupération BPM/Key/Mode/Audio Features"""
 
-    def __init__(self, cache_file: str = "reccobeats_cache.json", headless: bool = False):
+    def __init__(self, cache: KVCache | None = None, headless: bool = False):
         """
         Initialise le client ReccoBeats
 
         Args:
-            cache_file: Fichier de cache JSON
+            cache: Cache clé-valeur partagé (défaut : data/cache.db), espace « reccobeats »
             headless: Paramètre conservé pour compatibilité (non utilisé)
         """
-        self.cache_file = cache_file
-        self.cache = self._load_cache()
+        self.cache = (cache or default_kv_cache()).namespace("reccobeats")
 
         # Configuration ReccoBeats API
         self.recco_base_url = "https://api.reccobeats.com/v1"
@@ -46,22 +46,6 @@ class ReccoBeatsIntegratedClient:
 
         logger.info("ReccoBeats client initialisé")
 
-    def _load_cache(self) -> dict:
-        """Charge le cache depuis le fichier"""
-        try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
-    def _save_cache(self):
-        """Sauvegarde le cache"""
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            logger.error(f"Erreur sauvegarde cache: {e}")
-
     def _get_cache_key(self, spotify_id: str) -> str:
         """Génère une clé de cache basée sur l'ID Spotify"""
         return f"spotify_id::{spotify_id}"
@@ -239,7 +223,6 @@ class ReccoBeatsIntegratedClient:
 
             # Sauvegarder en cache
             self.cache[cache_key] = result
-            self._save_cache()
 
             logger.info(f"✅ Succès complet pour Spotify ID: {spotify_id}")
             return result
@@ -277,7 +260,6 @@ class ReccoBeatsIntegratedClient:
             )
 
             self.cache[cache_key] = result
-            self._save_cache()
 
             logger.info(f"✅ Succès complet pour Spotify ID: {spotify_id}")
             return result
@@ -311,7 +293,6 @@ class ReccoBeatsIntegratedClient:
         """Mémorise un échec « not_found » (commun sync/async)."""
         logger.warning(f"❌ Aucune donnée ReccoBeats pour {label}")
         self.cache[cache_key] = {"error": "not_found", "timestamp": time.time()}
-        self._save_cache()
 
     @staticmethod
     def _base_spotify_result(spotify_id: str, track_data: dict) -> dict:
@@ -457,7 +438,6 @@ class ReccoBeatsIntegratedClient:
             )
 
             self.cache[cache_key] = result
-            self._save_cache()
             logger.info(f"✅ Succès complet pour ISRC: {isrc}")
             return result
         except Exception:
@@ -492,7 +472,6 @@ class ReccoBeatsIntegratedClient:
             )
 
             self.cache[cache_key] = result
-            self._save_cache()
             logger.info(f"✅ Succès complet pour ISRC: {isrc}")
             return result
         except Exception:
@@ -607,7 +586,7 @@ class ReccoBeatsIntegratedClient:
             "total_entries": total,
             "successful_entries": success,
             "error_entries": errors,
-            "cache_file": self.cache_file,
+            "cache_db": str(self.cache.store.path),
         }
 
     def close(self):
@@ -0,0 +1,459 @@
+"""Batch HEADLESS multi-artistes, sans la GUI Tk : `python -m src.batch`.
+
+Les flux lourds (enrichissement, paroles synchro, streams, certifications)
+sont câblés dans `MainWindow` (dialogues CTk, `root.after`) : impossible de
+les planifier la nuit sur un serveur ou de traiter plusieurs artistes à la
+fois. Ce point d'entrée pilote les mêmes briques GUI-free pour une liste
+d'artistes DÉJÀ en base :
+
+  · par artiste, les morceaux traversent `run_pipeline` : enrichissement
+    (`DataEnricher.enrich_track_async`) → paroles synchro (`LyricsProvider`,
+    résolveur `synced_lyrics_resolver`) → certifications
+    (`apply_certifications`) → `save_tracks` par lots ; puis les streams
+    Kworb / YouTube Music (`StreamsProvider` → `update_kworb_streams`,
+    `update_ytmusic_streams`), qui écrivent eux-mêmes en base ;
+  · plusieurs artistes en vol sur LA boucle unique (`async_loop`,
+    `--artists`), `--concurrency` morceaux en vol par artiste ;
+  · `--processes N` : les artistes (indépendants) répartis sur un pool de
+    processus, chacun avec sa boucle et ses clients ;
+  · progression lisible par machine sur stdout, une ligne JSON par
+    événement (`artist_start`, `progress`, `step`, `artist_done`,
+    `artist_error`, `done`) — les logs restent dans `data/logs/`, et tout
+    autre `print()` (messages des clients API…) part sur stderr pendant le
+    run (`reserved_stdout`) : `> progress.jsonl` ne reçoit que du JSON.
+
+    python -m src.batch "Isha" "Damso" --steps enrich,certs --artists 2
+    python -m src.batch --file artistes.txt --processes 3 > progress.jsonl
+
+Code de sortie : 0 si tous les artistes sont passés, 1 sinon.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from src.concurrency import async_loop
+from src.concurrency.bounded import run_bounded
+from src.concurrency.pipeline import Stage, StageStats, run_pipeline
+from src.config import ENRICH_CONCURRENCY
+from src.utils.artist_onboarding import SAVE_BATCH_SIZE, SYNC_CONCURRENCY, lyrics_artist_name
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Étapes (ordre d'exécution par artiste)
+STEP_ENRICH = "enrich"
+STEP_LYRICS = "lyrics"
+STEP_CERTS = "certs"
+STEP_KWORB = "kworb"
+STEP_YTM = "ytm"
+ALL_STEPS = (STEP_ENRICH, STEP_LYRICS, STEP_CERTS, STEP_KWORB, STEP_YTM)
+TRACK_STEPS = (STEP_ENRICH, STEP_LYRICS, STEP_CERTS)  # passent par le pipeline
+STAGE_SAVE = "save"
+
+# Au plus une ligne `progress` par artiste et par intervalle (s)
+PROGRESS_INTERVAL = 0.5
+
+
+@dataclass
+class BatchOptions:
+    """Paramètres d'un run (picklable : transmis tels quels au pool de processus)."""
+
+    steps: tuple[str, ...] = ALL_STEPS
+    sources: list[str] | None = None  # sources d'enrichissement ; None = disponibles
+    force_update: bool = False
+    concurrency: int = ENRICH_CONCURRENCY  # morceaux en vol par artiste
+    artists_concurrency: int = 1  # artistes en vol par processus
+    progress_interval: float = PROGRESS_INTERVAL
+
+
+@dataclass
+class ArtistReport:
+    """Bilan d'un artiste (dernière ligne `artist_done` / `artist_error`)."""
+
+    artist: str
+    ok: bool = True
+    tracks: int = 0
+    stages: dict[str, dict] = field(default_factory=dict)
+    steps: dict[str, dict] = field(default_factory=dict)
+    error: str | None = None
+    elapsed: float = 0.0
+
+
+class JsonLinesEmitter:
+    """Événements de progression, une ligne JSON par appel (thread-safe).
+
+    `progress` est limité à une ligne par artiste et par `interval` secondes
+    (le pipeline rappelle après CHAQUE morceau de CHAQUE étage) ; le bilan
+    final de l'artiste passe toujours.
+    """
+
+    def __init__(self, stream=None, *, interval: float = PROGRESS_INTERVAL, clock=time.monotonic):
+        self.stream = stream
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_progress: dict[str, float] = {}
+
+    def __call__(self, event: str, **fields) -> None:
+        line = json.dumps(
+            {"ts": round(time.time(), 3), "event": event, **fields},
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._lock:
+            stream = self.stream or sys.stdout
+            stream.write(line + "\n")
+            stream.flush()
+
+    def progress(self, artist: str, stats: dict[str, StageStats]) -> None:
+        now = self._clock()
+        if now - self._last_progress.get(artist, float("-inf")) < self.interval:
+            return
+        self._last_progress[artist] = now
+        self("progress", artist=artist, stages=_stats_dict(stats))
+
+
+@contextmanager
+def reserved_stdout(real=None) -> Iterator:
+    """Réserve stdout aux événements JSON le temps du run.
+
+    `sys.stdout` pointe sur stderr (un `print()` de client API — 429, 401,
+    erreur réseau — ne casse plus le flux) ; renvoie le vrai stdout (`real`,
+    défaut : `sys.stdout` courant), seul destinataire de `JsonLinesEmitter`.
+    """
+    real = real or sys.stdout
+    real.flush()
+    saved = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        yield real
+    finally:
+        sys.stdout = saved
+
+
+def _stats_dict(stats: dict[str, StageStats]) -> dict[str, dict]:
+    return {name: {"done": s.done, "failed": s.failed} for name, s in stats.items()}
+
+
+def _track_stages(artist, options: BatchOptions, *, data_manager, data_enricher, lyrics, matcher):
+    """Étages du pipeline d'un artiste (save en dernier si au moins une étape)."""
+    from src.utils.certification_enricher import apply_certifications
+
+    async def enrich(track):
+        await data_enricher.enrich_track_async(
+            track,
+            sources=options.sources,
+            force_update=options.force_update,
+            artist_tracks=artist.tracks,
+        )
+        return track
+
+    async def synced(track):
+        # Indices SQL (`has_*`) : ne force pas le chargement différé des paroles
+        need_sync = not track.lyrics.has_synced
+        need_text = not track.lyrics.has_text
+        if need_sync or need_text:
+            # Ponts LRCLIB/Musixmatch = run_sync → hors de la boucle (thread)
+            await asyncio.to_thread(
+                lyrics.enrich,
+                track,
+                lyrics_artist_name(track, artist),
+                need_sync=need_sync,
+                need_text=need_text,
+            )
+        return track
+
+    async def certs(track):
+        apply_certifications(artist, [track], matcher)  # offline, matcher en mémoire
+        return track
+
+    async def save(batch):
+        await asyncio.to_thread(data_manager.save_tracks, batch)
+
+    stages = []
+    if STEP_ENRICH in options.steps:
+        stages.append(Stage(STEP_ENRICH, enrich, concurrency=options.concurrency))
+    if STEP_LYRICS in options.steps:
+        stages.append(Stage(STEP_LYRICS, synced, concurrency=SYNC_CONCURRENCY))
+    if STEP_CERTS in options.steps:
+        stages.append(Stage(STEP_CERTS, certs))
+    if stages:
+        stages.append(Stage(STAGE_SAVE, save, batch_size=SAVE_BATCH_SIZE))
+    return stages
+
+
+def _fetch_streams(step: str, artist, data_manager, streams_factory) -> dict:
+    """Une étape streams (sync : Kworb / YTMusic), client créé puis fermé ici."""
+    provider = streams_factory()
+    try:
+        if step == STEP_KWORB:
+            return provider.fetch_spotify(artist, data_manager)
+        return provider.fetch_ytm(artist, data_manager)
+    finally:
+        provider.close()
+
+
+async def run_artist(
+    name: str,
+    options: BatchOptions,
+    *,
+    data_manager,
+    data_enricher=None,
+    lyrics=None,
+    matcher=None,
+    streams_factory: Callable | None = None,
+    emit: JsonLinesEmitter,
+) -> ArtistReport:
+    """Toutes les étapes demandées pour UN artiste. Ne lève pas : un échec
+    est rapporté (`artist_error`) sans interrompre les autres artistes."""
+    report = ArtistReport(artist=name)
+    started = time.monotonic()
+    try:
+        artist = await asyncio.to_thread(data_manager.get_artist_by_name, name)
+        if artist is None:
+            raise LookupError(f"artiste absent de la base : {name!r}")
+        report.artist, report.tracks = artist.name, len(artist.tracks)
+        emit("artist_start", artist=artist.name, tracks=report.tracks)
+
+        stages = _track_stages(
+            artist,
+            options,
+            data_manager=data_manager,
+            data_enricher=data_enricher,
+            lyrics=lyrics,
+            matcher=matcher,
+        )
+        if stages and artist.tracks:
+            result = await run_pipeline(
+                artist.tracks,
+                stages,
+                on_progress=lambda stats: emit.progress(artist.name, stats),
+            )
+            report.stages = _stats_dict(result.stats)
+
+        for step in (STEP_KWORB, STEP_YTM):
+            if step not in options.steps:
+                continue
+            try:
+                summary = await asyncio.to_thread(
+                    _fetch_streams, step, artist, data_manager, streams_factory
+                )
+                status = "error" if summary.get("error") else "ok"
+            except Exception as e:
+                logger.exception(f"Batch {artist.name} : étape {step} en échec")
+                summary, status = {"error": str(e)}, "error"
+            report.steps[step] = {"status": status, **_summary_counts(summary)}
+            emit("step", artist=artist.name, step=step, **report.steps[step])
+            report.ok = report.ok and status == "ok"
+    except Exception as e:
+        logger.exception(f"Batch {name} : artiste en échec")
+        report.ok, report.error = False, str(e)
+    report.elapsed = round(time.monotonic() - started, 2)
+    if report.error:
+        emit("artist_error", artist=report.artist, error=report.error)
+    else:
+        emit("artist_done", **asdict(report))
+    return report
+
+
+def _summary_counts(summary: dict) -> dict:
+    """Compteurs scalaires d'un résumé d'updater (listes de titres écartées)."""
+    return {k: v for k, v in summary.items() if isinstance(v, (int, float, str)) or v is None}
+
+
+async def run_batch(
+    names: list[str],
+    options: BatchOptions,
+    *,
+    emit: JsonLinesEmitter,
+    data_manager=None,
+    data_enricher=None,
+    lyrics=None,
+    streams_factory: Callable | None = None,
+) -> list[ArtistReport]:
+    """Les artistes de `names`, au plus `options.artists_concurrency` en vol.
+
+    Dépendances non fournies créées ici et fermées à la fin (« qui crée
+    ferme ») ; l'enricheur ferme toujours ses ressources de batch.
+    """
+    if data_manager is None:
+        from src.utils.data_manager import DataManager
+
+        data_manager = await asyncio.to_thread(DataManager)
+    if data_enricher is None and STEP_ENRICH in options.steps:
+        from src.utils.data_enricher import DataEnricher
+
+        data_enricher = DataEnricher(
+            headless_reccobeats=True, headless_songbpm=True, headless_spotify_scraper=True
+        )
+    owned_lyrics = lyrics is None and STEP_LYRICS in options.steps
+    if owned_lyrics:
+        from src.enrichment.providers.lyrics import LyricsProvider
+
+        lyrics = LyricsProvider(sync_musixmatch=False)
+    matcher = None
+    if STEP_CERTS in options.steps:
+        from src.utils.cert_matcher import get_cert_matcher
+
+        matcher = await asyncio.to_thread(get_cert_matcher)
+    if streams_factory is None:
+        from src.enrichment.providers.streams import StreamsProvider
+
+        streams_factory = StreamsProvider
+
+    async def one(name: str) -> ArtistReport:
+        return await run_artist(
+            name,
+            options,
+            data_manager=data_manager,
+            data_enricher=data_enricher,
+            lyrics=lyrics,
+            matcher=matcher,
+            streams_factory=streams_factory,
+            emit=emit,
+        )
+
+    try:
+        done = await run_bounded(names, one, limit=options.artists_concurrency)
+    finally:
+        if data_enricher is not None:
+            await data_enricher.aclose_batch()
+        if owned_lyrics:
+            # close() passe par run_sync (session async) → hors de la boucle
+            await asyncio.to_thread(lyrics.close)
+    return [report for _, report in done]
+
+
+def _run_in_process(
+    names: list[str], options: BatchOptions, emit: JsonLinesEmitter | None = None
+) -> list[dict]:
+    """Corps d'un processus du pool : sa propre boucle, ses propres clients.
+
+    `emit` absent (processus du pool) : stdout réservé ici, sur le stdout
+    d'origine du processus (`sys.__stdout__` : un fork hérite du stdout déjà
+    redirigé du parent).
+    """
+    if emit is None:
+        with reserved_stdout(sys.__stdout__) as out:
+            emit = JsonLinesEmitter(out, interval=options.progress_interval)
+            return _run_in_process(names, options, emit)
+    async_loop.start()
+    try:
+        return [asdict(r) for r in async_loop.run_sync(run_batch(names, options, emit=emit))]
+    finally:
+        async_loop.shutdown()
+
+
+def split_round_robin(names: list[str], parts: int) -> list[list[str]]:
+    """Répartit les artistes sur `parts` processus (sans paquet vide)."""
+    parts = max(1, min(int(parts), len(names)))
+    return [names[i::parts] for i in range(parts)]
+
+
+def _read_names(args) -> list[str]:
+    names = list(args.artists)
+    if args.file:
+        for line in Path(args.file).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                names.append(line)
+    return list(dict.fromkeys(names))
+
+
+def _parse_steps(value: str) -> tuple[str, ...]:
+    steps = tuple(s.strip() for s in value.split(",") if s.strip())
+    unknown = set(steps) - set(ALL_STEPS)
+    if unknown or not steps:
+        raise argparse.ArgumentTypeError(
+            f"étapes inconnues : {', '.join(sorted(unknown)) or '(aucune)'} "
+            f"— parmi {', '.join(ALL_STEPS)}"
+        )
+    return steps
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.batch",
+        description="Enrichissement multi-artistes sans GUI (progression JSON lines sur stdout)",
+    )
+    parser.add_argument("artists", nargs="*", help="noms d'artistes (déjà en base)")
+    parser.add_argument("--file", metavar="CHEMIN", help="un artiste par ligne (# = commentaire)")
+    parser.add_argument(
+        "--steps",
+        type=_parse_steps,
+        default=ALL_STEPS,
+        help=f"étapes, séparées par des virgules (défaut : {','.join(ALL_STEPS)})",
+    )
+    parser.add_argument(
+        "--sources",
+        type=lambda v: [s.strip() for s in v.split(",") if s.strip()],
+        help="sources d'enrichissement (défaut : toutes celles configurées)",
+    )
+    parser.add_argument(
+        "--force-update", action="store_true", help="re-interroger même si déjà renseigné"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=ENRICH_CONCURRENCY,
+        help=f"morceaux en vol par artiste (défaut : {ENRICH_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--artists", dest="artists_concurrency", type=int, default=1, help="artistes en vol"
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1, help="processus (artistes répartis, défaut : 1)"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    names = _read_names(args)
+    if not names:
+        parser.error("aucun artiste (arguments ou --file)")
+    options = BatchOptions(
+        steps=args.steps,
+        sources=args.sources,
+        force_update=args.force_update,
+        concurrency=max(1, args.concurrency),
+        artists_concurrency=max(1, args.artists_concurrency),
+    )
+    with reserved_stdout() as out:
+        emit = JsonLinesEmitter(out, interval=options.progress_interval)
+        emit("start", artists=names, steps=list(options.steps), processes=args.processes)
+
+        started = time.monotonic()
+        chunks = split_round_robin(names, args.processes)
+        if len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                reports = [
+                    report
+                    for chunk_reports in pool.map(_run_in_process, chunks, [options] * len(chunks))
+                    for report in chunk_reports
+                ]
+        else:
+            reports = _run_in_process(names, options, emit)
+
+        failed = [r["artist"] for r in reports if not r["ok"]]
+        emit(
+            "done",
+            ok=len(reports) - len(failed),
+            failed=failed,
+            elapsed=round(time.monotonic() - started, 2),
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
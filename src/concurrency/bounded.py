@@ -0,0 +1,87 @@
+"""Concurrence BORNÉE pour les batchs async (plusieurs unités de travail en vol).
+
+Deux primitives, pour la même boucle asyncio que `rate_limiter` :
+
+  · `run_bounded` — exécute une coroutine par élément, au plus `limit` à la
+    fois. Un nouvel élément ne démarre qu'après `should_stop()` (sémantique
+    « arrêt ENTRE deux unités » de `stop_requested`) : les éléments en vol
+    finissent proprement, les suivants ne démarrent pas ;
+  · `KeyedSlots` — `clé → asyncio.Semaphore(n)` : plafond d'unités en vol PAR
+    clé (p.ex. par provider d'enrichissement), en plus du rate-limit par
+    domaine — qui, lui, borne le débit réseau quelle que soit la concurrence.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+
+
+class KeyedSlots:
+    """Sémaphores par clé, créés au 1er usage avec la limite demandée."""
+
+    def __init__(self) -> None:
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def slot(self, key: str, limit: int):
+        """Section où au plus `limit` coroutines tiennent la clé `key`.
+
+        La limite est figée à la création du sémaphore de la clé. Les
+        sémaphores sont liés à une boucle : un usage depuis une autre boucle
+        (nouvel `asyncio.run`, tests) repart de sémaphores neufs.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._semaphores.clear()
+            self._loop = loop
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(max(1, int(limit)))
+        async with semaphore:
+            yield
+
+
+async def run_bounded(
+    items: Iterable,
+    worker: Callable[..., Awaitable],
+    *,
+    limit: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> list[tuple]:
+    """`worker(item)` pour chaque élément, au plus `limit` en parallèle.
+
+    Renvoie les `(item, résultat)` des éléments TERMINÉS, dans l'ordre des
+    éléments (pas celui de complétion). `limit=1` = boucle séquentielle
+    historique. Une exception d'un worker annule les autres et remonte ; une
+    annulation de l'appelant annule tous les workers en vol.
+    """
+    items = list(items)
+    limit = max(1, int(limit))
+    results: dict[int, object] = {}
+    running: set[asyncio.Task] = set()
+
+    async def _one(index: int, item) -> None:
+        results[index] = await worker(item)
+
+    async def _wait_one() -> None:
+        done, pending = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        running.intersection_update(pending)
+        for task in done:
+            task.result()  # relève l'exception d'un worker
+
+    try:
+        for index, item in enumerate(items):
+            while len(running) >= limit:
+                await _wait_one()
+            if should_stop is not None and should_stop():
+                break
+            running.add(asyncio.create_task(_one(index, item)))
+        while running:
+            await _wait_one()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    return [(items[index], results[index]) for index in sorted(results)]
@@ -0,0 +1,176 @@
+"""Pipeline ASYNC par étages reliés par des files BORNÉES (flux continu).
+
+`run_bounded` traite UNE étape pour une liste connue d'avance ; l'import d'un
+artiste enchaîne plusieurs étapes (prefill → scrape → enrichissement → save)
+sur des éléments qui arrivent au fil de l'eau (pages Genius). `run_pipeline` :
+
+  · chaque `Stage` a ses `concurrency` workers ; un élément passe à l'étage
+    suivant dès qu'il a fini le sien — le premier morceau est persisté sans
+    attendre la fin de la discographie ;
+  · files bornées (`queue_size`) : un étage lent freine les précédents
+    (backpressure) au lieu d'accumuler toute la discographie en mémoire ;
+  · étage par LOTS (`batch_size`, persistance) : le lot part plein, ou dès que
+    la file d'entrée est vide — pas d'attente artificielle ;
+  · une exception sur un élément est journalisée et comptée (`failed`) ;
+    l'élément POURSUIT avec ce qu'il a (un scrape raté n'empêche pas le save).
+    Un worker qui renvoie None écarte l'élément ;
+  · `should_stop()` (sémantique `stop_requested`) : plus rien n'est tiré de la
+    source, les éléments en vol terminent toutes les étapes ; une annulation de
+    l'appelant, elle, arrête tout.
+
+`on_progress(stats)` est appelé après chaque élément traité par un étage, avec
+un instantané des compteurs par étage. Même boucle unique que `bounded`.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DONE = object()  # sentinelle de fin de flux (une par worker de l'étage suivant)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Un étage : `worker(élément)` (ou `worker(lot)` si `batch_size`)."""
+
+    name: str
+    worker: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    queue_size: int | None = None  # file d'entrée ; None = 2 × concurrency
+    batch_size: int | None = None  # étage par lots (un seul worker)
+
+    @property
+    def workers(self) -> int:
+        return 1 if self.batch_size else max(1, int(self.concurrency))
+
+
+@dataclass
+class StageStats:
+    """Compteurs d'un étage."""
+
+    done: int = 0
+    failed: int = 0
+    in_flight: int = 0
+
+
+@dataclass
+class PipelineResult:
+    """Éléments sortis du dernier étage (ordre de complétion) + compteurs."""
+
+    items: list = field(default_factory=list)
+    stats: dict[str, StageStats] = field(default_factory=dict)
+    stopped: bool = False
+
+
+async def _aiter(source: AsyncIterable | Iterable):
+    if isinstance(source, AsyncIterable):
+        async with aclosing(aiter(source)) as items:
+            async for item in items:
+                yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def run_pipeline(
+    source: AsyncIterable | Iterable,
+    stages: Sequence[Stage],
+    *,
+    should_stop: Callable[[], bool] | None = None,
+    on_progress: Callable[[dict[str, StageStats]], None] | None = None,
+) -> PipelineResult:
+    """Fait passer chaque élément de `source` par `stages`, en flux."""
+    if not stages:
+        raise ValueError("run_pipeline : au moins un étage")
+    result = PipelineResult(stats={stage.name: StageStats() for stage in stages})
+    inboxes = [asyncio.Queue(maxsize=stage.queue_size or 2 * stage.workers) for stage in stages]
+
+    def progress() -> None:
+        if on_progress is not None:
+            on_progress({name: replace(s) for name, s in result.stats.items()})
+
+    async def emit(index: int, item) -> None:
+        if item is None:
+            return
+        if index + 1 < len(stages):
+            await inboxes[index + 1].put(item)
+        else:
+            result.items.append(item)
+
+    async def feed() -> None:
+        async with aclosing(_aiter(source)) as items:
+            async for item in items:
+                if should_stop is not None and should_stop():
+                    result.stopped = True
+                    break
+                await inboxes[0].put(item)
+        for _ in range(stages[0].workers):
+            await inboxes[0].put(_DONE)
+
+    async def worker(index: int) -> None:
+        stage, stats, inbox = stages[index], result.stats[stages[index].name], inboxes[index]
+        while (item := await inbox.get()) is not _DONE:
+            stats.in_flight += 1
+            try:
+                out = await stage.worker(item)
+            except Exception:
+                logger.exception(f"Pipeline [{stage.name}] : élément en échec, il poursuit")
+                stats.failed += 1
+                out = item
+            finally:
+                stats.in_flight -= 1
+            stats.done += 1
+            progress()
+            await emit(index, out)
+
+    async def batch_worker(index: int) -> None:
+        stage, stats, inbox = stages[index], result.stats[stages[index].name], inboxes[index]
+        finished = False
+        while not finished:
+            batch = []
+            item = await inbox.get()
+            while True:
+                if item is _DONE:
+                    finished = True
+                    break
+                batch.append(item)
+                if len(batch) >= stage.batch_size or inbox.empty():
+                    break
+                item = inbox.get_nowait()
+            if not batch:
+                continue
+            stats.in_flight += len(batch)
+            try:
+                await stage.worker(batch)
+            except Exception:
+                logger.exception(f"Pipeline [{stage.name}] : lot de {len(batch)} en échec")
+                stats.failed += len(batch)
+            finally:
+                stats.in_flight -= len(batch)
+            stats.done += len(batch)
+            progress()
+            for item in batch:
+                await emit(index, item)
+
+    async def run_stage(index: int) -> None:
+        run_one = batch_worker if stages[index].batch_size else worker
+        await asyncio.gather(*(run_one(index) for _ in range(stages[index].workers)))
+        if index + 1 < len(stages):
+            for _ in range(stages[index + 1].workers):
+                await inboxes[index + 1].put(_DONE)
+
+    tasks = [asyncio.create_task(feed())]
+    tasks += [asyncio.create_task(run_stage(i)) for i in range(len(stages))]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return result
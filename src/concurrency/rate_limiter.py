@@ -1,16 +1,26 @@
 """Rate-limiter PAR DOMAINE pour les providers async (REFONTE Phase F1).
 
 Remplace, au fil de la Phase F, les `time.sleep(DELAY_BETWEEN_REQUESTS)`
-décentralisés des clients API : chaque domaine a un `asyncio.Semaphore(1)`
-(jamais deux requêtes simultanées vers le même site) et un délai minimum entre
-la fin d'une requête et le début de la suivante. Deux domaines différents ne se
-gênent pas.
+décentralisés des clients API. Chaque domaine suit une `DomainPolicy` :
+
+  · `max_concurrency` requêtes simultanées au plus (1 par défaut) ;
+  · un seau à jetons (`rate` requêtes/s soutenues, rafale de `burst`) pour les
+    domaines dont le budget est connu (Deezer : 50 req / 5 s) ;
+  · sinon, le délai minimum historique entre la FIN d'une requête et le début
+    de la suivante (`DELAY_BETWEEN_REQUESTS`).
+
+Adaptatif (AIMD) : une réponse 429/503 signalée par `observe()` divise l'allure
+du domaine par deux et suspend le domaine le temps du `Retry-After` (ou d'un
+repli) ; chaque réponse normale la remonte d'un cran, jusqu'au plafond de la
+politique. Deux domaines différents ne se gênent pas. `stats()` expose les
+attentes par domaine.
 
 Usage (F2+) ::
 
-    limiter = DomainRateLimiter()  # délai = DELAY_BETWEEN_REQUESTS
+    limiter = DomainRateLimiter(policies=DOMAIN_POLICIES)
     async with limiter.limit("api.deezer.com"):
         response = await client.get(url)
+        limiter.observe("api.deezer.com", response.status_code, response.headers.get("Retry-After"))
 
 Conçu pour UNE boucle asyncio (celle d'`async_loop`) — les primitives asyncio
 ne sont pas partageables entre boucles. L'horloge et le sleep sont injectables
@@ -19,53 +29,217 @@ pour tester sans attendre (horloge fake).
 
 import asyncio
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from contextlib import asynccontextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+
+@dataclass(frozen=True)
+class DomainPolicy:
+    """Budget d'un domaine. `rate=None` : pas de seau, délai fin → début seul."""
+
+    rate: float | None = None  # requêtes/s soutenues (plafond de l'AIMD)
+    burst: int = 1  # jetons du seau : requêtes partant d'affilée après un repos
+    max_concurrency: int = 1
+    min_delay: float | None = None  # None = délai du limiteur (seaux : 0)
+
+
+# Budgets connus des domaines appelés par la session async. Les autres gardent
+# la politique historique (une requête à la fois + DELAY_BETWEEN_REQUESTS).
+DOMAIN_POLICIES: dict[str, DomainPolicy] = {
+    # 50 req / 5 s (cf. DeezerAPI._check_rate_limit, voie sync) : seau plein +
+    # 5 s de recharge ≤ 50, soit rate ≤ (50 - burst) / 5. Le quota dépassé est
+    # servi en 200 (`{"error": {"code": 4}}`) : DeezerAPI le signale lui-même.
+    "api.deezer.com": DomainPolicy(rate=8.0, burst=10, max_concurrency=4, min_delay=0.0),
+    # API publique sans quota annoncé, tolérante
+    "lrclib.net": DomainPolicy(rate=4.0, burst=4, max_concurrency=2, min_delay=0.0),
+    "api.reccobeats.com": DomainPolicy(rate=2.0, burst=4, max_concurrency=2, min_delay=0.0),
+    # 3000 req / heure par clé
+    "api.getsong.co": DomainPolicy(rate=0.8, burst=3, max_concurrency=1, min_delay=0.0),
+    # Pas de quota publié ; lyricsgenius espace de GENIUS_SLEEP_TIME (0,5 s) en série
+    "api.genius.com": DomainPolicy(rate=3.0, burst=4, max_concurrency=4, min_delay=0.0),
+    # API desktop non officielle : prudence (captcha au moindre excès)
+    "apic-desktop.musixmatch.com": DomainPolicy(rate=0.5, burst=1, max_concurrency=1),
+    # Site public (backfill SNEP par année) : ~1 page/s, quelques pages en vol
+    "snepmusique.com": DomainPolicy(rate=1.0, burst=2, max_concurrency=3, min_delay=0.0),
+}
+
+# AIMD : allure (fraction du débit de la politique) divisée à chaque 429/503,
+# remontée d'un pas à chaque réponse normale.
+_DECREASE = 0.5
+_INCREASE = 0.05
+_MIN_PACE = 1 / 16
+
+# Statuts signalant un domaine saturé.
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Suspension sans `Retry-After` (divisée par l'allure) et plafond d'un
+# `Retry-After` (un serveur qui demande une heure n'immobilise pas le batch).
+_BACKOFF = 1.0
+_MAX_RETRY_AFTER = 120.0
+
+
+@dataclass
+class DomainStats:
+    """Compteurs d'un domaine (attentes en secondes d'horloge du limiteur)."""
+
+    requests: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    pace: float = 1.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
 
 
 @dataclass
 class _DomainState:
-    semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(1))
+    policy: DomainPolicy
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     next_allowed: float = 0.0  # horloge monotone : avant, on attend
+    blocked_until: float = 0.0  # Retry-After / repli après un 429
+    tokens: float | None = None  # None = seau plein au premier usage
+    refilled_at: float = 0.0
+    stats: DomainStats = field(default_factory=DomainStats)
+
+
+def parse_retry_after(value, now: float | None = None) -> float | None:
+    """En-tête `Retry-After` → secondes d'attente (None si absent/illisible).
+
+    Accepte les deux formes HTTP : un nombre de secondes ou une date.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        current = datetime.now(UTC).timestamp() if now is None else now
+        seconds = when.timestamp() - current
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
 
 
 class DomainRateLimiter:
-    """`domaine → Semaphore(1) + délai mini` entre deux requêtes du même domaine."""
+    """`domaine → concurrence + seau à jetons ou délai mini`, adaptatif (AIMD)."""
 
     def __init__(
         self,
         min_delay: float | None = None,
         *,
+        policies: Mapping[str, DomainPolicy] | None = None,
         clock: Callable[[], float] = time.monotonic,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
-        """`min_delay=None` → `DELAY_BETWEEN_REQUESTS` de la config (défaut app)."""
+        """`min_delay=None` → `DELAY_BETWEEN_REQUESTS` de la config (défaut app).
+
+        `policies=None` : politique historique pour tous les domaines (la
+        session de l'app passe `DOMAIN_POLICIES`).
+        """
         if min_delay is None:
             from src.config import DELAY_BETWEEN_REQUESTS
 
             min_delay = DELAY_BETWEEN_REQUESTS
         self.min_delay = float(min_delay)
+        self._policies = {k.strip().lower(): v for k, v in (policies or {}).items()}
         self._clock = clock
         self._sleep = sleep
         self._domains: dict[str, _DomainState] = {}
 
+    def policy(self, domain: str) -> DomainPolicy:
+        """Politique d'un domaine (sous-domaines compris), sinon l'historique."""
+        host = domain.strip().lower().rsplit("@", 1)[-1].split(":", 1)[0]
+        while host:
+            if host in self._policies:
+                return self._policies[host]
+            host = host.partition(".")[2]
+        return DomainPolicy()
+
     def _state(self, domain: str) -> _DomainState:
-        return self._domains.setdefault(domain.strip().lower(), _DomainState())
+        key = domain.strip().lower()
+        state = self._domains.get(key)
+        if state is None:
+            policy = self.policy(key)
+            state = self._domains[key] = _DomainState(
+                policy=policy, semaphore=asyncio.Semaphore(max(1, policy.max_concurrency))
+            )
+        return state
+
+    def _delay(self, state: _DomainState) -> float:
+        base = self.min_delay if state.policy.min_delay is None else state.policy.min_delay
+        return base / state.stats.pace
+
+    def _token_wait(self, state: _DomainState, now: float) -> float:
+        """Recharge le seau ; temps à attendre avant qu'un jeton soit disponible."""
+        policy = state.policy
+        if policy.rate is None:
+            return 0.0
+        rate = policy.rate * state.stats.pace
+        if state.tokens is None:
+            state.tokens = float(policy.burst)
+        else:
+            state.tokens = min(float(policy.burst), state.tokens + (now - state.refilled_at) * rate)
+        state.refilled_at = now
+        return 0.0 if state.tokens >= 1 else (1 - state.tokens) / rate
 
     @asynccontextmanager
     async def limit(self, domain: str):
-        """Section critique d'une requête vers `domain` : sérialise + espace.
+        """Section critique d'une requête vers `domain` : borne + espace.
 
-        Le délai court à partir de la FIN de la requête précédente (sortie du
-        `with`), même si elle a échoué — un site fâché se ménage aussi.
+        Le délai mini court à partir de la FIN de la requête précédente (sortie
+        du `with`), même si elle a échoué — un site fâché se ménage aussi.
         """
         state = self._state(domain)
+        entered = self._clock()
         async with state.semaphore:
-            wait = state.next_allowed - self._clock()
-            if wait > 0:
-                await self._sleep(wait)
+            async with state.lock:
+                while True:
+                    now = self._clock()
+                    wait = max(
+                        state.next_allowed - now,
+                        state.blocked_until - now,
+                        self._token_wait(state, now),
+                    )
+                    if wait <= 0:
+                        break
+                    await self._sleep(wait)
+                if state.tokens is not None:
+                    state.tokens -= 1
+                waited = self._clock() - entered
+                state.stats.requests += 1
+                state.stats.total_wait += waited
+                state.stats.max_wait = max(state.stats.max_wait, waited)
             try:
                 yield
             finally:
-                state.next_allowed = self._clock() + self.min_delay
+                state.next_allowed = self._clock() + self._delay(state)
+
+    def observe(self, domain: str, status: int, retry_after=None) -> None:
+        """Retour d'une réponse : 429/503 → ralentit (AIMD) et suspend le domaine."""
+        state = self._state(domain)
+        stats = state.stats
+        if status in THROTTLE_STATUSES:
+            stats.throttled += 1
+            stats.pace = max(_MIN_PACE, stats.pace * _DECREASE)
+            if state.tokens is not None:
+                state.tokens = 0.0  # plus de rafale avant d'avoir rechargé
+            pause = parse_retry_after(retry_after)
+            if pause is None:
+                pause = _BACKOFF / stats.pace
+            state.blocked_until = max(state.blocked_until, self._clock() + pause)
+        elif status < 400:
+            stats.pace = min(1.0, stats.pace + _INCREASE)
+
+    def stats(self) -> dict[str, DomainStats]:
+        """Instantané des compteurs par domaine (copies)."""
+        return {domain: replace(state.stats) for domain, state in self._domains.items()}
@@ -45,6 +45,8 @@ for _img_dir in (ARTIST_IMAGES_DIR, COVER_IMAGES_DIR, VIGNETTE_IMAGES_DIR):
     _img_dir.mkdir(parents=True, exist_ok=True)
 
 _VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+_VALID_DB_PROFILES = {"legacy", "performance"}
+_VALID_TEXT_COMPRESSIONS = {"auto", "zlib", "zstd", "none"}
 
 
 class Settings(BaseSettings):
@@ -75,15 +77,43 @@ class Settings(BaseSettings):
     # Pas de mkdir à l'import : création lazy dans dataviz.bubble_prod (gitignoré).
     exports_dir: str = ""
 
+    # --- Base SQLite (profil de connexion, cf. src/utils/db.py) ---
+    # "legacy" : une connexion par opération (NullPool), journal rollback — défaut.
+    # "performance" : WAL + synchronous=NORMAL + pool borné + pragmas mémoire
+    # (les lectures GUI ne bloquent plus derrière les écritures d'enrichissement).
+    db_profile: str = "legacy"
+    db_pool_size: int = 5  # connexions gardées ouvertes (profil performance)
+    db_mmap_size_mb: int = 256  # PRAGMA mmap_size (profil performance)
+    db_cache_size_mb: int = 64  # PRAGMA cache_size par connexion (profil performance)
+    # Compression des paroles / LRC en base (src/persistence/text_codec.py),
+    # OPT-IN : "none" (défaut) = écriture en clair ; "auto" = zstd si le paquet
+    # `zstandard` est installé, sinon zlib. La lecture décode toujours tous les
+    # formats (revenir à "none" ne rend pas les lignes compressées illisibles).
+    db_text_compression: str = "none"
+
     # --- Scraping ---
     selenium_timeout: int = 30  # secondes
     max_retries: int = 3
     delay_between_requests: float = 1.0  # secondes
+    # Morceaux enrichis simultanément par le batch async (1 = séquentiel
+    # historique) ; chaque provider garde son propre plafond (`max_concurrency`).
+    enrich_concurrency: int = 4
+    # Cache disque des réponses API de la session async (data/http_cache.db,
+    # src/api/http_cache.py) : TTL par domaine, éviction LRU au-delà du plafond.
+    http_cache_enabled: bool = True
+    http_cache_max_mb: int = 64
+    # Pages Playwright par site des scrapers async (src/scrapers/page_pool.py) :
+    # plafond de recherches simultanées sur un site, et recyclage d'une page
+    # après N usages (fuites mémoire des SPA).
+    scraper_pages_per_site: int = 3
+    scraper_page_max_uses: int = 50
 
     # --- Genius API ---
     genius_timeout: int = 30
     genius_retries: int = 2
     genius_sleep_time: float = 0.5
+    # Voie async : pages de /artists/{id}/songs demandées d'avance
+    genius_pages_ahead: int = 3
 
     # --- Interface ---
     window_width: int = 1200
@@ -115,6 +145,28 @@ class Settings(BaseSettings):
             )
         return level
 
+    @field_validator("db_profile", mode="before")
+    @classmethod
+    def _normalize_db_profile(cls, value: object) -> str:
+        profile = str(value).strip().lower()
+        if profile not in _VALID_DB_PROFILES:
+            raise ValueError(
+                f"DB_PROFILE invalide: {value!r} "
+                f"(attendu: {', '.join(sorted(_VALID_DB_PROFILES))})"
+            )
+        return profile
+
+    @field_validator("db_text_compression", mode="before")
+    @classmethod
+    def _normalize_db_text_compression(cls, value: object) -> str:
+        codec = str(value).strip().lower()
+        if codec not in _VALID_TEXT_COMPRESSIONS:
+            raise ValueError(
+                f"DB_TEXT_COMPRESSION invalide: {value!r} "
+                f"(attendu: {', '.join(sorted(_VALID_TEXT_COMPRESSIONS))})"
+            )
+        return codec
+
     @field_validator("theme", mode="before")
     @classmethod
     def _normalize_theme(cls, value: object) -> str:
@@ -144,15 +196,28 @@ BPMFINDER_PASSWORD = settings.bpmfinder_password
 DEBUG = settings.debug
 LOG_LEVEL = settings.log_level
 
+# Base SQLite
+DB_PROFILE = settings.db_profile
+DB_POOL_SIZE = settings.db_pool_size
+DB_MMAP_SIZE_MB = settings.db_mmap_size_mb
+DB_CACHE_SIZE_MB = settings.db_cache_size_mb
+DB_TEXT_COMPRESSION = settings.db_text_compression
+
 # Scraping
 SELENIUM_TIMEOUT = settings.selenium_timeout
 MAX_RETRIES = settings.max_retries
 DELAY_BETWEEN_REQUESTS = settings.delay_between_requests
+ENRICH_CONCURRENCY = settings.enrich_concurrency
+HTTP_CACHE_ENABLED = settings.http_cache_enabled
+HTTP_CACHE_MAX_MB = settings.http_cache_max_mb
+SCRAPER_PAGES_PER_SITE = settings.scraper_pages_per_site
+SCRAPER_PAGE_MAX_USES = settings.scraper_page_max_uses
 
 # Genius API
 GENIUS_TIMEOUT = settings.genius_timeout
 GENIUS_RETRIES = settings.genius_retries
 GENIUS_SLEEP_TIME = settings.genius_sleep_time
+GENIUS_PAGES_AHEAD = settings.genius_pages_ahead
 
 # Interface
 WINDOW_WIDTH = settings.window_width
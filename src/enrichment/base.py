@@ -109,6 +109,11 @@ class EnrichmentProvider(Protocol):
     # capture à la frontière batch). False = « pas de données » ; None =
     # crash/timeout, EXCLU du « tout a échoué » qui déclenche le nettoyage.
     error_result: bool | None
+    # Morceaux traités simultanément par CETTE source dans un batch concurrent
+    # (`DataEnricher.enrich_track_async`) : la taille du pool de pages pour les
+    # scrapers Playwright async (1 pour BPM Finder), davantage pour les API (le
+    # débit par domaine reste borné par la session).
+    max_concurrency: int
 
     def is_available(self) -> bool:
         """True si la source est utilisable (client/API/scraper initialisé)."""
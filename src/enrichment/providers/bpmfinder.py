@@ -31,6 +31,8 @@ class BpmFinderProvider:
     # Aligné sur l'historique : le provider capture tout en interne et renvoie
     # None sur exception — l'orchestrateur n'a rien à rattraper de spécifique.
     error_result = None
+    # Scraper Playwright (thread sync du run) : un morceau à la fois.
+    max_concurrency = 1
 
     def __init__(self, scraper=None, scraper_factory=None, async_scraper_factory=None):
         # PROPRIÉTAIRE de son scraper (créé lazy, fermé par close()).
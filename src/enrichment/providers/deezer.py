@@ -22,6 +22,8 @@ class DeezerProvider:
     name = "deezer"
     capabilities = {Capability.BPM}  # E7b structurel (non consommé)
     error_result = False
+    # API HTTP : plusieurs morceaux en vol, le domaine reste rate-limité.
+    max_concurrency = 4
 
     def __init__(self, client: DeezerAPI | None = None):
         self._client = client
@@ -20,6 +20,8 @@ class DiscogsProvider:
     name = "discogs"
     capabilities = {Capability.BPM}  # E7b structurel (non consommé)
     error_result = False
+    # Client sync sur le thread du run : un morceau à la fois.
+    max_concurrency = 1
 
     def __init__(self, client=None, client_factory=None):
         # Client créé lazy (le lookup du token DISCOGS_* vit dans la factory).
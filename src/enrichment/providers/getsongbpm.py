@@ -24,6 +24,8 @@ class GetSongBpmProvider:
     name = "getsongbpm"
     capabilities = {Capability.BPM}  # E7b structurel (non consommé)
     error_result = False
+    # API HTTP : plusieurs morceaux en vol, le domaine reste rate-limité.
+    max_concurrency = 4
 
     def __init__(self, fetcher=None, fetcher_factory=None):
         # Fetcher créé lazy (son ctor lève sans GETSONGBPM_API_KEY).
@@ -99,8 +99,9 @@ class LyricsProvider:
     def _http_session(self):
         if self._http is None:
             from src.api.async_http import AsyncHttpSession
+            from src.api.http_cache import default_response_cache
 
-            self._http = AsyncHttpSession()
+            self._http = AsyncHttpSession(cache=default_response_cache)
         return self._http
 
     # ── Clients (lazy, selon les sources demandées) ─────────────────────────
@@ -29,6 +29,9 @@ class ReccoBeatsProvider:
     name = "reccobeats"
     capabilities = {Capability.BPM}  # E7b structurel (non consommé)
     error_result = False
+    # API HTTP (rate-limit par domaine de la session) ; son scrape Spotify
+    # de secours passe par le thread sync, sérialisé de toute façon.
+    max_concurrency = 4
 
     def __init__(
         self,
@@ -10,6 +10,7 @@ import asyncio
 
 from playwright.async_api import Error as PlaywrightError
 
+from src.config import SCRAPER_PAGES_PER_SITE
 from src.enrichment.audio_normalize import key_mode_observations
 from src.enrichment.base import Capability, LazyResource
 from src.enrichment.context import EnrichmentContext
@@ -29,6 +30,9 @@ class SongBpmProvider:
     # None = crash/timeout ≠ False (« pas de données ») : n'entre pas dans le
     # « tout a échoué » qui déclenche le nettoyage de l'orchestrateur.
     error_result = None
+    # Scraper async : un morceau par page du pool (voie sync : un à la fois,
+    # sérialisé par le thread du run).
+    max_concurrency = SCRAPER_PAGES_PER_SITE
 
     def __init__(self, scraper=None, scraper_factory=None, async_scraper_factory=None):
         # PROPRIÉTAIRE de son scraper (créé lazy, fermé par close()).
@@ -234,8 +238,9 @@ class SongBpmProvider:
         """Voie async (F3c) : scraper Playwright ASYNC natif dans la boucle ;
         `asyncio.timeout(30)` remplace le threading.Timer de garde — même
         budget, mais l'annulation INTERROMPT la recherche (le Timer laissait
-        finir et jetait le résultat) et le driver est recyclé pour repartir
-        sain. Sans variante async configurée, repli sur le pont sync F2."""
+        finir et jetait le résultat) et SA page est recyclée par le pool — les
+        recherches concurrentes continuent. Sans variante async configurée,
+        repli sur le pont sync F2."""
         scraper = self._async_resource.get()
         if scraper is None:
             return await ctx.sync_runner.run(self.enrich, track, ctx)
@@ -253,7 +258,6 @@ class SongBpmProvider:
             except TimeoutError:
                 logger.error(f"⏰ SongBPM timeout après {timeout_seconds}s — recherche annulée")
                 logger.error(f"❌ SongBPM: Timeout expiré pour '{track.title}'")
-                await scraper.aclose()  # recyclé : recréé au prochain usage
                 return False
 
             if not track_data:
@@ -8,6 +8,7 @@ contexte (logique partagée avec ReccoBeats/SongBPM).
 
 from playwright.async_api import Error as PlaywrightError
 
+from src.config import SCRAPER_PAGES_PER_SITE
 from src.enrichment.base import Capability, LazyResource
 from src.enrichment.context import EnrichmentContext
 from src.models import Track
@@ -25,6 +26,9 @@ class SpotifyIdProvider:
     name = "spotify_id"
     capabilities = {Capability.BPM}  # E7b structurel (non consommé)
     error_result = False
+    # Scraper async : un morceau par page du pool (voie sync : un à la fois,
+    # sérialisé par le thread du run).
+    max_concurrency = SCRAPER_PAGES_PER_SITE
 
     def __init__(self, scraper=None, scraper_factory=None, async_scraper_factory=None):
         # PROPRIÉTAIRE du scraper Spotify (créé lazy, fermé par close()).
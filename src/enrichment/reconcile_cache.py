@@ -0,0 +1,102 @@
+"""Cache matérialisé du verdict de réconciliation (table `reconcile_cache`).
+
+Depuis E6, chaque chargement d'artiste re-vote les observations de CHAQUE
+morceau (cluster BPM, appariement key/mode…) alors qu'elles changent bien moins
+souvent qu'elles ne sont lues. Le verdict de `reconcile()` est donc persisté par
+morceau, avec l'EMPREINTE des observations qui l'ont produit :
+
+  - `fingerprint(observations)` : hash stable de l'ensemble (field, source,
+    value, confidence), indépendant de l'ordre, préfixé par `CACHE_VERSION`.
+    Une entrée n'est réutilisée QUE si l'empreinte concorde — toute écriture
+    d'observation, y compris hors repository (script, migration), l'invalide
+    d'elle-même. Les chemins d'écriture du repository la suppriment en plus
+    (pas de ligne périmée qui traîne).
+  - `lyrics_synced` est EXCLU : son verdict est un LRC complet (le dupliquer
+    doublerait le poids) et dépend de la durée du morceau ; il reste réconcilié
+    à la demande (chargement différé E7d). Les stratégies de `reconcile` étant
+    indépendantes par champ, le verdict assemblé est identique.
+
+Module PUR comme `reconcile.py` : les entrées sont lues et écrites par
+`TrackRepository` (`get_artist_tracks`, `rebuild_reconcile_cache`).
+"""
+
+import hashlib
+import json
+
+from src.enrichment.reconcile import LYRICS_SYNCED_FIELD, Resolution, reconcile
+
+# À incrémenter à TOUTE évolution d'une stratégie de `reconcile.py` (ou de la
+# forme de `Resolution`) : les empreintes changent → cache entier recalculé.
+CACHE_VERSION = 1
+
+# Champs jamais mis en cache (cf. docstring).
+UNCACHED_FIELDS = frozenset({LYRICS_SYNCED_FIELD})
+
+
+def fingerprint(observations) -> str:
+    """Empreinte stable d'un ensemble d'observations (ordre indifférent).
+
+    `value` comparée sous sa forme TEXT de stockage (une observation fraîche
+    `128` et sa relecture `"128"` ont la même empreinte) ; `seen_at` ignoré
+    (une re-vue à l'identique ne change pas le verdict).
+    """
+    items = sorted(
+        (
+            o.field,
+            o.source,
+            None if o.value is None else str(o.value),
+            None if o.confidence is None else float(o.confidence),
+        )
+        for o in observations
+    )
+    # repr d'un tuple de str/float/None : déterministe d'un run à l'autre (et
+    # nettement moins cher que json.dumps sur un chargement d'artiste).
+    payload = repr((CACHE_VERSION, items)).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def resolutions_to_json(resolutions: dict[str, Resolution]) -> str:
+    """Verdict → JSON (une liste par `Resolution`, valeurs int/float/str natives)."""
+    return json.dumps(
+        [[r.field, r.value, r.source, r.confidence, r.alt] for r in resolutions.values()],
+        ensure_ascii=False,
+    )
+
+
+def resolutions_from_json(payload: str) -> dict[str, Resolution]:
+    """Inverse de `resolutions_to_json`."""
+    return {item[0]: Resolution(*item) for item in json.loads(payload)}
+
+
+class ResolutionCache:
+    """Entrées du cache d'un lot de morceaux + verdicts à (ré)écrire.
+
+    `entries` : `track_id -> (empreinte, verdict JSON)` tel que lu en base.
+    `resolve()` sert de résolveur au mapper (`track_from_row(resolver=...)`) ;
+    les verdicts recalculés (absents ou périmés) s'accumulent dans `stale`,
+    que l'appelant persiste ensuite.
+    """
+
+    def __init__(self, entries: dict[int, tuple[str, str]] | None = None) -> None:
+        self._entries = entries or {}
+        self.stale: dict[int, tuple[str, str]] = {}
+        self.hits = 0
+
+    def resolve(self, track_id, observations, *, track_duration=None) -> dict[str, Resolution]:
+        """Verdict de `observations` : cache si l'empreinte concorde, sinon vote."""
+        cached_obs = [o for o in observations if o.field not in UNCACHED_FIELDS]
+        live_obs = [o for o in observations if o.field in UNCACHED_FIELDS]
+
+        digest = fingerprint(cached_obs)
+        entry = self._entries.get(track_id)
+        if entry is not None and entry[0] == digest:
+            resolutions = resolutions_from_json(entry[1])
+            self.hits += 1
+        else:
+            resolutions = reconcile(cached_obs, track_duration=track_duration)
+            if track_id is not None and cached_obs:
+                self.stale[track_id] = (digest, resolutions_to_json(resolutions))
+
+        if live_obs:
+            resolutions.update(reconcile(live_obs, track_duration=track_duration))
+        return resolutions
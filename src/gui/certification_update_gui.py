@@ -334,8 +334,8 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
 
     def _apply_to_current_artist(self):
         """Rematche les certifs de l'artiste courant depuis les CSV clean puis
-        persiste (E7h). Offline (matcher en mémoire) ; reset_cert_matcher pour
-        repartir des CSV fraîchement mis à jour dans cette session."""
+        persiste (E7h). Offline (matcher en mémoire) ; refresh_cert_matcher
+        applique d'abord les deltas des MàJ de la session."""
         app = getattr(self, "app", None)
         artist = getattr(app, "current_artist", None) if app else None
         if not artist or not getattr(artist, "tracks", None):
@@ -344,10 +344,10 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
 
         def run():
             try:
-                from src.utils.cert_matcher import get_cert_matcher, reset_cert_matcher
+                from src.utils.cert_matcher import get_cert_matcher, refresh_cert_matcher
                 from src.utils.certification_enricher import apply_certifications
 
-                reset_cert_matcher()  # repartir des CSV clean (MàJ de la session)
+                refresh_cert_matcher()  # deltas des CSV clean (MàJ de la session)
                 n = apply_certifications(artist, artist.tracks, get_cert_matcher())
                 for track in artist.tracks:
                     app.data_manager.save_track(track)
@@ -374,6 +374,32 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
 
         start_worker(run)
 
+    def _refresh_certifications(self):
+        """Applique au matcher les deltas publiés par les updaters, puis rematche
+        et persiste les SEULS artistes de la base touchés (artiste courant sur
+        place). Rechargement complet (None) : rien n'est rematché d'office →
+        « Appliquer à l'artiste courant ». Depuis un worker ; défensif."""
+        app = getattr(self, "app", None)
+        current = getattr(app, "current_artist", None) if app else None
+        try:
+            from src.utils.cert_matcher import get_cert_matcher, refresh_cert_matcher
+            from src.utils.certification_enricher import recertify_affected
+
+            touched = refresh_cert_matcher()
+            data_manager = getattr(app, "data_manager", None) if app else None
+            if not touched or data_manager is None:
+                return
+            counts = recertify_affected(data_manager, get_cert_matcher(), touched, loaded=[current])
+        except Exception as e:
+            logger.error(f"Rafraîchissement des certifications échoué: {e}")
+            return
+        if (
+            current is not None
+            and current.name in counts
+            and hasattr(app, "_populate_tracks_table")
+        ):
+            self.after(0, app._populate_tracks_table)
+
     def _update_snep(self):
         """Lance la mise à jour SNEP"""
         self._run_update_script("update_snep.py", "SNEP")
@@ -442,13 +468,8 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                 logger.error(f"RIAA artiste : {e}")
                 outputs.append(f"RIAA : erreur ({e})")
 
-            # 3) rafraîchir le matcher (nouvelles certifs sur disque)
-            try:
-                from src.utils.cert_matcher import reset_cert_matcher
-
-                reset_cert_matcher()
-            except Exception:
-                pass
+            # 3) rafraîchir le matcher (deltas publiés) + rematcher les touchés
+            self._refresh_certifications()
 
             self._set_progress(f"✅ Certifs récupérées pour {artist} (SNEP + RIAA)")
             self.after(
@@ -685,6 +706,7 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                         def apply():
                             self._set_progress("🧹 Nettoyage en cours...")
                             res = clean_snep_csv(csv_path, apply=True)
+                            self._refresh_certifications()
                             self.after(
                                 0,
                                 lambda: self._show_report_window(
@@ -826,12 +848,7 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                     errors="replace",
                 )
                 summary = "\n".join((result.stdout or "").strip().splitlines()[-6:]) or "Terminé."
-                try:
-                    from src.utils.cert_matcher import reset_cert_matcher
-
-                    reset_cert_matcher()
-                except Exception:
-                    pass
+                self._refresh_certifications()
                 self._set_progress("✅ RIAA nettoyé")
                 self.after(0, lambda: self._show_report_window("Nettoyage CSV RIAA", summary))
                 self.after(500, self._update_status)
@@ -864,12 +881,7 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                     errors="replace",
                 )
                 summary = "\n".join((result.stdout or "").strip().splitlines()[-6:]) or "Terminé."
-                try:
-                    from src.utils.cert_matcher import reset_cert_matcher
-
-                    reset_cert_matcher()
-                except Exception:
-                    pass
+                self._refresh_certifications()
                 self._set_progress("✅ BRMA nettoyé")
                 self.after(0, lambda: self._show_report_window("Nettoyage CSV BRMA", summary))
                 self.after(500, self._update_status)
@@ -898,6 +910,7 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                 self._set_progress("Mise à jour RIAA en cours...")
                 self._run_script_sync("update_riaa.py")
 
+                self._refresh_certifications()
                 self._set_progress("Toutes les mises à jour terminées !")
                 self.after(2000, lambda: self._set_progress(""))
                 self.after(500, self._update_status)
@@ -944,6 +957,7 @@ class CertificationUpdateDialog(ctk.CTkToplevel):
                 )
 
                 if result.returncode == 0:
+                    self._refresh_certifications()
                     self._set_progress(f"✅ Mise à jour {source_name} réussie")
                     self.after(500, self._update_status)
                     # Retour visible : dernières lignes de sortie du script
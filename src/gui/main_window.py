@@ -14,7 +14,7 @@ from src.gui.windows import artist_loader
 from src.gui.windows.export_studio import show_export_studio
 from src.gui.windows.source_health import show_source_health
 from src.gui.windows.track_details import TrackDetailsWindow
-from src.gui.workers import enrichment, retrieval, streams
+from src.gui.workers import enrichment, resume, retrieval, streams
 from src.gui.workers.lifecycle import start_worker
 from src.models import Artist, Track
 from src.utils.data_enricher import DataEnricher
@@ -70,6 +70,9 @@ class MainWindow:
         # Gerer la fermeture de l'application
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+        # Batchs interrompus à la session précédente : proposer la reprise
+        self.root.after(500, lambda: resume.offer_resume(self))
+
     def _create_widgets(self):
         """Crée tous les widgets de l'interface - VERSION RÉORGANISÉE"""
         # Frame principale
@@ -587,9 +590,7 @@ class MainWindow:
                 )
 
                 # Morceaux avec paroles (actifs uniquement)
-                tracks_with_lyrics = sum(
-                    1 for t in active_tracks if t.lyrics.text and t.lyrics.text.strip()
-                )
+                tracks_with_lyrics = sum(1 for t in active_tracks if t.lyrics.has_text)
 
                 # Morceaux avec données additionnelles = BPM + Key/Mode + Durée (actifs uniquement)
                 tracks_with_additional = sum(
@@ -213,7 +213,7 @@ def populate_albums_table(app):
             n_disabled = 0
         n_display = f"{n} ({n_disabled}❌)" if n_disabled else n
         credits = sum(len(t.credits or []) for t in tracks)
-        lyrics = sum(1 for t in tracks if t.lyrics.text and str(t.lyrics.text).strip())
+        lyrics = sum(1 for t in tracks if t.lyrics.has_text)
         total_sec = 0
         for t in tracks:
             d = t.duration
@@ -113,7 +113,7 @@ def populate_tracks_table(app):
 
             # Paroles : ✓ = texte, ⏱ = timestamps (paroles synchronisées) en plus
             has_lyrics_flag = track.lyrics.present
-            has_sync_flag = bool(track.lyrics.synced)
+            has_sync_flag = track.lyrics.has_synced
             if has_lyrics_flag and has_sync_flag:
                 lyrics_display = "✓⏱"
             elif has_sync_flag:
@@ -645,7 +645,7 @@ def sort_column(app, col):
             # rien < texte seul < texte + timestamps
             sort_key = lambda t: (
                 bool(t.lyrics.present),
-                bool(t.lyrics.synced),
+                t.lyrics.has_synced,
             )
         elif col == "BPM":
             sort_key = lambda t: t.audio.bpm or 0
@@ -4,13 +4,22 @@ Premier flux migré sur la boucle asyncio unique : le batch est une coroutine
 soumise via `async_loop.submit` (plus de `start_worker`). Les providers API
 purs tournent en httpx partagé dans la boucle ; les scrapers Playwright sync
 sur le thread dédié du run (`DataEnricher.sync_runner`) ; les saves SQLite via
-`asyncio.to_thread`. La progression GUI passe toujours par `root.after`
-(inchangé — thread-safe depuis la boucle comme depuis l'ancien thread).
+`asyncio.to_thread`, par lots (`save_tracks`). Plusieurs morceaux sont en vol
+à la fois (`run_bounded`, `ENRICH_CONCURRENCY`), chaque provider borné par son
+`max_concurrency` (scrapers Playwright : taille du pool de pages). La
+progression GUI passe toujours par `root.after` (inchangé — thread-safe depuis
+la boucle comme depuis l'ancien thread).
 
 À la fermeture de l'app, `shutdown_workers()` annule la task du batch : le
 save en cours se termine dans son thread (commit SQLite atomique), puis le
 `finally` de la coroutine ferme browsers/Playwright/session httpx dans le
 budget global de 8 s.
+
+Chaque lancement est un job reprenable (`batch_jobs`, e17) : une paire
+(morceau, source) par source cochée, marquée après chaque lot sauvegardé. Un
+batch interrompu est proposé à la reprise au démarrage suivant
+(`gui/workers/resume.py`) — seules les paires jamais sauvegardées sont
+rejouées, avec les options du lancement d'origine.
 """
 
 import asyncio
@@ -19,12 +28,20 @@ from tkinter import messagebox
 import customtkinter as ctk
 
 from src.concurrency import async_loop
+from src.concurrency.bounded import run_bounded
+from src.config import ENRICH_CONCURRENCY
 from src.gui.dialogs import report
 from src.gui.workers.lifecycle import stop_requested
+from src.utils.job_repository import ITEM_DONE, ITEM_FAILED, JOB_ENRICHMENT, BatchJob
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Morceaux enrichis persistés par lot (`save_tracks`, une transaction) : un
+# commit tous les N morceaux au lieu d'un par morceau. Une fermeture brutale
+# perd au plus N-1 enrichissements (le `finally` du batch vide le reste).
+_SAVE_BATCH_SIZE = 10
+
 
 def start_enrichment(app):
     """Lance l'enrichissement des données depuis toutes les sources"""
@@ -195,14 +212,31 @@ def start_enrichment(app):
     ctk.CTkButton(dialog, text="Démarrer", command=start_enrichment).pack(pady=20)
 
 
+def spotify_id_reset_targets(tracks: list, job: BatchJob | None) -> list:
+    """Morceaux dont le Spotify ID est à effacer (option « reset »).
+
+    Reprise : seuls ceux dont la paire `spotify_id` est encore en attente — un
+    ID déjà re-scrapé (paire faite) ne serait plus jamais recherché, et
+    reccobeats/deezer en attente tourneraient sans lui.
+    """
+    if job is None:
+        return list(tracks)
+    return [t for t in tracks if "spotify_id" in job.pending.get(t.id, ())]
+
+
 def run_enrichment(
     app,
     sources: list[str],
     force_update: bool = False,
     reset_spotify_id: bool = False,
     clear_on_failure: bool = True,
+    job: BatchJob | None = None,
 ):
-    """Exécute l'enrichissement avec les sources sélectionnées"""
+    """Exécute l'enrichissement avec les sources sélectionnées.
+
+    `job` : reprise d'un batch interrompu — chaque morceau n'est enrichi que
+    par ses sources encore en attente (`job.pending`).
+    """
     if not app.selected_tracks:
         messagebox.showwarning("Attention", "Aucun morceau sélectionné")
         return
@@ -218,7 +252,7 @@ def run_enrichment(
 
     # Reset des Spotify IDs si demandé
     if reset_spotify_id:
-        for track in selected_tracks_list:
+        for track in spotify_id_reset_targets(selected_tracks_list, job):
             if hasattr(track, "spotify_id") and track.spotify_id:
                 old_id = track.spotify_id
                 track.spotify_id = None
@@ -246,23 +280,78 @@ def run_enrichment(
             cleaned_count = 0
             track_results = []  # Pour stocker les résultats détaillés par track
 
-            # Enrichir chaque track individuellement
-            for i, track in enumerate(selected_tracks_list):
-                if stop_requested():
-                    logger.info(
-                        "⏹️ Fermeture demandée — enrichissement interrompu entre deux morceaux"
+            # Plusieurs morceaux en vol (ENRICH_CONCURRENCY), chaque provider
+            # borné par son `max_concurrency` ; sauvegarde par lots de
+            # _SAVE_BATCH_SIZE (SQLite hors boucle, un lot à la fois), reliquat
+            # vidé au `finally`.
+            total = len(selected_tracks_list)
+            completed = 0
+            pending_saves = []
+            save_lock = asyncio.Lock()
+
+            # Job reprenable : créé au lancement, repris tel quel sinon
+            track_sources = job.pending if job else {}
+            if job:
+                job_id = job.id
+            else:
+                job_id = await asyncio.to_thread(
+                    app.data_manager.create_job,
+                    JOB_ENRICHMENT,
+                    app.current_artist.id,
+                    [(t.id, source) for t in selected_tracks_list if t.id for source in sources],
+                    {
+                        "sources": sources,
+                        "force_update": force_update,
+                        "reset_spotify_id": reset_spotify_id,
+                        "clear_on_failure": clear_on_failure,
+                    },
+                )
+
+            async def flush(batch):
+                # Jalon APRÈS le save : une paire marquée est en base
+                async with save_lock:
+                    await asyncio.to_thread(app.data_manager.save_tracks, [t for t, _ in batch])
+                    await asyncio.to_thread(
+                        app.data_manager.mark_job_items, job_id, _job_outcomes(batch)
                     )
-                    break
-                update_progress(i, len(selected_tracks_list), f"Enrichissement: {track.title}")
 
+            async def enrich_one(track):
+                nonlocal completed, pending_saves
+                update_progress(completed, total, f"Enrichissement: {track.title}")
+
+                wanted = track_sources.get(track.id, sources)
                 results = await app.data_enricher.enrich_track_async(
                     track,
-                    sources=sources,
+                    sources=wanted,
                     force_update=force_update,
                     artist_tracks=all_artist_tracks,
                     clear_on_failure=clear_on_failure,
                 )
+                completed += 1
+
+                pending_saves.append((track, {s: results.get(s) for s in wanted}))
+                if len(pending_saves) >= _SAVE_BATCH_SIZE:
+                    batch, pending_saves = pending_saves, []
+                    await flush(batch)
+                return results
 
+            try:
+                done = await run_bounded(
+                    selected_tracks_list,
+                    enrich_one,
+                    limit=ENRICH_CONCURRENCY,
+                    should_stop=stop_requested,
+                )
+            finally:
+                if pending_saves:
+                    await flush(pending_saves)
+            if len(done) < total:
+                logger.info("⏹️ Fermeture demandée — enrichissement interrompu entre deux morceaux")
+            else:
+                await asyncio.to_thread(app.data_manager.finish_job, job_id)
+
+            # Résultats dans l'ordre de la sélection (pas celui de complétion)
+            for track, results in done:
                 # Compter les nettoyages
                 if results.get("cleaned", False):
                     cleaned_count += 1
@@ -270,9 +359,6 @@ def run_enrichment(
                 # Stocker les résultats pour ce track
                 track_results.append({"title": track.title, "results": results})
 
-                # Sauvegarder après chaque enrichissement (SQLite hors boucle)
-                await asyncio.to_thread(app.data_manager.save_track, track)
-
             disabled_count = len(app.selected_tracks) - len(selected_tracks_list)
             summary = _build_summary(
                 track_results,
@@ -301,40 +387,9 @@ def run_enrichment(
                 ),
             )
         finally:
-            # Scrapers Playwright ASYNC d'abord (F3) : browsers de la boucle
-            # fermés PUIS l'instance async partagée stoppée (garde-fou : tasks
-            # annulées avant de fermer Playwright async).
-            try:
-                await app.data_enricher.aclose_async_scrapers()
-            except Exception:
-                pass
-            try:
-                from src.scrapers.playwright_manager import stop_playwright_async
-
-                await stop_playwright_async()
-            except Exception:
-                pass
-            # Fermer les ressources SYNC des providers SUR LE THREAD SYNC DU RUN
-            # (celui qui a créé les browsers — Playwright est thread-affine ;
-            # ils seront recréés à la demande au batch suivant). Sans ça, un
-            # browser survivait au batch et son pipe Playwright cassait à
-            # l'arrêt de l'app (EPIPE cosmétique mais alarmant).
-            runner = app.data_enricher.sync_runner
-            try:
-                await runner.run(app.data_enricher.close)
-            except Exception:
-                pass
-            # Arrêter aussi l'instance Playwright THREAD-LOCALE du thread sync :
-            # browsers fermés, le driver Node n'a plus de raison de survivre.
-            try:
-                await runner.run(_stop_playwright)
-            except Exception:
-                pass
-            # Session httpx du batch (rouverte à la demande au suivant)
-            try:
-                await app.data_enricher.aclose_http()
-            except Exception:
-                pass
+            # Browsers, Playwright (boucle + thread sync du run) et session httpx
+            # du batch — recréés à la demande au suivant.
+            await app.data_enricher.aclose_batch()
             app.root.after(
                 0, lambda: app.enrich_button.configure(state="normal", text="Enrichir données")
             )
@@ -345,11 +400,15 @@ def run_enrichment(
     async_loop.submit(enrich_batch())
 
 
-def _stop_playwright():
-    """Arrêt de l'instance Playwright du thread appelant (helper picklable/nommé)."""
-    from src.scrapers.playwright_manager import stop_playwright
-
-    stop_playwright()
+def _job_outcomes(batch) -> list[tuple[int, str, str]]:
+    """(track_id, source, statut) d'un lot sauvegardé : succès ou « déjà
+    présent » → done ; échec, crash ou source non lancée → failed."""
+    return [
+        (track.id, source, ITEM_DONE if value else ITEM_FAILED)
+        for track, results in batch
+        if track.id
+        for source, value in results.items()
+    ]
 
 
 # Étiquettes courtes des sources (générique : toute source présente dans
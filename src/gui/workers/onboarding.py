@@ -0,0 +1,104 @@
+"""Import d'un artiste en flux (discographie → crédits/paroles → audio → save).
+
+Coroutine soumise à la boucle applicative (`async_loop.submit`), comme
+l'enrichissement : le cœur est `src/utils/artist_onboarding.py`. La
+progression affiche les compteurs PAR ÉTAGE (`root.after`, thread-safe) ; à
+la fin, les morceaux sont relus depuis la base et les vues rafraîchies.
+`stop_requested()` coupe l'arrivée de nouveaux morceaux, ceux en vol sont
+terminés et sauvegardés.
+"""
+
+import asyncio
+from tkinter import messagebox
+
+from src.concurrency import async_loop
+from src.gui.dialogs import report
+from src.gui.workers.lifecycle import stop_requested
+from src.utils.artist_onboarding import (
+    STAGE_CREDITS,
+    STAGE_ENRICH,
+    STAGE_PREFILL,
+    STAGE_SAVE,
+    STAGE_SYNC,
+    OnboardingOptions,
+    onboard_artist,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Libellés courts des étages (barre de progression)
+_STAGE_LABELS = {
+    STAGE_PREFILL: "media",
+    STAGE_CREDITS: "crédits",
+    STAGE_SYNC: "synchro",
+    STAGE_ENRICH: "audio",
+    STAGE_SAVE: "sauvés",
+}
+
+
+def _progress_text(stats) -> str:
+    return " · ".join(f"{_STAGE_LABELS.get(name, name)} {s.done}" for name, s in stats.items())
+
+
+def start_artist_onboarding(app, options: OnboardingOptions):
+    """Lance l'import en flux des nouveaux morceaux de l'artiste courant."""
+    artist = app.current_artist
+    if not artist or not artist.id:
+        messagebox.showwarning("Attention", "Aucun artiste enregistré sélectionné")
+        return
+
+    app.get_tracks_button.configure(state="disabled", text="Import en flux...")
+    app.progress_bar.set(0)
+
+    def on_progress(stats):
+        saved = stats[STAGE_SAVE].done
+        text = f"Import en flux : {_progress_text(stats)}"
+        app.root.after(0, lambda: app.progress_label.configure(text=text))
+        app.root.after(0, lambda: app.progress_var.set(min(1.0, saved / options.max_songs)))
+
+    async def onboard():
+        try:
+            result = await onboard_artist(
+                artist,
+                options,
+                genius_api=app.genius_api,
+                data_manager=app.data_manager,
+                data_enricher=app.data_enricher if options.enrich_sources != [] else None,
+                should_stop=stop_requested,
+                on_progress=on_progress,
+            )
+            artist.tracks = await asyncio.to_thread(app.data_manager.get_artist_tracks, artist.id)
+            app.tracks = artist.tracks
+
+            saved = sum(1 for t in result.items if t.id)
+            lines = [f"✅ {saved} nouveau(x) morceau(x) importé(s) pour {artist.name}"]
+            if result.stopped:
+                lines.append("⏹️ Import interrompu : les morceaux en vol ont été terminés")
+            for name, s in result.stats.items():
+                failed = f" ({s.failed} en échec)" if s.failed else ""
+                lines.append(f"  · {_STAGE_LABELS.get(name, name)} : {s.done}{failed}")
+            lines.append(f"📊 Total en base : {len(artist.tracks)} morceaux")
+            summary = "\n".join(lines)
+
+            app.root.after(0, lambda: report.show_scrollable_report(app, "Import terminé", summary))
+            app.root.after(0, app._update_artist_info)
+            app.root.after(0, app._update_statistics)
+            app.root.after(0, app._populate_tracks_table)
+
+        except Exception as e:
+            error_msg = str(e) or "Erreur inconnue lors de l'import"
+            logger.exception("Erreur lors de l'import en flux")
+            app.root.after(
+                0,
+                lambda: messagebox.showerror("Erreur", f"Erreur lors de l'import:\n{error_msg}"),
+            )
+        finally:
+            app.root.after(
+                0, lambda: app.get_tracks_button.configure(state="normal", text="Discographie")
+            )
+            app.root.after(0, lambda: app.progress_bar.set(0))
+            app.root.after(0, lambda: app.progress_label.configure(text=""))
+
+    async_loop.start()  # idempotent
+    async_loop.submit(onboard())
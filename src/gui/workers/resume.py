@@ -0,0 +1,89 @@
+"""Reprise, au démarrage, des batchs interrompus (jobs `batch_jobs`, e17).
+
+Un enrichissement, un scraping ou une mise à jour des streams coupé par la
+fermeture de l'app, un crash ou le budget de `shutdown_workers` reste un job
+'running' avec des paires (morceau, provider) en attente. Au démarrage, chaque
+job interrompu est proposé : « Oui » recharge l'artiste et relance le flux
+d'origine (mêmes options) sur les SEULES paires en attente ; « Non »
+l'abandonne (plus proposé). Un seul job est repris par démarrage — les
+suivants restent proposés au prochain.
+"""
+
+from tkinter import messagebox
+
+from src.gui.panels import tracks_table
+from src.gui.workers import enrichment, scraping, streams
+from src.utils.job_repository import JOB_ENRICHMENT, JOB_SCRAPING, JOB_STREAMS, BatchJob
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_KIND_LABELS = {
+    JOB_ENRICHMENT: "Enrichissement",
+    JOB_SCRAPING: "Crédits & Paroles",
+    JOB_STREAMS: "Nb Streams",
+}
+
+
+def describe_job(job: BatchJob) -> str:
+    """Message de la proposition de reprise (pur)."""
+    label = _KIND_LABELS.get(job.kind, job.kind)
+    tracks = sum(1 for track_id in job.pending if track_id is not None)
+    providers = sorted({p for providers in job.pending.values() for p in providers})
+    lines = [
+        f"{label} de {job.artist_name} interrompu",
+        f"(lancé le {job.created_at or '?'}, dernier jalon {job.checkpoint_at or '?'}).",
+        "",
+    ]
+    if tracks:
+        lines.append(f"📊 Restant : {tracks} morceau(x), {job.pending_count} appel(s) source")
+    lines.append(f"🔌 Sources : {', '.join(providers)}")
+    lines += ["", "Reprendre là où il s'est arrêté ?", "(Non = abandonner ce batch)"]
+    return "\n".join(lines)
+
+
+def offer_resume(app) -> None:
+    """Propose la reprise des jobs interrompus (du plus récent au plus ancien)."""
+    try:
+        jobs = app.data_manager.unfinished_jobs()
+    except Exception as e:
+        logger.error(f"Lecture des batchs interrompus: {e}")
+        return
+    for job in jobs:
+        if messagebox.askyesno("Batch interrompu", describe_job(job)):
+            resume_job(app, job)
+            return
+        app.data_manager.abandon_job(job.id)
+        logger.info(f"Batch {job.id} ({job.kind}) abandonné")
+
+
+def resume_job(app, job: BatchJob) -> None:
+    """Recharge l'artiste du job et relance son flux sur les paires en attente."""
+    artist = app.data_manager.get_artist_by_name(job.artist_name)
+    if artist is None:
+        logger.warning(f"Reprise du batch {job.id} : artiste {job.artist_name!r} introuvable")
+        app.data_manager.abandon_job(job.id)
+        return
+    app.current_artist = artist
+    app._update_artist_info()
+    tracks_table.apply_default_sort(app)
+    logger.info(f"▶️ Reprise du batch {job.id} ({job.kind}) : {job.pending_count} paire(s)")
+
+    options = job.options
+    if job.kind == JOB_STREAMS:
+        steps = {step for providers in job.pending.values() for step in providers}
+        streams.run_streams_update(app, "spotify" in steps, "ytm" in steps, job=job)
+        return
+
+    app.selected_tracks = {i for i, track in enumerate(artist.tracks) if track.id in job.pending}
+    if job.kind == JOB_ENRICHMENT:
+        enrichment.run_enrichment(
+            app,
+            options.get("sources", []),
+            force_update=options.get("force_update", False),
+            reset_spotify_id=options.get("reset_spotify_id", False),
+            clear_on_failure=options.get("clear_on_failure", True),
+            job=job,
+        )
+    elif job.kind == JOB_SCRAPING:
+        scraping.start_combined_scraping(app, **options, job=job)
@@ -4,6 +4,8 @@ from tkinter import messagebox
 
 import customtkinter as ctk
 
+from src.api.async_http import AsyncHttpSession
+from src.concurrency import async_loop
 from src.gui.dialogs import report
 from src.gui.workers.lifecycle import run_worker, stop_requested
 from src.utils.logger import get_logger
@@ -19,13 +21,13 @@ def get_tracks(app):
     # Inclure les features
     dialog = ctk.CTkToplevel(app.root)
     dialog.title("Options de récupération")
-    dialog.geometry("480x940")
+    dialog.geometry("480x1020")
 
     # Centrer la fenêtre
     dialog.update_idletasks()
     x = (dialog.winfo_screenwidth() // 2) - (240)
-    y = (dialog.winfo_screenheight() // 2) - (470)
-    dialog.geometry(f"480x940+{x}+{y}")
+    y = (dialog.winfo_screenheight() // 2) - (510)
+    dialog.geometry(f"480x1020+{x}+{y}")
 
     dialog.lift()
     dialog.focus_force()
@@ -37,6 +39,7 @@ def get_tracks(app):
     include_secondary_var = ctk.BooleanVar(value=False)  # Rôles secondaires (Additional Voices…)
     respect_deleted_var = ctk.BooleanVar(value=True)  # Ne pas réajouter les morceaux supprimés
     download_images_var = ctk.BooleanVar(value=True)  # Télécharger photos/covers/vignettes (Media)
+    pipeline_var = ctk.BooleanVar(value=False)  # Import en flux (crédits, paroles, audio)
 
     # Interface
     ctk.CTkLabel(
@@ -149,6 +152,26 @@ def get_tracks(app):
         justify="left",
     ).pack(anchor="w", padx=15, pady=(0, 8))
 
+    # Checkbox : import en flux (nouveaux morceaux jusqu'à la base, d'une traite)
+    pipeline_frame = ctk.CTkFrame(dialog)
+    pipeline_frame.pack(fill="x", padx=20, pady=(0, 5))
+
+    ctk.CTkCheckBox(
+        pipeline_frame,
+        text="Import complet en flux (crédits, paroles, audio)",
+        variable=pipeline_var,
+        font=("Arial", 12),
+    ).pack(anchor="w", padx=15, pady=12)
+
+    ctk.CTkLabel(
+        pipeline_frame,
+        text="🚀 Chaque NOUVEAU morceau enchaîne media → crédits/paroles → synchro →\n"
+        "audio → base dès sa découverte. Pas de fusion ni d'images (récup. classique).",
+        text_color="gray",
+        font=("Arial", 10),
+        justify="left",
+    ).pack(anchor="w", padx=15, pady=(0, 8))
+
     # Nombre maximum de morceaux
     max_songs_frame = ctk.CTkFrame(dialog)
     max_songs_frame.pack(fill="x", padx=20, pady=15)
@@ -191,6 +214,26 @@ def get_tracks(app):
         respect_deleted = respect_deleted_var.get()
         download_images = download_images_var.get()
         dialog.destroy()
+        if pipeline_var.get():
+            from src.gui.workers.onboarding import start_artist_onboarding
+            from src.utils.artist_onboarding import OnboardingOptions
+
+            skip = (
+                app.deleted_tracks_manager.load_deleted_ids(app.current_artist.name)
+                if respect_deleted
+                else set()
+            )
+            start_artist_onboarding(
+                app,
+                OnboardingOptions(
+                    max_songs=max_songs,
+                    include_features=include_features,
+                    include_secondary=include_secondary,
+                    prefill=prefill,
+                    skip_genius_ids=skip,
+                ),
+            )
+            return
         start_track_retrieval(
             app,
             max_songs,
@@ -319,15 +362,38 @@ def start_track_retrieval(
                     f"{n_retry} connus mais incomplets (album/Spotify/YouTube) à re-tenter"
                 )
 
-            # Récupérer les morceaux via l'API avec l'option features
-            new_tracks = app.genius_api.get_artist_songs(
-                app.current_artist,
-                max_songs=max_songs,
-                include_features=include_features,
-                prefill=prefill,
-                known_genius_ids=known_genius_ids,
-                include_secondary=include_secondary,
-            )
+            # Récupérer les morceaux via l'API avec l'option features — voie
+            # async sur la boucle applicative : pages et détails Genius en
+            # parallèle (budget du domaine), progression à chaque page reçue.
+            received = 0
+
+            def on_page(batch):
+                nonlocal received
+                received += len(batch)
+                app.root.after(
+                    0,
+                    lambda n=received: app.progress_label.configure(
+                        text=f"Récupération {mode_text} : {n} morceaux reçus..."
+                    ),
+                )
+
+            async def fetch_async():
+                http = AsyncHttpSession()
+                try:
+                    return await app.genius_api.get_artist_songs_async(
+                        http,
+                        app.current_artist,
+                        max_songs=max_songs,
+                        include_features=include_features,
+                        prefill=prefill,
+                        known_genius_ids=known_genius_ids,
+                        include_secondary=include_secondary,
+                        on_tracks=on_page,
+                    )
+                finally:
+                    await http.aclose()
+
+            new_tracks = async_loop.run_sync(fetch_async())
 
             # Historique des suppressions : ne pas réajouter les morceaux supprimés
             if new_tracks:
@@ -362,10 +428,14 @@ def start_track_retrieval(
                 new_count = 0
                 updated_count = 0
                 duplicates_avoided = 0
+                # Morceaux passés par la dédup (seuls ceux-là sont sauvegardables :
+                # les suivants n'ont pas encore récupéré l'ID de leur ligne en base)
+                deduped = len(new_tracks)
 
-                for track in new_tracks:
+                for index, track in enumerate(new_tracks):
                     if stop_requested():
                         logger.info("⏹️ Fermeture demandée — dédup interrompue")
+                        deduped = index
                         break
                     # ✅ DÉTECTION MULTI-NIVEAUX DES DOUBLONS
                     existing_track = None
@@ -469,19 +539,21 @@ def start_track_retrieval(
                     except Exception as e:
                         logger.warning(f"Téléchargement des images échoué: {e}")
 
-                # Sauvegarder dans la base
+                # Sauvegarder dans la base : UN lot, une transaction (un morceau en
+                # échec est isolé par savepoint et journalisé par save_tracks).
+                # Une fermeture demandée n'annule PAS le save : la transaction est
+                # courte, et les morceaux déjà dédupliqués ne doivent pas être perdus.
                 saved_count = 0
-                for track in new_tracks:
-                    if stop_requested():
-                        logger.info(
-                            "⏹️ Fermeture demandée — sauvegarde interrompue entre deux morceaux"
-                        )
-                        break
-                    try:
-                        app.data_manager.save_track(track)
-                        saved_count += 1
-                    except Exception as e:
-                        logger.warning(f"Erreur sauvegarde {track.title}: {e}")
+                if stop_requested():
+                    logger.info(
+                        f"⏹️ Fermeture demandée — sauvegarde des {deduped} morceau(x) "
+                        "déjà traités avant arrêt"
+                    )
+                try:
+                    saved_ids = app.data_manager.save_tracks(new_tracks[:deduped])
+                    saved_count = sum(1 for tid in saved_ids if tid is not None)
+                except Exception as e:
+                    logger.warning(f"Erreur sauvegarde du lot: {e}")
 
                 # ✅ CORRECTION : Recharger TOUS les tracks depuis la base après sauvegarde
                 app.current_artist.tracks = app.data_manager.get_artist_tracks(
@@ -6,6 +6,12 @@ coroutine soumise à la boucle unique le représente pour la coordination
 d'arrêt. Les CRAWLS Genius s'exécutent nativement dans la boucle (pont F4
 `run_sync` depuis le thread) : le thread ne porte plus que parsing + LLM +
 saves. `stop_requested()` est testé entre deux unités, comme avant.
+
+Job reprenable (`batch_jobs`, e17) : une paire (morceau, phase) par phase
+lancée — genius, discogs, lyrics (texte Genius), sync (timestamps + texte
+YTM). `JobCheckpoint` sauvegarde et marque les morceaux par lots au fil des
+phases ; un scraping interrompu ne rejoue à la reprise que les paires
+restées en attente.
 """
 
 from tkinter import messagebox
@@ -14,10 +20,34 @@ from src.enrichment.providers.lyrics import LyricsProvider
 from src.gui.dialogs import report
 from src.gui.workers.lifecycle import run_worker, stop_requested
 from src.scrapers.genius_scraper_v3 import GeniusScraperV3
+from src.utils.job_repository import JOB_SCRAPING, BatchJob, JobCheckpoint
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Phases suivies par le job (provider des paires)
+PHASE_GENIUS = "genius"
+PHASE_DISCOGS = "discogs"
+PHASE_LYRICS = "lyrics"
+PHASE_SYNC = "sync"
+
+
+def _job_phases(
+    scrape_genius, scrape_discogs, scrape_lyrics, scrape_sync, lyrics_genius, lyrics_ytm
+) -> list[str]:
+    """Phases réellement exécutées pour ces options (cf. corps de `scrape`)."""
+    phases = []
+    if scrape_genius:
+        phases.append(PHASE_GENIUS)
+    if scrape_discogs:
+        phases.append(PHASE_DISCOGS)
+    if scrape_lyrics or scrape_sync:
+        if lyrics_genius:
+            phases.append(PHASE_LYRICS)
+        if scrape_sync or lyrics_ytm:
+            phases.append(PHASE_SYNC)
+    return phases
+
 
 def start_combined_scraping(
     app,
@@ -33,12 +63,15 @@ def start_combined_scraping(
     sync_ytm=True,
     sync_musixmatch=False,
     force_sync=False,
+    job: BatchJob | None = None,
 ):
     """
     Lance le scraping combiné des crédits (Genius/Discogs), des paroles (texte) et/ou
     des timestamps (synchro : LRCLIB / YTM / Musixmatch) avec options de mise à jour forcée.
 
     `scrape_sync` : None => rétro-compat (déduit de sync_lrclib/sync_ytm/sync_musixmatch).
+    `job` : reprise d'un scraping interrompu (déjà confirmée) — chaque phase ne
+    traite que ses morceaux encore en attente.
     """
     # Rétro-compatibilité : anciens appels sans paramètres de synchro.
     if scrape_sync is None:
@@ -98,11 +131,33 @@ def start_combined_scraping(
         time_per_track += 2
     confirm_msg += f"\n⏱️ Temps estimé : ~{len(selected_tracks_list) * time_per_track:.0f}s"
 
-    result = messagebox.askyesno("Crédits & Paroles", confirm_msg)
-
-    if not result:
+    if job is None and not messagebox.askyesno("Crédits & Paroles", confirm_msg):
         return
 
+    phases = _job_phases(
+        scrape_genius, scrape_discogs, scrape_lyrics, scrape_sync, lyrics_genius, lyrics_ytm
+    )
+    options = {
+        "scrape_genius": scrape_genius,
+        "scrape_discogs": scrape_discogs,
+        "force_credits": force_credits,
+        "scrape_lyrics": scrape_lyrics,
+        "force_lyrics": force_lyrics,
+        "lyrics_ytm": lyrics_ytm,
+        "lyrics_genius": lyrics_genius,
+        "scrape_sync": scrape_sync,
+        "sync_lrclib": sync_lrclib,
+        "sync_ytm": sync_ytm,
+        "sync_musixmatch": sync_musixmatch,
+        "force_sync": force_sync,
+    }
+
+    def phase_tracks(*names):
+        """Morceaux à traiter par la phase (reprise : ceux encore en attente)."""
+        if job is None:
+            return selected_tracks_list
+        return [t for t in selected_tracks_list if set(names) & set(job.pending.get(t.id, ()))]
+
     # Afficher la barre de progression
     app._show_progress_bar()
     app.is_scraping = True
@@ -129,10 +184,25 @@ def start_combined_scraping(
         discogs_credits_results = None
         lyrics_results = None
         sync_results = None
+        checkpoint = None
 
         try:
             logger.info(f"Début du scraping combiné de {len(selected_tracks_list)} morceaux")
 
+            # Les jalons sauvegardent en cours de route : artiste posé d'emblée
+            for track in selected_tracks_list:
+                track.artist = app.current_artist
+            if job is None:
+                job_id = app.data_manager.create_job(
+                    JOB_SCRAPING,
+                    app.current_artist.id,
+                    [(t.id, phase) for t in selected_tracks_list if t.id for phase in phases],
+                    options,
+                )
+            else:
+                job_id = job.id
+            checkpoint = JobCheckpoint(app.data_manager, job_id, save=app.data_manager.save_tracks)
+
             total_tasks = (
                 (1 if scrape_genius else 0)
                 + (1 if scrape_discogs else 0)
@@ -146,17 +216,23 @@ def start_combined_scraping(
                 logger.info(f"[{current_task}/{total_tasks}] Scraping des crédits Genius...")
 
                 scraper = GeniusScraperV3(headless=True)
+                genius_tracks = phase_tracks(PHASE_GENIUS)
 
                 if force_credits:
                     # Effacer les crédits Genius existants pour forcer le re-scraping
-                    for track in selected_tracks_list:
+                    for track in genius_tracks:
                         # Garder les crédits Discogs, supprimer uniquement ceux de Genius
                         track.credits = [c for c in track.credits if c.source != "genius"]
                         track.credits_scraped_at = None
 
+                def on_genius(current, total, name):
+                    # Rappelé APRÈS chaque morceau du batch
+                    update_progress(current, total, name, "Genius")
+                    track = genius_tracks[current - 1]
+                    checkpoint.record(track, PHASE_GENIUS, bool(track.credits))
+
                 genius_credits_results = scraper.scrape_multiple_tracks(
-                    selected_tracks_list,
-                    progress_callback=lambda c, t, n: update_progress(c, t, n, "Genius"),
+                    genius_tracks, progress_callback=on_genius
                 )
 
             if stop_requested():
@@ -175,30 +251,34 @@ def start_combined_scraping(
                 discogs_token = os.getenv("DISCOGS_TOKEN") or os.getenv("DISCOGS_USER_TOKEN")
                 discogs_client = DiscogsClient(user_token=discogs_token)
 
+                discogs_tracks = phase_tracks(PHASE_DISCOGS)
                 if force_credits:
                     # Effacer les crédits Discogs existants pour forcer le re-scraping
-                    for track in selected_tracks_list:
+                    for track in discogs_tracks:
                         # Garder les crédits Genius, supprimer uniquement ceux de Discogs
                         track.credits = [c for c in track.credits if c.source != "discogs"]
 
                 discogs_success = 0
                 discogs_failed = 0
-                for i, track in enumerate(selected_tracks_list, 1):
+                for i, track in enumerate(discogs_tracks, 1):
                     if stop_requested():
                         logger.info(
                             "⏹️ Fermeture demandée — Discogs interrompu entre deux morceaux"
                         )
                         break
+                    ok = False
                     try:
-                        update_progress(i, len(selected_tracks_list), track.title, "Discogs")
+                        update_progress(i, len(discogs_tracks), track.title, "Discogs")
 
-                        if discogs_client.enrich_track_data(track, force_update=force_credits):
+                        ok = discogs_client.enrich_track_data(track, force_update=force_credits)
+                        if ok:
                             discogs_success += 1
                         else:
                             discogs_failed += 1
                     except Exception as e:
                         logger.error(f"Erreur Discogs pour {track.title}: {e}")
                         discogs_failed += 1
+                    checkpoint.record(track, PHASE_DISCOGS, bool(ok))
 
                 discogs_credits_results = {"success": discogs_success, "failed": discogs_failed}
 
@@ -212,15 +292,17 @@ def start_combined_scraping(
                     return
 
                 # Mise à jour forcée : TEXTE et SYNCHRO sont désormais indépendants.
+                # Chaque reset ne vise que les morceaux dont SA phase est en attente
+                # (reprise : un texte déjà obtenu n'est pas effacé pour la synchro).
                 if force_lyrics:
-                    for track in selected_tracks_list:
+                    for track in phase_tracks(PHASE_LYRICS):
                         track.lyrics.text = None
                         track.anecdotes = None
                         track.lyrics.present = False
                         track.lyrics.scraped_at = None
                         track.lyrics.source = None
                 if force_sync:
-                    for track in selected_tracks_list:
+                    for track in phase_tracks(PHASE_SYNC):
                         track.lyrics.synced = None
                         track.lyrics.synced_source = None
                         track.lyrics.synced_confidence = None
@@ -235,18 +317,25 @@ def start_combined_scraping(
                 # 1) TEXTE STRUCTURÉ : Genius (sections [Couplet : artiste]). Le batch
                 #    skippe les morceaux déjà pourvus (ex. via la phase crédits Genius).
                 if lyrics_genius:
+                    lyrics_tracks = phase_tracks(PHASE_LYRICS)
                     need_text = [
-                        t for t in selected_tracks_list if not (t.lyrics.present and t.lyrics.text)
+                        t for t in lyrics_tracks if not (t.lyrics.present and t.lyrics.text)
                     ]
+
+                    def on_lyrics(current, total, name):
+                        update_progress(current, total, name, "Paroles (Genius)")
+                        track = lyrics_tracks[current - 1]
+                        checkpoint.record(track, PHASE_LYRICS, bool(track.lyrics.text))
+
                     if need_text:
                         if scraper is None:
                             scraper = GeniusScraperV3(headless=True)
                         lyrics_results = scraper.scrape_lyrics_batch(
-                            selected_tracks_list,
-                            progress_callback=lambda c, t, n: update_progress(
-                                c, t, n, "Paroles (Genius)"
-                            ),
+                            lyrics_tracks, progress_callback=on_lyrics
                         )
+                    else:
+                        for track in lyrics_tracks:
+                            checkpoint.record(track, PHASE_LYRICS)
                     for t in selected_tracks_list:
                         if t.lyrics.present and t.lyrics.text and not t.lyrics.source:
                             t.lyrics.source = "genius"
@@ -271,7 +360,8 @@ def start_combined_scraping(
                         )
 
                         n_lrclib, n_ytm, n_mxm, n_cross, n_review, n_text = 0, 0, 0, 0, 0, 0
-                        for i, track in enumerate(selected_tracks_list):
+                        sync_tracks = phase_tracks(PHASE_SYNC)
+                        for i, track in enumerate(sync_tracks):
                             if stop_requested():
                                 logger.info(
                                     "⏹️ Fermeture demandée — synchro interrompue entre deux morceaux"
@@ -283,6 +373,7 @@ def start_combined_scraping(
                                 track.lyrics.present and track.lyrics.text
                             )
                             if not need_sync and not need_text:
+                                checkpoint.record(track, PHASE_SYNC)
                                 continue
 
                             # Nom d'artiste (feat → artiste principal)
@@ -313,7 +404,12 @@ def start_combined_scraping(
                                     n_review += 1
                             if outcome.text is not None:
                                 n_text += 1
-                            update_progress(i + 1, n_tracks, track.title, "Timestamps")
+                            checkpoint.record(
+                                track,
+                                PHASE_SYNC,
+                                outcome.lyrics_synced is not None or outcome.text is not None,
+                            )
+                            update_progress(i + 1, len(sync_tracks), track.title, "Timestamps")
                         logger.info(
                             f"⏱ Synchro : {n_lrclib} LRCLIB, {n_ytm} YTM, {n_mxm} Musixmatch ; "
                             f"{n_cross} croisé(s), {n_review} à vérifier ; {n_text} texte(s) fallback"
@@ -347,10 +443,11 @@ def start_combined_scraping(
                         "lyrics_scraped": n_ok,
                     }
 
-            # Sauvegarder les données mises à jour
-            for track in selected_tracks_list:
-                track.artist = app.current_artist
-                app.data_manager.save_track(track)
+            # Sauvegarder les données mises à jour (un lot, une transaction),
+            # puis jalon des paires encore en tampon et clôture du job
+            app.data_manager.save_tracks(selected_tracks_list)
+            checkpoint.flush(save=False)
+            app.data_manager.finish_job(job_id)
 
             # Afficher le résumé
             success_msg = "Scraping terminé !\n\n"
@@ -404,6 +501,13 @@ def start_combined_scraping(
                 0, lambda: messagebox.showerror("Erreur", f"Erreur lors du scraping: {error_msg}")
             )
         finally:
+            # Interruption : ce qui a été scrapé depuis le dernier jalon est
+            # sauvegardé (le reste demeure en attente pour la reprise)
+            if checkpoint is not None:
+                try:
+                    checkpoint.flush()
+                except Exception as e:
+                    logger.error(f"Jalon final du scraping non écrit: {e}")
             # S'assurer que le scraper est fermé
             if scraper:
                 try:
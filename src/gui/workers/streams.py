@@ -1,4 +1,10 @@
-"""Mise à jour des streams Spotify (Kworb) / YouTube Music en thread"""
+"""Mise à jour des streams Spotify (Kworb) / YouTube Music en thread
+
+Job reprenable (`batch_jobs`, e17) : une étape par source, au niveau de
+l'artiste (`track_id` NULL) — chaque provider écrit lui-même en base, l'étape
+est marquée dès qu'il rend la main. Une mise à jour interrompue ne relance à
+la reprise que les sources non terminées.
+"""
 
 from tkinter import messagebox
 
@@ -7,6 +13,7 @@ import customtkinter as ctk
 from src.enrichment.providers.streams import StreamsProvider
 from src.gui.dialogs import kworb_confirm, report
 from src.gui.workers.lifecycle import run_worker, stop_requested
+from src.utils.job_repository import ITEM_DONE, ITEM_FAILED, JOB_STREAMS, BatchJob
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -66,8 +73,18 @@ def start_streams_update(app):
     ctk.CTkButton(dialog, text="Lancer", command=launch, width=120).pack(pady=18)
 
 
-def run_streams_update(app, fetch_spotify: bool, fetch_ytm: bool, ytm_channel_raw: str = ""):
-    """Lance la récupération des streams dans un thread daemon."""
+def run_streams_update(
+    app,
+    fetch_spotify: bool,
+    fetch_ytm: bool,
+    ytm_channel_raw: str = "",
+    job: BatchJob | None = None,
+):
+    """Lance la récupération des streams dans un thread daemon.
+
+    `job` : reprise d'une mise à jour interrompue (les sources à relancer sont
+    déduites par l'appelant de `job.pending`).
+    """
     if hasattr(app, "streams_button"):
         app.streams_button.configure(state="disabled")
 
@@ -80,6 +97,21 @@ def run_streams_update(app, fetch_spotify: bool, fetch_ytm: bool, ytm_channel_ra
             app.root.after(0, app._show_progress_bar)
             results = {}
 
+            if job is None:
+                steps = [s for s, on in (("spotify", fetch_spotify), ("ytm", fetch_ytm)) if on]
+                job_id = app.data_manager.create_job(
+                    JOB_STREAMS,
+                    app.current_artist.id,
+                    [(None, step) for step in steps],
+                    {"fetch_spotify": fetch_spotify, "fetch_ytm": fetch_ytm},
+                )
+            else:
+                job_id = job.id
+
+            def step_done(step: str) -> None:
+                status = ITEM_FAILED if "error" in results.get(step, {}) else ITEM_DONE
+                app.data_manager.mark_job_items(job_id, [(None, step, status)])
+
             if fetch_spotify and not stop_requested():
                 app.root.after(
                     0, lambda: app.progress_label.configure(text="Spotify (Kworb) en cours...")
@@ -90,6 +122,9 @@ def run_streams_update(app, fetch_spotify: bool, fetch_ytm: bool, ytm_channel_ra
                     )
                 except Exception as e:
                     results["spotify"] = {"error": str(e)}
+                # Kworb interrompu par un arrêt : l'étape reste 'pending' (reprise)
+                if not stop_requested():
+                    step_done("spotify")
 
             if fetch_ytm and not stop_requested():
                 app.root.after(
@@ -126,6 +161,9 @@ def run_streams_update(app, fetch_spotify: bool, fetch_ytm: bool, ytm_channel_ra
                             logger.warning(f"Vues clips échouées: {e}")
                 except Exception as e:
                     results["ytm"] = {"error": str(e)}
+                if not stop_requested():
+                    step_done("ytm")
+            app.data_manager.finish_job(job_id)
 
             # Construire le message résumé
             lines = ["Récupération terminée !\n"]
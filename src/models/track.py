@@ -1,10 +1,11 @@
 """Modèles pour représenter les morceaux et crédits"""
 
+import copy
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 if TYPE_CHECKING:
     from src.enrichment.observation import Observation
@@ -221,6 +222,119 @@ _MUSIC_EXCLUSIONS = (
 )
 
 
+class _Deferred:
+    """Marqueur d'un champ différé pas encore chargé (valeur d'instantané)."""
+
+    def __repr__(self) -> str:
+        return "<différé>"
+
+
+DEFERRED = _Deferred()
+
+
+class _DeferredField:
+    """Descripteur d'un champ à chargement différé (projection E7d).
+
+    Valeur absente de `__dict__` → le premier accès délègue au chargeur posé par
+    `defer()` (`loader.load(key)`), qui remplit le champ — et ceux des morceaux
+    voisins, par lots. Une affectation avant chargement prime (jamais écrasée).
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        attrs = obj.__dict__
+        if self.name not in attrs:
+            loader, key = attrs["_lazy"]
+            loader.load(key)
+        return attrs[self.name]
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self.name] = value
+
+
+# Noms des champs suivis par classe (calculés une fois : `fields()` est coûteux
+# et `_tracked_values` tourne pour chaque morceau chargé).
+_TRACKED_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+class ChangeTracked:
+    """Suivi des modifications (dirty tracking) par instantané des champs.
+
+    `mark_clean()` mémorise l'état courant — posé par le mapper à la lecture DB
+    puis par le repository après chaque sauvegarde ; `changed_fields()` renvoie
+    les champs modifiés depuis, ou None si aucun instantané (objet construit hors
+    base : l'appelant retombe sur l'écriture complète). L'instantané vit dans
+    `__dict__`, hors des champs dataclass (ni repr, ni eq, ni asdict).
+    """
+
+    # Champs exclus du suivi (transitoires, identité, sous-objets suivis à part).
+    _UNTRACKED: ClassVar[frozenset[str]] = frozenset()
+
+    def _tracked_values(self) -> dict[str, Any]:
+        cls = type(self)
+        names = _TRACKED_NAMES.get(cls)
+        if names is None:
+            names = tuple(f.name for f in fields(cls) if f.name not in cls._UNTRACKED)
+            _TRACKED_NAMES[cls] = names
+        values = {}
+        attrs = self.__dict__
+        for name in names:
+            value = attrs.get(name, DEFERRED)  # champ différé non chargé : marqueur
+            # Listes/dicts copiés : une mutation en place doit rester visible
+            # (deepcopy seulement si non vide — chemin chaud du chargement).
+            if isinstance(value, (list, dict)):
+                value = copy.deepcopy(value) if value else type(value)()
+            values[name] = value
+        return values
+
+    def mark_clean(self) -> None:
+        """L'état courant devient la référence (= ce que la base contient)."""
+        self.__dict__["_snapshot"] = self._tracked_values()
+
+    def changed_fields(self) -> set[str] | None:
+        """Champs modifiés depuis `mark_clean()` ; None si jamais marqué propre."""
+        snapshot = self.__dict__.get("_snapshot")
+        if snapshot is None:
+            return None
+        return {name for name, value in self._tracked_values().items() if snapshot[name] != value}
+
+    # --- Champs différés (projection E7d) -----------------------------------
+
+    # Champs retirés de l'instance par `defer()` (classes « Deferred* »).
+    _DEFERRED_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    def defer(self, loader, key) -> None:
+        """Retire les champs différés : chargés au premier accès via `loader.load(key)`."""
+        for name in self._DEFERRED_FIELDS:
+            self.__dict__.pop(name, None)
+        self.__dict__["_lazy"] = (loader, key)
+
+    def peek(self, name: str) -> Any:
+        """Valeur d'un champ SANS déclencher de chargement différé (None si pas chargé)."""
+        return self.__dict__.get(name)
+
+    def fill_deferred(self, values: dict[str, Any], clean_values: dict[str, Any] | None = None):
+        """Pose les champs différés chargés (appelé par le chargeur).
+
+        Un champ affecté entre-temps par l'appelant n'est pas écrasé. L'instantané
+        adopte `clean_values` (défaut : `values`) — la valeur telle qu'en base —
+        pour qu'un champ chargé ne compte pas comme modifié.
+        """
+        attrs = self.__dict__
+        snapshot = attrs.get("_snapshot")
+        clean_values = values if clean_values is None else clean_values
+        for name, value in values.items():
+            if name in attrs:
+                continue
+            attrs[name] = value
+            if snapshot is not None and snapshot.get(name) is DEFERRED:
+                snapshot[name] = clean_values[name]
+
+
 @dataclass
 class Credit:
     """Représente un crédit sur un morceau"""
@@ -276,7 +390,7 @@ class Credit:
 
 
 @dataclass
-class Audio:
+class Audio(ChangeTracked):
     """Données audio réconciliées d'un morceau (BPM / key / mode + provenance).
 
     Sous-objet de `Track` (Phase 5). Regroupe les champs audio historiquement
@@ -298,7 +412,7 @@ class Audio:
 
 
 @dataclass
-class Streams:
+class Streams(ChangeTracked):
     """Compteurs de streams d'un morceau (Spotify via Kworb + YouTube Music).
 
     Sous-objet de `Track` (Phase 5). Écrits en base par write-through
@@ -314,7 +428,7 @@ class Streams:
 
 
 @dataclass
-class Lyrics:
+class Lyrics(ChangeTracked):
     """Paroles d'un morceau (texte + synchro LRC + provenance).
 
     Sous-objet de `Track` (Phase 5). Champs renommés (le sous-objet porte déjà le
@@ -330,9 +444,57 @@ class Lyrics:
     synced_source: str | None = None  # colonne `lyrics_synced_source`
     synced_confidence: int | None = None  # colonne `lyrics_synced_confidence`
 
+    @property
+    def has_text(self) -> bool:
+        """Paroles non vides (vues liste : ne force pas un chargement différé)."""
+        return bool(self.text and self.text.strip())
+
+    @property
+    def has_synced(self) -> bool:
+        """LRC retenu présent (vues liste : ne force pas un chargement différé)."""
+        return bool(self.synced)
+
+
+class DeferredLyrics(Lyrics):
+    """`Lyrics` dont texte et synchro sont chargés au premier accès (E7d).
+
+    Construit par le mapper en chargement par projection : `text` et le trio
+    `synced*` (réconcilié depuis les observations `lyrics_synced`) restent en
+    base tant qu'on n'y touche pas. `has_text` / `has_synced` répondent depuis
+    des indices calculés en SQL, sans charger le contenu.
+    """
+
+    _DEFERRED_FIELDS: ClassVar[tuple[str, ...]] = (
+        "text",
+        "synced",
+        "synced_source",
+        "synced_confidence",
+    )
+    text = _DeferredField()
+    synced = _DeferredField()
+    synced_source = _DeferredField()
+    synced_confidence = _DeferredField()
+
+    def __init__(self, loader, key, *, has_text: bool, has_synced: bool, **kwargs):
+        super().__init__(**kwargs)
+        self.defer(loader, key)
+        self.__dict__["_hints"] = (has_text, has_synced)
+
+    @property
+    def has_text(self) -> bool:
+        if "text" in self.__dict__:
+            return super().has_text
+        return self.__dict__["_hints"][0]
+
+    @property
+    def has_synced(self) -> bool:
+        if "synced" in self.__dict__:
+            return super().has_synced
+        return self.__dict__["_hints"][1]
+
 
 @dataclass
-class Certs:
+class Certs(ChangeTracked):
     """Certifications d'un morceau (plus haute + listes détaillées).
 
     Sous-objet de `Track` (Phase 5). Renommé (`certs`) pour éviter la collision
@@ -349,7 +511,7 @@ class Certs:
 
 
 @dataclass
-class Media:
+class Media(ChangeTracked):
     """Images (pochette/vignette) et vidéo YouTube d'un morceau.
 
     Sous-objet de `Track` (Phase 5). Accès via track.media.<champ> ; noms alignés
@@ -365,7 +527,7 @@ class Media:
 
 
 @dataclass(eq=False)
-class Track:
+class Track(ChangeTracked):
     """Représente un morceau musical"""
 
     id: int | None = None
@@ -456,6 +618,63 @@ class Track:
     # `streams` (Phase 5) : accès via track.streams.<champ>.
     streams: Streams = field(default_factory=Streams)
 
+    # Dirty tracking : identité, transitoires et dates système hors suivi ; les
+    # sous-objets ont leur propre instantané, les crédits un instantané de clés.
+    _UNTRACKED: ClassVar[frozenset[str]] = frozenset(
+        {
+            "id",
+            "title",
+            "artist",
+            "_album_from_api",
+            "_release_date_from_api",
+            "audio",
+            "lyrics",
+            "media",
+            "certs",
+            "streams",
+            "credits",
+            "observations",
+            "clear_audio_observations",
+            "scraping_errors",
+            "created_at",
+            "updated_at",
+        }
+    )
+    _SUB_OBJECTS: ClassVar[tuple[str, ...]] = ("audio", "lyrics", "certs", "media", "streams")
+
+    def mark_clean(self, *, with_credits: bool = True) -> None:
+        """Instantané du morceau, de ses sous-objets et (si connus) de ses crédits.
+
+        `with_credits=False` : crédits non chargés depuis la base → pas de
+        référence, « credits » restera toujours modifié (remplacement complet).
+        """
+        super().mark_clean()
+        for name in self._SUB_OBJECTS:
+            self.__dict__[name].mark_clean()
+        self.__dict__["_credits_snapshot"] = self.credit_keys() if with_credits else None
+
+    def changed_fields(self) -> set[str] | None:
+        """Champs modifiés, sous-objets en notation pointée (`lyrics.text`, `certs.entries`…).
+
+        None si le morceau n'a pas d'instantané OU si un sous-objet a été remplacé
+        depuis (le nouveau n'en a pas) : état de référence inconnu.
+        """
+        changed = super().changed_fields()
+        if changed is None:
+            return None
+        for name in self._SUB_OBJECTS:
+            sub_changed = self.__dict__[name].changed_fields()
+            if sub_changed is None:
+                return None
+            changed |= {f"{name}.{sub_field}" for sub_field in sub_changed}
+        if self.credit_keys() != self.__dict__["_credits_snapshot"]:
+            changed.add("credits")
+        return changed
+
+    def credit_keys(self) -> list[tuple]:
+        """Crédits sous forme de clés comparables (name, role, role_detail, source)."""
+        return [(c.name, c.role, c.role_detail, c.source) for c in self.credits]
+
     def _identity(self) -> tuple:
         """Clé d'identité métier d'un morceau.
 
@@ -818,3 +1037,14 @@ class Track:
             if sid not in ids:
                 ids.append(sid)
         return ids
+
+
+class DeferredTrack(Track):
+    """`Track` du chargement par projection (E7d) : `anecdotes` différé.
+
+    Les paroles vivent dans un `DeferredLyrics` ; le chargeur remplit les deux
+    ensemble (une requête par lot de morceaux).
+    """
+
+    _DEFERRED_FIELDS: ClassVar[tuple[str, ...]] = ("anecdotes",)
+    anecdotes = _DeferredField()
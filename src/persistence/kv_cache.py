@@ -0,0 +1,313 @@
+"""Cache clé → valeur PARTAGÉ des clients externes (`data/cache.db`).
+
+Remplace les caches « dictionnaire entier réécrit à chaque insertion »
+(`reccobeats_cache.json`, `getsongbpm_cache.json`, `spotify_ids_cache.json`,
+`bpmfinder_cache.json` — O(n²) en I/O sur un batch, fichier tronqué au moindre
+crash) et le cache sqlite+pickle de `YouTubeSearcher`. Une seule base SQLite
+(WAL), une ligne par entrée :
+
+  · ESPACES DE NOMS — chaque client a le sien (`namespace("reccobeats")`),
+    vu comme un `dict` (`CacheNamespace`) : le code client garde ses
+    `cache[key] = …`, `key in cache`, `del cache[key]` ;
+  · TTL par espace, et TTL distinct pour les entrées NÉGATIVES (`"not_found"`,
+    `{"error": …}`) — un morceau introuvable aujourd'hui peut apparaître
+    demain, une analyse réussie reste valable ;
+  · écritures O(1), chacune dans sa PROPRE transaction courte (autocommit ;
+    en WAL + `synchronous=NORMAL` un commit ne coûte pas de fsync) : aucun
+    verrou d'écriture n'est gardé entre deux appels, la GUI, `src.batch` et
+    ses `--processes` partagent la base sans se bloquer ;
+  · écritures BEST-EFFORT : base verrouillée au-delà de `busy_timeout`
+    (autre processus en pleine maintenance…) → avertissement, l'entrée
+    n'est pas mise en cache mais le résultat d'API n'est jamais perdu ;
+  · maintenance hors batch (`purge_expired`, `evict` par âge / taille) et
+    import unique des anciens fichiers JSON (`import_json`), pilotés par
+    `scripts/cache_maintenance.py`.
+
+Valeurs sérialisées en JSON (jamais de pickle). Accès protégés par un verrou :
+le cache est partagé entre le thread sync du batch (Playwright) et la boucle
+asyncio.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import contextmanager
+from pathlib import Path
+
+DAY = 86400.0
+
+# Durée de vie par défaut d'une entrée négative : on retente la semaine suivante.
+NEGATIVE_TTL = 7 * DAY
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    negative INTEGER NOT NULL DEFAULT 0,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_kv_entries_stored ON kv_entries (stored_at);
+"""
+
+
+def is_negative_value(value) -> bool:
+    """Entrée « introuvable » des clients : `"not_found"` ou dict porteur d'`error`."""
+    if value == "not_found":
+        return True
+    return isinstance(value, dict) and bool(value.get("error"))
+
+
+class KVCache:
+    """Base SQLite des espaces de noms (une connexion autocommit, verrou)."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None : pas de transaction implicite laissée ouverte
+        self._conn = sqlite3.connect(
+            self.path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def namespace(
+        self,
+        name: str,
+        *,
+        ttl: float | None = None,
+        negative_ttl: float | None = NEGATIVE_TTL,
+        is_negative: Callable[[object], bool] = is_negative_value,
+    ) -> "CacheNamespace":
+        """Vue `dict` de l'espace `name` (`ttl=None` : pas d'expiration)."""
+        return CacheNamespace(
+            self, name, ttl=ttl, negative_ttl=negative_ttl, is_negative=is_negative
+        )
+
+    # ── Accès élémentaires (utilisés par CacheNamespace) ──────────────────────
+
+    def lookup(self, namespace: str, key: str) -> tuple[bool, object]:
+        """`(trouvée, valeur)` ; une entrée expirée est absente."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM kv_entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= self._clock()):
+            return False, None
+        return True, json.loads(row[0])
+
+    def put(
+        self, namespace: str, key: str, value, *, ttl: float | None, negative: bool = False
+    ) -> None:
+        """Écrit (ou remplace) une entrée, commitée aussitôt ; best-effort."""
+        payload = json.dumps(value, ensure_ascii=False)
+        now = self._clock()
+        self._write(
+            "INSERT OR REPLACE INTO kv_entries "
+            "(namespace, key, value, negative, stored_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (namespace, key, payload, negative, now, None if ttl is None else now + ttl),
+        )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Supprime une entrée ; False si elle était absente (best-effort)."""
+        deleted = self._write(
+            "DELETE FROM kv_entries WHERE namespace = ? AND key = ?", (namespace, key)
+        )
+        return deleted != 0
+
+    def keys(self, namespace: str) -> list[str]:
+        """Clés vivantes (non expirées) de l'espace, triées."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM kv_entries WHERE namespace = ? "
+                "AND (expires_at IS NULL OR expires_at > ?) ORDER BY key",
+                (namespace, self._clock()),
+            ).fetchall()
+        return [key for (key,) in rows]
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM kv_entries WHERE namespace = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, self._clock()),
+            ).fetchone()[0]
+
+    def _write(self, sql: str, params: tuple) -> int | None:
+        """Une écriture autocommitée ; None si la base est restée verrouillée.
+
+        Une donnée de cache se ré-obtient : un verrou (ou une autre erreur
+        SQLite) ne doit jamais faire échouer le client qui vient d'appeler l'API.
+        """
+        try:
+            with self._lock:
+                return self._conn.execute(sql, params).rowcount
+        except sqlite3.OperationalError as e:
+            # import tardif : src.utils importe les clients API, qui importent ce module
+            from src.utils.logger import get_logger
+
+            get_logger(__name__).warning(f"⚠️ Cache {self.path.name} : écriture ignorée ({e})")
+            return None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transaction explicite et courte (maintenance, imports groupés)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # ── Maintenance (hors batch) ──────────────────────────────────────────────
+
+    def purge_expired(self) -> int:
+        """Supprime les entrées expirées ; renvoie leur nombre."""
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM kv_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (self._clock(),),
+            ).rowcount
+
+    def evict(self, *, max_age: float | None = None, max_bytes: int | None = None) -> int:
+        """Supprime les entrées plus vieilles que `max_age` (s), puis les plus
+        anciennes jusqu'à passer sous `max_bytes` (taille des valeurs)."""
+        evicted = 0
+        with self._transaction() as conn:
+            if max_age is not None:
+                evicted += conn.execute(
+                    "DELETE FROM kv_entries WHERE stored_at < ?", (self._clock() - max_age,)
+                ).rowcount
+            if max_bytes is not None:
+                total = conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM kv_entries"
+                ).fetchone()[0]
+                rows = conn.execute(
+                    "SELECT namespace, key, LENGTH(value) FROM kv_entries ORDER BY stored_at"
+                ).fetchall()
+                doomed = []
+                for namespace, key, size in rows:
+                    if total <= max_bytes:
+                        break
+                    doomed.append((namespace, key))
+                    total -= size
+                conn.executemany("DELETE FROM kv_entries WHERE namespace = ? AND key = ?", doomed)
+                evicted += len(doomed)
+        return evicted
+
+    def stats(self) -> dict[str, dict]:
+        """Par espace : entrées, négatives, expirées (à purger), octets."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT namespace, COUNT(*), SUM(negative), "
+                "SUM(expires_at IS NOT NULL AND expires_at <= ?), SUM(LENGTH(value)) "
+                "FROM kv_entries GROUP BY namespace ORDER BY namespace",
+                (self._clock(),),
+            ).fetchall()
+        return {
+            namespace: {"entries": n, "negative": neg, "expired": expired, "bytes": size}
+            for namespace, n, neg, expired, size in rows
+        }
+
+    def vacuum(self) -> None:
+        """Rend au disque la place libérée par `purge_expired` / `evict`."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CacheNamespace(MutableMapping):
+    """Espace de noms d'un `KVCache`, interface `dict` (clés str, valeurs JSON)."""
+
+    def __init__(
+        self,
+        store: KVCache,
+        name: str,
+        *,
+        ttl: float | None,
+        negative_ttl: float | None,
+        is_negative: Callable[[object], bool],
+    ) -> None:
+        self.store = store
+        self.name = name
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._is_negative = is_negative
+
+    def __getitem__(self, key: str):
+        found, value = self.store.lookup(self.name, key)
+        if not found:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.store.lookup(self.name, key)[0]
+
+    def __setitem__(self, key: str, value) -> None:
+        negative = self._is_negative(value)
+        ttl = self.negative_ttl if negative else self.ttl
+        self.store.put(self.name, key, value, ttl=ttl, negative=negative)
+
+    def __delitem__(self, key: str) -> None:
+        if not self.store.delete(self.name, key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.name))
+
+    def __len__(self) -> int:
+        return self.store.count(self.name)
+
+    def import_json(self, path: str | Path) -> int:
+        """Import unique d'un ancien cache JSON (`{clé: valeur}`).
+
+        Les entrées déjà présentes dans l'espace sont gardées (plus récentes que
+        le fichier) ; les négatives importées repartent pour un `negative_ttl`.
+        Renvoie le nombre d'entrées importées.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} : objet JSON attendu")
+        imported = 0
+        with self.store._transaction():  # une transaction pour tout le fichier
+            for key, value in data.items():
+                if key not in self:
+                    self[str(key)] = value
+                    imported += 1
+        return imported
+
+
+_default_cache: KVCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_kv_cache() -> KVCache:
+    """Cache partagé de l'app (`data/cache.db`), ouvert une fois par processus."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            from src.config import DATA_DIR
+
+            _default_cache = KVCache(DATA_DIR / "cache.db")
+    return _default_cache
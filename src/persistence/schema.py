@@ -27,6 +27,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Integer,
     MetaData,
     Table,
@@ -137,6 +138,10 @@ tracks = Table(
     Column("youtube_video_views", Integer),  # vues de LA vidéo (≠ ytm_streams)
     Column("youtube_video_views_updated", TIMESTAMP),
     UniqueConstraint("title", "artist_id"),
+    # e13 : l'UNIQUE(title, artist_id) a `title` en tête → inutilisable pour les
+    # filtres `WHERE artist_id = ?` (chargement d'un artiste, agrégats). Index
+    # (artist_id, title) : sert aussi l'`ORDER BY title` de get_artist_tracks.
+    Index("ix_tracks_artist_id_title", "artist_id", "title"),
     sqlite_autoincrement=True,
 )
 
@@ -151,6 +156,9 @@ credits = Table(
     Column("role_detail", Text),
     Column("source", Text),
     UniqueConstraint("track_id", "name", "role", "role_detail"),
+    # e13 : lookup par morceau explicite (l'UNIQUE le couvre déjà en tête, mais
+    # l'index étroit est plus compact pour les JOIN/GROUP BY track_id).
+    Index("ix_credits_track_id", "track_id"),
     sqlite_autoincrement=True,
 )
 
@@ -180,6 +188,7 @@ albums = Table(
     Column("ytm_streams_updated", TIMESTAMP),
     Column("spotify_album_ids", Text),
     UniqueConstraint("title", "artist_id"),
+    Index("ix_albums_artist_id", "artist_id"),  # e13 (cf. tracks)
     sqlite_autoincrement=True,
 )
 
@@ -204,5 +213,64 @@ observations = Table(
     Column("confidence", REAL),
     Column("seen_at", TIMESTAMP),
     UniqueConstraint("track_id", "field", "source"),
+    # e13 : requêtes transverses par champ/source (contrôles, stats, backfills) ;
+    # le lookup par morceau passe par l'UNIQUE (track_id en tête).
+    Index("ix_observations_field_source", "field", "source"),
+    sqlite_autoincrement=True,
+)
+
+
+# Cache de réconciliation (e14) : verdict de `reconcile()` par morceau (JSON) +
+# empreinte des observations qui l'ont produit (`src/enrichment/reconcile_cache.py`).
+# Donnée DÉRIVÉE : une entrée dont l'empreinte ne concorde plus est recalculée au
+# chargement ; reconstruction complète par `scripts/rebuild_reconcile_cache.py`.
+# Pas de cascade FK (cf. observations) → delete/merge la purgent explicitement.
+reconcile_cache = Table(
+    "reconcile_cache",
+    metadata,
+    Column("track_id", Integer, ForeignKey("tracks.id"), primary_key=True),
+    Column("obs_hash", Text, nullable=False),
+    Column("resolutions", Text, nullable=False),
+    Column("built_at", TIMESTAMP),
+)
+
+
+# Index plein texte (e16) : table virtuelle FTS5 `track_search`, NON déclarable
+# en MetaData (ni ses tables fantômes `track_search_*`). DDL et maintenance dans
+# `src/persistence/search_index.py` ; exclue du garde-fou test_schema_reflects_db.
+
+
+# Travaux de batch REPRENABLES (e17) : un job par lancement d'enrichissement /
+# scraping / streams, une ligne par paire (morceau, provider) à traiter. Les
+# workers passent les paires à 'done'/'failed' au fil des sauvegardes (jalon =
+# `checkpoint_at`) ; au redémarrage, un job encore 'running' avec des paires
+# 'pending' est proposé à la reprise (`src/utils/job_repository.py`).
+# `options` : paramètres du lancement (JSON) rejoués à la reprise.
+batch_jobs = Table(
+    "batch_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("kind", Text, nullable=False),  # 'enrichment' / 'scraping' / 'streams'
+    Column("artist_id", Integer, ForeignKey("artists.id"), nullable=False),
+    Column("options", Text),
+    Column("status", Text, nullable=False),  # 'running' / 'done' / 'abandoned'
+    Column("created_at", TIMESTAMP),
+    Column("checkpoint_at", TIMESTAMP),
+    Index("ix_batch_jobs_status", "status"),
+    sqlite_autoincrement=True,
+)
+
+# `track_id` NULL = étape au niveau de l'artiste (streams). Pas de FK vers
+# tracks : un morceau supprimé entre-temps est simplement ignoré à la reprise.
+batch_job_items = Table(
+    "batch_job_items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("job_id", Integer, ForeignKey("batch_jobs.id"), nullable=False),
+    Column("track_id", Integer),
+    Column("provider", Text, nullable=False),
+    Column("status", Text, nullable=False),  # 'pending' / 'done' / 'failed'
+    Column("updated_at", TIMESTAMP),
+    UniqueConstraint("job_id", "track_id", "provider"),
     sqlite_autoincrement=True,
 )
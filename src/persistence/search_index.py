@@ -0,0 +1,154 @@
+"""Index plein texte du catalogue (table virtuelle FTS5 `track_search`, révision e16).
+
+« Quels morceaux parlent de X ? », « tout ce qui est crédité à Y, tous artistes
+confondus » : sans index, seul un chargement d'artiste ou un `LIKE '%…%'` sur
+toute la base y répondait. `track_search` indexe, une ligne par morceau
+(`rowid = tracks.id`) :
+
+    title | lyrics (paroles en clair) | anecdotes | credits (noms, un par ligne)
+
+Tenue à jour par des HOOKS DU REPOSITORY (`reindex_tracks` / `remove_tracks`
+dans la transaction de l'écriture), pas par des triggers SQL : les paroles sont
+stockées compressées (BLOB `text_codec`, illisible pour FTS5) et la colonne
+`credits` agrège une autre table. Table FTS « à contenu » (le texte y est
+recopié en clair) : c'est ce qui permet `snippet()` et une suppression par
+rowid — `contentless_delete` exige SQLite 3.43. Donnée DÉRIVÉE : une écriture
+hors repository (script, SQL à la main) se rattrape par `rebuild` (cf.
+`scripts/rebuild_search_index.py`).
+
+Module bas niveau (importé par le repository et la migration) : pas de logger
+applicatif, les erreurs SQL remontent à l'appelant.
+"""
+
+import re
+
+from sqlalchemy import bindparam, text
+
+from src.persistence.text_codec import decode_text
+
+SEARCH_TABLE = "track_search"
+
+# Colonnes indexées, dans l'ordre de la table (index de colonne FTS5 = position).
+SEARCH_COLUMNS = ("title", "lyrics", "anecdotes", "credits")
+
+# unicode61 + remove_diacritics 2 : « cafe » trouve « café », casse ignorée.
+CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    + ", ".join(SEARCH_COLUMNS)
+    + ", tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+# Poids bm25 par colonne (même ordre) : un titre ou un crédit qui matche pèse
+# plus qu'une occurrence noyée dans des paroles.
+BM25_WEIGHTS = (8.0, 1.0, 2.0, 4.0)
+
+# Morceaux relus par requête (lecture de `tracks` + `credits`) à la réindexation.
+_BATCH = 500
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def match_expression(query: str, column: str | None = None) -> str | None:
+    """Requête utilisateur → expression MATCH FTS5 sûre (None si aucun terme).
+
+    Chaque mot devient un terme entre guillemets (la syntaxe FTS5 — AND, NEAR,
+    `*`, `:`… — n'est jamais interprétée), tous requis ; le dernier est un
+    préfixe (recherche « au fil de la frappe »). `column` restreint à une
+    colonne de `SEARCH_COLUMNS`.
+    """
+    terms = _TERM.findall(query or "")
+    if not terms:
+        return None
+    if column is not None and column not in SEARCH_COLUMNS:
+        raise ValueError(f"Colonne de recherche inconnue: {column}")
+    expression = " ".join(f'"{term}"' for term in terms) + "*"
+    return f"{column} : ({expression})" if column else expression
+
+
+def _chunks(ids: list[int]):
+    for start in range(0, len(ids), _BATCH):
+        yield ids[start : start + _BATCH]
+
+
+def remove_tracks(conn, track_ids) -> None:
+    """Retire des morceaux de l'index (absents : no-op)."""
+    ids = sorted({int(tid) for tid in track_ids if tid is not None})
+    for chunk in _chunks(ids):
+        conn.execute(
+            text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": chunk},
+        )
+
+
+def _documents(conn, track_ids: list[int]) -> list[dict]:
+    """Documents à indexer pour ces morceaux (paroles décodées, crédits agrégés)."""
+    credits: dict[int, list[str]] = {}
+    for tid, name in conn.execute(
+        text(
+            "SELECT track_id, name FROM credits WHERE track_id IN :ids "
+            "AND name IS NOT NULL ORDER BY track_id, id"
+        ).bindparams(bindparam("ids", expanding=True)),
+        {"ids": track_ids},
+    ):
+        names = credits.setdefault(tid, [])
+        if name not in names:  # même personne sous plusieurs rôles : une fois
+            names.append(name)
+    return [
+        {
+            "rowid": tid,
+            "title": title,
+            "lyrics": decode_text(lyrics),
+            "anecdotes": anecdotes,
+            "credits": "\n".join(credits.get(tid, ())) or None,
+        }
+        for tid, title, lyrics, anecdotes in conn.execute(
+            text("SELECT id, title, lyrics, anecdotes FROM tracks WHERE id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": track_ids},
+        )
+    ]
+
+
+def _insert(conn, documents: list[dict]) -> None:
+    if documents:
+        conn.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) "
+                "VALUES (:rowid, " + ", ".join(f":{c}" for c in SEARCH_COLUMNS) + ")"
+            ),
+            documents,
+        )
+
+
+def reindex_tracks(conn, track_ids) -> None:
+    """(Ré)indexe des morceaux depuis leur état en base (disparus : retirés)."""
+    ids = sorted({int(tid) for tid in track_ids if tid is not None})
+    remove_tracks(conn, ids)
+    for chunk in _chunks(ids):
+        _insert(conn, _documents(conn, chunk))
+
+
+def rebuild(conn) -> int:
+    """Vide puis reconstruit tout l'index ; renvoie le nombre de morceaux indexés."""
+    conn.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    indexed = 0
+    last_id = 0
+    while True:
+        ids = list(
+            conn.execute(
+                text(f"SELECT id FROM tracks WHERE id > :last ORDER BY id LIMIT {_BATCH}"),
+                {"last": last_id},
+            ).scalars()
+        )
+        if not ids:
+            break
+        documents = _documents(conn, ids)
+        _insert(conn, documents)
+        indexed += len(documents)
+        last_id = ids[-1]
+    # Fusionne les segments de l'index (b-trees écrits lot par lot).
+    conn.execute(text(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')"))
+    return indexed
@@ -0,0 +1,106 @@
+"""Compression transparente des gros textes (paroles, LRC) à la frontière DB.
+
+`tracks.lyrics`, `tracks.lyrics_synced` et `observations.value` des
+`lyrics_synced` (un LRC brut PAR SOURCE) font l'essentiel du poids de la base et
+des octets lus à l'ouverture d'un artiste. Compression OPTIONNELLE (désactivée
+par défaut, `DB_TEXT_COMPRESSION`) ; activée, ils sont stockés ainsi :
+
+    BLOB = MAGIC (b"\\x00MC") + codec (b"z" zlib | b"s" zstd) + charge compressée
+
+Un TEXT légitime ne commence jamais par NUL et SQLite garde le type de chaque
+valeur (affinité dynamique) : une ligne legacy en clair reste une `str`, lue
+telle quelle. Seuls les textes d'au moins `MIN_COMPRESS_BYTES` octets sont
+compressés, et seulement si le résultat est plus court.
+
+Écriture : `encode_text` (repository : `save_track`, `_upsert_observations`).
+Lecture : `decode_text` (mapper, lectures d'observations). Codec d'écriture
+piloté par `DB_TEXT_COMPRESSION` (config, "none" par défaut) ; zstd est
+optionnel (paquet `zstandard`) — « auto » se replie sur zlib sans lui.
+"""
+
+import logging
+import zlib
+
+from src.config import DB_TEXT_COMPRESSION
+
+# zstandard est une dépendance OPTIONNELLE : sans elle, écriture zlib et lecture
+# des lignes zstd impossible (signalée, la valeur en base n'est pas touchée).
+try:
+    import zstandard
+
+    _ZSTD_ERRORS: tuple[type[Exception], ...] = (zstandard.ZstdError,)
+except ImportError:  # pragma: no cover
+    zstandard = None
+    _ZSTD_ERRORS = ()
+
+# Module bas niveau (importé par le mapper et les migrations) : logger stdlib,
+# comme src/models — `src.utils.logger` importerait le paquet utils (cycle).
+logger = logging.getLogger(__name__)
+
+MAGIC = b"\x00MC"
+_CODEC_TAGS = {"zlib": b"z", "zstd": b"s"}
+
+# En dessous, le gain ne paie pas l'en-tête ni le coût CPU.
+MIN_COMPRESS_BYTES = 512
+
+# Champs d'observation compressés (les autres sont des scalaires courts, parfois
+# comparés en SQL).
+COMPRESSED_OBS_FIELDS = frozenset({"lyrics_synced"})
+
+
+def resolve_codec(codec: str | None = None) -> str:
+    """Codec d'écriture effectif ("zlib", "zstd" ou "none")."""
+    codec = codec or DB_TEXT_COMPRESSION
+    if codec == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if codec == "zstd" and zstandard is None:
+        logger.warning("⚠️ DB_TEXT_COMPRESSION=zstd sans le paquet zstandard : repli zlib")
+        return "zlib"
+    return codec
+
+
+def is_compressed(value) -> bool:
+    """Valeur stockée au format compressé (BLOB marqué) ?"""
+    return isinstance(value, bytes) and value.startswith(MAGIC)
+
+
+def encode_text(value, codec: str | None = None):
+    """Forme de stockage d'un texte : BLOB compressé, ou la valeur telle quelle
+    (None, non-str, texte court/blanc, codec "none", compression sans gain)."""
+    if not isinstance(value, str) or not value.strip():
+        return value
+    codec = resolve_codec(codec)
+    if codec == "none":
+        return value
+    raw = value.encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return value
+    if codec == "zstd":
+        payload = zstandard.ZstdCompressor(level=9).compress(raw)
+    else:
+        payload = zlib.compress(raw, 9)
+    blob = MAGIC + _CODEC_TAGS[codec] + payload
+    return blob if len(blob) < len(raw) else value
+
+
+def decode_text(value):
+    """Inverse de `encode_text` ; une valeur non compressée est rendue telle quelle.
+
+    Ligne zstd sans `zstandard`, ou charge corrompue : None + erreur loguée (le
+    COALESCE de la sauvegarde préserve alors la valeur en base).
+    """
+    if not isinstance(value, bytes):
+        return value
+    if not value.startswith(MAGIC):
+        return value.decode("utf-8", errors="replace")
+    tag, payload = value[len(MAGIC) : len(MAGIC) + 1], value[len(MAGIC) + 1 :]
+    try:
+        if tag == _CODEC_TAGS["zlib"]:
+            return zlib.decompress(payload).decode("utf-8")
+        if tag == _CODEC_TAGS["zstd"] and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError, *_ZSTD_ERRORS) as e:
+        logger.error(f"❌ Texte compressé illisible ({len(value)} o): {e}")
+        return None
+    logger.error(f"❌ Codec de texte compressé non disponible: {tag!r}")
+    return None
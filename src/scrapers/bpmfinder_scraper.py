@@ -12,7 +12,6 @@ Backend observé (session Chrome 2026-07-03) : POST api.audioaidynamics.com/api/
 l'UI (pas d'API documentée) et on parse les cartes par diff avant/après.
 """
 
-import json
 import logging
 import re
 import threading
@@ -28,13 +27,13 @@ from src.config import (
     BPMFINDER_SESSION_FILE,
     DATA_DIR,
 )
+from src.persistence.kv_cache import KVCache, default_kv_cache
 from src.scrapers.playwright_manager import get_playwright
 from src.utils.music_theory import note_to_pitch_class, parse_mode
 
 logger = logging.getLogger("BPMFinderScraper")
 
 ANALYZER_URL = "https://audioaidynamics.com/music-analyzer"
-_CACHE_FILE = DATA_DIR / "bpmfinder_cache.json"
 
 # "Key: C minor … BPM: 87 … Camelot: 5A" (l'ordre des cartes suit le DOM)
 _CARD_RE = re.compile(
@@ -48,14 +47,15 @@ _CARD_RE = re.compile(
 class BPMFinderScraper:
     """Analyse BPM/Key via audioaidynamics (Playwright, session persistée)."""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, cache: KVCache | None = None):
         self.headless = headless
         self._playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self._thread_id = None  # thread propriétaire du driver (Playwright sync = thread-affine)
-        self.cache = self._load_cache()
+        # Par videoId : une analyse suffit, le résultat ne change pas (pas de TTL)
+        self.cache = (cache or default_kv_cache()).namespace("bpmfinder")
         # Dernier code HTTP d'erreur backend observé (>=400 sur /api/…), posé par
         # le listener réseau et lu par _await_and_parse pour un abandon rapide.
         self._last_api_error: int | None = None
@@ -71,22 +71,6 @@ class BPMFinderScraper:
             (BPMFINDER_EMAIL and BPMFINDER_PASSWORD) or Path(BPMFINDER_SESSION_FILE).exists()
         )
 
-    # ── Cache (par videoId : une analyse suffit, le résultat ne change pas) ───
-
-    def _load_cache(self) -> dict:
-        try:
-            return json.loads(Path(_CACHE_FILE).read_text(encoding="utf-8"))
-        except (OSError, ValueError):
-            return {}
-
-    def _save_cache(self):
-        try:
-            Path(_CACHE_FILE).write_text(
-                json.dumps(self.cache, ensure_ascii=False, indent=1), encoding="utf-8"
-            )
-        except OSError as e:
-            logger.debug(f"Cache BPM Finder non sauvegardé: {e}")
-
     # ── Driver / session ───────────────────────────────────────────────────────
 
     # Consentement cookies ESSENTIELS SEULEMENT (décline analytics/pubs) —
@@ -400,7 +384,6 @@ class BPMFinderScraper:
             result = self._await_and_parse(before, timeout_s, label=vid)
             if result:
                 self.cache[vid] = result
-                self._save_cache()
                 self._save_session()  # prolonge la session (cookies rafraîchis)
                 return result
 
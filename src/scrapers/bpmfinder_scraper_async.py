@@ -12,8 +12,10 @@ du videoId, parsing des cartes `_cards_from_text` / `_card_to_result`, listener
 d'erreurs backend `_log_api_error`, disponibilité, consentement cookies). Les
 méthodes touchant Playwright sont réécrites en async (MÊMES sélecteurs, MÊMES
 timeouts, MÊME séquence : analyzer → login modal → champ YouTube → Upload →
-polling des cartes par diff). Le browser naît, travaille et meurt DANS la boucle
-(`get_playwright_async`), fermé par `aclose()`.
+polling des cartes par diff). La page vient d'un `PagePool` d'UNE page (un
+compte, des analyses mises en file côté serveur) : chauffée sur l'analyzer,
+session partagée par le contexte, recyclée seule après erreur. Le browser naît,
+travaille et meurt DANS la boucle (`get_playwright_async`), fermé par `aclose()`.
 
 ACTIVATION : fournir `async_scraper_factory=lambda: BPMFinderScraperAsync(headless=True)`
 au `BpmFinderProvider` (montage `DataEnricher`) et ajouter le provider à
@@ -33,8 +35,11 @@ from src.config import (
     BPMFINDER_PASSWORD,
     BPMFINDER_SESSION_FILE,
     DATA_DIR,
+    SCRAPER_PAGE_MAX_USES,
 )
+from src.persistence.kv_cache import KVCache
 from src.scrapers.bpmfinder_scraper import ANALYZER_URL, BPMFinderScraper
+from src.scrapers.page_pool import PagePool
 from src.scrapers.playwright_manager import get_playwright_async
 
 logger = logging.getLogger("BPMFinderScraper")
@@ -43,8 +48,16 @@ logger = logging.getLogger("BPMFinderScraper")
 class BPMFinderScraperAsync(BPMFinderScraper):
     """Variante async du scraper BPM Finder (mêmes sélecteurs, même séquence)."""
 
-    def __init__(self, headless: bool = True):
-        super().__init__(headless=headless)
+    def __init__(self, headless: bool = True, cache: KVCache | None = None):
+        super().__init__(headless=headless, cache=cache)
+        self._pool = PagePool(
+            "BPM Finder",
+            launch=self._launch_async,
+            new_context=self._new_context_async,
+            warm=self._goto_analyzer_async,
+            size=1,
+            max_uses=SCRAPER_PAGE_MAX_USES,
+        )
         logger.info(f"BPMFinderScraperAsync initialisé (headless={headless}, driver lazy)")
 
     # ── Garde-fous : pas d'API sync sur l'instance async ────────────────────
@@ -63,51 +76,39 @@ class BPMFinderScraperAsync(BPMFinderScraper):
 
     # ── Driver / session (miroirs async) ────────────────────────────────────
 
-    async def _ensure_driver_async(self):
-        """Crée le browser/context/page dans la boucle (pas d'affinité thread à
-        gérer — un seul thread de boucle, contrairement à la voie sync)."""
-        if self.page is not None:
-            return
-        self._playwright = await get_playwright_async()
-        self.browser = await self._playwright.chromium.launch(headless=self.headless)
+    async def _launch_async(self):
+        playwright = await get_playwright_async()
+        return await playwright.chromium.launch(headless=self.headless)
+
+    async def _new_context_async(self, browser):
+        """Contexte partagé par les pages du pool : session reprise, consentement
+        pré-installé, listener d'erreurs backend (handler sync)."""
         storage = str(BPMFINDER_SESSION_FILE) if Path(BPMFINDER_SESSION_FILE).exists() else None
-        self.context = await self.browser.new_context(storage_state=storage)
-        await self.context.add_init_script(self._CONSENT_INIT)
-        self.context.on("response", self._log_api_error)  # handler sync (lit des propriétés)
-        self.page = await self.context.new_page()
+        context = await browser.new_context(storage_state=storage)
+        await context.add_init_script(self._CONSENT_INIT)
+        context.on("response", self._log_api_error)
         logger.info(
             f"🌐 BPM Finder: Playwright async initialisé "
             f"(session {'reprise' if storage else 'neuve'})"
         )
-
-    async def _cleanup_resources_async(self):
-        # NB: ne pas stopper self._playwright — instance partagée (playwright_manager)
-        for attr in ("page", "context", "browser"):
-            obj = getattr(self, attr, None)
-            if obj:
-                try:
-                    await obj.close()
-                except PlaywrightError:
-                    pass
-                setattr(self, attr, None)
-        self._playwright = None
+        return context
 
     async def aclose(self):
-        await self._cleanup_resources_async()
+        await self._pool.aclose()
         logger.info("✅ BPMFinderScraper async fermé")
 
-    async def _save_session_async(self):
+    async def _save_session_async(self, page):
         try:
             Path(BPMFINDER_SESSION_FILE).parent.mkdir(parents=True, exist_ok=True)
-            await self.context.storage_state(path=str(BPMFINDER_SESSION_FILE))
+            await page.context.storage_state(path=str(BPMFINDER_SESSION_FILE))
             logger.info("💾 Session BPM Finder sauvegardée")
         except (PlaywrightError, OSError) as e:
             logger.warning(f"Session BPM Finder non sauvegardée: {e}")
 
-    async def _dismiss_cookie_overlay_async(self):
+    async def _dismiss_cookie_overlay_async(self, page):
         """Miroir async de `_dismiss_cookie_overlay` (même JS injecté)."""
         try:
-            await self.page.evaluate("""
+            await page.evaluate("""
                 () => {
                   const fc = document.querySelector('.fc-message-root');
                   if (fc) {
@@ -134,20 +135,20 @@ class BPMFinderScraperAsync(BPMFinderScraper):
         except PlaywrightError:
             pass
 
-    async def _goto_analyzer_async(self, force: bool = False):
-        if force or not (self.page.url or "").startswith(ANALYZER_URL):
-            await self.page.goto(ANALYZER_URL, wait_until="domcontentloaded", timeout=45_000)
+    async def _goto_analyzer_async(self, page, force: bool = False):
+        if force or not (page.url or "").startswith(ANALYZER_URL):
+            await page.goto(ANALYZER_URL, wait_until="domcontentloaded", timeout=45_000)
             try:
-                await self.page.wait_for_load_state("networkidle", timeout=15_000)
+                await page.wait_for_load_state("networkidle", timeout=15_000)
             except PlaywrightTimeoutError:
                 pass
-            await self.page.wait_for_timeout(1_500)
-            await self._dismiss_cookie_overlay_async()
+            await page.wait_for_timeout(1_500)
+            await self._dismiss_cookie_overlay_async(page)
 
-    async def _find_youtube_input_async(self, timeout_ms: int = 15_000):
+    async def _find_youtube_input_async(self, page, timeout_ms: int = 15_000):
         """Champ URL YouTube (placeholder « Or Enter YouTube URL »). None si absent."""
         try:
-            loc = self.page.get_by_placeholder("YouTube", exact=False)
+            loc = page.get_by_placeholder("YouTube", exact=False)
             await loc.wait_for(state="visible", timeout=timeout_ms)
             return loc.first
         except PlaywrightError:
@@ -158,7 +159,7 @@ class BPMFinderScraperAsync(BPMFinderScraper):
             "input[type='text']",
         ):
             try:
-                el = await self.page.wait_for_selector(sel, state="visible", timeout=3_000)
+                el = await page.wait_for_selector(sel, state="visible", timeout=3_000)
                 if el:
                     return el
             except PlaywrightError:
@@ -167,22 +168,22 @@ class BPMFinderScraperAsync(BPMFinderScraper):
 
     # ── Login (miroirs async) ───────────────────────────────────────────────
 
-    async def _is_logged_in_async(self) -> bool:
+    async def _is_logged_in_async(self, page) -> bool:
         try:
-            cookies = await self.context.cookies()
+            cookies = await page.context.cookies()
             return any(c.get("name") == "access_token" for c in cookies)
         except PlaywrightError:
             return False
 
-    async def _looks_logged_out_async(self) -> bool:
-        if await self._is_logged_in_async():
+    async def _looks_logged_out_async(self, page) -> bool:
+        if await self._is_logged_in_async(page):
             return False
         try:
-            return await self.page.locator("span:text-is('LOGIN')").count() > 0
+            return await page.locator("span:text-is('LOGIN')").count() > 0
         except PlaywrightError:
             return False
 
-    async def _try_login_async(self) -> bool:
+    async def _try_login_async(self, page) -> bool:
         if not (BPMFINDER_EMAIL and BPMFINDER_PASSWORD):
             logger.error(
                 "BPM Finder: identifiants absents (BPMFINDER_EMAIL/PASSWORD) "
@@ -191,23 +192,23 @@ class BPMFinderScraperAsync(BPMFinderScraper):
             return False
         try:
             pwd_sel = "input[type='password']"
-            if not await self.page.query_selector(pwd_sel):
-                await self.page.locator("span:text-is('LOGIN')").first.click()
-                await self.page.wait_for_selector(pwd_sel, timeout=10_000)
+            if not await page.query_selector(pwd_sel):
+                await page.locator("span:text-is('LOGIN')").first.click()
+                await page.wait_for_selector(pwd_sel, timeout=10_000)
 
-            await self.page.fill("input[type='email']", BPMFINDER_EMAIL)
-            await self.page.fill(pwd_sel, BPMFINDER_PASSWORD)
-            await self.page.click("button:has-text('Login')")
-            await self.page.wait_for_timeout(4_000)
+            await page.fill("input[type='email']", BPMFINDER_EMAIL)
+            await page.fill(pwd_sel, BPMFINDER_PASSWORD)
+            await page.click("button:has-text('Login')")
+            await page.wait_for_timeout(4_000)
 
-            await self._goto_analyzer_async(force=True)
-            if await self._looks_logged_out_async():
+            await self._goto_analyzer_async(page, force=True)
+            if await self._looks_logged_out_async(page):
                 logger.error(
                     "BPM Finder: login refusé (vérifier identifiants) — "
                     "ou UI de login inattendue : scripts/bpmfinder_login.py"
                 )
                 return False
-            await self._save_session_async()
+            await self._save_session_async(page)
             logger.info("✅ BPM Finder: connecté")
             return True
         except (PlaywrightError, OSError) as e:
@@ -218,14 +219,14 @@ class BPMFinderScraperAsync(BPMFinderScraper):
 
     # ── Analyse (miroir async) ──────────────────────────────────────────────
 
-    async def _cards_async(self) -> set[tuple[str, str, str, str]]:
+    async def _cards_async(self, page) -> set[tuple[str, str, str, str]]:
         try:
-            text = await self.page.inner_text("body") or ""
+            text = await page.inner_text("body") or ""
         except PlaywrightError:
             return set()
         return self._cards_from_text(text)
 
-    async def _dump_debug_state_async(self, label: str):
+    async def _dump_debug_state_async(self, page, label: str):
         if getattr(self, "_debug_dumped", False):
             return
         self._debug_dumped = True
@@ -234,21 +235,21 @@ class BPMFinderScraperAsync(BPMFinderScraper):
             diag.mkdir(parents=True, exist_ok=True)
             safe = re.sub(r"[^\w.-]", "_", label)[:60]
             stamp = time.strftime("%Y%m%d_%H%M%S")
-            await self.page.screenshot(path=str(diag / f"bpmfinder_{stamp}_{safe}.png"))
+            await page.screenshot(path=str(diag / f"bpmfinder_{stamp}_{safe}.png"))
             (diag / f"bpmfinder_{stamp}_{safe}.txt").write_text(
-                await self.page.inner_text("body") or "", encoding="utf-8"
+                await page.inner_text("body") or "", encoding="utf-8"
             )
             logger.warning(f"BPM Finder: état de la page capturé dans {diag}")
         except (PlaywrightError, OSError):
             pass
 
-    async def _await_and_parse_async(self, before, timeout_s: int, label: str) -> dict | None:
+    async def _await_and_parse_async(self, page, before, timeout_s: int, label: str) -> dict | None:
         """Attend la NOUVELLE carte (diff avant/après) et la parse en dict."""
         deadline = time.time() + timeout_s
         new_card = None
         while time.time() < deadline:
-            await self.page.wait_for_timeout(2_000)
-            fresh = (await self._cards_async()) - before
+            await page.wait_for_timeout(2_000)
+            fresh = (await self._cards_async(page)) - before
             if fresh:
                 new_card = sorted(fresh)[0]
                 break
@@ -259,7 +260,7 @@ class BPMFinderScraperAsync(BPMFinderScraper):
                 return None
         if not new_card:
             logger.warning(f"BPM Finder: pas de résultat en {timeout_s}s pour {label}")
-            await self._dump_debug_state_async(f"timeout_{label}")
+            await self._dump_debug_state_async(page, f"timeout_{label}")
             return None
         return self._card_to_result(new_card, label)
 
@@ -274,11 +275,19 @@ class BPMFinderScraperAsync(BPMFinderScraper):
             logger.debug(f"BPM Finder: cache hit {vid}")
             return self.cache[vid]
 
-        await self._ensure_driver_async()
-        await self._goto_analyzer_async()
+        async with self._pool.lease() as page:
+            result = await self._analyze_on_page_async(page, youtube_url, vid, timeout_s)
+            if self.last_failure_reason == "ui":
+                self._pool.discard(page)  # page dans un état inattendu : recyclée
+            return result
+
+    async def _analyze_on_page_async(
+        self, page, youtube_url: str, vid: str, timeout_s: int
+    ) -> dict | None:
+        await self._goto_analyzer_async(page)
 
-        if not await self._is_logged_in_async():
-            if not await self._try_login_async():
+        if not await self._is_logged_in_async(page):
+            if not await self._try_login_async(page):
                 self.last_failure_reason = "login"
                 return None
         else:
@@ -288,18 +297,18 @@ class BPMFinderScraperAsync(BPMFinderScraper):
         for attempt in range(2):
             if attempt:
                 logger.info(f"BPM Finder: nouvel essai ({attempt + 1}/2) pour {vid}")
-                await self._goto_analyzer_async(force=True)
+                await self._goto_analyzer_async(page, force=True)
             self._last_api_error = None  # armé pour cette tentative
 
-            before = await self._cards_async()
-            url_input = await self._find_youtube_input_async()
+            before = await self._cards_async(page)
+            url_input = await self._find_youtube_input_async(page)
             if not url_input:
-                await self._goto_analyzer_async(force=True)
-                url_input = await self._find_youtube_input_async()
+                await self._goto_analyzer_async(page, force=True)
+                url_input = await self._find_youtube_input_async(page)
             if not url_input:
                 try:
                     dbg = str(DATA_DIR / "bpmfinder_debug.png")
-                    await self.page.screenshot(path=dbg)
+                    await page.screenshot(path=dbg)
                     logger.error(f"BPM Finder: champ YouTube introuvable — capture: {dbg}")
                 except (PlaywrightError, OSError):
                     logger.error("BPM Finder: champ YouTube introuvable (UI changée ?)")
@@ -307,23 +316,22 @@ class BPMFinderScraperAsync(BPMFinderScraper):
                 return None
             try:
                 await url_input.fill(youtube_url)
-                await self._dismiss_cookie_overlay_async()
+                await self._dismiss_cookie_overlay_async(page)
                 try:
-                    await self.page.click("button:has-text('Upload')", timeout=15_000)
+                    await page.click("button:has-text('Upload')", timeout=15_000)
                 except PlaywrightError:
-                    await self._dismiss_cookie_overlay_async()
-                    await self.page.click("button:has-text('Upload')", timeout=10_000)
+                    await self._dismiss_cookie_overlay_async(page)
+                    await page.click("button:has-text('Upload')", timeout=10_000)
             except PlaywrightError as e:
                 logger.error(f"BPM Finder: saisie/Upload échoué: {e}")
-                await self._dump_debug_state_async(f"upload_{vid}")
+                await self._dump_debug_state_async(page, f"upload_{vid}")
                 self.last_failure_reason = "ui"
                 return None
 
-            result = await self._await_and_parse_async(before, timeout_s, label=vid)
+            result = await self._await_and_parse_async(page, before, timeout_s, label=vid)
             if result:
                 self.cache[vid] = result
-                self._save_cache()
-                await self._save_session_async()  # prolonge la session (cookies rafraîchis)
+                await self._save_session_async(page)  # prolonge la session (cookies rafraîchis)
                 return result
 
             status = self._last_api_error
@@ -3,6 +3,7 @@ Scraper Genius — VERSION 3 (Crawl4AI + Ollama/Llama 3.2)
 Remplace les sélecteurs CSS fragiles de v2 par une extraction via LLM.
 """
 
+import asyncio
 import re
 import time
 from datetime import datetime
@@ -66,6 +67,16 @@ _JS_WAIT_CREDITS = (
 )
 
 
+# Crawl d'une page morceau pour les crédits (sync et async)
+_CREDITS_CRAWL = {
+    "js_before_wait": _JS_EXPAND_CREDITS,
+    "wait_for": "js:" + _JS_WAIT_CREDITS,
+    "wait_timeout": 15_000,
+    "page_timeout": 30_000,
+    "delay_before_return": 1.5,
+}
+
+
 class GeniusScraperV3(CrawlAIScraperBase):
     """
     Scraper Genius v3 — Crawl4AI pour le rendu + Llama 3.2 pour le parsing.
@@ -96,15 +107,32 @@ class GeniusScraperV3(CrawlAIScraperBase):
             logger.warning(f"GeniusScraperV3: pas d'URL Genius pour '{track.title}'")
             return []
 
-        markdown, html = self._crawl_page(
-            url=track.genius_url,
-            js_before_wait=_JS_EXPAND_CREDITS,
-            wait_for="js:" + _JS_WAIT_CREDITS,
-            wait_timeout=15_000,
-            page_timeout=30_000,
-            delay_before_return=1.5,
+        markdown, html = self._crawl_page(url=track.genius_url, **_CREDITS_CRAWL)
+        credits = self._apply_credits_page(track, markdown, html, include_lyrics)
+        time.sleep(DELAY_BETWEEN_REQUESTS)
+        return credits
+
+    async def scrape_track_credits_async(
+        self, track: Track, include_lyrics: bool = True
+    ) -> list[Credit]:
+        """Jumeau async de `scrape_track_credits` (pipeline d'import, depuis la
+        boucle) : crawl natif `acrawl_page`, parse BS4/LLM dans un thread (le
+        fallback Ollama est bloquant)."""
+        if not track.genius_url:
+            logger.warning(f"GeniusScraperV3: pas d'URL Genius pour '{track.title}'")
+            return []
+
+        markdown, html = await self.acrawl_page(track.genius_url, **_CREDITS_CRAWL)
+        credits = await asyncio.to_thread(
+            self._apply_credits_page, track, markdown, html, include_lyrics
         )
+        await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
+        return credits
 
+    def _apply_credits_page(
+        self, track: Track, markdown: str | None, html: str | None, include_lyrics: bool
+    ) -> list[Credit]:
+        """Crédits (+ paroles, album) d'une page crawlée, posés sur `track`."""
         # Paroles + anecdotes depuis le même HTML (gratuit)
         if include_lyrics and html:
             try:
@@ -152,7 +180,6 @@ class GeniusScraperV3(CrawlAIScraperBase):
             track.add_credit(credit)
 
         logger.info(f"GeniusScraperV3: {len(credits)} crédit(s) pour '{track.title}'")
-        time.sleep(DELAY_BETWEEN_REQUESTS)
         return credits
 
     def scrape_multiple_tracks(self, tracks, progress_callback=None) -> dict:
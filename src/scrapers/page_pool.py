@@ -0,0 +1,185 @@
+"""Pool de pages Playwright ASYNC par site (scrapers de la boucle asyncio).
+
+Avant : un scraper async = un browser = UNE page — un batch concurrent faisait
+la queue derrière un seul onglet, et la moindre erreur recréait tout le
+browser (`_reset_browser_on_error_async`), coupant au passage les recherches
+en cours. `PagePool` garde, pour un site :
+
+  · UN browser et UN contexte (cookies partagés : bannière de consentement et
+    session de login valent pour toutes les pages) ;
+  · au plus `size` pages, prêtées par `lease()` — plafond de concurrence du
+    site ; une page n'est créée qu'à la demande (ou par `prewarm`), puis
+    « chauffée » une fois (`warm` : page d'accueil, cookies) et réutilisée ;
+  · recyclage PAR PAGE : après `max_uses` prêts, sur exception dans le
+    `with`, ou si le scraper la signale (`discard`, erreurs qu'il avale) —
+    seule cette page est fermée, les autres continuent. Un browser mort
+    (crash, `is_connected()` faux) est relancé au prêt suivant.
+
+Même règle que `playwright_manager` : l'instance Playwright partagée n'est
+jamais stoppée ici ; `aclose()` ferme pages, contexte et browser, DANS la
+boucle. Lancement du browser et réglage du contexte sont injectés (tests).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from playwright.async_api import Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledPage:
+    page: object
+    uses: int = 0
+    broken: bool = False
+
+
+class PagePool:
+    """Pages Playwright réutilisables d'un site, prêtées une à une."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        launch: Callable[[], Awaitable],
+        new_context: Callable[[object], Awaitable],
+        warm: Callable[[object], Awaitable[None]] | None = None,
+        size: int = 1,
+        max_uses: int = 50,
+    ) -> None:
+        """`launch()` → browser ; `new_context(browser)` → contexte réglé
+        (routes, scripts d'init, session) ; `warm(page)` prépare une page neuve."""
+        self.name = name
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self._launch = launch
+        self._new_context = new_context
+        self._warm = warm
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._setup_lock = asyncio.Lock()
+        self._browser = None
+        self._context = None
+        self._idle: list[_PooledPage] = []
+        self._leased: dict[int, _PooledPage] = {}
+        self.stats = {"leases": 0, "created": 0, "recycled": 0, "relaunched": 0}
+
+    @asynccontextmanager
+    async def lease(self):
+        """Page prêtée pour la durée du `with` (attend si les `size` sont prises)."""
+        async with self._semaphore:
+            pooled = await self._checkout()
+            self._leased[id(pooled.page)] = pooled
+            self.stats["leases"] += 1
+            try:
+                yield pooled.page
+            except BaseException:
+                pooled.broken = True  # exception, timeout, annulation : état inconnu
+                raise
+            finally:
+                del self._leased[id(pooled.page)]
+                await self._checkin(pooled)
+
+    def discard(self, page) -> None:
+        """Page en erreur (exception avalée par le scraper) : fermée au retour."""
+        pooled = self._leased.get(id(page))
+        if pooled is not None:
+            pooled.broken = True
+
+    async def prewarm(self, count: int | None = None) -> None:
+        """Crée et chauffe d'avance `count` pages (défaut : `size`)."""
+        wanted = self.size if count is None else min(self.size, count)
+        missing = wanted - len(self._idle) - len(self._leased)
+        created = await asyncio.gather(
+            *(self._create() for _ in range(max(0, missing))), return_exceptions=True
+        )
+        for pooled in created:
+            if isinstance(pooled, BaseException):
+                logger.warning(f"⚠️ {self.name}: page non préchauffée: {pooled}")
+            else:
+                self._idle.append(pooled)
+
+    def _alive(self, pooled: _PooledPage) -> bool:
+        return (
+            self._browser is not None
+            and self._browser.is_connected()
+            and not pooled.page.is_closed()
+        )
+
+    async def _checkout(self) -> _PooledPage:
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._alive(pooled):
+                return pooled
+            await self._close_page(pooled)
+        return await self._create()
+
+    async def _checkin(self, pooled: _PooledPage) -> None:
+        pooled.uses += 1
+        if pooled.broken or pooled.uses >= self.max_uses or not self._alive(pooled):
+            self.stats["recycled"] += 1
+            logger.debug(
+                f"♻️ {self.name}: page recyclée "
+                f"({'erreur' if pooled.broken else f'{pooled.uses} usage(s)'})"
+            )
+            await self._close_page(pooled)
+        else:
+            self._idle.append(pooled)
+
+    async def _create(self) -> _PooledPage:
+        async with self._setup_lock:
+            if self._browser is None or not self._browser.is_connected():
+                await self._relaunch()
+            context = self._context
+        page = await context.new_page()
+        pooled = _PooledPage(page)
+        try:
+            if self._warm is not None:
+                await self._warm(page)
+        except BaseException:
+            await self._close_page(pooled)
+            raise
+        self.stats["created"] += 1
+        return pooled
+
+    async def _relaunch(self) -> None:
+        """(Re)lance browser + contexte ; les pages de l'ancien sont abandonnées."""
+        if self._browser is not None:
+            self.stats["relaunched"] += 1
+            logger.warning(f"⚠️ {self.name}: browser perdu — relance")
+        await self._close_browser()
+        self._browser = await self._launch()
+        try:
+            self._context = await self._new_context(self._browser)
+        except BaseException:
+            await self._close_browser()
+            raise
+        logger.info(f"🌐 {self.name}: browser async prêt (pool de {self.size} page(s))")
+
+    @staticmethod
+    async def _close_page(pooled: _PooledPage) -> None:
+        try:
+            await pooled.page.close()
+        except PlaywrightError:
+            pass
+
+    async def _close_browser(self) -> None:
+        # NB: ne pas stopper l'instance Playwright — partagée (playwright_manager)
+        for attr in ("_context", "_browser"):
+            obj = getattr(self, attr)
+            if obj is not None:
+                try:
+                    await obj.close()
+                except PlaywrightError:
+                    pass
+                setattr(self, attr, None)
+
+    async def aclose(self) -> None:
+        """Ferme pages libres, contexte et browser (fin de batch ; ré-ouvrable)."""
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_page(pooled)
+        await self._close_browser()
@@ -4,9 +4,11 @@ Sous-classe de `SongBPMScraper` : la logique PURE est héritée (matching
 artiste/titre, normalisations, extraction regex+LLM des détails) ; les méthodes
 touchant Playwright sont réécrites en async (mêmes sélecteurs, mêmes timeouts,
 même séquence de recherche : accueil → champ query → résultats → détails).
-Le fallback LLM (Ollama, bloquant) passe par `asyncio.to_thread`. Le browser
-naît, travaille et meurt DANS la boucle, fermé par `aclose()` en fin de batch.
-Le timeout de garde de 30 s vit chez le PROVIDER (`asyncio.timeout`, F3c).
+Le fallback LLM (Ollama, bloquant) passe par `asyncio.to_thread`. Les pages
+viennent d'un `PagePool` (SCRAPER_PAGES_PER_SITE recherches simultanées, page
+d'accueil et cookies déjà passés) ; une erreur ne recycle QUE sa page. Le
+browser naît, travaille et meurt DANS la boucle, fermé par `aclose()` en fin
+de batch. Le timeout de garde de 30 s vit chez le PROVIDER (`asyncio.timeout`).
 """
 
 import asyncio
@@ -17,6 +19,8 @@ from typing import Any
 from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from src.config import SCRAPER_PAGE_MAX_USES, SCRAPER_PAGES_PER_SITE
+from src.scrapers.page_pool import PagePool
 from src.scrapers.playwright_manager import get_playwright_async
 from src.scrapers.songbpm_scraper_v2 import SongBPMScraper
 from src.utils.logger import log_api
@@ -27,8 +31,16 @@ logger = logging.getLogger(__name__)
 class SongBPMScraperAsync(SongBPMScraper):
     """Variante async du scraper SongBPM (mêmes sélecteurs, même matching)."""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, pages: int = SCRAPER_PAGES_PER_SITE):
         super().__init__(headless=headless)
+        self._pool = PagePool(
+            "SongBPM",
+            launch=self._launch_async,
+            new_context=self._new_context_async,
+            warm=self._warm_page_async,
+            size=pages,
+            max_uses=SCRAPER_PAGE_MAX_USES,
+        )
         logger.info(f"SongBPMScraperAsync initialisé (headless={headless}, driver lazy)")
 
     # ── Garde-fous : pas d'API sync sur l'instance async ────────────────────
@@ -42,68 +54,46 @@ class SongBPMScraperAsync(SongBPMScraper):
     def close(self):
         raise RuntimeError("Instance async : utiliser aclose()")
 
-    # ── Init / cleanup (miroirs async) ──────────────────────────────────────
+    # ── Pool de pages (init / cleanup) ──────────────────────────────────────
+
+    async def _launch_async(self):
+        logger.info(f"🌐 Initialisation Playwright async SongBPM (headless={self.headless})...")
+        playwright = await get_playwright_async()
+        return await playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+                "--disable-webgl",
+                "--disable-webgl2",
+            ],
+        )
 
-    async def _ensure_driver_async(self):
-        if self.page is not None:
-            return
-        await self._init_driver_async()
+    async def _new_context_async(self, browser):
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        )
+        # Bloquer les images pour accélérer
+        await context.route("**/*.{png,jpg,jpeg,gif,webp,svg,ico}", lambda route: route.abort())
+        await context.add_init_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        )
+        return context
 
-    async def _init_driver_async(self):
-        try:
-            logger.info(f"🌐 Initialisation Playwright async SongBPM (headless={self.headless})...")
-            self._playwright = await get_playwright_async()
-            self.browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--disable-webgl",
-                    "--disable-webgl2",
-                ],
-            )
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            )
-            # Bloquer les images pour accélérer
-            await self.context.route(
-                "**/*.{png,jpg,jpeg,gif,webp,svg,ico}", lambda route: route.abort()
-            )
-            self.page = await self.context.new_page()
-            await self.page.add_init_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            )
-            logger.info("✅ SongBPM async: Playwright initialisé avec succès")
-        except Exception as e:
-            logger.error(f"❌ Erreur initialisation Playwright async SongBPM: {e}")
-            await self._cleanup_resources_async()
-            raise
-
-    async def _cleanup_resources_async(self):
-        # NB: ne pas stopper self._playwright — instance partagée (playwright_manager)
-        for attr in ("page", "context", "browser"):
-            obj = getattr(self, attr, None)
-            if obj:
-                try:
-                    await obj.close()
-                except PlaywrightError:
-                    pass
-                setattr(self, attr, None)
-        self._playwright = None
+    async def _warm_page_async(self, page):
+        """Page neuve : accueil chargé, bannière cookies fermée (cookie du contexte)."""
+        await page.goto(self.base_url, wait_until="domcontentloaded", timeout=30_000)
+        await self._handle_cookies_async(page)
 
     async def aclose(self):
-        await self._cleanup_resources_async()
+        await self._pool.aclose()
         logger.info("✅ SongBPM async: Browser fermé")
 
-    async def _reset_browser_on_error_async(self):
-        logger.warning("⚠️ Réinitialisation du browser après erreur")
-        await self._cleanup_resources_async()
-
     # ── Cookies ─────────────────────────────────────────────────────────────
 
-    async def _handle_cookies_async(self):
+    async def _handle_cookies_async(self, page):
         try:
             agree_selectors = [
                 ".qc-cmp2-summary-buttons button[mode='primary']",
@@ -115,7 +105,7 @@ class SongBPMScraperAsync(SongBPMScraper):
             ]
             for selector in agree_selectors:
                 try:
-                    btn = await self.page.query_selector(selector)
+                    btn = await page.query_selector(selector)
                     if btn and await btn.is_visible():
                         await btn.click()
                         logger.info(f"✅ Popup cookies fermé via: {selector}")
@@ -127,14 +117,14 @@ class SongBPMScraperAsync(SongBPMScraper):
 
     # ── Détails (miroir async ; texte → détails = logique pure héritée) ─────
 
-    async def _extract_track_details_async(self, detail_url: str, timeout: int = 30) -> dict:
+    async def _extract_track_details_async(self, page, detail_url: str, timeout: int = 30) -> dict:
         details: dict[str, Any] = {}
         try:
             # Les liens du site sont relatifs (/@artiste/titre) → URL absolue requise
             if detail_url.startswith("/"):
                 detail_url = "https://songbpm.com" + detail_url
             logger.info(f"📄 Navigation détails: {detail_url}")
-            await self.page.goto(detail_url, wait_until="domcontentloaded", timeout=timeout * 1000)
+            await page.goto(detail_url, wait_until="domcontentloaded", timeout=timeout * 1000)
 
             content_selectors = [
                 "div.lg\\:prose-xl",
@@ -144,13 +134,13 @@ class SongBPMScraperAsync(SongBPMScraper):
             ]
             full_text = None
             for selector in content_selectors:
-                el = await self.page.query_selector(selector)
+                el = await page.query_selector(selector)
                 if el and await el.is_visible():
                     full_text = await el.inner_text()
                     break
 
             if not full_text:
-                body = await self.page.query_selector("body")
+                body = await page.query_selector("body")
                 full_text = await body.inner_text() if body else ""
 
             clean_text = re.sub(r"\s+", " ", full_text).replace("\xa0", " ")
@@ -165,10 +155,10 @@ class SongBPMScraperAsync(SongBPMScraper):
 
     # ── Résultats de recherche (miroir async du DOM-walking) ────────────────
 
-    async def _get_search_results_async(self) -> list[dict[str, Any]]:
+    async def _get_search_results_async(self, page) -> list[dict[str, Any]]:
         results = []
         try:
-            containers = await self.page.query_selector_all("div.bg-card")
+            containers = await page.query_selector_all("div.bg-card")
             logger.debug(f"📋 {len(containers)} conteneurs trouvés")
 
             for container in containers:
@@ -264,6 +254,7 @@ class SongBPMScraperAsync(SongBPMScraper):
 
     async def _perform_search_async(
         self,
+        page,
         track_title: str,
         artist_name: str,
         spotify_id: str | None = None,
@@ -272,31 +263,32 @@ class SongBPMScraperAsync(SongBPMScraper):
         reload_homepage: bool = True,
     ) -> dict[str, Any] | None:
         try:
-            if reload_homepage:
+            # Page fraîchement chauffée : déjà sur l'accueil, cookies passés
+            if reload_homepage and page.url != self.base_url:
                 logger.info("🌐 Chargement page d'accueil SongBPM...")
-                await self.page.goto(self.base_url, wait_until="domcontentloaded", timeout=30_000)
-                await self._handle_cookies_async()
+                await page.goto(self.base_url, wait_until="domcontentloaded", timeout=30_000)
+                await self._handle_cookies_async(page)
 
             search_selector = "input[name='query'][placeholder='type a song, get a bpm']"
             try:
-                await self.page.wait_for_selector(search_selector, timeout=10_000)
+                await page.wait_for_selector(search_selector, timeout=10_000)
             except PlaywrightTimeoutError:
                 logger.error("⏰ Champ de recherche introuvable")
                 return None
 
             search_query = f"{artist_name} {track_title}"
             logger.info(f"🔍 Recherche: '{search_query}'")
-            await self.page.fill(search_selector, search_query)
-            await self.page.press(search_selector, "Enter")
+            await page.fill(search_selector, search_query)
+            await page.press(search_selector, "Enter")
 
             # Attendre les résultats
             try:
-                await self.page.wait_for_selector("div.bg-card", timeout=10_000)
+                await page.wait_for_selector("div.bg-card", timeout=10_000)
             except PlaywrightTimeoutError:
                 logger.warning(f"❌ Aucun résultat pour '{track_title}'")
                 return None
 
-            results = await self._get_search_results_async()
+            results = await self._get_search_results_async(page)
             if not results:
                 return None
 
@@ -312,7 +304,9 @@ class SongBPMScraperAsync(SongBPMScraper):
                     logger.info(f"✅ Correspondance trouvée (résultat #{i})")
                     if fetch_details and result.get("detail_url"):
                         try:
-                            details = await self._extract_track_details_async(result["detail_url"])
+                            details = await self._extract_track_details_async(
+                                page, result["detail_url"]
+                            )
                             result.update(details)
                         except (
                             PlaywrightError,
@@ -332,11 +326,11 @@ class SongBPMScraperAsync(SongBPMScraper):
 
         except PlaywrightTimeoutError:
             logger.error("❌ SongBPM: Timeout Playwright")
-            await self._reset_browser_on_error_async()
+            self._pool.discard(page)  # page recyclée, les autres recherches continuent
             return None
         except (PlaywrightError, AttributeError, KeyError, TypeError, ValueError) as e:
             logger.error(f"❌ SongBPM: Erreur recherche: {e}")
-            await self._reset_browser_on_error_async()
+            self._pool.discard(page)
             return None
 
     async def search_track_async(
@@ -347,39 +341,37 @@ class SongBPMScraperAsync(SongBPMScraper):
         max_results_to_check: int = 5,
         fetch_details: bool = True,
     ) -> dict[str, Any] | None:
-        await self._ensure_driver_async()
-        if not self.page:
-            logger.error("❌ SongBPM: Browser non initialisé")
-            return None
-
         logger.info(f"🔍 SongBPM: '{track_title}' par {artist_name}")
-        result = await self._perform_search_async(
-            track_title=track_title,
-            artist_name=artist_name,
-            spotify_id=spotify_id,
-            max_results_to_check=max_results_to_check,
-            fetch_details=fetch_details,
-        )
-        if result:
-            log_api("SongBPM", f"search/{track_title}", True)
-            return result
-
-        # Fallback sans parenthèses
-        if re.search(r"[\(\)\[\]]", track_title):
-            cleaned = self._remove_parentheses_and_brackets(track_title)
-            if cleaned and cleaned != track_title:
-                logger.info(f"🔄 Nouvelle tentative: '{cleaned}'")
-                result = await self._perform_search_async(
-                    track_title=cleaned,
-                    artist_name=artist_name,
-                    spotify_id=spotify_id,
-                    max_results_to_check=max_results_to_check,
-                    fetch_details=fetch_details,
-                    reload_homepage=False,
-                )
-                if result:
-                    log_api("SongBPM", f"search/{track_title}", True)
-                    return result
+        async with self._pool.lease() as page:
+            result = await self._perform_search_async(
+                page,
+                track_title=track_title,
+                artist_name=artist_name,
+                spotify_id=spotify_id,
+                max_results_to_check=max_results_to_check,
+                fetch_details=fetch_details,
+            )
+            if result:
+                log_api("SongBPM", f"search/{track_title}", True)
+                return result
+
+            # Fallback sans parenthèses
+            if re.search(r"[\(\)\[\]]", track_title):
+                cleaned = self._remove_parentheses_and_brackets(track_title)
+                if cleaned and cleaned != track_title:
+                    logger.info(f"🔄 Nouvelle tentative: '{cleaned}'")
+                    result = await self._perform_search_async(
+                        page,
+                        track_title=cleaned,
+                        artist_name=artist_name,
+                        spotify_id=spotify_id,
+                        max_results_to_check=max_results_to_check,
+                        fetch_details=fetch_details,
+                        reload_homepage=False,
+                    )
+                    if result:
+                        log_api("SongBPM", f"search/{track_title}", True)
+                        return result
 
         log_api("SongBPM", f"search/{track_title}", False)
         return None
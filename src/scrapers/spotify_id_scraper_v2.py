@@ -25,6 +25,7 @@ from playwright.sync_api import (
     TimeoutError as PlaywrightTimeoutError,
 )
 
+from src.persistence.kv_cache import KVCache, default_kv_cache
 from src.scrapers.playwright_manager import get_playwright
 from src.utils.llm_extractor import build_spotify_match_prompt, get_shared_extractor
 
@@ -34,9 +35,8 @@ logger = logging.getLogger("SpotifyIDScraper")
 class SpotifyIDScraper:
     """Scraper pour récupérer les IDs Spotify via recherche directe (Playwright)"""
 
-    def __init__(self, cache_file: str = "spotify_ids_cache.json", headless: bool = True):
-        self.cache_file = cache_file
-        self.cache = self._load_cache()
+    def __init__(self, cache: KVCache | None = None, headless: bool = True):
+        self.cache = (cache or default_kv_cache()).namespace("spotify_id")
         self.headless = headless
         self._playwright: PlaywrightInstance | None = None
         self.browser: Browser | None = None
@@ -116,20 +116,6 @@ class SpotifyIDScraper:
     # Cache
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _load_cache(self):
-        try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
-    def _save_cache(self):
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            logger.error(f"Erreur sauvegarde cache: {e}")
-
     def _get_cache_key(self, artist: str, title: str) -> str:
         return f"{artist.lower().strip()}::{title.lower().strip()}"
 
@@ -320,14 +306,12 @@ class SpotifyIDScraper:
             sid = best["id"]
             logger.info(f"✅ SÉLECTIONNÉ: {sid} (relevance: {best['relevance']:.2f})")
             self.cache[cache_key] = sid
-            self._save_cache()
             return sid
         else:
             logger.warning(f"❌ Aucun ID Spotify trouvé pour '{title}'")
             # Ne pas cacher l'échec si des erreurs techniques ont eu lieu
             if not had_errors:
                 self.cache[cache_key] = "not_found"
-                self._save_cache()
             return None
 
     def _select_track_with_llm(self, artist: str, title: str, found_tracks: list) -> dict | None:
@@ -517,7 +501,6 @@ class SpotifyIDScraper:
             except PlaywrightTimeoutError:
                 logger.warning(f"⏰ Timeout recherche artiste: {artist_name}")
                 self.cache[cache_key] = "not_found"
-                self._save_cache()
                 return None
 
             links = self.page.query_selector_all("a[href*='/artist/']")
@@ -536,7 +519,6 @@ class SpotifyIDScraper:
                     if artist_lower in combined:
                         logger.info(f"✅ ID artiste Spotify trouvé: {aid}")
                         self.cache[cache_key] = aid
-                        self._save_cache()
                         return aid
                 except (PlaywrightError, AttributeError, TypeError, ValueError):
                     continue
@@ -549,7 +531,6 @@ class SpotifyIDScraper:
                     if aid:
                         logger.warning(f"⚠️ ID artiste Spotify (fallback, sans vérif nom): {aid}")
                         self.cache[cache_key] = aid
-                        self._save_cache()
                         return aid
                 except (PlaywrightError, AttributeError, TypeError, ValueError):
                     continue
@@ -558,7 +539,6 @@ class SpotifyIDScraper:
             logger.error(f"❌ Erreur recherche ID artiste '{artist_name}': {e}")
 
         self.cache[cache_key] = "not_found"
-        self._save_cache()
         return None
 
     def close(self):
@@ -0,0 +1,179 @@
+"""Import d'un artiste EN FLUX : découverte Genius → prefill → crédits/paroles
+→ synchro → enrichissement audio → save, sans barrière entre les étapes.
+
+Avant : récupérer la discographie (`start_track_retrieval`), attendre la fin,
+puis lancer scraping et enrichissement comme des batchs séparés — chaque étape
+attendait que la précédente ait fini TOUS les morceaux, et la discographie
+entière restait en mémoire entre deux. Ici les morceaux découverts page par
+page (`GeniusAPI.iter_artist_songs_async`) traversent les étages de
+`run_pipeline` (files bornées, concurrence propre à chaque étage) : le premier
+morceau complet est en base pendant que les pages suivantes arrivent.
+
+Seuls les morceaux NOUVEAUX passent (genius_id absent de `artist.tracks` et
+de `skip_genius_ids`, p.ex. l'historique des suppressions) : la fusion avec
+l'existant reste l'affaire de la récupération classique. Les étages reprennent
+les briques des flux existants (jumeaux async Genius, `GeniusScraperV3`,
+`LyricsProvider`, `DataEnricher.enrich_track_async`, `save_tracks`).
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.concurrency.pipeline import PipelineResult, Stage, StageStats, run_pipeline
+from src.config import ENRICH_CONCURRENCY
+from src.models import Artist, Track
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Concurrence par étage. Prefill : borné surtout par le budget api.genius.com ;
+# crédits : UN navigateur Crawl4AI (profil persistant, challenge Cloudflare) ;
+# synchro : ponts LRCLIB/YTM dans des threads (YTM est sync).
+PREFILL_CONCURRENCY = 4
+CREDITS_CONCURRENCY = 1
+SYNC_CONCURRENCY = 2
+SAVE_BATCH_SIZE = 10
+
+# Noms d'étages (clés des compteurs de progression)
+STAGE_PREFILL = "prefill"
+STAGE_CREDITS = "credits"
+STAGE_SYNC = "sync"
+STAGE_ENRICH = "enrich"
+STAGE_SAVE = "save"
+
+
+@dataclass
+class OnboardingOptions:
+    """Options de l'import (cf. dialogue de récupération)."""
+
+    max_songs: int = 200
+    include_features: bool = True
+    include_secondary: bool = False
+    prefill: bool = True
+    credits: bool = True  # crédits + paroles Genius (même crawl)
+    synced_lyrics: bool = True  # LRCLIB + YTM
+    enrich_sources: list[str] | None = None  # None = toutes ; [] = pas d'audio
+    skip_genius_ids: set = field(default_factory=set)
+
+
+def lyrics_artist_name(track: Track, artist: Artist) -> str:
+    """Nom d'artiste des recherches (feat → artiste principal)."""
+    if track.is_featuring and track.primary_artist_name:
+        return track.primary_artist_name
+    return track.artist.name if track.artist else artist.name
+
+
+async def onboard_artist(
+    artist: Artist,
+    options: OnboardingOptions,
+    *,
+    genius_api,
+    data_manager,
+    data_enricher=None,
+    http=None,
+    credits_scraper=None,
+    lyrics_provider=None,
+    should_stop: Callable[[], bool] | None = None,
+    on_progress: Callable[[dict[str, StageStats]], None] | None = None,
+) -> PipelineResult:
+    """Importe les nouveaux morceaux de `artist` (persisté : `artist.id`) en flux.
+
+    Les dépendances non fournies sont créées ici et fermées à la fin (« qui
+    crée ferme ») ; `data_enricher` fourni → ses ressources de batch sont
+    fermées (`aclose_batch`). Renvoie les morceaux sauvegardés et les
+    compteurs par étage.
+    """
+    if not artist.id:
+        raise ValueError(f"Artiste non persisté : {artist.name}")
+    owned_http = http is None
+    if owned_http:
+        from src.api.async_http import AsyncHttpSession
+
+        http = AsyncHttpSession()
+    if options.credits and credits_scraper is None:
+        from src.scrapers.genius_scraper_v3 import GeniusScraperV3
+
+        credits_scraper = GeniusScraperV3(headless=True)
+    owned_lyrics = options.synced_lyrics and lyrics_provider is None
+    if owned_lyrics:
+        from src.enrichment.providers.lyrics import LyricsProvider
+
+        lyrics_provider = LyricsProvider(sync_musixmatch=False)
+
+    known = {t.genius_id for t in artist.tracks if t.genius_id} | set(options.skip_genius_ids)
+
+    async def discovered():
+        async for batch in genius_api.iter_artist_songs_async(
+            http,
+            artist,
+            options.max_songs,
+            include_features=options.include_features,
+            include_secondary=options.include_secondary,
+        ):
+            for track in batch:
+                if track.genius_id not in known:
+                    yield track
+
+    async def prefill(track: Track) -> Track:
+        await genius_api.prefill_track_async(http, track)
+        return track
+
+    async def credits(track: Track) -> Track:
+        await credits_scraper.scrape_track_credits_async(track)
+        return track
+
+    async def synced(track: Track) -> Track:
+        need_text = not (track.lyrics.present and track.lyrics.text)
+        # Ponts LRCLIB/Musixmatch = run_sync → hors de la boucle (thread)
+        await asyncio.to_thread(
+            lyrics_provider.enrich,
+            track,
+            lyrics_artist_name(track, artist),
+            need_sync=not track.lyrics.synced,
+            need_text=need_text,
+        )
+        return track
+
+    async def enrich(track: Track) -> Track:
+        await data_enricher.enrich_track_async(
+            track, sources=options.enrich_sources, artist_tracks=artist.tracks
+        )
+        return track
+
+    async def save(batch: list[Track]) -> None:
+        await asyncio.to_thread(data_manager.save_tracks, batch)
+
+    stages = []
+    if options.prefill:
+        stages.append(Stage(STAGE_PREFILL, prefill, concurrency=PREFILL_CONCURRENCY))
+    if options.credits:
+        stages.append(Stage(STAGE_CREDITS, credits, concurrency=CREDITS_CONCURRENCY))
+    if options.synced_lyrics:
+        stages.append(Stage(STAGE_SYNC, synced, concurrency=SYNC_CONCURRENCY))
+    if data_enricher is not None and options.enrich_sources != []:
+        stages.append(Stage(STAGE_ENRICH, enrich, concurrency=ENRICH_CONCURRENCY))
+    stages.append(Stage(STAGE_SAVE, save, batch_size=SAVE_BATCH_SIZE))
+
+    logger.info(
+        f"🚀 Import en flux de {artist.name} : {' → '.join(s.name for s in stages)} "
+        f"(max {options.max_songs} morceaux)"
+    )
+    try:
+        result = await run_pipeline(
+            discovered(), stages, should_stop=should_stop, on_progress=on_progress
+        )
+    finally:
+        if data_enricher is not None:
+            await data_enricher.aclose_batch()
+        if owned_lyrics:
+            # close() passe par run_sync (session async) → hors de la boucle
+            await asyncio.to_thread(lyrics_provider.close)
+        if owned_http:
+            await http.aclose()
+    saved = sum(1 for t in result.items if t.id)
+    logger.info(
+        f"✅ Import en flux de {artist.name} : {saved}/{len(result.items)} morceau(x) "
+        f"sauvegardé(s)" + (" (interrompu)" if result.stopped else "")
+    )
+    return result
@@ -14,6 +14,7 @@ from typing import Any
 from sqlalchemy import func, select, text, update
 
 from src.models import Artist
+from src.persistence import search_index
 from src.persistence.binding import date_bind
 from src.persistence.schema import artists, monthly_listeners_history
 from src.utils.logger import get_logger
@@ -131,6 +132,15 @@ class ArtistRepository:
             logger.error(f"❌ Erreur dans get_artist_by_name: {e}")
             return None
 
+    def get_artist_names(self) -> list[str]:
+        """Noms de tous les artistes de la base (ordre alphabétique)."""
+        try:
+            with self.engine.connect() as conn:
+                return list(conn.execute(select(artists.c.name).order_by(artists.c.name)).scalars())
+        except Exception as e:
+            logger.error(f"❌ Erreur dans get_artist_names: {e}")
+            return []
+
     def delete_artist(self, artist_name: str) -> bool:
         """Supprime un artiste et toutes ses données associées"""
         try:
@@ -170,14 +180,36 @@ class ArtistRepository:
                     {"aid": artist_id},
                 ).rowcount
 
-                # 2b. Supprimer les observations (pas de cascade FK, E4)
+                # 2b. Supprimer les observations (pas de cascade FK, E4) et le
+                # cache de réconciliation qui en dérive (e14)
+                for table in ("observations", "reconcile_cache"):
+                    conn.execute(
+                        text(
+                            f"DELETE FROM {table} WHERE track_id IN "
+                            "(SELECT id FROM tracks WHERE artist_id = :aid)"
+                        ),
+                        {"aid": artist_id},
+                    )
+
+                # 2c. Retirer ses morceaux de l'index plein texte (e16)
+                search_index.remove_tracks(
+                    conn,
+                    conn.execute(
+                        text("SELECT id FROM tracks WHERE artist_id = :aid"), {"aid": artist_id}
+                    ).scalars(),
+                )
+
+                # 2d. Jobs de batch reprenables de l'artiste (e17)
                 conn.execute(
                     text(
-                        "DELETE FROM observations WHERE track_id IN "
-                        "(SELECT id FROM tracks WHERE artist_id = :aid)"
+                        "DELETE FROM batch_job_items WHERE job_id IN "
+                        "(SELECT id FROM batch_jobs WHERE artist_id = :aid)"
                     ),
                     {"aid": artist_id},
                 )
+                conn.execute(
+                    text("DELETE FROM batch_jobs WHERE artist_id = :aid"), {"aid": artist_id}
+                )
 
                 # 3. Supprimer les morceaux
                 deleted_tracks = conn.execute(
@@ -0,0 +1,140 @@
+"""Journal des deltas de certifications publiés par les updaters.
+
+Les updaters SNEP/BRMA/RIAA tournent en sous-processus (scripts lancés par
+la fenêtre Certifications) : le matcher du processus GUI ne voit leurs
+ajouts qu'en rechargeant les trois pays depuis les CSV. Chaque réécriture
+d'un CSV clean passe désormais par `recording(body, csv_path)`, qui ajoute
+au journal `cert_deltas.jsonl` du dossier des sources (celui qui contient
+`<body>/certif_<body>.csv`, soit `data/certifications/`) une entrée :
+
+    {"body": "SNEP", "before": [taille, mtime_ns] | null, "after": [...],
+     "added": [ligne CSV, ...], "removed": [ligne CSV, ...]}
+
+`added` / `removed` = lignes du CSV clean (dicts colonne → texte) apparues /
+disparues (différence multi-ensemble, colonnes confondues). `before` /
+`after` = empreinte du fichier avant / après écriture : le matcher
+n'applique une entrée que si `before` correspond à l'état qu'il a chargé
+(sinon rechargement complet) — un CSV modifié hors journal est détecté.
+
+Le journal est borné (`JOURNAL_MAX_ENTRIES`, les plus anciennes tombent) ;
+un matcher trop en retard recharge tout. Best-effort : un échec de
+publication n'empêche jamais la mise à jour elle-même.
+"""
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from src.config import DATA_PATH
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_NAME = "cert_deltas.jsonl"
+JOURNAL_MAX_ENTRIES = 200
+
+
+def journal_path(root: Path | None = None) -> Path:
+    """Journal du dossier des sources `root` (défaut : data/certifications/)."""
+    return Path(root or Path(DATA_PATH) / "certifications") / JOURNAL_NAME
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    """Empreinte (taille, mtime ns) d'un CSV, None s'il n'existe pas."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_rows(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    # Lu comme le matcher (`CertMatcher._load_source`) : mêmes valeurs texte
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype=str).fillna("")
+    return df.to_dict("records")
+
+
+def diff_rows(before: list[dict], after: list[dict]) -> tuple[list[dict], list[dict]]:
+    """(ajoutées, retirées) entre deux versions d'un CSV, en multi-ensemble."""
+
+    def key(row: dict) -> tuple:
+        return tuple(sorted((k, str(v)) for k, v in row.items()))
+
+    old, new = Counter(map(key, before)), Counter(map(key, after))
+    added, removed = new - old, old - new
+    return (
+        [dict(k) for k, n in added.items() for _ in range(n)],
+        [dict(k) for k, n in removed.items() for _ in range(n)],
+    )
+
+
+def publish(entry: dict, path: Path | None = None) -> None:
+    """Ajoute une entrée au journal `path` (réécrit borné s'il déborde)."""
+    path = path or journal_path()
+    line = json.dumps(entry, ensure_ascii=False)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+        if len(lines) >= JOURNAL_MAX_ENTRIES:
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            keep = lines[-(JOURNAL_MAX_ENTRIES - 1) :] + [line]
+            tmp.write_text("\n".join(keep) + "\n", encoding="utf-8")
+            os.replace(tmp, path)
+        else:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        logger.warning(f"⚠️ Delta de certifications non publié ({entry.get('body')}): {e}")
+
+
+def read_journal(path: Path | None = None) -> list[dict]:
+    """Entrées du journal, de la plus ancienne à la plus récente."""
+    path = path or journal_path()
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue  # ligne tronquée (crash pendant l'écriture) : ignorée
+    return entries
+
+
+@contextmanager
+def recording(body: str, csv_path: Path) -> Iterator[None]:
+    """Publie le delta du CSV clean `csv_path` réécrit dans le bloc `with`."""
+    csv_path = Path(csv_path)
+    before_stamp = file_stamp(csv_path)
+    try:
+        before = _read_rows(csv_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Delta {body} : CSV avant mise à jour illisible ({e})")
+        before = None
+    yield
+    after_stamp = file_stamp(csv_path)
+    if before is None or after_stamp == before_stamp:
+        return
+    try:
+        added, removed = diff_rows(before, _read_rows(csv_path))
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Delta {body} : CSV après mise à jour illisible ({e})")
+        return
+    publish(
+        {
+            "body": body,
+            "before": before_stamp,
+            "after": after_stamp,
+            "added": added,
+            "removed": removed,
+        },
+        journal_path(csv_path.parent.parent),
+    )
+    logger.info(f"📨 Delta {body} publié : +{len(added)} / -{len(removed)} ligne(s)")
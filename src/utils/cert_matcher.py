@@ -10,13 +10,21 @@ normalisation identique (zéro régression SNEP, vérifié par test comparatif).
 Les résultats sont tagués par pays (`country`/`body`/`flag`) → l'affichage peut
 grouper par territoire.
 
-RIAA-ready : ajouter une source = une méthode `_load_riaa()` qui pousse des
-lignes au même format ; le matcher ne change pas.
+RIAA-ready : ajouter une source = une branche de `_store_row()` qui produit
+des lignes au même format ; le matcher ne change pas.
+
+Mise à jour INCRÉMENTALE : les updaters publient les lignes ajoutées/retirées
+de chaque CSV clean (`cert_delta`) ; `refresh()` les applique au magasin et à
+ses index en place (compteur `version`) au lieu de tout recharger, et renvoie
+les artistes normalisés touchés — l'app ne rematche que ceux-là.
 """
 
 from __future__ import annotations
 
+import functools
 import re
+import threading
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -24,7 +32,10 @@ from typing import Any
 import pandas as pd
 
 from src.config import DATA_PATH
+from src.utils import cert_normalize
+from src.utils.cert_delta import file_stamp, read_journal
 from src.utils.cert_normalize import normalize_text as _normalize_text
+from src.utils.cert_store_cache import load_store, save_store, store_key
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +56,39 @@ _CAT_MAP = {
 
 _COUNTRY = {"SNEP": "FR", "BRMA": "BE", "RIAA": "US"}
 _FLAG = {"SNEP": "🇫🇷", "BRMA": "🇧🇪", "RIAA": "🇺🇸"}
+_COUNTRY_ORDER = {"FR": 0, "BE": 1, "US": 2}
+
+# Colonnes du magasin
+_STORE_COLUMNS = [
+    "artist_clean",
+    "title_clean",
+    "cat",
+    "level",
+    "date",
+    "country",
+    "body",
+    "flag",
+    "artist_name",
+    "title",
+    "release_date",
+    "publisher",
+    "detail_url",
+]
+
+# Format colonne (`_format`) ← colonne du magasin
+_RECORD_FIELDS = {
+    "certification": "level",
+    "title": "title",
+    "artist_name": "artist_name",
+    "category": "cat",
+    "certification_date": "date",
+    "release_date": "release_date",
+    "publisher": "publisher",
+    "detail_url": "detail_url",
+    "country": "country",
+    "body": "body",
+    "flag": "flag",
+}
 
 # Priorité d'affichage (plus petit = plus haut). Les multi-platine BE sont
 # classés juste au-dessus de Platine selon le multiplicateur.
@@ -66,6 +110,36 @@ _RANK = {
 }
 
 
+# Cache binaire du magasin normalisé, invalidé par les CSV ou le code producteur
+STORE_CACHE_NAME = ".cert_store.npz"
+_STORE_CODE = [Path(__file__), Path(cert_normalize.__file__)]
+
+
+def _source_files() -> dict[str, Path]:
+    """CSV clean de chaque source (lus à chaque construction du magasin)."""
+    root = Path(DATA_PATH) / "certifications"
+    return {body: root / body / f"certif_{body}.csv" for body in ("snep", "brma", "riaa")}
+
+
+def _source_stamps() -> dict[str, list[int] | None]:
+    """Empreinte (taille, mtime) de chaque CSV clean, comparée aux deltas publiés."""
+    return {body: file_stamp(path) for body, path in _source_files().items()}
+
+
+def affected_artists(names: Iterable[str], touched: set[str]) -> list[str]:
+    """Noms (bruts) dont le matching peut changer après un delta touchant `touched`.
+
+    Même sémantique que le matching (l'artiste de la certif CONTIENT le nom
+    normalisé de l'artiste) : « IAM » est touché par une certif de « WILLIAMS ».
+    """
+    out = []
+    for name in names:
+        a = _normalize_text(name)
+        if a and any(a in t for t in touched):
+            out.append(name)
+    return out
+
+
 def _norm_cat(cat: str) -> str:
     return _CAT_MAP.get((cat or "").strip().lower(), (cat or "").strip().lower())
 
@@ -96,162 +170,329 @@ def _riaa_level(s: str) -> str:
     return s  # Gold, Platinum, Diamond, etc.
 
 
+class _CertIndex:
+    """Index du magasin, construit au chargement puis complété par `add`.
+
+    Remplace les masques pandas sur TOUT le magasin, refaits pour chaque
+    artiste candidat de chaque morceau (`apply_certifications` ∝ taille du
+    magasin × nombre de morceaux) :
+
+      · `exact` : seaux (artist_clean, title_clean) → lignes (S1/S2 exacts,
+        et S4 : les préfixes du titre y sont cherchés directement — un trie
+        des titres sans structure de plus) ;
+      · `grams` : index inversé trigrammes → artistes distincts ; les lignes
+        dont l'artiste CONTIENT `a` (≡ `str.contains`) ne sont cherchées que
+        parmi les artistes portant tous les trigrammes de `a`, puis vérifiées ;
+        mémorisé par `a` (un artiste revient pour chacun de ses morceaux).
+
+    Les sous-chaînes de titre ne sont ensuite testées que sur ces lignes
+    candidates. Lignes = positions dans `df`, toujours dans l'ordre du magasin.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        artists = df["artist_clean"].tolist() if not df.empty else []
+        self.titles: list[str] = df["title_clean"].tolist() if not df.empty else []
+        self.cats: list[str] = df["cat"].tolist() if not df.empty else []
+        self.exact: dict[tuple[str, str], list[int]] = {}
+        self.by_artist: dict[str, list[int]] = {}
+        for i, (a, t) in enumerate(zip(artists, self.titles, strict=True)):
+            self.exact.setdefault((a, t), []).append(i)
+            self.by_artist.setdefault(a, []).append(i)
+        self.grams: dict[str, set[str]] = {}
+        for a in self.by_artist:
+            for gram in _trigrams(a):
+                self.grams.setdefault(gram, set()).add(a)
+        self._artist_rows: dict[str, list[int]] = {}
+
+    def add(self, rows: list[tuple[str, str, str]]) -> None:
+        """Indexe des lignes (artist_clean, title_clean, cat) ajoutées en fin de
+        magasin ; oublie les `artist_rows` mémorisés qu'elles complètent."""
+        for a, t, cat in rows:
+            i = len(self.titles)
+            self.titles.append(t)
+            self.cats.append(cat)
+            self.exact.setdefault((a, t), []).append(i)
+            if a not in self.by_artist:
+                for gram in _trigrams(a):
+                    self.grams.setdefault(gram, set()).add(a)
+            self.by_artist.setdefault(a, []).append(i)
+        artists = {a for a, _, _ in rows}
+        self._artist_rows = {
+            k: v for k, v in self._artist_rows.items() if not any(k in a for a in artists)
+        }
+
+    def artist_rows(self, a: str) -> list[int]:
+        """Lignes dont l'artiste contient `a`, dans l'ordre du magasin."""
+        rows = self._artist_rows.get(a)
+        if rows is None:
+            grams = _trigrams(a)
+            if grams:
+                postings = sorted((self.grams.get(g, set()) for g in grams), key=len)
+                names = postings[0].intersection(*postings[1:])
+            else:  # `a` de moins de 3 caractères : tous les artistes
+                names = self.by_artist.keys()
+            rows = sorted(i for name in names if a in name for i in self.by_artist[name])
+            self._artist_rows[a] = rows
+        return rows
+
+    def containing(self, a: str, t: str) -> list[int]:
+        """Lignes dont l'artiste contient `a` ET le titre contient `t`."""
+        titles = self.titles
+        return [i for i in self.artist_rows(a) if t in titles[i]]
+
+    def truncated(self, a: str, t: str) -> list[int]:
+        """Lignes de l'artiste `a` dont le titre (≥ 8 car.) est un préfixe STRICT de `t`."""
+        return sorted(i for k in range(8, len(t)) for i in self.exact.get((a, t[:k]), ()))
+
+
+def _trigrams(s: str) -> set[str]:
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
 class CertMatcher:
     """Magasin unifié + raccordement morceau/album ↔ certifs, multi-pays."""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         # Normalisation partagée (parité entre sources garantie par cert_normalize)
         self._norm = _normalize_text
-        self.df = self._load_all()
+        self._use_cache = use_cache
+        # Sérialise `refresh` et les lectures (worker GUI vs MàJ de certifs)
+        self._lock = threading.RLock()
+        self.version = 0
+        self._load()
         logger.info(
             f"✅ CertMatcher : {len(self.df)} certifs unifiées "
             f"({self.df['body'].value_counts().to_dict() if not self.df.empty else {}})"
         )
 
     # ------------------------------------------------------------------ chargement
+    def _load(self) -> None:
+        """(Re)construit magasin, index et format colonne depuis le disque."""
+        # Empreintes AVANT lecture : un CSV réécrit pendant le chargement ne
+        # correspondra à aucun delta → rechargement complet au prochain refresh
+        self._stamps = _source_stamps()
+        self.df = self._load_cached() if self._use_cache else self._load_all()
+        self._index = _CertIndex(self.df)
+        self._build_records()
+
+    def _load_cached(self) -> pd.DataFrame:
+        """Magasin depuis le cache binaire si sa clé est valide (quelques ms),
+        sinon depuis les CSV — puis remis en cache (`cert_store_cache`)."""
+        path = Path(DATA_PATH) / "certifications" / STORE_CACHE_NAME
+        key = store_key(list(_source_files().values()), _STORE_CODE)
+        df = load_store(path, key)
+        if df is not None:
+            logger.debug(f"CertMatcher : magasin relu depuis {path.name}")
+            return df
+        df = self._load_all()
+        if not df.empty:
+            save_store(path, key, df)
+        return df
+
     def _load_all(self) -> pd.DataFrame:
         rows: list[dict] = []
         rows += self._load_snep()
         rows += self._load_brma()
         rows += self._load_riaa()
         if not rows:
-            return pd.DataFrame(
-                columns=[
-                    "artist_clean",
-                    "title_clean",
-                    "cat",
-                    "level",
-                    "date",
-                    "country",
-                    "body",
-                    "flag",
-                    "artist_name",
-                    "title",
-                    "release_date",
-                    "publisher",
-                    "detail_url",
-                ]
-            )
-        df = pd.DataFrame(rows)
-        df["title_len"] = df["title_clean"].str.len()
-        return df
+            return pd.DataFrame(columns=_STORE_COLUMNS)
+        return pd.DataFrame(rows)
 
-    def _load_snep(self) -> list[dict]:
-        # CSV canonique (brut→clean via snep_build) — lu en direct comme BRMA/RIAA,
-        # normalisation à la volée (parité assurée par cert_normalize).
-        csv = Path(DATA_PATH) / "certifications" / "snep" / "certif_snep.csv"
+    def _load_source(self, body: str) -> list[dict]:
+        """Lignes du magasin issues du CSV clean de `body` (SNEP/BRMA/RIAA)."""
+        csv = _source_files()[body.lower()]
         if not csv.exists():
             return []
         try:
             df = pd.read_csv(csv, encoding="utf-8-sig", dtype=str).fillna("")
         except Exception as e:
-            logger.error(f"CertMatcher: chargement SNEP impossible : {e}")
+            logger.error(f"CertMatcher: chargement {body} impossible : {e}")
             return []
-        rows = []
-        for _, r in df.iterrows():
-            artist = str(r.get("artist", "")).strip()
-            title = str(r.get("title", "")).strip()
-            rows.append(
-                {
-                    "artist_clean": self._norm(artist),
-                    "title_clean": self._norm(title),
-                    "cat": _norm_cat(r.get("category", "")),
-                    "level": str(r.get("certification", "")).strip(),
-                    "date": str(r.get("certification_date", "")).strip()[:10],
-                    "country": "FR",
-                    "body": "SNEP",
-                    "flag": "🇫🇷",
-                    "artist_name": artist,
-                    "title": title,
-                    "release_date": str(r.get("release_date", "")).strip()[:10],
-                    "publisher": str(r.get("publisher", "")).strip(),
-                    "detail_url": "",
-                }
-            )
-        return rows
+        rows = (self._store_row(body, r) for r in df.to_dict("records"))
+        return [row for row in rows if row]
+
+    def _load_snep(self) -> list[dict]:
+        # CSV canonique (brut→clean via snep_build) — lu en direct comme BRMA/RIAA,
+        # normalisation à la volée (parité assurée par cert_normalize).
+        return self._load_source("SNEP")
 
     def _load_brma(self) -> list[dict]:
-        csv = Path(DATA_PATH) / "certifications" / "brma" / "certif_brma.csv"
-        if not csv.exists():
-            return []
-        try:
-            df = pd.read_csv(csv, encoding="utf-8-sig", dtype=str).fillna("")
-        except Exception as e:
-            logger.error(f"CertMatcher: chargement BRMA impossible : {e}")
-            return []
-        rows = []
-        for _, r in df.iterrows():
-            artist = str(r.get("artist", "")).strip()
-            title = str(r.get("title", "")).strip()
-            rows.append(
-                {
-                    "artist_clean": self._norm(artist),
-                    "title_clean": self._norm(title),
-                    "cat": _norm_cat(r.get("category", "")),
-                    "level": str(r.get("certification_level", "")).strip(),
-                    "date": str(r.get("certification_date", "")).strip()[:10],
-                    "country": "BE",
-                    "body": "BRMA",
-                    "flag": "🇧🇪",
-                    "artist_name": artist,
-                    "title": title,
-                    "release_date": "",
-                    "publisher": "",
-                    "detail_url": str(r.get("detail_url", "")).strip(),
-                }
-            )
-        return rows
+        return self._load_source("BRMA")
 
     def _load_riaa(self) -> list[dict]:
-        """Charge les certifs RIAA (US). Fichier historique : certif_riaa.csv.
+        """Charge les certifs RIAA (US). Fichier historique : certif_riaa.csv."""
+        return self._load_source("RIAA")
+
+    def _store_row(self, body: str, r: dict) -> dict | None:
+        """Ligne du magasin depuis une ligne du CSV clean de `body` (None = ignorée).
 
-        Schéma toléré (insensible à la casse) : Artist, Title, Certification_Date
-        (« October 17, 2017 »), Format_Type (SINGLE/ALBUM), Certification_Type
-        (« 4x Multi-Platinum »), Label. Compatible aussi avec un futur schéma
-        minuscule (award_level, format).
+        Partagée par le chargement et les deltas publiés (`refresh`) : une
+        ligne ajoutée à chaud est normalisée exactement comme au chargement.
         """
-        csv = Path(DATA_PATH) / "certifications" / "riaa" / "certif_riaa.csv"
-        if not csv.exists():
-            return []
-        try:
-            df = pd.read_csv(csv, encoding="utf-8-sig", dtype=str).fillna("")
-        except Exception as e:
-            logger.error(f"CertMatcher: chargement RIAA impossible : {e}")
-            return []
+        if body == "RIAA":
+            # Schéma toléré (insensible à la casse) : Artist, Title,
+            # Certification_Date (« October 17, 2017 »), Format_Type
+            # (SINGLE/ALBUM), Certification_Type (« 4x Multi-Platinum »), Label.
+            # Compatible aussi avec un futur schéma minuscule (award_level, format).
+            low = {str(k).lower(): v for k, v in r.items()}
+
+            def col(*names):
+                for n in names:
+                    if n in low:
+                        return str(low[n]).strip()
+                return ""
+
+            artist, title = col("artist"), col("title")
+            if not artist or not title:
+                return None
+            level = _riaa_level(col("certification_type", "award_level", "certification_level"))
+            cat = _norm_cat(col("format_type", "format"))
+            date = _to_iso_date(col("certification_date"))
+            release_date = _to_iso_date(col("release_date"))
+            publisher, detail_url = col("label"), ""
+        else:
+            artist = str(r.get("artist", "")).strip()
+            title = str(r.get("title", "")).strip()
+            cat = _norm_cat(r.get("category", ""))
+            date = str(r.get("certification_date", "")).strip()[:10]
+            if body == "SNEP":
+                level = str(r.get("certification", "")).strip()
+                release_date = str(r.get("release_date", "")).strip()[:10]
+                publisher = str(r.get("publisher", "")).strip()
+                detail_url = ""
+            else:
+                level = str(r.get("certification_level", "")).strip()
+                release_date = publisher = ""
+                detail_url = str(r.get("detail_url", "")).strip()
+        return {
+            "artist_clean": self._norm(artist),
+            "title_clean": self._norm(title),
+            "cat": cat,
+            "level": level,
+            "date": date,
+            "country": _COUNTRY[body],
+            "body": body,
+            "flag": _FLAG[body],
+            "artist_name": artist,
+            "title": title,
+            "release_date": release_date,
+            "publisher": publisher,
+            "detail_url": detail_url,
+        }
 
-        cmap = {c.lower(): c for c in df.columns}
+    # ------------------------------------------------------------------ deltas
+    def refresh(self) -> set[str] | None:
+        """Applique au magasin les deltas publiés par les updaters (`cert_delta`).
 
-        def col(row, *names, default=""):
-            for n in names:
-                if n in cmap:
-                    return str(row.get(cmap[n], "")).strip()
-            return default
+        Chaque entrée du journal dont l'empreinte « avant » est celle du CSV
+        chargé est appliquée en place (lignes, index, format colonne), en
+        chaîne jusqu'à l'état du disque. Renvoie les `artist_clean` touchés
+        (vide = rien de neuf), ou None si le magasin a dû être rechargé en
+        entier (CSV modifié hors journal, journal tronqué, delta incohérent).
+        """
+        with self._lock:
+            disk = _source_stamps()
+            if disk == self._stamps:
+                return set()
+            touched: set[str] = set()
+            try:
+                for entry in read_journal():
+                    source = str(entry.get("body", "")).lower()
+                    if (
+                        source in self._stamps
+                        and self._stamps[source] != disk[source]
+                        and entry.get("before") == self._stamps[source]
+                    ):
+                        touched |= self._apply_delta(entry)
+                        self._stamps[source] = entry.get("after")
+                        self.version += 1
+            except (KeyError, ValueError) as e:
+                logger.warning(f"⚠️ Delta de certifications inapplicable ({e}) : rechargement")
+                self._stamps = {}
+            if self._stamps != disk:
+                self._load()
+                self.version += 1
+                logger.info(f"🔄 CertMatcher rechargé (v{self.version}) : {len(self.df)} certifs")
+                return None
+            self._save_cache()
+            logger.info(
+                f"🔄 CertMatcher v{self.version} : {len(self.df)} certifs, "
+                f"{len(touched)} artiste(s) touché(s)"
+            )
+            return touched
 
-        rows = []
-        for _, r in df.iterrows():
-            artist = col(r, "artist")
-            title = col(r, "title")
-            if not artist or not title:
-                continue
-            level = _riaa_level(col(r, "certification_type", "award_level", "certification_level"))
-            rows.append(
-                {
-                    "artist_clean": self._norm(artist),
-                    "title_clean": self._norm(title),
-                    "cat": _norm_cat(col(r, "format_type", "format")),
-                    "level": level,
-                    "date": _to_iso_date(col(r, "certification_date")),
-                    "country": "US",
-                    "body": "RIAA",
-                    "flag": "🇺🇸",
-                    "artist_name": artist,
-                    "title": title,
-                    "release_date": _to_iso_date(col(r, "release_date")),
-                    "publisher": col(r, "label"),
-                    "detail_url": "",
-                }
+    def _apply_delta(self, entry: dict) -> set[str]:
+        """Applique une entrée du journal ; renvoie les artistes normalisés touchés.
+
+        Une ligne retirée + une ligne ajoutée de même identité (artiste, titre,
+        catégorie) = ligne MODIFIÉE (niveau, date…), remplacée sur place. Les
+        ajouts restants vont en fin de magasin (`_CertIndex.add`) ; un retrait
+        sans remplaçant reconstruit index et format colonne (sans relire les
+        CSV). ValueError si une ligne retirée est absente du magasin.
+        """
+        body = str(entry["body"]).upper()
+        added = [row for row in (self._store_row(body, r) for r in entry["added"]) if row]
+        removed = [row for row in (self._store_row(body, r) for r in entry["removed"]) if row]
+
+        def identity(row):
+            return (row["artist_clean"], row["title_clean"], row["cat"])
+
+        pending: dict[tuple, list[dict]] = {}
+        for row in added:
+            pending.setdefault(identity(row), []).append(row)
+        claimed: set[int] = set()
+        dropped: list[int] = []
+        for row in removed:
+            record = self._record(row)
+            pos = next(
+                (
+                    i
+                    for i in self._index.exact.get((row["artist_clean"], row["title_clean"]), ())
+                    if i not in claimed and self._records[i] == record
+                ),
+                None,
             )
-        return rows
+            if pos is None:
+                raise ValueError(f"ligne {body} absente du magasin : {row['artist_name']}")
+            claimed.add(pos)
+            replacements = pending.get(identity(row))
+            if replacements:
+                self._replace_row(pos, replacements.pop(0))
+            else:
+                dropped.append(pos)
+        appended = [row for rows in pending.values() for row in rows]
+
+        if dropped:
+            df = self.df.drop(index=self.df.index[dropped])
+            if appended:
+                df = pd.concat([df, pd.DataFrame(appended, columns=df.columns)], ignore_index=True)
+            self.df = df.reset_index(drop=True)
+            self._index = _CertIndex(self.df)
+            self._build_records()
+        elif appended:
+            new = pd.DataFrame(appended, columns=self.df.columns)
+            self.df = pd.concat([self.df, new], ignore_index=True)
+            self._index.add([identity(row) for row in appended])
+            for row in appended:
+                record = self._record(row)
+                self._records.append(record)
+                self._sort_keys.append(self._sort_key(record))
+        return {row["artist_clean"] for row in added + removed}
+
+    def _replace_row(self, pos: int, row: dict) -> None:
+        """Remplace la ligne `pos` par `row` (même artiste/titre/catégorie : index intact)."""
+        self.df.iloc[pos] = [row.get(c, "") for c in self.df.columns]
+        record = self._record(row)
+        self._records[pos] = record
+        self._sort_keys[pos] = self._sort_key(record)
+
+    def _save_cache(self) -> None:
+        """Remet le magasin à jour en cache, si les CSV n'ont pas bougé entre-temps."""
+        if not self._use_cache or self.df.empty:
+            return
+        key = store_key(list(_source_files().values()), _STORE_CODE)
+        if _source_stamps() == self._stamps:
+            save_store(Path(DATA_PATH) / "certifications" / STORE_CACHE_NAME, key, self.df)
 
     # ------------------------------------------------------------------ matching
     def _level_rank(self, level: str) -> float:
@@ -268,64 +509,50 @@ class CertMatcher:
         return 99.0
 
     def _track_match_indices(self, a: str, t: str) -> list[int]:
-        """Stratégies SNEP portées (exact → feat → featuring → tronqué)."""
-        df = self.df
-        if df.empty or not a:
+        """Stratégies SNEP portées (exact → feat → featuring → tronqué).
+
+        Résolues sur l'index (`_CertIndex`) : seaux exacts, lignes dont
+        l'artiste contient `a`, préfixes du titre — mêmes lignes, même ordre
+        que les anciens masques pandas sur tout le magasin.
+        """
+        index = self._index
+        if not index.titles or not a:
             return []
         seen: list[int] = []
         sset = set()
 
-        def add(sub):
-            for idx in sub.index:
+        def add(rows):
+            for idx in rows:
                 if idx not in sset:
                     sset.add(idx)
                     seen.append(idx)
 
-        ac = df["artist_clean"]
-        tc = df["title_clean"]
-
         # Titre tout-symbole (ex: Ed Sheeran « ÷ », « = ») → normalize_text = ''.
         # On fait UNIQUEMENT un match exact (artiste + titre vide) ; surtout pas
         # de substring « LIKE %% » qui ramènerait TOUTE la disco (bug historique).
         if not t:
-            add(df[(ac == a) & (tc == "")])
+            add(index.exact.get((a, ""), ()))
             return seen
 
         # S1 : exact (artiste+titre), sinon fuzzy substring
-        s1 = df[(ac == a) & (tc == t)]
-        if s1.empty:
-            s1 = df[
-                ac.str.contains(a, regex=False, na=False)
-                & tc.str.contains(t, regex=False, na=False)
-            ]
-        add(s1)
+        fuzzy = index.containing(a, t)
+        add(index.exact.get((a, t)) or fuzzy)
 
         # S2 : si le titre contient un featuring, retenter avec la partie principale
         m = _FEAT_RE.match(t)
         if m:
             main = m.group(1).strip()
-            s2 = df[(ac == a) & (tc == main)]
-            if s2.empty and main:
-                s2 = df[
-                    ac.str.contains(a, regex=False, na=False)
-                    & tc.str.contains(main, regex=False, na=False)
-                ]
+            s2 = index.exact.get((a, main), ())
+            if not s2 and main:
+                s2 = index.containing(a, main)
             add(s2)
 
         # S3 : l'artiste apparaît en featuring (substring artiste + titre)
-        s3 = df[
-            ac.str.contains(a, regex=False, na=False) & tc.str.contains(t, regex=False, na=False)
-        ]
-        add(s3)
+        add(fuzzy)
 
         # S4 : titre de certif TRONQUÉ (préfixe du morceau) — en dernier recours
         if not seen and len(t) >= 8:
-            cand = df[(ac == a) & df["title_len"].between(8, len(t) - 1)]
-            if not cand.empty:
-                cand = cand[
-                    cand["title_clean"].apply(lambda x: isinstance(x, str) and t.startswith(x))
-                ]
-                add(cand)
+            add(index.truncated(a, t))
         return seen
 
     def get_track_certifications(
@@ -338,44 +565,60 @@ class CertMatcher:
         déposée sous l'ARTISTE PRINCIPAL à un morceau où notre artiste n'est
         que secondaire/feat (cas « morceau secondaire »).
         """
-        t = self._norm(title)
-        candidates = [self._norm(artist)]
-        for x in extra_artists or []:
-            nx = self._norm(x)
-            if nx and nx not in candidates:
-                candidates.append(nx)
-
-        idx, seen = [], set()
-        for a in candidates:
-            for i in self._track_match_indices(a, t):
-                if i not in seen:
-                    seen.add(i)
-                    idx.append(i)
-        return self._format(self.df.loc[idx]) if idx else []
+        return self.match_tracks(artist, [(title, extra_artists)])[0]
+
+    def match_tracks(
+        self, artist: str, tracks: Iterable[tuple[str, Iterable[str] | None]]
+    ) -> list[list[dict[str, Any]]]:
+        """`get_track_certifications` pour toute une discographie, en un appel.
+
+        `tracks` : paires (titre, artistes supplémentaires). Renvoie, dans le
+        même ordre, la liste triée (même ordre que `_format`) de chaque morceau.
+        Normalisations et résolutions sont mutualisées sur le lot : chaque nom,
+        chaque (artiste, titre) et chaque combinaison de candidats n'est
+        traité qu'une fois (titres répétés, mêmes featurings sur tout l'album).
+        """
+        norm = functools.cache(self._norm)
+        main = norm(artist)
+        indices = functools.cache(self._track_match_indices)
+        resolved: dict[tuple, list[dict[str, Any]]] = {}
+        results = []
+        with self._lock:
+            for title, extra_artists in tracks:
+                candidates = [main]
+                for x in extra_artists or []:
+                    nx = norm(x)
+                    if nx and nx not in candidates:
+                        candidates.append(nx)
+                key = (norm(title), tuple(candidates))
+                if key not in resolved:
+                    t = key[0]
+                    idx = list(dict.fromkeys(i for a in candidates for i in indices(a, t)))
+                    resolved[key] = self._format(idx)
+                # Copies : deux morceaux ne partagent jamais les mêmes dicts
+                results.append([dict(c) for c in resolved[key]])
+        return results
 
     def get_artist_certifications(self, artist: str) -> list[dict[str, Any]]:
         """Toutes les certifs (tous pays) de l'artiste (match substring, comme SNEP)."""
         a = self._norm(artist)
-        df = self.df
-        if df.empty or not a:
-            return []
-        return self._format(df[df["artist_clean"].str.contains(a, regex=False, na=False)])
+        with self._lock:
+            if self.df.empty or not a:
+                return []
+            return self._format(self._index.artist_rows(a))
 
     def get_album_certifications(self, artist: str, album: str) -> list[dict[str, Any]]:
         """Certifs d'ALBUM (catégorie album) raccordées à cet album, tous pays."""
         a = self._norm(artist)
         t = self._norm(album)
-        df = self.df
-        if df.empty or not a or not t:
-            return []
-        alb = df[df["cat"] == "album"]
-        exact = alb[(alb["artist_clean"] == a) & (alb["title_clean"] == t)]
-        if exact.empty:
-            exact = alb[
-                alb["artist_clean"].str.contains(a, regex=False, na=False)
-                & alb["title_clean"].str.contains(t, regex=False, na=False)
-            ]
-        return self._format(exact)
+        with self._lock:
+            if self.df.empty or not a or not t:
+                return []
+            index = self._index
+            exact = [i for i in index.exact.get((a, t), ()) if index.cats[i] == "album"]
+            if not exact:
+                exact = [i for i in index.containing(a, t) if index.cats[i] == "album"]
+            return self._format(exact)
 
     def audit_artist_certifications(
         self, artist_name: str, track_titles: list[str], album_titles: list[str] | None = None
@@ -467,34 +710,46 @@ class CertMatcher:
         }
 
     # ------------------------------------------------------------------ sortie
-    def _format(self, rows: pd.DataFrame) -> list[dict[str, Any]]:
-        out = []
-        for _, r in rows.iterrows():
-            out.append(
-                {
-                    "certification": r["level"],
-                    "title": r["title"],
-                    "artist_name": r["artist_name"],
-                    "category": r["cat"],
-                    "certification_date": r["date"],
-                    "release_date": r.get("release_date", ""),
-                    "publisher": r.get("publisher", ""),
-                    "detail_url": r.get("detail_url", ""),
-                    "country": r["country"],
-                    "body": r["body"],
-                    "flag": r["flag"],
-                }
+    def _format(self, idx: list[int]) -> list[dict[str, Any]]:
+        """Lignes `idx` du magasin au format colonne, triées : pays (FR, BE, US)
+        puis niveau puis date. Dicts et clés de tri précalculés par ligne."""
+        records, keys = self._records, self._sort_keys
+        return [dict(records[i]) for i in sorted(idx, key=keys.__getitem__)]
+
+    def _build_records(self) -> None:
+        """Format colonne + clé de tri de chaque ligne, une fois pour tout le magasin."""
+        df = self.df
+
+        def col(name: str) -> list:
+            return df[name].tolist() if name in df.columns else [""] * len(df)
+
+        fields = {out: col(name) for out, name in _RECORD_FIELDS.items()}
+        names = list(fields)
+        self._records = [
+            dict(zip(names, values, strict=True)) for values in zip(*fields.values(), strict=True)
+        ]
+        ranks = {level: self._level_rank(level) for level in set(fields["certification"])}
+        self._sort_keys = [
+            (_COUNTRY_ORDER.get(country, 9), ranks[level], date or "")
+            for country, level, date in zip(
+                fields["country"],
+                fields["certification"],
+                fields["certification_date"],
+                strict=True,
             )
-        # Tri : pays (FR, BE, US) puis niveau puis date décroissante
-        order = {"FR": 0, "BE": 1, "US": 2}
-        out.sort(
-            key=lambda c: (
-                order.get(c["country"], 9),
-                self._level_rank(c["certification"]),
-                c["certification_date"] or "",
-            ),
+        ]
+
+    @staticmethod
+    def _record(row: dict) -> dict[str, Any]:
+        """Format colonne d'UNE ligne du magasin (lignes publiées par delta)."""
+        return {out: row.get(name, "") for out, name in _RECORD_FIELDS.items()}
+
+    def _sort_key(self, record: dict) -> tuple:
+        return (
+            _COUNTRY_ORDER.get(record["country"], 9),
+            self._level_rank(record["certification"]),
+            record["certification_date"] or "",
         )
-        return out
 
 
 _instance: CertMatcher | None = None
@@ -508,6 +763,18 @@ def get_cert_matcher() -> CertMatcher:
 
 
 def reset_cert_matcher() -> None:
-    """Force un rechargement (après une MàJ de certifs)."""
+    """Force un rechargement complet (préférer `refresh_cert_matcher`)."""
     global _instance
     _instance = None
+
+
+def refresh_cert_matcher() -> set[str] | None:
+    """Applique au matcher chargé les deltas publiés depuis (après une MàJ de certifs).
+
+    Renvoie les `artist_clean` touchés (à filtrer par `affected_artists`), ou
+    None quand tout peut avoir changé (rechargement complet, ou aucun matcher
+    encore chargé — le prochain `get_cert_matcher()` lira les CSV à jour).
+    """
+    if _instance is None:
+        return None
+    return _instance.refresh()
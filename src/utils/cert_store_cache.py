@@ -0,0 +1,104 @@
+"""Cache binaire du magasin de certifications normalisé (`CertMatcher`).
+
+Chaque démarrage et chaque `reset_cert_matcher()` relisaient les CSV
+SNEP/BRMA/RIAA et repassaient `normalize_text` sur chaque artiste et chaque
+titre (plusieurs secondes). Le magasin normalisé est sérialisé une fois,
+puis rechargé tant que sa clé est valide :
+
+  · CLÉ — taille + mtime (ns) de chaque CSV source et empreinte du code qui
+    produit le magasin (`cert_normalize`, `cert_matcher` : une règle de
+    normalisation ou de chargement modifiée invalide le cache), plus
+    `STORE_CACHE_FORMAT` ;
+  · FORMAT — un `.npz` numpy SANS pickle (`allow_pickle=False`) : une table
+    de chaînes dédupliquées (texte UTF-8 + bornes) et une matrice de codes
+    int32 colonne × ligne ;
+  · écriture atomique (fichier temporaire puis `os.replace`) : plusieurs
+    processus (`python -m src.batch --processes`) peuvent reconstruire en
+    même temps sans corrompre le fichier.
+
+Best-effort : un cache absent, périmé ou illisible = reconstruction
+transparente depuis les CSV.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# À incrémenter si la disposition du fichier change
+STORE_CACHE_FORMAT = 1
+
+
+def store_key(sources: list[Path], code_files: list[Path]) -> str:
+    """Clé du magasin : CSV sources (taille, mtime) + empreinte du code producteur."""
+    parts: dict = {"format": STORE_CACHE_FORMAT, "sources": [], "code": []}
+    for path in sources:
+        try:
+            st = path.stat()
+            parts["sources"].append([path.name, st.st_size, st.st_mtime_ns])
+        except OSError:
+            parts["sources"].append([path.name, None])
+    for path in code_files:
+        parts["code"].append(hashlib.sha256(path.read_bytes()).hexdigest())
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def save_store(path: Path, key: str, df: pd.DataFrame) -> bool:
+    """Sérialise `df` (colonnes texte) sous `key`. False si l'écriture échoue."""
+    columns = list(df.columns)
+    table: dict[str, int] = {}
+    codes = np.empty((len(columns), len(df)), dtype=np.int32)
+    for c, column in enumerate(columns):
+        codes[c] = [table.setdefault(str(value), len(table)) for value in df[column].tolist()]
+    strings = list(table)
+    bounds = np.zeros(len(strings) + 1, dtype=np.int64)
+    bounds[1:] = np.cumsum([len(s) for s in strings])
+    blob = np.frombuffer("".join(strings).encode("utf-8"), dtype=np.uint8)
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                key=np.array(key),
+                columns=np.array(columns),
+                text=blob,
+                bounds=bounds,
+                codes=codes,
+            )
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"⚠️ Cache du magasin de certifs non écrit ({path.name}): {e}")
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def load_store(path: Path, key: str) -> pd.DataFrame | None:
+    """Magasin sérialisé sous `key`, ou None (absent, périmé, illisible)."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["key"]) != key:
+                return None
+            columns = data["columns"].tolist()
+            text = data["text"].tobytes().decode("utf-8")
+            bounds = data["bounds"].tolist()
+            codes = data["codes"].tolist()
+    except (OSError, ValueError, KeyError, UnicodeDecodeError) as e:
+        logger.warning(f"⚠️ Cache du magasin de certifs illisible ({path.name}): {e}")
+        return None
+    strings = [text[bounds[i] : bounds[i + 1]] for i in range(len(bounds) - 1)]
+    return pd.DataFrame(
+        {column: [strings[c] for c in row] for column, row in zip(columns, codes, strict=True)},
+        columns=columns,
+    )
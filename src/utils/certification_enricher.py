@@ -1,11 +1,15 @@
 """Enrichissement des données avec les certifications.
 
-Cœur : `apply_certifications(artist, tracks, matcher)` (E7g) — rematche chaque
-morceau/album contre les CSV clean (matcher en mémoire, offline, rapide) et pose
+Cœur : `apply_certifications(artist, tracks, matcher)` (E7g) — rematche toute la
+discographie (`match_tracks`, un seul appel) puis chaque album contre les CSV
+clean (matcher en mémoire, offline, rapide) et pose
 `track.certs.entries`/`album_certifications`. La MATÉRIALISATION passe par des
 objets typés `Certification` (`from_match`) puis se re-sérialise au format
 colonne (`to_column_dict`), byte-compatible avec `cert_matcher._format` (contrat
 mapper/GUI inchangé). Ne PERSISTE pas : l'appelant (worker retrieval, E7h) save.
+
+Après une MàJ de certifs, `recertify_affected` rematche et persiste les seuls
+artistes de la base touchés par le delta appliqué au matcher (`refresh`).
 """
 
 from src.models import Artist, Track
@@ -41,6 +45,15 @@ def _extra_artists(track: Track, artist_name: str) -> list[str]:
     return extra
 
 
+def _match_one(matcher, artist_name: str, query: tuple) -> list[dict] | None:
+    """Correspondances d'UN morceau ; None si son matching échoue."""
+    try:
+        return matcher.match_tracks(artist_name, [query])[0]
+    except Exception as e:
+        logger.error(f"Erreur matching des certifications de {query[0]!r}: {e}")
+        return None
+
+
 def apply_certifications(artist: Artist, tracks: list[Track], matcher) -> int:
     """Pose `track.certs.entries`/`album_certifications` depuis le matcher unifié.
 
@@ -54,12 +67,20 @@ def apply_certifications(artist: Artist, tracks: list[Track], matcher) -> int:
     enriched = 0
     album_cache: dict[str, list[dict]] = {}  # évite de re-chercher le même album
 
-    for track in tracks:
+    queries = [(_normalize_title(t.title or ""), _extra_artists(t, artist.name)) for t in tracks]
+    # Toute la discographie en UN appel (normalisations/résolutions mutualisées)
+    try:
+        all_matches = matcher.match_tracks(artist.name, queries)
+    except Exception as e:
+        # Un seul titre fautif ne doit pas effacer les certifs de tout l'artiste :
+        # repli morceau par morceau, comme avant le matching groupé.
+        logger.warning(f"Matching groupé des certifications de {artist.name} en échec: {e}")
+        all_matches = [_match_one(matcher, artist.name, query) for query in queries]
+
+    for track, matches in zip(tracks, all_matches, strict=True):
+        if matches is None:
+            continue  # matching en échec : certifications existantes laissées telles quelles
         try:
-            title = _normalize_title(track.title)
-            extra = _extra_artists(track, artist.name)
-
-            matches = matcher.get_track_certifications(artist.name, title, extra_artists=extra)
             track.certs.entries = [Certification.from_match(m).to_column_dict() for m in matches]
 
             if track.certs.entries:
@@ -98,3 +119,28 @@ def apply_certifications(artist: Artist, tracks: list[Track], matcher) -> int:
     if albums_with_certs:
         logger.info(f"💿 {albums_with_certs}/{len(tracks)} morceaux ont des certifs d'album")
     return enriched
+
+
+def recertify_affected(data_manager, matcher, touched: set[str], loaded=()) -> dict[str, int]:
+    """Rematche et PERSISTE les artistes de la base touchés par un delta de certifs.
+
+    `touched` : `artist_clean` renvoyés par `refresh_cert_matcher()` ; seuls les
+    artistes dont le nom normalisé y figure (`affected_artists`) sont relus et
+    rematchés. `loaded` : artistes déjà en mémoire (artiste courant de la GUI),
+    rematchés sur place plutôt que relus. Renvoie {nom: morceaux certifiés}.
+    """
+    from src.utils.cert_matcher import affected_artists
+
+    if not touched:
+        return {}
+    in_memory = {a.name: a for a in loaded if a}
+    counts: dict[str, int] = {}
+    for name in affected_artists(data_manager.get_artist_names(), touched):
+        artist = in_memory.get(name) or data_manager.get_artist_by_name(name)
+        if not artist or not artist.tracks:
+            continue
+        counts[name] = apply_certifications(artist, artist.tracks, matcher)
+        data_manager.save_tracks(artist.tracks)
+    if counts:
+        logger.info(f"🏆 Certifs rematchées pour {len(counts)} artiste(s) : {', '.join(counts)}")
+    return counts
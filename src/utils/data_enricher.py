@@ -3,13 +3,16 @@ Module d'enrichissement des données tracks
 VERSION CORRIGÉE: Empêche la duplication des Spotify IDs + Intégration Spotify_ID scraper + GetSongBPM API
 """
 
+import asyncio
 import os
 
 from src.api.async_http import AsyncHttpSession
 from src.api.deezer_api import DeezerAPI
 from src.api.discogs_api import DiscogsClient
 from src.api.getsongbpm_api import GetSongBPMFetcher
+from src.api.http_cache import default_response_cache
 from src.api.reccobeats_api import ReccoBeatsIntegratedClient
+from src.concurrency.bounded import KeyedSlots
 from src.concurrency.serial_worker import SerialWorker
 from src.models import Track
 from src.scrapers.songbpm_scraper_v2 import SongBPMScraper
@@ -125,10 +128,14 @@ class DataEnricher:
         )
 
         # Voie async (Phase F2) : session httpx PARTAGÉE (créée lazy dans la
-        # boucle, fermée par aclose_http en fin de batch) + thread sync dédié
-        # du flux (affinité Playwright — les scrapers y naissent et y meurent).
-        self._http = AsyncHttpSession()
+        # boucle, fermée par aclose_http en fin de batch ; cache disque des
+        # réponses ouvert au 1er GET) + thread sync dédié du flux (affinité
+        # Playwright — les scrapers y naissent et y meurent).
+        self._http = AsyncHttpSession(cache=default_response_cache)
         self.sync_runner = SerialWorker("enrich-sync")
+        # Batch concurrent : plafond de morceaux en vol PAR provider
+        # (`max_concurrency` : pool de pages pour les scrapers, plus pour les API).
+        self._slots = KeyedSlots()
 
         self.apis_available = {
             p.name: p.is_available() for p in [*self._pipeline, self._discogs_provider]
@@ -370,7 +377,8 @@ class DataEnricher:
         # Boucle ordonnée : gate() décide (skip → valeur posée telle quelle),
         # enrich() tourne derrière la frontière d'exception de _run_step.
         for provider in self._pipeline:
-            self._run_step(provider, track, ctx, sources, results)
+            if not self._resolved_this_run(provider, track, ctx, sources, results):
+                self._run_step(provider, track, ctx, sources, results)
 
         # Réconciliation (§8.3) — le MOTEUR pilote les colonnes legacy, AVANT Discogs
         self._finalize_run(track, ballot, ctx)
@@ -397,6 +405,7 @@ class DataEnricher:
         Providers API purs (deezer, getsongbpm, reccobeats) via la session
         httpx partagée ; scrapers sync (spotify_id, songbpm, bpmfinder,
         discogs, Genius) sur le thread sync dédié du run (affinité Playwright).
+        Les sources indépendantes tournent en parallèle (`_DEPENDENCIES`).
         """
         sources, ctx, ballot, results, initial_bpm = self._start_run(
             track, sources, force_update, artist_tracks, clear_on_failure
@@ -408,8 +417,10 @@ class DataEnricher:
 
         # VOIE ISRC PRIORITAIRE (même gating que la voie sync)
         if "reccobeats" in sources and self.apis_available.get("reccobeats"):
+            recco = self._reccobeats_provider
             try:
-                ctx.isrc_satisfied = await self._reccobeats_provider.try_by_isrc_async(track, ctx)
+                async with self._slots.slot(recco.name, recco.max_concurrency):
+                    ctx.isrc_satisfied = await recco.try_by_isrc_async(track, ctx)
                 if ctx.isrc_satisfied:
                     logger.info(
                         f"⚡ ISRC a fourni les données audio pour '{track.title}' → scrape Spotify évité"
@@ -417,8 +428,7 @@ class DataEnricher:
             except Exception:
                 logger.exception("Voie ISRC échec")
 
-        for provider in self._pipeline:
-            await self._run_step_async(provider, track, ctx, sources, results)
+        await self._run_pipeline_async(track, ctx, sources, results)
 
         # Réconciliation (§8.3) — le MOTEUR pilote les colonnes legacy, AVANT Discogs
         self._finalize_run(track, ballot, ctx)
@@ -514,8 +524,8 @@ class DataEnricher:
     @property
     def _pipeline(self):
         """Ordre d'appel historique des sources AVANT le vote BPM (Discogs
-        vient après le vote). Relu à chaque accès : les tests substituent les
-        providers par attribut."""
+        vient après le vote) — ordre topologique de `_DEPENDENCIES`. Relu à
+        chaque accès : les tests substituent les providers par attribut."""
         return [
             self._spotify_id_provider,
             self._reccobeats_provider,
@@ -525,6 +535,86 @@ class DataEnricher:
             self._deezer_provider,
         ]
 
+    # Graphe des sources du pipeline (voie async) : une source attend la fin de
+    # celles dont elle lit l'issue ou dont elle réécrit les champs ; les autres
+    # tournent en parallèle. reccobeats lit le Spotify ID. songbpm (navigateur,
+    # coûteux) attend les votes des API reccobeats/getsongbpm : c'est ce qui
+    # permet de le SAUTER sur consensus (`_resolved_this_run`) — lancé en
+    # parallèle, il partirait toujours. deezer valide son résultat contre la
+    # durée déjà connue (`verify_duration(previous_duration)`), que la voie ISRC
+    # de reccobeats renseigne : sans cette attente, un mauvais hit Deezer ne
+    # serait plus rejeté ; il attend aussi songbpm, dont il réécrit la durée.
+    # bpmfinder (dernier recours) n'attend que songbpm. `_pipeline` reste un
+    # ordre topologique (voie sync, création des tâches).
+    _DEPENDENCIES = {
+        "spotify_id": (),
+        "reccobeats": ("spotify_id",),
+        "getsongbpm": (),
+        "songbpm": ("reccobeats", "getsongbpm"),
+        "bpmfinder": ("songbpm",),
+        "deezer": ("reccobeats", "songbpm"),
+    }
+
+    # Sources coûteuses (browser, quota) sautées quand le morceau est déjà
+    # résolu CE run, même en force_update (cf. `_resolved_this_run`).
+    _SKIP_WHEN_RESOLVED = frozenset({"songbpm", "bpmfinder"})
+
+    def _resolved_this_run(self, provider, track, ctx, sources: list[str], results: dict) -> bool:
+        """Arrêt anticipé : consensus BPM + key ET mode observés par ce run.
+
+        Les gates des providers sautent déjà les morceaux complets hors
+        force_update ; en force_update elles relançaient browser et quota
+        BPM Finder même quand les API venaient de tout recouper.
+        """
+        name = provider.name
+        if (
+            name not in self._SKIP_WHEN_RESOLVED
+            or name not in sources
+            or not self.apis_available.get(name)
+        ):
+            return False
+        if not (
+            ctx.bpm_ballot.consensus_reached()
+            and ctx.has_observation("key")
+            and ctx.has_observation("mode")
+        ):
+            return False
+        logger.info(
+            f"⏭️ {name} non appelé : '{track.title}' déjà résolu (consensus BPM + key/mode)"
+        )
+        results[name] = "not_needed"
+        return True
+
+    async def _run_pipeline_async(self, track, ctx, sources: list[str], results: dict) -> None:
+        """Exécute `_pipeline` selon `_DEPENDENCIES` : une tâche par source,
+        lancée dès que ses dépendances ont fini.
+
+        Les clés de `results` sont remises dans l'ordre du pipeline (rapport
+        stable, quel que soit l'ordre de complétion).
+        """
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run(provider, deps):
+            if deps:
+                await asyncio.gather(*deps)
+            if not self._resolved_this_run(provider, track, ctx, sources, results):
+                await self._run_step_async(provider, track, ctx, sources, results)
+
+        pipeline = self._pipeline
+        for provider in pipeline:
+            deps = [tasks[d] for d in self._DEPENDENCIES.get(provider.name, ()) if d in tasks]
+            tasks[provider.name] = asyncio.create_task(run(provider, deps))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        ordered = {p.name: results.pop(p.name) for p in pipeline if p.name in results}
+        ordered.update(results)
+        results.clear()
+        results.update(ordered)
+
     def _run_step(self, provider, track, ctx, sources: list[str], results: dict) -> None:
         """Exécute une source si demandée et disponible : gate() puis enrich().
 
@@ -557,7 +647,11 @@ class DataEnricher:
     async def _run_step_async(
         self, provider, track, ctx, sources: list[str], results: dict
     ) -> None:
-        """Jumeau async de `_run_step` : mêmes gates, même frontière d'exception."""
+        """Jumeau async de `_run_step` : mêmes gates, même frontière d'exception.
+
+        Plusieurs morceaux peuvent être en vol (batch concurrent) : `enrich_async`
+        attend une place parmi les `max_concurrency` du provider.
+        """
         name = provider.name
         if name not in sources or not self.apis_available.get(name):
             return
@@ -568,7 +662,8 @@ class DataEnricher:
             return
 
         try:
-            outcome = await provider.enrich_async(track, ctx)
+            async with self._slots.slot(name, provider.max_concurrency):
+                outcome = await provider.enrich_async(track, ctx)
             results[name] = outcome
             if outcome is True:
                 logger.info(f"✅ {name} SUCCÈS pour '{track.title}'")
@@ -594,6 +689,33 @@ class DataEnricher:
             except Exception as e:  # noqa: BLE001 — fermeture best-effort de fin de batch
                 logger.warning(f"⚠️ Fermeture async provider {provider.name}: {e}")
 
+    async def aclose_batch(self) -> None:
+        """Fin d'un batch async (enrichissement, import en flux) : ferme tout ce
+        que le run a ouvert, recréé à la demande au suivant. À appeler DANS la
+        boucle ; chaque étape est best-effort.
+
+        Scrapers Playwright ASYNC d'abord (browsers de la boucle) PUIS l'instance
+        async partagée ; ensuite les ressources SYNC des providers SUR LE THREAD
+        SYNC DU RUN (celui qui a créé les browsers — Playwright est
+        thread-affine ; sans ça un browser survivait au batch et son pipe cassait
+        à l'arrêt de l'app, EPIPE) et l'instance Playwright thread-locale de ce
+        thread ; enfin la session httpx.
+        """
+        from src.scrapers.playwright_manager import stop_playwright, stop_playwright_async
+
+        steps = (
+            self.aclose_async_scrapers,
+            stop_playwright_async,
+            lambda: self.sync_runner.run(self.close),
+            lambda: self.sync_runner.run(stop_playwright),
+            self.aclose_http,
+        )
+        for step in steps:
+            try:
+                await step()
+            except Exception as e:  # noqa: BLE001 — fermeture best-effort de fin de batch
+                logger.debug(f"Fermeture de fin de batch: {e}")
+
     def _apply_genius_feat_metadata(self, track) -> None:
         """FEATS : media/album/relations via API Genius AVANT ReccoBeats
         (le Spotify ID Genius fiabilise la chaîne ; 1 appel/feat espace les
@@ -2,9 +2,10 @@
 
 `DataManager` est la façade unique utilisée par la GUI et les scripts. Elle
 compose `Database` (connexion + schéma + migrations) et hérite des repositories
-`ArtistRepository` et `TrackRepository` (une responsabilité par module). L'API
-publique est inchangée : aucun appelant ne bouge. Les méthodes transverses
-(export JSON, statistiques globales, import des certifications) restent ici.
+`ArtistRepository`, `TrackRepository` et `JobRepository` (une responsabilité
+par module). L'API publique est inchangée : aucun appelant ne bouge. Les
+méthodes transverses (export JSON, statistiques globales, import des
+certifications) restent ici.
 """
 
 import json
@@ -17,13 +18,14 @@ from sqlalchemy import text
 from src.config import ARTISTS_DIR, DATABASE_URL
 from src.utils.artist_repository import ArtistRepository
 from src.utils.db import Database
+from src.utils.job_repository import JobRepository
 from src.utils.logger import get_logger
 from src.utils.track_repository import TrackRepository
 
 logger = get_logger(__name__)
 
 
-class DataManager(ArtistRepository, TrackRepository):
+class DataManager(ArtistRepository, TrackRepository, JobRepository):
     """Gère la persistance des données (façade sur Database + repositories)."""
 
     def __init__(self):
@@ -17,15 +17,29 @@ par `bootstrap` :
      vierge, applique les révisions en attente sinon), avec backup auto avant
      tout upgrade réel. Toute évolution de schéma passe désormais par une
      révision Alembic (fin du gel de schéma).
+
+Profil de connexion (`Settings.db_profile`, env `DB_PROFILE`) :
+  - ``legacy`` (défaut) : NullPool — une connexion sqlite3 par opération, journal
+    rollback. Comportement historique exact.
+  - ``performance`` : pool borné (QueuePool) + pragmas posés à chaque nouvelle
+    connexion — WAL (les lecteurs, ex. le tableau des morceaux côté GUI, ne
+    bloquent plus derrière les écritures de l'enrichissement sur le thread de
+    la boucle async), ``synchronous=NORMAL`` (fsync au checkpoint seulement, sûr
+    en WAL), budget ``mmap_size``/``cache_size``, ``temp_store=MEMORY``. Une
+    connexion n'est utilisée que par un thread à la fois (checkout du pool) :
+    ``check_same_thread=False`` est donc sûr.
+NB : le mode WAL est PERSISTANT dans le fichier — revenir à ``legacy`` laisse la
+base en WAL (sans effet de bord : sqlite3 le gère de manière transparente).
 """
 
 import sqlite3
 from datetime import date, datetime
 from pathlib import Path
 
-from sqlalchemy import create_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool, QueuePool
 
+from src.config import DB_CACHE_SIZE_MB, DB_MMAP_SIZE_MB, DB_POOL_SIZE, DB_PROFILE
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -54,18 +68,74 @@ sqlite3.register_adapter(datetime, _adapt_datetime_iso)
 sqlite3.register_adapter(date, _adapt_date_iso)
 
 
+def performance_pragmas(
+    mmap_size_mb: int = DB_MMAP_SIZE_MB, cache_size_mb: int = DB_CACHE_SIZE_MB
+) -> tuple[str, ...]:
+    """Pragmas du profil ``performance``, dans l'ordre d'application."""
+    return (
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        f"mmap_size={mmap_size_mb * 1024 * 1024}",
+        f"cache_size=-{cache_size_mb * 1024}",  # négatif = taille en KiB
+        "temp_store=MEMORY",
+    )
+
+
+def _apply_pragmas(engine, pragmas: tuple[str, ...]) -> None:
+    """Pose `pragmas` sur chaque NOUVELLE connexion DBAPI du moteur (pas à chaque
+    checkout : une connexion recyclée par le pool les garde)."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(f"PRAGMA {pragma}")
+        finally:
+            cursor.close()
+
+
 class Database:
     """Accès physique à la base SQLite : moteur Core + schéma Alembic."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, profile: str | None = None):
         self.db_path = db_path
-        # Moteur SQLAlchemy Core (phase E2) : NullPool = une connexion par
-        # opération, reproduit EXACTEMENT le comportement de `connect()`
-        # (sqlite3). Les deux visent le même fichier ; QueuePool = optimisation à
-        # évaluer plus tard (au plus tôt en F).
-        self.engine = create_engine(f"sqlite:///{Path(db_path).as_posix()}", poolclass=NullPool)
+        self.profile = profile or DB_PROFILE
+        self.engine = self._create_engine()
         self._ensure_schema()
 
+    def _create_engine(self):
+        """Moteur SQLAlchemy Core (phase E2) selon le profil de connexion.
+
+        ``legacy`` : NullPool = une connexion par opération, reproduit EXACTEMENT
+        le comportement historique de `connect()` (sqlite3). ``performance`` :
+        QueuePool borné (pas d'overflow : le nombre de fichiers ouverts reste
+        fixe) + pragmas WAL/mémoire (cf. docstring module).
+        """
+        url = f"sqlite:///{Path(self.db_path).as_posix()}"
+        if self.profile == "legacy":
+            return create_engine(url, poolclass=NullPool)
+        if self.profile != "performance":
+            raise ValueError(f"Profil de base inconnu: {self.profile!r}")
+
+        engine = create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=0,
+            pool_timeout=30,
+            # Une connexion circule entre le thread GUI, les workers et le thread
+            # de la boucle async — jamais simultanément (checkout exclusif).
+            connect_args={"check_same_thread": False},
+        )
+        _apply_pragmas(engine, performance_pragmas())
+        logger.info(f"Profil base 'performance' : WAL + pool de {DB_POOL_SIZE} connexion(s)")
+        return engine
+
+    def dispose(self) -> None:
+        """Ferme les connexions gardées par le pool (no-op en profil legacy)."""
+        self.engine.dispose()
+
     def _ensure_schema(self):
         """Amène la base au head Alembic (schéma à jour) au démarrage.
 
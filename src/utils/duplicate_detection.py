@@ -0,0 +1,256 @@
+"""Détection ensembliste des doublons de morceaux (moteur de propositions de fusion).
+
+Remplace les scans « un titre à la fois » des scripts (`LOWER(title) = LOWER(?)`
+par groupe, N+1 sur les crédits) : TOUT le catalogue est lu en une passe
+(`TrackRepository.find_duplicate_candidates`), puis
+
+  1. BLOCAGE — chaque morceau reçoit des clés de bloc, toujours DANS son artiste
+     (un featuring présent chez deux artistes n'est pas un doublon) : titre
+     normalisé (`normalize_title`), genius_id, spotify_id, ISRC, et tranche de
+     durée (deux tranches décalées : 199 s et 200 s se croisent) ;
+  2. SCORE — seules les paires d'un même bloc sont comparées (`score_pair`) :
+     identifiants égaux ou contradictoires, titres (égalité normalisée, sinon
+     Jaccard des mots), durée, marqueurs de version (« Remix », « Live »…) ;
+  3. REGROUPEMENT — les paires retenues sont fusionnées en groupes
+     (union-find) ; dans chaque groupe la fiche la plus complète est gardée et
+     chaque autre membre devient une `MergeProposal(keep_id, delete_id)`,
+     directement applicable par `TrackRepository.merge_tracks`.
+
+Module PUR (aucun accès DB) : les `DuplicateCandidate` sont construits par le
+mapper (`duplicate_candidate_from_row`), seule frontière de coercition.
+"""
+
+from dataclasses import dataclass, field
+from itertools import combinations
+
+from src.utils.title_matching import normalize_title
+
+# Score minimal d'une proposition (échelle 0–1).
+DEFAULT_MIN_SCORE = 0.6
+
+# Largeur (s) des tranches de durée du blocage.
+DURATION_BUCKET = 4
+
+# Un bloc plus gros que ça n'est pas sélectif (tranche de durée d'un artiste
+# prolifique, titre générique « Intro ») : il est ignoré, les autres clés
+# (titre, identifiants) couvrent ses vrais doublons.
+MAX_BLOCK_SIZE = 64
+
+# Mots signalant une VERSION distincte (ne pas fusionner « Titre » et
+# « Titre (Remix) ») — comparés sur le titre normalisé, mot à mot. Pas
+# Intro/Outro/Interlude : souvent le même morceau (cf. merge_duplicates --find).
+VERSION_MARKERS = frozenset(
+    {
+        "remix",
+        "rmx",
+        "live",
+        "acoustic",
+        "acoustique",
+        "instrumental",
+        "instru",
+        "acapella",
+        "cappella",
+        "edit",
+        "extended",
+        "remaster",
+        "remastered",
+        "demo",
+        "version",
+        "clean",
+        "radio",
+        "slowed",
+        "sped",
+        "reverb",
+    }
+)
+
+
+@dataclass(slots=True)
+class DuplicateCandidate:
+    """Morceau vu par le moteur : clés de comparaison + indices de complétude."""
+
+    id: int
+    artist_id: int
+    title: str
+    album: str | None = None
+    duration: int | None = None
+    genius_id: str | None = None
+    spotify_id: str | None = None
+    isrc: str | None = None
+    has_lyrics: bool = False
+    credit_count: int = 0
+    norm_title: str = field(init=False)
+    words: frozenset = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.norm_title = normalize_title(self.title or "")
+        self.words = frozenset(self.norm_title.split())
+
+    @property
+    def completeness(self) -> int:
+        """Fiche la plus remplie = fiche gardée (mêmes poids que merge_duplicates)."""
+        return (
+            bool(self.album)
+            + 2 * bool(self.genius_id)
+            + bool(self.duration)
+            + bool(self.spotify_id)
+            + bool(self.isrc)
+            + bool(self.has_lyrics)
+            + 2 * bool(self.credit_count)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MergeProposal:
+    """Fusion proposée : `delete_id` dans `keep_id` (cf. `merge_tracks`)."""
+
+    keep_id: int
+    delete_id: int
+    artist_id: int
+    score: float
+    keep_title: str
+    delete_title: str
+    reasons: tuple[str, ...] = ()
+
+
+def blocking_keys(c: DuplicateCandidate) -> list[tuple]:
+    """Clés de bloc d'un morceau (toutes préfixées par son artiste)."""
+    keys = []
+    if c.norm_title:
+        keys.append(("title", c.artist_id, c.norm_title))
+    for name in ("genius_id", "spotify_id", "isrc"):
+        value = getattr(c, name)
+        if value:
+            keys.append((name, c.artist_id, str(value).strip().upper()))
+    if c.duration:
+        keys.append(("duration", c.artist_id, c.duration // DURATION_BUCKET))
+        keys.append(
+            ("duration+", c.artist_id, (c.duration + DURATION_BUCKET // 2) // DURATION_BUCKET)
+        )
+    return keys
+
+
+def score_pair(a: DuplicateCandidate, b: DuplicateCandidate) -> tuple[float, tuple[str, ...]]:
+    """Vraisemblance (0–1) que `a` et `b` soient le même morceau, et ses raisons."""
+    score = 0.0
+    reasons = []
+
+    for name, label, weight in (
+        ("genius_id", "genius_id", 0.5),
+        ("spotify_id", "spotify_id", 0.4),
+        ("isrc", "ISRC", 0.5),
+    ):
+        va, vb = getattr(a, name), getattr(b, name)
+        if va and vb:
+            if str(va).strip().upper() == str(vb).strip().upper():
+                score += weight
+                reasons.append(f"même {label}")
+            else:
+                # Deux identifiants distincts : deux enregistrements distincts.
+                score -= weight
+                reasons.append(f"{label} différents")
+
+    if a.norm_title and a.norm_title == b.norm_title:
+        score += 0.5
+        reasons.append("titre normalisé identique")
+    elif a.words and b.words:
+        jaccard = len(a.words & b.words) / len(a.words | b.words)
+        score += 0.4 * jaccard
+        if jaccard >= 0.5:
+            reasons.append(f"titres proches ({jaccard:.0%})")
+
+    markers = (a.words ^ b.words) & VERSION_MARKERS
+    if markers:
+        score -= 0.4
+        reasons.append(f"version distincte ? ({', '.join(sorted(markers))})")
+
+    if a.duration and b.duration:
+        delta = abs(a.duration - b.duration)
+        if delta <= 2:
+            score += 0.2
+            reasons.append(f"durée ±{delta}s")
+        elif delta > 10:
+            score -= 0.3
+            reasons.append(f"durées éloignées ({delta}s)")
+
+    return max(0.0, min(1.0, score)), tuple(reasons)
+
+
+def _find(parent: dict[int, int], x: int) -> int:
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def find_duplicates(candidates, *, min_score: float = DEFAULT_MIN_SCORE) -> list[MergeProposal]:
+    """Propositions de fusion, de la plus sûre à la moins sûre.
+
+    Un groupe de N doublons donne (au plus) N-1 propositions vers la MÊME fiche
+    gardée (la plus complète, à égalité l'id le plus bas) : les appliquer dans
+    l'ordre ne fusionne jamais dans une fiche déjà supprimée. Un membre relié au
+    groupe par un tiers mais comparé à la fiche gardée sous le seuil n'est pas
+    proposé.
+    """
+    by_id = {c.id: c for c in candidates}
+    blocks: dict[tuple, list[int]] = {}
+    for c in by_id.values():
+        for key in blocking_keys(c):
+            blocks.setdefault(key, []).append(c.id)
+
+    scored: dict[tuple[int, int], tuple[float, tuple[str, ...]]] = {}
+    for key, ids in blocks.items():
+        if len(ids) < 2 or len(ids) > MAX_BLOCK_SIZE:
+            continue
+        # Bloc de durée : sans mot de titre commun, le score plafonne à 0,2
+        # (seule la durée concorde) — paire écartée avant le score complet.
+        by_duration = key[0].startswith("duration")
+        for x, y in combinations(sorted(ids), 2):
+            if (x, y) in scored:
+                continue
+            a, b = by_id[x], by_id[y]
+            if by_duration and a.words.isdisjoint(b.words):
+                continue
+            scored[(x, y)] = score_pair(a, b)
+
+    parent: dict[int, int] = {}
+    best_link: dict[int, tuple[float, tuple[str, ...]]] = {}
+    for (x, y), verdict in scored.items():
+        if verdict[0] >= min_score:
+            parent.setdefault(x, x)
+            parent.setdefault(y, y)
+            parent[_find(parent, x)] = _find(parent, y)
+            for member in (x, y):
+                if member not in best_link or verdict[0] > best_link[member][0]:
+                    best_link[member] = verdict
+
+    groups: dict[int, list[int]] = {}
+    for x in parent:
+        groups.setdefault(_find(parent, x), []).append(x)
+
+    proposals = []
+    for members in groups.values():
+        keep = max((by_id[m] for m in members), key=lambda c: (c.completeness, -c.id))
+        for member in members:
+            if member == keep.id:
+                continue
+            pair = (min(keep.id, member), max(keep.id, member))
+            verdict = scored.get(pair)
+            if verdict is not None and verdict[0] < min_score:
+                continue  # relié par un tiers mais jugé distinct de la fiche gardée
+            # Membre relié au groupe par un tiers : meilleure paire qui l'y rattache.
+            score, reasons = verdict or best_link[member]
+            other = by_id[member]
+            proposals.append(
+                MergeProposal(
+                    keep_id=keep.id,
+                    delete_id=member,
+                    artist_id=keep.artist_id,
+                    score=round(score, 3),
+                    keep_title=keep.title,
+                    delete_title=other.title,
+                    reasons=reasons,
+                )
+            )
+    proposals.sort(key=lambda p: (-p.score, p.artist_id, p.keep_id, p.delete_id))
+    return proposals
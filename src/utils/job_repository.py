@@ -0,0 +1,277 @@
+"""Repository des travaux de batch reprenables (tables `batch_jobs` / `batch_job_items`, e17).
+
+Un lancement d'enrichissement, de scraping ou de streams est un JOB : une
+ligne par paire (morceau, provider) à traiter, toutes 'pending' à la création.
+Les workers les passent à 'done' / 'failed' APRÈS la sauvegarde des morceaux
+concernés (`mark_job_items`, jalon `checkpoint_at`) : une paire encore
+'pending' n'a jamais atteint la base. Un job terminé passe à 'done'
+(`finish_job`) ; interrompu (fermeture, crash, budget de `shutdown_workers`
+dépassé), il reste 'running' et ses seules paires 'pending' sont proposées à
+la reprise au démarrage suivant (`unfinished_jobs`). 'failed' = tenté sans
+succès : jamais rejoué (pas de quota re-dépensé sur un introuvable).
+
+Utilisé comme base de `DataManager` (fournit `self.engine`). `JobCheckpoint`
+regroupe les jalons des workers SYNC (scraping) par lots.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Types de job (= flux GUI rejoué à la reprise)
+JOB_ENRICHMENT = "enrichment"
+JOB_SCRAPING = "scraping"
+JOB_STREAMS = "streams"
+
+# Statuts de job
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ABANDONED = "abandoned"
+
+# Statuts de paire (morceau, provider)
+ITEM_PENDING = "pending"
+ITEM_DONE = "done"
+ITEM_FAILED = "failed"
+
+# Morceaux par jalon de `JobCheckpoint` (cf. _SAVE_BATCH_SIZE de l'enrichissement)
+CHECKPOINT_EVERY = 10
+
+
+@dataclass
+class BatchJob:
+    """Job interrompu, tel que proposé à la reprise."""
+
+    id: int
+    kind: str
+    artist_id: int
+    artist_name: str
+    options: dict
+    created_at: str | None = None
+    checkpoint_at: str | None = None
+    # track_id (None = étape artiste) → providers encore 'pending'
+    pending: dict[int | None, list[str]] = field(default_factory=dict)
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(providers) for providers in self.pending.values())
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class JobRepository:
+    """Persistance des jobs de batch. Requiert `self.engine` (fourni par DataManager)."""
+
+    def create_job(
+        self,
+        kind: str,
+        artist_id: int,
+        pairs: Iterable[tuple[int | None, str]],
+        options: dict | None = None,
+    ) -> int:
+        """Crée un job 'running' et ses paires (track_id, provider) 'pending'."""
+        now = _now()
+        with self.engine.begin() as conn:
+            job_id = conn.execute(
+                text(
+                    "INSERT INTO batch_jobs (kind, artist_id, options, status, created_at, "
+                    "checkpoint_at) VALUES (:kind, :aid, :options, :status, :now, :now)"
+                ),
+                {
+                    "kind": kind,
+                    "aid": artist_id,
+                    "options": json.dumps(options or {}, ensure_ascii=False),
+                    "status": JOB_RUNNING,
+                    "now": now,
+                },
+            ).lastrowid
+            rows = [
+                {"job": job_id, "tid": track_id, "provider": provider, "now": now}
+                for track_id, provider in dict.fromkeys(pairs)
+            ]
+            if rows:
+                conn.execute(
+                    text(
+                        "INSERT INTO batch_job_items (job_id, track_id, provider, status, "
+                        f"updated_at) VALUES (:job, :tid, :provider, '{ITEM_PENDING}', :now)"
+                    ),
+                    rows,
+                )
+        logger.debug(f"Job {job_id} ({kind}) créé : {len(rows)} paire(s)")
+        return job_id
+
+    def mark_job_items(self, job_id: int, pairs: Iterable[tuple[int | None, str, str]]) -> None:
+        """Jalon : passe les paires (track_id, provider, statut) et date le job.
+
+        À appeler APRÈS la sauvegarde des morceaux concernés. Best-effort : un
+        échec ne coûte qu'un re-traitement de ces paires à la reprise.
+        """
+        now = _now()
+        rows = [
+            {"job": job_id, "tid": track_id, "provider": provider, "status": status, "now": now}
+            for track_id, provider, status in pairs
+        ]
+        if not rows:
+            return
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "UPDATE batch_job_items SET status = :status, updated_at = :now "
+                        "WHERE job_id = :job AND track_id IS :tid AND provider = :provider"
+                    ),
+                    rows,
+                )
+                conn.execute(
+                    text("UPDATE batch_jobs SET checkpoint_at = :now WHERE id = :job"),
+                    {"job": job_id, "now": now},
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"⚠️ Jalon du job {job_id} non écrit ({len(rows)} paire(s)): {e}")
+
+    def finish_job(self, job_id: int) -> bool:
+        """Clôt le job s'il ne reste aucune paire 'pending' (sinon il reste reprenable)."""
+        with self.engine.begin() as conn:
+            done = conn.execute(
+                text(
+                    "UPDATE batch_jobs SET status = :done, checkpoint_at = :now "
+                    "WHERE id = :job AND NOT EXISTS (SELECT 1 FROM batch_job_items "
+                    "WHERE job_id = :job AND status = :pending)"
+                ),
+                {"job": job_id, "done": JOB_DONE, "pending": ITEM_PENDING, "now": _now()},
+            ).rowcount
+        return bool(done)
+
+    def abandon_job(self, job_id: int) -> None:
+        """Reprise refusée : le job n'est plus proposé."""
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("UPDATE batch_jobs SET status = :status WHERE id = :job"),
+                {"job": job_id, "status": JOB_ABANDONED},
+            )
+
+    def pending_job_items(self, job_id: int) -> dict[int | None, list[str]]:
+        """track_id (None = étape artiste) → providers encore 'pending'."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT track_id, provider FROM batch_job_items "
+                    "WHERE job_id = :job AND status = :pending ORDER BY id"
+                ),
+                {"job": job_id, "pending": ITEM_PENDING},
+            ).all()
+        pending: dict[int | None, list[str]] = {}
+        for track_id, provider in rows:
+            pending.setdefault(track_id, []).append(provider)
+        return pending
+
+    def unfinished_jobs(self) -> list[BatchJob]:
+        """Jobs 'running' ayant encore des paires 'pending', le plus récent d'abord.
+
+        Les paires des morceaux supprimés entre-temps sont ignorées ; un job
+        qui n'a plus rien à faire est clos au passage.
+        """
+        with self.engine.connect() as conn:
+            jobs = conn.execute(
+                text(
+                    "SELECT j.id, j.kind, j.artist_id, a.name, j.options, j.created_at, "
+                    "j.checkpoint_at FROM batch_jobs j JOIN artists a ON a.id = j.artist_id "
+                    "WHERE j.status = :running ORDER BY j.id DESC"
+                ),
+                {"running": JOB_RUNNING},
+            ).all()
+            if not jobs:
+                return []
+            items = conn.execute(
+                text(
+                    "SELECT i.job_id, i.track_id, i.provider FROM batch_job_items i "
+                    "WHERE i.job_id IN :jobs AND i.status = :pending AND (i.track_id IS NULL "
+                    "OR EXISTS (SELECT 1 FROM tracks t WHERE t.id = i.track_id)) ORDER BY i.id"
+                ).bindparams(bindparam("jobs", expanding=True)),
+                {"jobs": [row[0] for row in jobs], "pending": ITEM_PENDING},
+            ).all()
+        pending: dict[int, dict[int | None, list[str]]] = {}
+        for job_id, track_id, provider in items:
+            pending.setdefault(job_id, {}).setdefault(track_id, []).append(provider)
+
+        unfinished = []
+        for job_id, kind, artist_id, name, options, created_at, checkpoint_at in jobs:
+            if job_id not in pending:
+                self._close_job(job_id)
+                continue
+            unfinished.append(
+                BatchJob(
+                    id=job_id,
+                    kind=kind,
+                    artist_id=artist_id,
+                    artist_name=name,
+                    options=json.loads(options or "{}"),
+                    created_at=str(created_at) if created_at else None,
+                    checkpoint_at=str(checkpoint_at) if checkpoint_at else None,
+                    pending=pending[job_id],
+                )
+            )
+        return unfinished
+
+    def _close_job(self, job_id: int) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("UPDATE batch_jobs SET status = :done WHERE id = :job"),
+                {"job": job_id, "done": JOB_DONE},
+            )
+
+
+class JobCheckpoint:
+    """Jalons d'un job pour un worker SYNC, par lots de `every` morceaux.
+
+    `record(track, provider, ok)` consigne une paire traitée ; tous les
+    `every` morceaux distincts, `flush()` sauvegarde ces morceaux (`save`,
+    une transaction) PUIS marque leurs paires — jamais une paire 'done' dont
+    le résultat ne serait pas en base. `job_id=None` : aucun suivi (no-op).
+    """
+
+    def __init__(
+        self,
+        repository: JobRepository,
+        job_id: int | None,
+        save: Callable[[list], object] | None = None,
+        every: int = CHECKPOINT_EVERY,
+    ) -> None:
+        self.repository = repository
+        self.job_id = job_id
+        self.save = save
+        self.every = max(1, int(every))
+        self._pending: dict[int, tuple] = {}  # id(track) → (track, [(provider, statut)])
+
+    def record(self, track, provider: str, ok: bool = True) -> None:
+        if self.job_id is None:
+            return
+        entry = self._pending.setdefault(id(track), (track, []))
+        entry[1].append((provider, ITEM_DONE if ok else ITEM_FAILED))
+        if len(self._pending) >= self.every:
+            self.flush()
+
+    def flush(self, *, save: bool = True) -> None:
+        """Sauvegarde (sauf `save=False` : déjà faite par l'appelant) puis marque."""
+        if not self._pending:
+            return
+        entries, self._pending = list(self._pending.values()), {}
+        if save and self.save is not None:
+            self.save([track for track, _ in entries])
+        self.repository.mark_job_items(
+            self.job_id,
+            [
+                (track.id, provider, status)
+                for track, outcomes in entries
+                for provider, status in outcomes
+            ],
+        )
@@ -0,0 +1,238 @@
+"""Backfill SNEP CONCURRENT et REPRENABLE (filtre serveur `?annee=YYYY`).
+
+`update_snep.scrape_year` parcourt les pages d'une année en série (sleep
+aléatoire entre deux pages), `backfill_years` enchaînait les années et le CSV
+maître était réécrit à la fin de chacune : un backfill pluriannuel durait des
+heures et une interruption perdait tout. Ici :
+
+  · plusieurs ANNÉES en vol (`run_bounded`), les pages d'une année en série,
+    sur l'`AsyncHttpSession` — débit borné par la politique `snepmusique.com`
+    du `DomainRateLimiter` (AIMD sur 429/503) au lieu des sleeps ;
+  · parsing (`_parse_certifications_page`, BeautifulSoup) HORS de la boucle
+    (`asyncio.to_thread`), sortie inchangée ;
+  · chaque page parsée est AJOUTÉE au staging `certif-.backfill.csv`
+    (append-only, flush + fsync), PUIS la dernière page terminée de l'année
+    est notée dans le jalon `certif-.backfill.json` (écriture atomique) —
+    ces écritures aussi hors de la boucle ; une année n'est notée terminée
+    qu'une fois sa dernière page passée (page vide : retentée plus tard) ;
+  · fusion UNIQUE à la fin : maître ∪ staging, dédup `_row_key`, une seule
+    réécriture (`_write_merged`) ; staging supprimé, jalons supprimés quand
+    toutes les années sont terminées.
+
+Reprise : relancé sur les mêmes années après une interruption (erreur réseau
+persistante, Ctrl+C, crash), le backfill saute les années terminées et
+reprend les autres à la page qui suit leur jalon ; une page rejouée (crash
+entre staging et jalon) est absorbée par la dédup de la fusion.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+
+import httpx
+
+from src.concurrency.bounded import run_bounded
+from src.config import DELAY_BETWEEN_REQUESTS, MAX_RETRIES, SELENIUM_TIMEOUT
+from src.utils.update_snep import (
+    _HTTP_HEADERS,
+    _SNEP_BASE,
+    _discover_last_page,
+    _load_existing,
+    _parse_certifications_page,
+    _row_key,
+    _write_merged,
+    safe_print,
+)
+
+# Années en vol simultanément (le limiteur de domaine borne le débit réel)
+BACKFILL_CONCURRENCY = 3
+
+
+def staging_path(dest_path: Path) -> Path:
+    """Staging append-only du backfill, à côté du CSV maître."""
+    return dest_path.with_name(f"{dest_path.stem}.backfill.csv")
+
+
+def checkpoint_path(dest_path: Path) -> Path:
+    """Jalons par année du backfill, à côté du CSV maître."""
+    return dest_path.with_name(f"{dest_path.stem}.backfill.json")
+
+
+def _year_url(year: int, page: int) -> str:
+    if page == 1:
+        return f"{_SNEP_BASE}?annee={year}"
+    return f"{_SNEP_BASE}page/{page}?annee={year}"
+
+
+class _Checkpoint:
+    """Jalons `{année: {"page": dernière terminée, "last_page": n, "done": bool}}`."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.years: dict[str, dict] = {}
+        self._lock = threading.Lock()  # marqué depuis les threads des années en vol
+        if path.exists():
+            try:
+                self.years = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                safe_print(f"⚠️ Jalons du backfill illisibles ({e}) — reprise de zéro")
+
+    def get(self, year: int) -> dict:
+        return self.years.get(str(year), {})
+
+    def mark(self, year: int, **state) -> None:
+        with self._lock:
+            self.years.setdefault(str(year), {}).update(state)
+            self._write()
+
+    def clear_if_complete(self) -> None:
+        """Supprime les jalons quand toutes les années sont terminées (et fusionnées)."""
+        if all(s.get("done") for s in self.years.values()):
+            self.years = {}
+            self.path.unlink(missing_ok=True)
+
+    def _write(self) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(json.dumps(self.years, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class _Staging:
+    """Lignes parsées, ajoutées page par page (durables avant le jalon)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8", newline="\n")  # noqa: SIM115
+        self._lock = threading.Lock()  # une page à la fois, quelle que soit l'année
+
+    def append(self, rows: list[str]) -> None:
+        with self._lock:
+            self._file.write("".join(f"{row}\n" for row in rows))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def _fetch_page(http, url: str) -> str:
+    """GET avec retries + backoff (comme `update_snep._fetch`), rate-limité par domaine."""
+    last_exc = None
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            resp = await http.get(url, timeout=SELENIUM_TIMEOUT)
+            resp.raise_for_status()
+            return resp.text
+        except httpx.HTTPError as e:
+            last_exc = e
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(DELAY_BETWEEN_REQUESTS * attempt)
+    raise last_exc
+
+
+def _parse_page(html: str) -> tuple[list[str], int]:
+    """Lignes de la page + dernière page annoncée (appelé hors de la boucle)."""
+    return _parse_certifications_page(html), _discover_last_page(html)
+
+
+async def _crawl_year(
+    http, year: int, staging: _Staging, checkpoint: _Checkpoint, max_pages: int
+) -> int:
+    """Pages de `year` à partir du jalon, vers le staging. Renvoie les lignes stagées."""
+    state = checkpoint.get(year)
+    if state.get("done"):
+        safe_print(f"⏭️ Année {year} : déjà terminée")
+        return 0
+    page = state.get("page", 0) + 1
+    last_page = state.get("last_page")
+    if page > 1:
+        safe_print(f"↩️ Année {year} : reprise page {page}/{last_page}")
+    staged = 0
+    while last_page is None or page <= last_page:
+        try:
+            html = await _fetch_page(http, _year_url(year, page))
+        except httpx.HTTPError as e:
+            safe_print(f"❌ Année {year} page {page} : {e} — reprise au prochain lancement")
+            return staged
+        rows, announced = await asyncio.to_thread(_parse_page, html)
+        if last_page is None:
+            last_page = min(announced, max_pages)
+            safe_print(f"📅 Année {year} : {last_page} page(s) à parcourir")
+        if not rows:
+            # Page vide ou structure changée : l'année n'est PAS terminée (jalon
+            # inchangé), elle sera retentée au prochain lancement.
+            safe_print(f"⚠️ Année {year} page {page} : aucun bloc — reprise au prochain lancement")
+            return staged
+        # Écritures fsync hors de la boucle : les autres années restent en vol
+        await asyncio.to_thread(staging.append, rows)
+        staged += len(rows)
+        await asyncio.to_thread(checkpoint.mark, year, page=page, last_page=last_page)
+        safe_print(f"📄 {year} p{page}/{last_page} : {len(rows)} certifs")
+        page += 1
+    await asyncio.to_thread(checkpoint.mark, year, done=True)
+    return staged
+
+
+def merge_staging(dest_path: Path) -> int:
+    """Fusionne le staging dans le CSV maître (dédup `_row_key`), en UNE écriture.
+
+    Supprime ensuite le staging, et les jalons si toutes les années sont
+    terminées. Renvoie le nombre de certifications ajoutées au maître.
+    """
+    staging = staging_path(dest_path)
+    if not staging.exists():
+        return 0
+    header, existing_lines, keys = _load_existing(dest_path)
+    new_lines = []
+    for row in staging.read_text(encoding="utf-8").splitlines():
+        f = row.split(";")
+        if len(f) < 7:
+            continue
+        key = _row_key(f)
+        if key not in keys:
+            keys.add(key)
+            new_lines.append(row)
+    _write_merged(dest_path, header, existing_lines, new_lines)
+    staging.unlink()
+    _Checkpoint(checkpoint_path(dest_path)).clear_if_complete()
+    return len(new_lines)
+
+
+async def backfill(
+    dest_path: Path,
+    years,
+    *,
+    http=None,
+    concurrency: int = BACKFILL_CONCURRENCY,
+    max_pages: int = 400,
+) -> int:
+    """Scrape les années `years` (reprise sur jalons) puis fusionne une fois.
+
+    `http` non fourni → une `AsyncHttpSession` est créée ici et fermée à la
+    fin (« qui crée ferme »). Une exception (ou une annulation) laisse staging
+    et jalons en place pour la reprise. Renvoie le nombre de certifications
+    ajoutées au CSV maître.
+    """
+    owned_http = http is None
+    if owned_http:
+        from src.api.async_http import AsyncHttpSession
+
+        http = AsyncHttpSession(headers=_HTTP_HEADERS)
+    checkpoint = _Checkpoint(checkpoint_path(dest_path))
+    staging = _Staging(staging_path(dest_path))
+    try:
+        done = await run_bounded(
+            sorted({int(y) for y in years}),
+            lambda year: _crawl_year(http, year, staging, checkpoint, max_pages),
+            limit=concurrency,
+        )
+    finally:
+        staging.close()
+        if owned_http:
+            await http.aclose()
+    staged = sum(n for _, n in done)
+    added = await asyncio.to_thread(merge_staging, dest_path)
+    safe_print(f"🔀 Backfill : {staged} ligne(s) parcourue(s), {added} nouvelle(s) fusionnée(s)")
+    return added
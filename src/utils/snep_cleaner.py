@@ -270,19 +270,20 @@ def clean_snep_csv(csv_path: str | Path, apply: bool = False, reimport: bool = T
         report["applied"] = True
 
         if reimport:
-            # Régénère le CSV canonique (clean) depuis le brut nettoyé, puis
-            # rafraîchit le matcher — plus d'import DB (convention brut+clean).
-            from src.utils.cert_matcher import reset_cert_matcher
+            # Régénère le CSV canonique (clean) depuis le brut nettoyé et publie
+            # le delta, appliqué par le matcher (`refresh_cert_matcher`) — plus
+            # d'import DB (convention brut+clean).
+            from src.utils.cert_delta import recording
             from src.utils.snep_build import rebuild
 
             snep = Path(csv_path).parent
-            rebuild(
-                Path(csv_path),
-                snep / "certif_snep.csv",
-                snep / "certif_snep.meta.json",
-                source="CLEAN",
-            )
-            reset_cert_matcher()
+            with recording("SNEP", snep / "certif_snep.csv"):
+                rebuild(
+                    Path(csv_path),
+                    snep / "certif_snep.csv",
+                    snep / "certif_snep.meta.json",
+                    source="CLEAN",
+                )
 
     return report
 
@@ -8,6 +8,15 @@ coûté des faux non-matchés ("MURDER INC" vs "MURDER INC.", "S.O.A.B" vs "SOAB
 import re
 import unicodedata
 
+# Motifs compilés une fois : le normaliseur tourne sur tout le catalogue
+# (détection des doublons, matching Kworb/YTM).
+_FEAT_BRACKETED = re.compile(r"\s*[\(\[]\s*(?:feat|ft|avec|with)\.?[^\)\]]*[\)\]]", re.IGNORECASE)
+_FEAT_TRAILING = re.compile(r"\s+(?:feat|ft)\.?\s+.*$", re.IGNORECASE)
+_APOSTROPHES = re.compile(r"['’‘`´]")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACE_BEFORE_DIGIT = re.compile(r"\s+(?=\d)")
+_SPACES = re.compile(r"\s+")
+
 
 def normalize_title(s: str) -> str:
     """Normalise un titre : feat (avec/sans parenthèses), apostrophes, accents,
@@ -15,17 +24,17 @@ def normalize_title(s: str) -> str:
     if not s:
         return ""
     # Retirer les suffixes featuring : "Titre (feat. X)" / "[feat. X]" → "Titre"
-    s = re.sub(r"\s*[\(\[]\s*(?:feat|ft|avec|with)\.?[^\)\]]*[\)\]]", "", s, flags=re.IGNORECASE)
+    s = _FEAT_BRACKETED.sub("", s)
     # "Titre ft. X" sans parenthèses (vu sur kworb : "Ronaldinho qui jongle ft. ISHA")
-    s = re.sub(r"\s+(?:feat|ft)\.?\s+.*$", "", s, flags=re.IGNORECASE)
+    s = _FEAT_TRAILING.sub("", s)
     # Unifier/supprimer les apostrophes (typographiques ou droites)
-    s = re.sub(r"['’‘`´]", "", s)
+    s = _APOSTROPHES.sub("", s)
     s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
     # Points supprimés (acronymes : "S.O.A.B"→"SOAB", "Pt. 2"→"Pt 2")
     s = s.replace(".", "")
     # Autre ponctuation → espace ("L'augmentation - Pt 2" ≈ "…, Pt 2")
-    s = re.sub(r"[^\w\s]", " ", s)
+    s = _PUNCTUATION.sub(" ", s)
     # Espace avant chiffre supprimé ("Vol.3"/"Vol. 3"→"vol3", "Pt 2"→"pt2")
-    s = re.sub(r"\s+(?=\d)", "", s)
-    s = re.sub(r"\s+", " ", s).strip().lower()
+    s = _SPACE_BEFORE_DIGIT.sub("", s)
+    s = _SPACES.sub(" ", s).strip().lower()
     return s
@@ -9,18 +9,33 @@ Le domaine (`models/`, logique métier) accède aux attributs directement, sans
 `track_from_row(row, artist)` est une fonction pure (aucun accès DB) : elle
 prend une `sqlite3.Row` de la table `tracks` + l'`Artist` déjà construit, et
 renvoie un `Track` — ou `None` si la ligne est inexploitable (id/titre absent).
-Le chargement des crédits reste à l'appelant (il a besoin du curseur).
+Le chargement des crédits reste à l'appelant (il a besoin du curseur) ; il les
+passe déjà chargés pour qu'ils entrent dans l'instantané du dirty tracking.
 """
 
 import json
 
 from src.models import Artist, Track
+from src.models.track import DeferredLyrics, DeferredTrack, Lyrics
+from src.persistence.text_codec import decode_text
+from src.utils.duplicate_detection import DuplicateCandidate
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 _NULL_LITERALS = ("None", "NULL", "")
 
+# Colonnes LOURDES différées par le chargement par projection (E7d) : paroles,
+# LRC retenu (+ provenance/confiance, réconciliés avec lui) et anecdotes. Lues
+# par `fill_heavy_columns` au premier accès, jamais par `track_from_row(deferred=…)`.
+HEAVY_COLUMNS = (
+    "lyrics",
+    "lyrics_synced",
+    "lyrics_synced_source",
+    "lyrics_synced_confidence",
+    "anecdotes",
+)
+
 
 def _clean(value, default=None):
     """Valeur telle quelle, sauf littéraux DB vides ('None'/'NULL'/'') → default."""
@@ -74,11 +89,20 @@ def _clean_duration(value, default=None):
         return default
 
 
-def track_from_row(row, artist: Artist, observations=None) -> Track | None:
+def track_from_row(
+    row, artist: Artist, observations=None, credits=None, deferred=None, resolver=None
+) -> Track | None:
     """Construit un Track depuis une ligne `SELECT * FROM tracks` (sqlite3.Row).
 
     Renvoie None si la ligne n'a pas d'id ou de titre exploitable — l'appelant
-    passe alors au morceau suivant. Les crédits ne sont PAS chargés ici.
+    passe alors au morceau suivant. Les crédits ne sont PAS chargés ici :
+    `credits` (liste déjà lue par l'appelant) est seulement attachée.
+
+    Dirty tracking : le morceau est marqué propre (`mark_clean`) AVANT la
+    réconciliation — l'instantané reflète les COLONNES lues, donc un verdict
+    réconcilié qui diffère de sa colonne (ex. `lyrics_synced`) compte comme une
+    modification et sera réécrit, comme avec l'écriture complète. `credits=None`
+    → crédits inconnus : toujours resynchronisés (diff contre la base) au save.
 
     `observations` (phase E6, bascule lecture) : liste d'`Observation` du morceau.
     Si fournie, le moteur les réconcilie et PILOTE bpm/bpm_alt/source/confidence
@@ -88,6 +112,16 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
     garde en phase ; un morceau jamais réenrichi lit ses colonnes). Réalise le
     point-2 : l'appariement key/mode inter-runs se fait ici, sur l'union
     persistée des observations.
+
+    `deferred` (chargement par projection E7d) : chargeur des colonnes lourdes.
+    La ligne ne porte alors PAS `HEAVY_COLUMNS` mais deux indices SQL
+    (`has_lyrics_text`, `has_synced_hint`) ; le morceau est un `DeferredTrack`
+    dont paroles/LRC/anecdotes sont remplis au premier accès
+    (`fill_heavy_columns`), et `observations` exclut `lyrics_synced`.
+
+    `resolver` (cache de réconciliation) : `ResolutionCache` dont `resolve()`
+    remplace l'appel direct à `reconcile()` — même verdict, repris de la table
+    `reconcile_cache` quand l'empreinte des observations concorde.
     """
     track_id = row["id"]
     title = row["title"]
@@ -97,7 +131,17 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
     if str(title).strip() in _NULL_LITERALS:
         return None
 
-    track = Track(id=track_id, title=str(title).strip())
+    if deferred is None:
+        track = Track(id=track_id, title=str(title).strip())
+    else:
+        track = DeferredTrack(id=track_id, title=str(title).strip())
+        track.defer(deferred, track_id)
+        track.lyrics = DeferredLyrics(
+            deferred,
+            track_id,
+            has_text=bool(row["has_lyrics_text"]),
+            has_synced=bool(row["has_synced_hint"]),
+        )
     track.artist = artist
 
     track.album = _clean(row["album"])
@@ -119,9 +163,10 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
     track.audio.reccobeats_resolution = None
     track.audio.bpm_alt = None
     track.lyrics.source = _clean(row["lyrics_source"])
-    track.lyrics.synced = _clean(row["lyrics_synced"])
-    track.lyrics.synced_source = _clean(row["lyrics_synced_source"])
-    track.lyrics.synced_confidence = _clean_int(row["lyrics_synced_confidence"])
+    if deferred is None:
+        track.lyrics.synced = _clean(decode_text(row["lyrics_synced"]))
+        track.lyrics.synced_source = _clean(row["lyrics_synced_source"])
+        track.lyrics.synced_confidence = _clean_int(row["lyrics_synced_confidence"])
     track.youtube_url = _clean(row["youtube_url"])
     track.youtube_url_source = _clean(row["youtube_url_source"])
     track.streams.spotify_streams = _clean_int(row["spotify_streams"])
@@ -168,9 +213,10 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
     track.featured_artists = _clean(row["featured_artists"])
     track.secondary_role = _clean(row["secondary_role"])
 
-    # Propriétés paroles
-    track.lyrics.text = _clean(row["lyrics"])
-    track.anecdotes = _clean(row["anecdotes"])
+    # Propriétés paroles (texte/anecdotes différés en projection)
+    if deferred is None:
+        track.lyrics.text = _clean(decode_text(row["lyrics"]))
+        track.anecdotes = _clean(row["anecdotes"])
     track.lyrics.present = bool(_clean(row["has_lyrics"], False))
     track.lyrics.scraped_at = _clean(row["lyrics_scraped_at"])
 
@@ -206,6 +252,10 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
         )
         track.certs.album_entries = []
 
+    if credits is not None:
+        track.credits = credits
+    track.mark_clean(with_credits=credits is not None)
+
     # E6 : les observations pilotent l'audio réconciliable (bpm/key/mode), en
     # écrasant les colonnes legacy déjà posées ci-dessus. Champ sans observation
     # = colonne legacy conservée (fallback). Import local (anti-cycle utils↔enrich).
@@ -214,6 +264,63 @@ def track_from_row(row, artist: Artist, observations=None) -> Track | None:
 
         # track.duration posé plus haut (l.135) : alimente la stratégie
         # lyrics_synced (départage par durée réelle dans compare_synced).
-        apply_resolutions(track, reconcile(observations, track_duration=track.duration))
+        if resolver is not None:
+            resolutions = resolver.resolve(track_id, observations, track_duration=track.duration)
+        else:
+            resolutions = reconcile(observations, track_duration=track.duration)
+        apply_resolutions(track, resolutions)
 
     return track
+
+
+def fill_heavy_columns(track: DeferredTrack, row, observations=None) -> None:
+    """Remplit les champs différés d'un `DeferredTrack` depuis ses `HEAVY_COLUMNS`.
+
+    Mêmes coercitions que `track_from_row`. `observations` = les `lyrics_synced`
+    du morceau, réconciliées ICI par le même moteur (stratégies par champ
+    indépendantes) → valeurs identiques au chargement complet. L'instantané
+    adopte les COLONNES, comme `track_from_row` qui marque propre avant de
+    réconcilier. `row` None (ligne disparue) → champs à None.
+    """
+    columns = {
+        "text": _clean(decode_text(row["lyrics"])) if row else None,
+        "synced": _clean(decode_text(row["lyrics_synced"])) if row else None,
+        "synced_source": _clean(row["lyrics_synced_source"]) if row else None,
+        "synced_confidence": _clean_int(row["lyrics_synced_confidence"]) if row else None,
+    }
+    values = columns
+    if observations:
+        from src.enrichment.reconcile import apply_resolutions, reconcile
+
+        # Morceau jetable : apply_resolutions reste la seule écriture du verdict.
+        scratch = Track(duration=track.duration, lyrics=Lyrics(**columns))
+        apply_resolutions(scratch, reconcile(observations, track_duration=track.duration))
+        values = {
+            "text": scratch.lyrics.text,
+            "synced": scratch.lyrics.synced,
+            "synced_source": scratch.lyrics.synced_source,
+            "synced_confidence": scratch.lyrics.synced_confidence,
+        }
+
+    track.lyrics.fill_deferred(values, columns)
+    track.fill_deferred({"anecdotes": _clean(row["anecdotes"]) if row else None})
+
+
+def duplicate_candidate_from_row(row) -> DuplicateCandidate | None:
+    """`DuplicateCandidate` depuis une ligne de `find_duplicate_candidates`
+    (colonnes de `tracks` + `has_lyrics_text` / `credit_count` calculés en SQL).
+    Mêmes coercitions que `track_from_row` ; None si id/titre/artiste absent."""
+    if not row["id"] or not _clean(row["title"]) or not row["artist_id"]:
+        return None
+    return DuplicateCandidate(
+        id=row["id"],
+        artist_id=row["artist_id"],
+        title=row["title"],
+        album=_clean(row["album"]),
+        duration=_clean_duration(row["duration"]),
+        genius_id=_clean(row["genius_id"]),
+        spotify_id=_clean(row["spotify_id"]),
+        isrc=_clean(row["isrc"]),
+        has_lyrics=bool(row["has_lyrics_text"]),
+        credit_count=row["credit_count"] or 0,
+    )
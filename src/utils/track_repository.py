@@ -7,20 +7,38 @@ constant vs l'ancien `data_manager.py` (refonte 1.5 puis bascule Core phase E2).
 """
 
 import json
+import threading
 import time
+from collections import Counter
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
-from sqlalchemy import func, literal, or_, select, text, update
+from sqlalchemy import bindparam, func, literal, or_, select, text, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.enrichment.observation import Observation
-from src.models import Credit, Track
+from src.models import Credit, CreditRole, Track
+from src.models.track import DeferredTrack
+from src.persistence import search_index
 from src.persistence.binding import date_bind
-from src.persistence.schema import albums, artists, credits, tracks
+from src.persistence.schema import albums, artists, tracks
+from src.persistence.text_codec import COMPRESSED_OBS_FIELDS, decode_text, encode_text
+from src.utils.duplicate_detection import (
+    DEFAULT_MIN_SCORE,
+    DuplicateCandidate,
+    MergeProposal,
+    find_duplicates,
+)
 from src.utils.logger import get_logger
-from src.utils.track_mapper import track_from_row
+from src.utils.title_matching import normalize_title
+from src.utils.track_mapper import (
+    HEAVY_COLUMNS,
+    duplicate_candidate_from_row,
+    fill_heavy_columns,
+    track_from_row,
+)
 
 logger = get_logger(__name__)
 
@@ -29,6 +47,153 @@ logger = get_logger(__name__)
 # ressusciterait à la lecture. bpm_alt suit bpm (octave dérivée).
 _AUDIO_OBS_FIELDS = ("bpm", "bpm_alt", "key", "mode", "time_signature")
 
+# Rôle texte (colonne `credits.role`) → enum, précalculé une fois : le chargement
+# d'un gros artiste convertit des dizaines de milliers de crédits. Rôle inconnu
+# (valeur historique, faute de frappe) → OTHER, comme l'ancien `CreditRole(x)`.
+_CREDIT_ROLE_BY_VALUE = {role.value: role for role in CreditRole}
+
+# Dirty tracking : champ du modèle (notation pointée des sous-objets) → colonne
+# de `tracks` réécrite par l'UPDATE de save_track. Champs absents (streams,
+# vidéo YouTube, audio…) : jamais écrits ici (write-through dédiés, observations).
+_COLUMN_BY_FIELD = {
+    "album": "album",
+    "track_number": "track_number",
+    "release_date": "release_date",
+    "genius_id": "genius_id",
+    "spotify_id": "spotify_id",
+    "discogs_id": "discogs_id",
+    "isrc": "isrc",
+    "duration": "duration",
+    "genre": "genre",
+    "genius_url": "genius_url",
+    "spotify_url": "spotify_url",
+    "youtube_url": "youtube_url",
+    "youtube_url_source": "youtube_url_source",
+    "is_featuring": "is_featuring",
+    "primary_artist_name": "primary_artist_name",
+    "featured_artists": "featured_artists",
+    "secondary_role": "secondary_role",
+    "lyrics.text": "lyrics",
+    "lyrics.scraped_at": "lyrics_scraped_at",
+    "lyrics.source": "lyrics_source",
+    "lyrics.synced": "lyrics_synced",
+    "lyrics.synced_source": "lyrics_synced_source",
+    "lyrics.synced_confidence": "lyrics_synced_confidence",
+    "anecdotes": "anecdotes",
+    "certs.entries": "certifications",
+    "certs.album_entries": "album_certifications",
+    "relationships": "relationships",
+    "media.cover_path": "cover_path",
+    "media.yt_thumbnail_path": "yt_thumbnail_path",
+    "last_scraped": "last_scraped",
+}
+# Colonnes JSON : clé de `params` déjà sérialisée (CASE '[]' de l'UPDATE complet).
+_JSON_PARAM_BY_COLUMN = {
+    "certifications": "certifications_json",
+    "album_certifications": "album_certifications_json",
+    "relationships": "relationships_json",
+}
+# Champs du modèle indexés par `track_search` (e16) : un morceau relu dont aucun
+# n'a changé n'est pas réindexé (le titre est la clé de la ligne, jamais modifié
+# par save_track).
+_SEARCH_FIELDS = frozenset({"lyrics.text", "anecdotes", "credits"})
+
+# Chargement par projection (E7d) : colonnes de la vue liste (tout `tracks` sauf
+# HEAVY_COLUMNS, dérivé de schema.py) + deux indices de présence calculés en SQL
+# pour les vues liste (`Lyrics.has_text` / `has_synced`) sans rapatrier le
+# contenu. has_synced_hint : LRC en colonne OU observation lyrics_synced non
+# vide (le verdict réconcilié en découle ; un LRC illisible reste un indice).
+# Un BLOB (texte compressé, jamais blanc : text_codec) répond sans être lu.
+_PROJECTION_SQL = (
+    "SELECT "
+    + ", ".join(c.name for c in tracks.columns if c.name not in HEAVY_COLUMNS)
+    + ", (lyrics IS NOT NULL AND (typeof(lyrics) = 'blob' OR trim(lyrics, ' ' || "
+    "char(9, 10, 13)) NOT IN ('', 'None', 'NULL'))) AS has_lyrics_text, "
+    "((lyrics_synced IS NOT NULL AND lyrics_synced NOT IN ('', 'None', 'NULL')) "
+    "OR EXISTS (SELECT 1 FROM observations o WHERE o.track_id = tracks.id "
+    "AND o.field = 'lyrics_synced' AND o.value IS NOT NULL AND o.value != '')"
+    ") AS has_synced_hint "
+    "FROM tracks WHERE artist_id = :aid ORDER BY title"
+)
+
+# Taille max d'un lot de colonnes lourdes chargé à la demande (lots croissants
+# 1, 2, 4… : une fiche ouverte coûte une ligne, une boucle complète peu de requêtes).
+_LAZY_BATCH_MAX = 256
+
+
+def _observation_from_row(r) -> Observation:
+    """`Observation` depuis une ligne `observations` (`value`/`seen_at` en brut,
+    LRC compressé décodé)."""
+    return Observation(
+        field=r["field"],
+        value=decode_text(r["value"]),
+        source=r["source"],
+        confidence=r["confidence"],
+        seen_at=r["seen_at"],
+    )
+
+
+class _HeavyColumnsLoader:
+    """Chargeur des colonnes lourdes d'un `get_artist_tracks` par projection (E7d).
+
+    Garde les morceaux dont paroles/LRC/anecdotes sont encore en base. Le premier
+    accès à un champ différé charge ce morceau ET les suivants en attente, par
+    lots croissants (jusqu'à `_LAZY_BATCH_MAX`) : 2 requêtes par lot (colonnes
+    de `tracks` + observations `lyrics_synced`). Verrouillé : l'UI et un worker
+    peuvent toucher les mêmes morceaux.
+    """
+
+    def __init__(self, engine) -> None:
+        self._engine = engine
+        self._pending: dict[int, DeferredTrack] = {}
+        self._batch_size = 1
+        self._lock = threading.Lock()
+
+    def register(self, track: DeferredTrack) -> None:
+        self._pending[track.id] = track
+
+    def load(self, track_id: int) -> None:
+        with self._lock:
+            track = self._pending.pop(track_id, None)
+            if track is None:
+                return  # déjà chargé (lot voisin ou autre thread)
+            batch = {track_id: track}
+            for key in list(islice(self._pending, self._batch_size - 1)):
+                batch[key] = self._pending.pop(key)
+            self._batch_size = min(self._batch_size * 2, _LAZY_BATCH_MAX)
+
+            rows, observations = self._fetch(list(batch))
+            for key, pending in batch.items():
+                fill_heavy_columns(pending, rows.get(key), observations.get(key))
+
+    def _fetch(self, ids: list[int]) -> tuple[dict[int, Any], dict[int, list[Observation]]]:
+        ids_param = bindparam("ids", expanding=True)
+        try:
+            with self._engine.connect() as conn:
+                rows = {
+                    r["id"]: r
+                    for r in conn.execute(
+                        text(
+                            f"SELECT id, {', '.join(HEAVY_COLUMNS)} FROM tracks WHERE id IN :ids"
+                        ).bindparams(ids_param),
+                        {"ids": ids},
+                    ).mappings()
+                }
+                by_track: dict[int, list[Observation]] = {}
+                for r in conn.execute(
+                    text(
+                        "SELECT track_id, field, value, source, confidence, seen_at "
+                        "FROM observations WHERE field = 'lyrics_synced' AND track_id IN :ids"
+                    ).bindparams(ids_param),
+                    {"ids": ids},
+                ).mappings():
+                    by_track.setdefault(r["track_id"], []).append(_observation_from_row(r))
+        except SQLAlchemyError as e:
+            # Champs posés à None : COALESCE au save → la base garde le contenu.
+            logger.warning(f"⚠️ Chargement différé des paroles échoué ({len(ids)} morceaux): {e}")
+            return {}, {}
+        return rows, by_track
+
 
 class TrackRepository:
     """Persistance des morceaux, crédits et albums. Requiert `self.engine`."""
@@ -52,240 +217,420 @@ class TrackRepository:
             if not track.artist or not track.artist.id:
                 raise ValueError("Le morceau doit avoir un artiste avec un ID")
 
-            existing_track = (
-                conn.execute(
-                    text(
-                        "SELECT id, is_featuring, primary_artist_name, featured_artists, "
-                        "lyrics, has_lyrics, lyrics_scraped_at FROM tracks "
-                        "WHERE title = :title AND artist_id = :artist_id"
-                    ),
-                    {"title": track.title, "artist_id": track.artist.id},
-                )
-                .mappings()
-                .first()
+            existing_id = conn.execute(
+                text("SELECT id FROM tracks WHERE title = :title AND artist_id = :artist_id"),
+                {"title": track.title, "artist_id": track.artist.id},
+            ).scalar()
+            if self._write_track(conn, track, existing_id):
+                search_index.reindex_tracks(conn, [track.id])
+
+        # commit fait (sortie du bloc `engine.begin()`) : l'état persisté devient
+        # la référence du dirty tracking pour la prochaine sauvegarde.
+        track.mark_clean()
+        logger.info(
+            f"Morceau sauvegardé: {track.title} (ID: {track.id}, "
+            f"Featuring: {track.is_featuring}, Paroles: {track.lyrics.has_text})"
+        )
+        return track.id
+
+    def save_tracks(self, tracks: list[Track]) -> list[int | None]:
+        """Sauvegarde un LOT de morceaux dans UNE transaction (même sémantique que save_track).
+
+        Un seul commit (donc un seul fsync) pour tout le lot au lieu d'un par
+        morceau : la première importation d'une discographie de 600 titres passe
+        de 600+ transactions à une. Les ids existants sont résolus en UNE requête
+        (par artiste, index e13), les crédits/erreurs/observations partent en
+        `executemany`. Chaque morceau est écrit sous SAVEPOINT : un échec est
+        annulé seul et journalisé, le reste du lot est commité.
+
+        Renvoie les ids dans l'ordre de `tracks` (None = morceau non sauvegardé :
+        sans artiste persisté, ou écriture en échec).
+        """
+        ids: list[int | None] = [None] * len(tracks)
+        if not tracks:
+            return ids
+        t0 = time.perf_counter()
+        with self.engine.begin() as conn:
+            existing = self._existing_track_ids(
+                conn, {t.artist.id for t in tracks if t.artist and t.artist.id}
             )
+            to_index: list[int] = []
+            for i, track in enumerate(tracks):
+                if not track.artist or not track.artist.id:
+                    logger.warning(f"Morceau ignoré (artiste sans ID): {track.title}")
+                    continue
+                key = (track.title, track.artist.id)
+                previous_id = track.id
+                try:
+                    with conn.begin_nested():
+                        if self._write_track(conn, track, existing.get(key)):
+                            to_index.append(track.id)
+                except (SQLAlchemyError, TypeError, ValueError) as e:
+                    # ROLLBACK TO SAVEPOINT : seul ce morceau est perdu. L'id posé
+                    # par un INSERT annulé ne doit pas survivre sur l'objet.
+                    track.id = previous_id
+                    logger.warning(f"Erreur sauvegarde {track.title}: {e}")
+                    continue
+                # Doublon de titre DANS le lot : le second met à jour le premier.
+                existing[key] = track.id
+                ids[i] = track.id
+                logger.debug(f"Morceau sauvegardé: {track.title} (ID: {track.id})")
+            # Index plein texte du lot en une passe (lectures groupées par 500).
+            search_index.reindex_tracks(conn, to_index)
+
+        # Lot commité : référence du dirty tracking pour les morceaux écrits.
+        for track, tid in zip(tracks, ids, strict=True):
+            if tid is not None:
+                track.mark_clean()
+        saved = sum(1 for tid in ids if tid is not None)
+        logger.info(
+            f"💾 Lot sauvegardé: {saved}/{len(tracks)} morceaux "
+            f"en une transaction ({time.perf_counter() - t0:.2f}s)"
+        )
+        return ids
+
+    def _existing_track_ids(self, conn, artist_ids: set[int]) -> dict[tuple[str, int], int]:
+        """(title, artist_id) → id des morceaux déjà en base pour ces artistes (une requête)."""
+        if not artist_ids:
+            return {}
+        rows = conn.execute(
+            text("SELECT id, title, artist_id FROM tracks WHERE artist_id IN :aids").bindparams(
+                bindparam("aids", expanding=True)
+            ),
+            {"aids": sorted(artist_ids)},
+        )
+        return {(title, artist_id): tid for tid, title, artist_id in rows}
 
-            if existing_track:
-                track.id = existing_track["id"]
-                # NB : plus de « préservation » ici. Les anciens blocs gardés par
-                # `not hasattr(track, "is_featuring"/"lyrics")` étaient morts (champs
-                # de la dataclass → hasattr toujours vrai) et, de toute façon,
-                # redondants : les paroles sont préservées par le COALESCE de
-                # l'UPDATE ci-dessous, et is_featuring suit la décision documentée
-                # « le track en mémoire fait foi » (écrasé SANS COALESCE). La fusion
-                # en mémoire des données enrichies se fait en amont côté worker
-                # (gui/workers/retrieval.py).
-
-            # Sérialiser les champs JSON une seule fois (partagés UPDATE/INSERT)
-            certifications_json = json.dumps(track.certs.entries)
-            album_certifications_json = json.dumps(track.certs.album_entries)
-            relationships_json = json.dumps(track.relationships or [])
-
-            # Paramètres NOMMÉS : un seul dict {colonne: valeur}, lié par nom
-            # (:col). L'ordre des ~44 valeurs ne peut plus se désynchroniser du
-            # SQL (cause de bugs positionnels). Le même dict sert à l'UPDATE et
-            # à l'INSERT ; sqlite3 ignore les clés non référencées.
-            # NB : SEULS key/mode/spotify_page_title ne sont pas des champs de la
-            # dataclass Track (posés dynamiquement par le mapper) → getattr requis.
-            # Les autres colonnes sont des champs garantis → accès direct.
-            params = {
-                "title": track.title,
-                "artist_id": track.artist.id,
-                "album": track.album,
-                "track_number": track.track_number,
-                "release_date": track.release_date,
-                "genius_id": track.genius_id,
-                "spotify_id": track.spotify_id,
-                "discogs_id": track.discogs_id,
-                "isrc": track.isrc,
-                # E7-D1 : les colonnes audio ne sont plus écrites (pilotées par les
-                # observations, reconcile au mapper) → clés retirées de params.
-                "duration": track.duration,
-                "genre": track.genre,
-                "genius_url": track.genius_url,
-                "spotify_url": track.spotify_url,
-                "youtube_url": track.youtube_url,
-                "youtube_url_source": track.youtube_url_source,
-                "is_featuring": track.is_featuring,
-                "primary_artist_name": track.primary_artist_name,
-                "featured_artists": track.featured_artists,
-                "secondary_role": track.secondary_role,
-                "lyrics": track.lyrics.text,
-                "lyrics_scraped_at": track.lyrics.scraped_at,
-                "lyrics_source": track.lyrics.source,
-                "lyrics_synced": track.lyrics.synced,
-                "lyrics_synced_source": track.lyrics.synced_source,
-                "lyrics_synced_confidence": track.lyrics.synced_confidence,
-                "has_lyrics": bool(track.lyrics.text),  # INSERT uniquement
-                "anecdotes": track.anecdotes,
-                "certifications_json": certifications_json,
-                "album_certifications_json": album_certifications_json,
-                "relationships_json": relationships_json,
-                "spotify_page_title": getattr(track, "spotify_page_title", None),
-                # Chantier « Media » : chemins d'images (kind/vues vidéo passent par
-                # update_track_video_views, jamais ici).
-                "cover_path": track.media.cover_path,
-                "yt_thumbnail_path": track.media.yt_thumbnail_path,
-                "now": datetime.now(),
-                "last_scraped": track.last_scraped,
-            }
+    def _write_track(self, conn, track: Track, existing_id: int | None) -> bool:
+        """Écrit UN morceau et ses dépendances sur `conn` (transaction de l'appelant).
 
-            if existing_track:
-                params["id"] = track.id
-                # UPDATE NON-DESTRUCTIF : COALESCE préserve la valeur existante
-                # quand le track entrant n'a pas la donnée (None). Évite qu'un
-                # re-fetch de discographie (API Genius, champs vides) écrase
-                # les données enrichies (lyrics, BPM, key, spotify_id...).
-                #
-                # DÉCISION is_featuring : seul champ écrasé SANS COALESCE (le
-                # track en mémoire fait foi pour le statut featuring au moment du
-                # save). Comportement historique conservé. Les appelants qui
-                # re-sauvent depuis l'API portent is_featuring sur l'objet.
-                conn.execute(
-                    text("""
-                    UPDATE tracks
-                    SET album = COALESCE(:album, album),
-                        track_number = COALESCE(:track_number, track_number),
-                        release_date = COALESCE(:release_date, release_date),
-                        genius_id = COALESCE(:genius_id, genius_id),
-                        spotify_id = COALESCE(:spotify_id, spotify_id),
-                        discogs_id = COALESCE(:discogs_id, discogs_id),
-                        isrc = COALESCE(:isrc, isrc),
-                        -- E7-D1 : colonnes audio (bpm, bpm_alt, bpm_source,
-                        -- bpm_confidence, key, mode, key_mode_source, musical_key,
-                        -- time_signature, reccobeats_resolution) NON écrites — la
-                        -- réconciliation des observations les pilote (mapper E6).
-                        -- Gelées jusqu'au drop E7-D2 ; lues en fallback si aucune obs.
-                        duration = COALESCE(:duration, duration),
-                        genre = COALESCE(:genre, genre),
-                        genius_url = COALESCE(:genius_url, genius_url),
-                        spotify_url = COALESCE(:spotify_url, spotify_url),
-                        youtube_url = COALESCE(:youtube_url, youtube_url),
-                        youtube_url_source = COALESCE(:youtube_url_source, youtube_url_source),
-                        is_featuring = :is_featuring,
-                        primary_artist_name = COALESCE(:primary_artist_name, primary_artist_name),
-                        featured_artists = COALESCE(:featured_artists, featured_artists),
-                        secondary_role = COALESCE(:secondary_role, secondary_role),
-                        lyrics = COALESCE(:lyrics, lyrics),
-                        lyrics_scraped_at = COALESCE(:lyrics_scraped_at, lyrics_scraped_at),
-                        lyrics_source = COALESCE(:lyrics_source, lyrics_source),
-                        lyrics_synced = COALESCE(:lyrics_synced, lyrics_synced),
-                        lyrics_synced_source = COALESCE(:lyrics_synced_source, lyrics_synced_source),
-                        lyrics_synced_confidence = COALESCE(:lyrics_synced_confidence, lyrics_synced_confidence),
-                        has_lyrics = CASE WHEN :lyrics IS NOT NULL THEN 1 ELSE has_lyrics END,
-                        anecdotes = COALESCE(:anecdotes, anecdotes),
-                        certifications = CASE WHEN :certifications_json = '[]' THEN certifications ELSE :certifications_json END,
-                        album_certifications = CASE WHEN :album_certifications_json = '[]' THEN album_certifications ELSE :album_certifications_json END,
-                        relationships = CASE WHEN :relationships_json = '[]' THEN relationships ELSE :relationships_json END,
-                        cover_path = COALESCE(:cover_path, cover_path),
-                        yt_thumbnail_path = COALESCE(:yt_thumbnail_path, yt_thumbnail_path),
-                        updated_at = :now,
-                        last_scraped = COALESCE(:last_scraped, last_scraped)
-                    WHERE id = :id
-                """),
-                    params,
-                )
-            else:
-                result = conn.execute(
-                    text("""
-                    -- E7-D1 : colonnes audio (bpm, bpm_alt, bpm_source, bpm_confidence,
-                    -- key, mode, key_mode_source, musical_key, time_signature,
-                    -- reccobeats_resolution) NON insérées — pilotées par les
-                    -- observations (mapper E6). NULL à l'INSERT, gelées jusqu'au drop D2.
-                    INSERT INTO tracks (
-                        title, artist_id, album, track_number, release_date,
-                        genius_id, spotify_id, discogs_id, isrc,
-                        duration, genre,
-                        genius_url, spotify_url, youtube_url, youtube_url_source,
-                        is_featuring, primary_artist_name, featured_artists, secondary_role,
-                        lyrics, lyrics_scraped_at, lyrics_source, lyrics_synced, lyrics_synced_source, lyrics_synced_confidence, has_lyrics, anecdotes,
-                        certifications, album_certifications, relationships, spotify_page_title,
-                        cover_path, yt_thumbnail_path,
-                        created_at, updated_at, last_scraped
-                    ) VALUES (
-                        :title, :artist_id, :album, :track_number, :release_date,
-                        :genius_id, :spotify_id, :discogs_id, :isrc,
-                        :duration, :genre,
-                        :genius_url, :spotify_url, :youtube_url, :youtube_url_source,
-                        :is_featuring, :primary_artist_name, :featured_artists, :secondary_role,
-                        :lyrics, :lyrics_scraped_at, :lyrics_source, :lyrics_synced, :lyrics_synced_source, :lyrics_synced_confidence, :has_lyrics, :anecdotes,
-                        :certifications_json, :album_certifications_json, :relationships_json, :spotify_page_title,
-                        :cover_path, :yt_thumbnail_path,
-                        :now, :now, :last_scraped
-                    )
-                """),
-                    params,
+        Chemin commun de `save_track` et `save_tracks` : UPDATE non-destructif si
+        `existing_id`, sinon INSERT ; puis crédits, erreurs de scraping,
+        observations du run et nettoyage audio. Pose `track.id`.
+
+        Dirty tracking : un morceau relu de CETTE ligne (instantané du mapper ou
+        d'une sauvegarde précédente) n'écrit que ses colonnes modifiées et
+        synchronise ses crédits par diff ; sinon écriture complète (fallback).
+
+        Renvoie True si l'index plein texte du morceau est à refaire (champ
+        indexé modifié, ou écriture complète) — laissé à l'appelant, qui
+        réindexe en lot.
+        """
+        reloaded = existing_id is not None and track.id == existing_id
+        changed = track.changed_fields() if reloaded else None
+        if existing_id is not None:
+            track.id = existing_id
+            # NB : plus de « préservation » ici. Les anciens blocs gardés par
+            # `not hasattr(track, "is_featuring"/"lyrics")` étaient morts (champs
+            # de la dataclass → hasattr toujours vrai) et, de toute façon,
+            # redondants : les paroles sont préservées par le COALESCE de
+            # l'UPDATE ci-dessous, et is_featuring suit la décision documentée
+            # « le track en mémoire fait foi » (écrasé SANS COALESCE). La fusion
+            # en mémoire des données enrichies se fait en amont côté worker
+            # (gui/workers/retrieval.py).
+
+        # Sérialiser les champs JSON une seule fois (partagés UPDATE/INSERT)
+        certifications_json = json.dumps(track.certs.entries)
+        album_certifications_json = json.dumps(track.certs.album_entries)
+        relationships_json = json.dumps(track.relationships or [])
+
+        # Paramètres NOMMÉS : un seul dict {colonne: valeur}, lié par nom
+        # (:col). L'ordre des ~44 valeurs ne peut plus se désynchroniser du
+        # SQL (cause de bugs positionnels). Le même dict sert à l'UPDATE et
+        # à l'INSERT ; sqlite3 ignore les clés non référencées.
+        # NB : SEULS key/mode/spotify_page_title ne sont pas des champs de la
+        # dataclass Track (posés dynamiquement par le mapper) → getattr requis.
+        # Les autres colonnes sont des champs garantis → accès direct.
+        params = {
+            "title": track.title,
+            "artist_id": track.artist.id,
+            "album": track.album,
+            "track_number": track.track_number,
+            "release_date": track.release_date,
+            "genius_id": track.genius_id,
+            "spotify_id": track.spotify_id,
+            "discogs_id": track.discogs_id,
+            "isrc": track.isrc,
+            # E7-D1 : les colonnes audio ne sont plus écrites (pilotées par les
+            # observations, reconcile au mapper) → clés retirées de params.
+            "duration": track.duration,
+            "genre": track.genre,
+            "genius_url": track.genius_url,
+            "spotify_url": track.spotify_url,
+            "youtube_url": track.youtube_url,
+            "youtube_url_source": track.youtube_url_source,
+            "is_featuring": track.is_featuring,
+            "primary_artist_name": track.primary_artist_name,
+            "featured_artists": track.featured_artists,
+            "secondary_role": track.secondary_role,
+            # Champs différés (projection E7d) lus SANS les charger : non chargé →
+            # None → COALESCE garde la base, qui détient justement la valeur.
+            # Paroles / LRC compressés à l'écriture (text_codec, décodés par le mapper).
+            "lyrics": encode_text(track.lyrics.peek("text")),
+            "lyrics_scraped_at": track.lyrics.scraped_at,
+            "lyrics_source": track.lyrics.source,
+            "lyrics_synced": encode_text(track.lyrics.peek("synced")),
+            "lyrics_synced_source": track.lyrics.peek("synced_source"),
+            "lyrics_synced_confidence": track.lyrics.peek("synced_confidence"),
+            "has_lyrics": bool(track.lyrics.peek("text")),  # INSERT uniquement
+            "anecdotes": track.peek("anecdotes"),
+            "certifications_json": certifications_json,
+            "album_certifications_json": album_certifications_json,
+            "relationships_json": relationships_json,
+            "spotify_page_title": getattr(track, "spotify_page_title", None),
+            # Chantier « Media » : chemins d'images (kind/vues vidéo passent par
+            # update_track_video_views, jamais ici).
+            "cover_path": track.media.cover_path,
+            "yt_thumbnail_path": track.media.yt_thumbnail_path,
+            "now": datetime.now(),
+            "last_scraped": track.last_scraped,
+        }
+
+        if changed is not None:
+            self._update_changed_columns(conn, track.id, changed, params)
+        elif existing_id is not None:
+            params["id"] = track.id
+            # UPDATE NON-DESTRUCTIF : COALESCE préserve la valeur existante
+            # quand le track entrant n'a pas la donnée (None). Évite qu'un
+            # re-fetch de discographie (API Genius, champs vides) écrase
+            # les données enrichies (lyrics, BPM, key, spotify_id...).
+            #
+            # DÉCISION is_featuring : seul champ écrasé SANS COALESCE (le
+            # track en mémoire fait foi pour le statut featuring au moment du
+            # save). Comportement historique conservé. Les appelants qui
+            # re-sauvent depuis l'API portent is_featuring sur l'objet.
+            conn.execute(
+                text("""
+                UPDATE tracks
+                SET album = COALESCE(:album, album),
+                    track_number = COALESCE(:track_number, track_number),
+                    release_date = COALESCE(:release_date, release_date),
+                    genius_id = COALESCE(:genius_id, genius_id),
+                    spotify_id = COALESCE(:spotify_id, spotify_id),
+                    discogs_id = COALESCE(:discogs_id, discogs_id),
+                    isrc = COALESCE(:isrc, isrc),
+                    -- E7-D1 : colonnes audio (bpm, bpm_alt, bpm_source,
+                    -- bpm_confidence, key, mode, key_mode_source, musical_key,
+                    -- time_signature, reccobeats_resolution) NON écrites — la
+                    -- réconciliation des observations les pilote (mapper E6).
+                    -- Gelées jusqu'au drop E7-D2 ; lues en fallback si aucune obs.
+                    duration = COALESCE(:duration, duration),
+                    genre = COALESCE(:genre, genre),
+                    genius_url = COALESCE(:genius_url, genius_url),
+                    spotify_url = COALESCE(:spotify_url, spotify_url),
+                    youtube_url = COALESCE(:youtube_url, youtube_url),
+                    youtube_url_source = COALESCE(:youtube_url_source, youtube_url_source),
+                    is_featuring = :is_featuring,
+                    primary_artist_name = COALESCE(:primary_artist_name, primary_artist_name),
+                    featured_artists = COALESCE(:featured_artists, featured_artists),
+                    secondary_role = COALESCE(:secondary_role, secondary_role),
+                    lyrics = COALESCE(:lyrics, lyrics),
+                    lyrics_scraped_at = COALESCE(:lyrics_scraped_at, lyrics_scraped_at),
+                    lyrics_source = COALESCE(:lyrics_source, lyrics_source),
+                    lyrics_synced = COALESCE(:lyrics_synced, lyrics_synced),
+                    lyrics_synced_source = COALESCE(:lyrics_synced_source, lyrics_synced_source),
+                    lyrics_synced_confidence = COALESCE(:lyrics_synced_confidence, lyrics_synced_confidence),
+                    has_lyrics = CASE WHEN :lyrics IS NOT NULL THEN 1 ELSE has_lyrics END,
+                    anecdotes = COALESCE(:anecdotes, anecdotes),
+                    certifications = CASE WHEN :certifications_json = '[]' THEN certifications ELSE :certifications_json END,
+                    album_certifications = CASE WHEN :album_certifications_json = '[]' THEN album_certifications ELSE :album_certifications_json END,
+                    relationships = CASE WHEN :relationships_json = '[]' THEN relationships ELSE :relationships_json END,
+                    cover_path = COALESCE(:cover_path, cover_path),
+                    yt_thumbnail_path = COALESCE(:yt_thumbnail_path, yt_thumbnail_path),
+                    updated_at = :now,
+                    last_scraped = COALESCE(:last_scraped, last_scraped)
+                WHERE id = :id
+            """),
+                params,
+            )
+        else:
+            result = conn.execute(
+                text("""
+                -- E7-D1 : colonnes audio (bpm, bpm_alt, bpm_source, bpm_confidence,
+                -- key, mode, key_mode_source, musical_key, time_signature,
+                -- reccobeats_resolution) NON insérées — pilotées par les
+                -- observations (mapper E6). NULL à l'INSERT, gelées jusqu'au drop D2.
+                INSERT INTO tracks (
+                    title, artist_id, album, track_number, release_date,
+                    genius_id, spotify_id, discogs_id, isrc,
+                    duration, genre,
+                    genius_url, spotify_url, youtube_url, youtube_url_source,
+                    is_featuring, primary_artist_name, featured_artists, secondary_role,
+                    lyrics, lyrics_scraped_at, lyrics_source, lyrics_synced, lyrics_synced_source, lyrics_synced_confidence, has_lyrics, anecdotes,
+                    certifications, album_certifications, relationships, spotify_page_title,
+                    cover_path, yt_thumbnail_path,
+                    created_at, updated_at, last_scraped
+                ) VALUES (
+                    :title, :artist_id, :album, :track_number, :release_date,
+                    :genius_id, :spotify_id, :discogs_id, :isrc,
+                    :duration, :genre,
+                    :genius_url, :spotify_url, :youtube_url, :youtube_url_source,
+                    :is_featuring, :primary_artist_name, :featured_artists, :secondary_role,
+                    :lyrics, :lyrics_scraped_at, :lyrics_source, :lyrics_synced, :lyrics_synced_source, :lyrics_synced_confidence, :has_lyrics, :anecdotes,
+                    :certifications_json, :album_certifications_json, :relationships_json, :spotify_page_title,
+                    :cover_path, :yt_thumbnail_path,
+                    :now, :now, :last_scraped
                 )
-                track.id = result.lastrowid
+            """),
+                params,
+            )
+            track.id = result.lastrowid
 
+        if track.id and changed is not None:
+            # Diff contre la base : seuls les crédits ajoutés/retirés sont écrits.
+            if "credits" in changed:
+                self._sync_credits(conn, track.id, track.credits)
+        elif track.id:
             # Supprimer les anciens crédits avant d'ajouter les nouveaux
-            if track.id:
-                conn.execute(
-                    text("DELETE FROM credits WHERE track_id = :track_id"),
-                    {"track_id": track.id},
-                )
+            conn.execute(
+                text("DELETE FROM credits WHERE track_id = :track_id"),
+                {"track_id": track.id},
+            )
+            self._insert_credits(conn, track.id, track.credits)
+
+        # Sauvegarder les erreurs (un seul executemany)
+        if track.scraping_errors:
+            now = datetime.now()
+            conn.execute(
+                text(
+                    "INSERT INTO scraping_errors (track_id, error_message, error_time) "
+                    "VALUES (:track_id, :error_message, :error_time)"
+                ),
+                [
+                    {"track_id": track.id, "error_message": error, "error_time": now}
+                    for error in track.scraping_errors
+                ],
+            )
 
-                # Sauvegarder les nouveaux crédits
-                for credit in track.credits:
-                    self._save_credit(conn, track.id, credit)
+        # Observations fraîches du run (phase E5) : upsert DANS la même
+        # transaction que les colonnes legacy — la moitié « persistance » de
+        # la triple écriture (E5c-1). Write-through pur : ne pilote PAS encore
+        # les colonnes legacy (bascule reconcile → E5c-2, vote audio). No-op
+        # tant qu'aucun provider `fetch()` ne peuple `track.observations`.
+        if track.id and track.observations:
+            self._upsert_observations(conn, track.id, track.observations)
+
+        # E7-D1 : nettoyage audio demandé → supprimer les observations audio
+        # persistées DANS la même transaction. Sans ça, la réconciliation du
+        # mapper les ressusciterait à la lecture (l'attribut mis à None ne
+        # suffit plus : la vérité vit dans `observations`, pas dans la colonne).
+        # E7-D2 : plus de colonnes audio à vider (droppées) — la suppression
+        # des observations suffit (le mapper n'a plus de fallback colonne).
+        if track.id and track.clear_audio_observations:
+            conn.execute(
+                text("DELETE FROM observations WHERE track_id = :tid AND field = :field"),
+                [{"tid": track.id, "field": obs_field} for obs_field in _AUDIO_OBS_FIELDS],
+            )
+        return changed is None or bool(changed & _SEARCH_FIELDS)
 
-            # Sauvegarder les erreurs
-            for error in track.scraping_errors:
-                conn.execute(
-                    text(
-                        "INSERT INTO scraping_errors (track_id, error_message, error_time) "
-                        "VALUES (:track_id, :error_message, :error_time)"
-                    ),
-                    {"track_id": track.id, "error_message": error, "error_time": datetime.now()},
-                )
+    def _update_changed_columns(
+        self, conn, track_id: int, changed: set[str], params: dict[str, Any]
+    ) -> bool:
+        """UPDATE minimal : seules les colonnes des champs modifiés (dirty tracking).
 
-            # Observations fraîches du run (phase E5) : upsert DANS la même
-            # transaction que les colonnes legacy — la moitié « persistance » de
-            # la triple écriture (E5c-1). Write-through pur : ne pilote PAS encore
-            # les colonnes legacy (bascule reconcile → E5c-2, vote audio). No-op
-            # tant qu'aucun provider `fetch()` ne peuple `track.observations`.
-            if track.id and track.observations:
-                self._upsert_observations(conn, track.id, track.observations)
-
-            # E7-D1 : nettoyage audio demandé → supprimer les observations audio
-            # persistées DANS la même transaction. Sans ça, la réconciliation du
-            # mapper les ressusciterait à la lecture (l'attribut mis à None ne
-            # suffit plus : la vérité vit dans `observations`, pas dans la colonne).
-            if track.id and track.clear_audio_observations:
-                for obs_field in _AUDIO_OBS_FIELDS:
-                    self._delete_observations(conn, track.id, obs_field)
-                # E7-D2 : plus de colonnes audio à vider (droppées) — la suppression
-                # des observations suffit (le mapper n'a plus de fallback colonne).
-
-            # commit auto à la sortie du bloc `engine.begin()`
-            logger.info(
-                f"Morceau sauvegardé: {track.title} (ID: {track.id}, "
-                f"Featuring: {track.is_featuring}, Paroles: {bool(track.lyrics.text)})"
+        Même sémantique que l'UPDATE complet, colonne par colonne : None (COALESCE)
+        et liste JSON vide (CASE '[]') conservent la base, is_featuring est écrasé,
+        des paroles non nulles posent has_lyrics. Rien d'effectif → aucun UPDATE
+        (updated_at inchangé). Renvoie True si une ligne a été écrite.
+        """
+        assignments = []
+        for column in sorted({_COLUMN_BY_FIELD[f] for f in changed if f in _COLUMN_BY_FIELD}):
+            param = _JSON_PARAM_BY_COLUMN.get(column, column)
+            value = params[param]
+            if column != "is_featuring" and (
+                value is None or (column in _JSON_PARAM_BY_COLUMN and value == "[]")
+            ):
+                continue
+            assignments.append(f"{column} = :{param}")
+            if column == "lyrics":
+                assignments.append("has_lyrics = 1")
+        if not assignments:
+            return False
+        # Colonnes issues de _COLUMN_BY_FIELD (constante), valeurs liées par nom.
+        conn.execute(
+            text(f"UPDATE tracks SET {', '.join(assignments)}, updated_at = :now WHERE id = :id"),
+            {**params, "id": track_id},
+        )
+        return True
+
+    def _sync_credits(self, conn, track_id: int, track_credits: list[Credit]) -> None:
+        """Synchronise les crédits par diff contre la base (multiensemble de clés).
+
+        Les lignes en base sont normalisées comme au chargement (rôle inconnu →
+        OTHER, source absente → genius) : une ligne déjà présente n'est ni
+        supprimée ni réinsérée, seules les disparues sont supprimées (par id) et
+        les nouvelles insérées (en fin d'ordre de lecture).
+        """
+        wanted = Counter(
+            (c.name, c.role, c.role_detail, c.source) for c in track_credits if c.role is not None
+        )
+        stale_ids = []
+        for row in conn.execute(
+            text(
+                "SELECT id, name, role, role_detail, source FROM credits "
+                "WHERE track_id = :tid ORDER BY id"
+            ),
+            {"tid": track_id},
+        ):
+            key = (
+                row.name,
+                _CREDIT_ROLE_BY_VALUE.get(row.role, CreditRole.OTHER),
+                row.role_detail,
+                row.source or "genius",
             )
-            return track.id
+            if row.name and row.role and wanted[key] > 0:
+                wanted[key] -= 1
+            else:
+                stale_ids.append(row.id)
 
-    def _save_credit(self, conn, track_id: int, credit: Credit):
-        """Sauvegarde un crédit (connexion Core fournie par l'appelant)."""
-        try:
+        if stale_ids:
+            conn.execute(
+                text("DELETE FROM credits WHERE id = :id"), [{"id": cid} for cid in stale_ids]
+            )
+        new_credits = []
+        for credit in track_credits:
+            key = (credit.name, credit.role, credit.role_detail, credit.source)
+            if wanted[key] > 0:
+                wanted[key] -= 1
+                new_credits.append(credit)
+        self._insert_credits(conn, track_id, new_credits)
+
+    def _insert_credits(self, conn, track_id: int, track_credits: list[Credit]) -> None:
+        """Insère les crédits d'un morceau en un `executemany`.
+
+        `INSERT OR IGNORE` : un doublon (UNIQUE track_id/name/role/role_detail) ou
+        un crédit incomplet est écarté SANS faire échouer le lot — même tolérance
+        que l'ancien INSERT unitaire sous try/except. Rôle absent → crédit ignoré.
+        """
+        rows = [
+            {
+                "track_id": track_id,
+                "name": credit.name,
+                "role": credit.role.value,
+                "role_detail": credit.role_detail,
+                "source": credit.source,
+            }
+            for credit in track_credits
+            if credit.role is not None
+        ]
+        if rows:
             conn.execute(
                 text(
-                    "INSERT INTO credits (track_id, name, role, role_detail, source) "
+                    "INSERT OR IGNORE INTO credits (track_id, name, role, role_detail, source) "
                     "VALUES (:track_id, :name, :role, :role_detail, :source)"
                 ),
-                {
-                    "track_id": track_id,
-                    "name": credit.name,
-                    "role": credit.role.value,
-                    "role_detail": credit.role_detail,
-                    "source": credit.source,
-                },
+                rows,
             )
-        except Exception as e:
-            # Log mais ne pas arrêter le processus pour un crédit
-            logger.debug(f"Erreur lors de la sauvegarde du crédit {credit.name}: {e}")
 
-    def get_artist_tracks(self, artist_id: int) -> list[Track]:
-        """Récupère tous les morceaux d'un artiste (via le moteur Core)."""
+    def get_artist_tracks(self, artist_id: int, *, lazy: bool = True) -> list[Track]:
+        """Récupère tous les morceaux d'un artiste (via le moteur Core).
+
+        `lazy` (défaut, E7d) : chargement par projection — paroles, LRC retenu et
+        anecdotes restent en base et sont chargés au premier accès, par lots
+        (`DeferredTrack`/`DeferredLyrics`), avec les observations `lyrics_synced`
+        (réconciliées à ce moment-là, mêmes valeurs). `lazy=False` : tout en une
+        fois (`SELECT *`), comme avant.
+        """
         result: list[Track] = []
 
         try:
@@ -342,12 +687,18 @@ class TrackRepository:
                 # donne un accès par nom, indexable comme sqlite3.Row.
                 # Témoin de perf (E7d) : chrono par sous-phase pour localiser le
                 # coût du chargement d'un gros artiste (SELECT tracks / observations
-                # / boucle mapper+crédits). La boucle mapper porte à la fois la
-                # réconciliation par morceau ET un N+1 sur les crédits.
+                # / crédits / boucle mapper). Crédits chargés en 1 requête pour tout
+                # l'artiste (ex-N+1 par morceau) : la boucle mapper ne porte plus
+                # que la réconciliation par morceau.
                 _t0 = time.monotonic()
+                loader = _HeavyColumnsLoader(self.engine) if lazy else None
                 rows = (
                     conn.execute(
-                        text("SELECT * FROM tracks WHERE artist_id = :aid ORDER BY title"),
+                        text(
+                            _PROJECTION_SQL
+                            if lazy
+                            else "SELECT * FROM tracks WHERE artist_id = :aid ORDER BY title"
+                        ),
                         {"aid": artist_id},
                     )
                     .mappings()
@@ -358,9 +709,32 @@ class TrackRepository:
 
                 # E6 : observations de TOUT l'artiste en 1 requête (pas par track),
                 # groupées par track_id → passées au mapper qui les réconcilie.
-                observations_by_track = self._observations_by_artist(conn, artist_id)
+                # Projection : les LRC bruts (`lyrics_synced`) restent en base.
+                observations_by_track = self._observations_by_artist(
+                    conn, artist_id, exclude_field="lyrics_synced" if lazy else None
+                )
                 _t_obs = time.monotonic()
 
+                # Crédits de TOUT l'artiste en 1 requête, groupés par track_id
+                # (même principe que les observations).
+                try:
+                    credits_by_track = self._credits_by_artist(conn, artist_id)
+                except SQLAlchemyError as credits_error:
+                    logger.debug(f"Erreur _credits_by_artist: {credits_error}")
+                    credits_by_track = None
+
+                # Cache de réconciliation (e14) : verdicts déjà votés, repris par
+                # le mapper tant que l'empreinte des observations concorde.
+                # Import local (anti-cycle utils↔enrich, cf. track_mapper).
+                from src.enrichment.reconcile_cache import ResolutionCache
+
+                try:
+                    resolver = ResolutionCache(self._reconcile_cache_by_artist(conn, artist_id))
+                except SQLAlchemyError as cache_error:
+                    logger.debug(f"Erreur _reconcile_cache_by_artist: {cache_error}")
+                    resolver = ResolutionCache()
+                _t_credits = time.monotonic()
+
                 # Volume des LRC bruts chargés (`lyrics_synced`) : champ lourd
                 # (~3-10 Ko × sources × morceaux), cible désignée de l'optim E7d.
                 _n_obs = sum(len(v) for v in observations_by_track.values())
@@ -375,17 +749,25 @@ class TrackRepository:
                 # `row` est une RowMapping, indexable par nom comme sqlite3.Row).
                 for i, row in enumerate(rows):
                     try:
+                        # Crédits préchargés (requête repository) attachés par le
+                        # mapper, AVANT son instantané de dirty tracking. Échec de
+                        # lecture → None : crédits inconnus, jamais diffés.
                         track = track_from_row(
-                            row, artist, observations_by_track.get(row["id"], [])
+                            row,
+                            artist,
+                            observations_by_track.get(row["id"], []),
+                            (
+                                None
+                                if credits_by_track is None
+                                else credits_by_track.get(row["id"], [])
+                            ),
+                            deferred=loader,
+                            resolver=resolver,
                         )
                         if track is None:
                             continue
-
-                        # Chargement crédits (a besoin de la connexion → hors mapper)
-                        try:
-                            track.credits = self._get_track_credits(conn, row["id"])
-                        except Exception:
-                            track.credits = []
+                        if loader is not None:
+                            loader.register(track)
 
                         result.append(track)
 
@@ -404,66 +786,58 @@ class TrackRepository:
 
                 _t_end = time.monotonic()
                 logger.info(
-                    "⏱ get_artist_tracks: %d tracks, %d obs dont %.0f Ko lyrics_synced "
-                    "en %.2fs (rows %.2fs, obs %.2fs, map+crédits %.2fs)",
+                    "⏱ get_artist_tracks: %d tracks, %d obs dont %.0f Ko lyrics_synced, "
+                    "cache %d/%d en %.2fs (rows %.2fs, obs %.2fs, crédits %.2fs, map %.2fs)",
                     len(result),
                     _n_obs,
                     _lyrics_bytes / 1024,
+                    resolver.hits,
+                    resolver.hits + len(resolver.stale),
                     _t_end - _t0,
                     _t_rows - _t0,
                     _t_obs - _t_rows,
-                    _t_end - _t_obs,
+                    _t_credits - _t_obs,
+                    _t_end - _t_credits,
                 )
 
+            # Hors de la connexion de lecture : verdicts recalculés (absents ou
+            # périmés) remis en cache pour le prochain chargement.
+            self._store_resolutions(resolver.stale)
+
         except Exception as e:
             logger.error(f"❌ Erreur dans get_artist_tracks: {e}")
 
         return result
 
-    def _get_track_credits(self, conn, track_id: int) -> list[Credit]:
-        """Récupère les crédits d'un morceau (connexion Core fournie par l'appelant)."""
-        # Pas d'annotation sur `result` : `Credit` est ré-importé localement dans
-        # la boucle (avec `CreditRole`), donc traité comme variable locale — une
-        # annotation `list[Credit]` ici déclencherait F823 (réf. avant assignation).
-        result = []
-
-        try:
-            credit_rows = (
-                conn.execute(select(credits).where(credits.c.track_id == track_id)).mappings().all()
+    def _credits_by_artist(self, conn, artist_id: int) -> dict[int, list[Credit]]:
+        """Crédits de tous les morceaux d'un artiste, groupés par track_id (1 requête).
+
+        Ordre par morceau = ordre d'insertion (`c.id`), celui de l'ancienne lecture
+        par morceau. Lignes sans nom ou sans rôle ignorées ; source absente →
+        'genius' (défaut historique)."""
+        rows = conn.execute(
+            text(
+                "SELECT c.track_id, c.name, c.role, c.role_detail, c.source "
+                "FROM credits c JOIN tracks t ON t.id = c.track_id "
+                "WHERE t.artist_id = :aid ORDER BY c.id"
+            ),
+            {"aid": artist_id},
+        ).all()
+        role_by_value = _CREDIT_ROLE_BY_VALUE
+        other = CreditRole.OTHER
+        by_track: dict[int, list[Credit]] = {}
+        for track_id, name, role_str, role_detail, source in rows:
+            if not name or not role_str:
+                continue
+            by_track.setdefault(track_id, []).append(
+                Credit(
+                    name=str(name),
+                    role=role_by_value.get(role_str, other),
+                    role_detail=role_detail,
+                    source=str(source or "genius"),
+                )
             )
-
-            for row in credit_rows:
-                try:
-                    name = row["name"]
-                    role_str = row["role"]
-                    role_detail = row["role_detail"]
-                    source = row["source"] or "genius"
-
-                    if name and role_str:
-                        from src.models import Credit, CreditRole
-
-                        # Conversion du rôle string vers enum
-                        try:
-                            role = CreditRole(role_str)
-                        except ValueError:
-                            role = CreditRole.OTHER
-
-                        credit = Credit(
-                            name=str(name),
-                            role=role,
-                            role_detail=role_detail,
-                            source=str(source),
-                        )
-                        result.append(credit)
-
-                except (KeyError, ValueError, TypeError) as credit_error:
-                    logger.debug(f"Erreur crédit: {credit_error}")
-                    continue
-
-        except (SQLAlchemyError, KeyError, ValueError, TypeError) as e:
-            logger.debug(f"Erreur _get_track_credits: {e}")
-
-        return result
+        return by_track
 
     # ──────────────────────────────────────────────────────────────────────
     # Observations (phase E5) — provenance scalaire par (track, field, source).
@@ -477,32 +851,27 @@ class TrackRepository:
     # survivre à un crash : observations + colonnes legacy tombent ensemble).
     # ──────────────────────────────────────────────────────────────────────
 
-    def _observations_by_artist(self, conn, artist_id: int) -> dict[int, list[Observation]]:
+    def _observations_by_artist(
+        self, conn, artist_id: int, *, exclude_field: str | None = None
+    ) -> dict[int, list[Observation]]:
         """Observations de tous les morceaux d'un artiste, groupées par track_id
-        (1 requête, pour la bascule lecture E6). `value`/`seen_at` en brut."""
+        (1 requête, pour la bascule lecture E6). `value`/`seen_at` en brut.
+        `exclude_field` : champ laissé en base (projection E7d : `lyrics_synced`)."""
         rows = (
             conn.execute(
                 text(
                     "SELECT o.track_id, o.field, o.value, o.source, o.confidence, o.seen_at "
                     "FROM observations o JOIN tracks t ON t.id = o.track_id "
-                    "WHERE t.artist_id = :aid"
+                    "WHERE t.artist_id = :aid AND o.field IS NOT :exclude"
                 ),
-                {"aid": artist_id},
+                {"aid": artist_id, "exclude": exclude_field},
             )
             .mappings()
             .all()
         )
         by_track: dict[int, list[Observation]] = {}
         for r in rows:
-            by_track.setdefault(r["track_id"], []).append(
-                Observation(
-                    field=r["field"],
-                    value=r["value"],
-                    source=r["source"],
-                    confidence=r["confidence"],
-                    seen_at=r["seen_at"],
-                )
-            )
+            by_track.setdefault(r["track_id"], []).append(_observation_from_row(r))
         return by_track
 
     def get_observations(self, track_id: int, *, conn=None) -> list[Observation]:
@@ -524,16 +893,116 @@ class TrackRepository:
             .mappings()
             .all()
         )
-        return [
-            Observation(
-                field=r["field"],
-                value=r["value"],
-                source=r["source"],
-                confidence=r["confidence"],
-                seen_at=r["seen_at"],
-            )
-            for r in rows
+        return [_observation_from_row(r) for r in rows]
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Cache de réconciliation (e14, `reconcile_cache`) — donnée DÉRIVÉE des
+    # observations : chaque écriture d'observation purge l'entrée du morceau,
+    # et une entrée dont l'empreinte ne concorde plus est de toute façon
+    # ignorée (écritures hors repository : scripts, migrations).
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _reconcile_cache_by_artist(self, conn, artist_id: int) -> dict[int, tuple[str, str]]:
+        """Entrées du cache des morceaux d'un artiste : track_id → (empreinte, JSON)."""
+        rows = conn.execute(
+            text(
+                "SELECT c.track_id, c.obs_hash, c.resolutions "
+                "FROM reconcile_cache c JOIN tracks t ON t.id = c.track_id "
+                "WHERE t.artist_id = :aid"
+            ),
+            {"aid": artist_id},
+        ).all()
+        return {track_id: (obs_hash, payload) for track_id, obs_hash, payload in rows}
+
+    def _store_resolutions(self, entries: dict[int, tuple[str, str]], *, conn=None) -> None:
+        """Upsert d'entrées du cache (track_id → (empreinte, JSON)). Best-effort :
+        un échec (base verrouillée…) ne coûte qu'un re-vote au prochain chargement."""
+        if not entries:
+            return
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            {"tid": track_id, "hash": obs_hash, "payload": payload, "now": now}
+            for track_id, (obs_hash, payload) in entries.items()
         ]
+        stmt = text(
+            "INSERT INTO reconcile_cache (track_id, obs_hash, resolutions, built_at) "
+            "VALUES (:tid, :hash, :payload, :now) "
+            "ON CONFLICT(track_id) DO UPDATE SET obs_hash = excluded.obs_hash, "
+            "resolutions = excluded.resolutions, built_at = excluded.built_at"
+        )
+        if conn is not None:
+            conn.execute(stmt, rows)
+            return
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(stmt, rows)
+        except SQLAlchemyError as e:
+            logger.warning(f"⚠️ Cache de réconciliation non écrit ({len(rows)} morceaux): {e}")
+
+    def _invalidate_resolutions(self, conn, track_ids) -> None:
+        conn.execute(
+            text("DELETE FROM reconcile_cache WHERE track_id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": list(track_ids)},
+        )
+
+    def rebuild_reconcile_cache(self, artist_id: int | None = None) -> int:
+        """Recalcule le cache de réconciliation d'un artiste (ou de TOUS).
+
+        Vote complet des observations (hors `UNCACHED_FIELDS`) de chaque morceau
+        qui en a, une transaction par artiste ; les entrées des morceaux sans
+        observation (ou disparus) sont purgées. Renvoie le nombre d'entrées écrites.
+        """
+        from src.enrichment.reconcile import reconcile
+        from src.enrichment.reconcile_cache import (
+            UNCACHED_FIELDS,
+            fingerprint,
+            resolutions_to_json,
+        )
+
+        with self.engine.connect() as conn:
+            if artist_id is not None:
+                artist_ids = [artist_id]
+            else:
+                artist_ids = list(
+                    conn.execute(
+                        text("SELECT DISTINCT artist_id FROM tracks WHERE artist_id IS NOT NULL")
+                    ).scalars()
+                )
+
+        written = 0
+        for aid in artist_ids:
+            with self.engine.begin() as conn:
+                by_track: dict[int, list[Observation]] = {}
+                for track_id, observations in self._observations_by_artist(conn, aid).items():
+                    cached = [o for o in observations if o.field not in UNCACHED_FIELDS]
+                    if cached:
+                        by_track[track_id] = cached
+                conn.execute(
+                    text(
+                        "DELETE FROM reconcile_cache WHERE track_id IN "
+                        "(SELECT id FROM tracks WHERE artist_id = :aid)"
+                    ),
+                    {"aid": aid},
+                )
+                entries = {
+                    track_id: (fingerprint(obs), resolutions_to_json(reconcile(obs)))
+                    for track_id, obs in by_track.items()
+                }
+                self._store_resolutions(entries, conn=conn)
+                written += len(entries)
+        if artist_id is None:
+            # Orphelines (morceau supprimé hors repository) : rien ne les relirait.
+            with self.engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "DELETE FROM reconcile_cache "
+                        "WHERE track_id NOT IN (SELECT id FROM tracks)"
+                    )
+                )
+        logger.info(f"🧮 Cache de réconciliation reconstruit : {written} morceau(x)")
+        return written
 
     def upsert_observations(self, track_id: int, observations, *, conn=None) -> None:
         """Upsert les observations d'un morceau (clé (field, source)). No-op si vide."""
@@ -563,32 +1032,50 @@ class TrackRepository:
             text("DELETE FROM observations WHERE track_id = :tid AND field = :field"),
             {"tid": track_id, "field": field},
         )
+        from src.enrichment.reconcile_cache import UNCACHED_FIELDS
+
+        if field not in UNCACHED_FIELDS:
+            self._invalidate_resolutions(conn, [track_id])
 
     def _upsert_observations(self, conn, track_id: int, observations) -> None:
+        rows = []
         for obs in observations:
             # `seen_at` verbatim (string) comme le backfill E4 et le stockage
             # legacy ; datetime → format legacy, absent → maintenant.
             seen_at = obs.seen_at or datetime.now()
             if isinstance(seen_at, datetime):
                 seen_at = seen_at.strftime("%Y-%m-%d %H:%M:%S")
-            conn.execute(
-                text(
-                    "INSERT INTO observations "
-                    "(track_id, field, value, source, confidence, seen_at) "
-                    "VALUES (:tid, :field, :value, :source, :confidence, :seen_at) "
-                    "ON CONFLICT(track_id, field, source) DO UPDATE SET "
-                    "value = excluded.value, confidence = excluded.confidence, "
-                    "seen_at = excluded.seen_at"
-                ),
+            value = None if obs.value is None else str(obs.value)
+            if obs.field in COMPRESSED_OBS_FIELDS:
+                value = encode_text(value)  # LRC brut par source
+            rows.append(
                 {
                     "tid": track_id,
                     "field": obs.field,
-                    "value": None if obs.value is None else str(obs.value),
+                    "value": value,
                     "source": obs.source,
                     "confidence": None if obs.confidence is None else float(obs.confidence),
                     "seen_at": seen_at,
-                },
+                }
             )
+        if not rows:
+            return
+        from src.enrichment.reconcile_cache import UNCACHED_FIELDS
+
+        if any(row["field"] not in UNCACHED_FIELDS for row in rows):
+            self._invalidate_resolutions(conn, [track_id])
+        # Un seul `executemany` pour toutes les observations du morceau.
+        conn.execute(
+            text(
+                "INSERT INTO observations "
+                "(track_id, field, value, source, confidence, seen_at) "
+                "VALUES (:tid, :field, :value, :source, :confidence, :seen_at) "
+                "ON CONFLICT(track_id, field, source) DO UPDATE SET "
+                "value = excluded.value, confidence = excluded.confidence, "
+                "seen_at = excluded.seen_at"
+            ),
+            rows,
+        )
 
     def delete_track(self, track_id: int) -> bool:
         """Supprime définitivement un morceau et ses données associées"""
@@ -603,6 +1090,8 @@ class TrackRepository:
                 conn.execute(
                     text("DELETE FROM observations WHERE track_id = :tid"), {"tid": track_id}
                 )
+                self._invalidate_resolutions(conn, [track_id])
+                search_index.remove_tracks(conn, [track_id])
                 deleted = conn.execute(
                     text("DELETE FROM tracks WHERE id = :tid"), {"tid": track_id}
                 ).rowcount
@@ -655,9 +1144,13 @@ class TrackRepository:
                     text("UPDATE observations SET track_id = :keep_id WHERE track_id = :delete_id"),
                     {"keep_id": keep_id, "delete_id": delete_id},
                 )
+                # Observations du keep changées : verdict à revoter au chargement.
+                self._invalidate_resolutions(conn, [keep_id, delete_id])
                 conn.execute(
                     text("DELETE FROM tracks WHERE id = :delete_id"), {"delete_id": delete_id}
                 )
+                # Crédits transférés : le keep est réindexé, le doublon disparaît.
+                search_index.reindex_tracks(conn, [keep_id, delete_id])
                 logger.info(
                     f"🔀 Track {delete_id} fusionné dans {keep_id} "
                     f"({transferred} crédit(s) transféré(s))"
@@ -667,6 +1160,126 @@ class TrackRepository:
             logger.error(f"Erreur fusion track {delete_id} → {keep_id}: {e}")
             return False
 
+    def find_duplicate_candidates(
+        self, artist_id: int | None = None, *, min_score: float = DEFAULT_MIN_SCORE
+    ) -> list[MergeProposal]:
+        """Propositions de fusion de doublons, d'un artiste ou de TOUT le catalogue.
+
+        Une requête (`get_duplicate_candidates`) puis le moteur ensembliste de
+        `duplicate_detection` (blocage titre normalisé / identifiants / durée,
+        score par paire, regroupement). Chaque proposition s'applique telle
+        quelle : `merge_tracks(p.keep_id, p.delete_id)` — backup à la charge de
+        l'appelant, comme pour toute fusion.
+        """
+        t0 = time.perf_counter()
+        candidates = self.get_duplicate_candidates(artist_id)
+
+        proposals = find_duplicates(candidates, min_score=min_score)
+        logger.info(
+            f"🔁 {len(proposals)} fusion(s) proposée(s) sur {len(candidates)} morceaux "
+            f"({time.perf_counter() - t0:.2f}s)"
+        )
+        return proposals
+
+    def get_duplicate_candidates(
+        self, artist_id: int | None = None, *, title: str | None = None
+    ) -> list[DuplicateCandidate]:
+        """Morceaux vus par le moteur de doublons (d'un artiste ou de tout le
+        catalogue), crédits comptés dans la même requête.
+
+        `title` : ne garde que les morceaux de même titre NORMALISÉ
+        (`normalize_title` : casse, accents, ponctuation) — filtre appliqué
+        après lecture, SQL ne sait pas normaliser.
+        """
+        # Paroles : présence seule (un BLOB compressé n'est jamais blanc) ;
+        # crédits : nombre par morceau, agrégé dans la même requête.
+        sql = (
+            "SELECT t.id, t.artist_id, t.title, t.album, t.duration, t.genius_id, "
+            "t.spotify_id, t.isrc, (t.lyrics IS NOT NULL AND (typeof(t.lyrics) = 'blob' "
+            "OR trim(t.lyrics) NOT IN ('', 'None', 'NULL'))) AS has_lyrics_text, "
+            "COALESCE(c.n, 0) AS credit_count FROM tracks t LEFT JOIN "
+            "(SELECT track_id, COUNT(*) AS n FROM credits GROUP BY track_id) c "
+            "ON c.track_id = t.id" + (" WHERE t.artist_id = :aid" if artist_id is not None else "")
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(sql), {"aid": artist_id}).mappings().all()
+        candidates = [c for c in map(duplicate_candidate_from_row, rows) if c is not None]
+        if title is not None:
+            wanted = normalize_title(title)
+            candidates = [c for c in candidates if c.norm_title == wanted]
+        return candidates
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Recherche plein texte (index FTS5 `track_search`, e16)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        artist_id: int | None = None,
+        *,
+        column: str | None = None,
+        markers: tuple[str, str] = ("[", "]"),
+    ) -> list[dict[str, Any]]:
+        """Recherche dans titres, paroles, anecdotes et noms crédités, TOUS artistes.
+
+        Mots requis (le dernier en préfixe), accents et casse ignorés ; classés
+        par pertinence bm25 (titre et crédits pondérés au-dessus des paroles).
+        `artist_id` restreint à un artiste, `column` à une colonne de l'index
+        ("title", "lyrics", "anecdotes", "credits" — ex. tous les morceaux
+        crédités à un producteur). Chaque résultat : track_id, title, artist_id,
+        artist_name, album, score (plus bas = meilleur) et snippet (extrait de la
+        colonne la plus pertinente, termes entourés de `markers`).
+        """
+        expression = search_index.match_expression(query, column)
+        if expression is None:
+            return []
+        weights = ", ".join(str(w) for w in search_index.BM25_WEIGHTS)
+        sql = (
+            f"SELECT s.rowid AS track_id, t.title, t.artist_id, a.name AS artist_name, "
+            f"t.album, bm25({search_index.SEARCH_TABLE}, {weights}) AS score, "
+            f"snippet({search_index.SEARCH_TABLE}, -1, :open, :close, '…', 12) AS snippet "
+            f"FROM {search_index.SEARCH_TABLE} s "
+            "JOIN tracks t ON t.id = s.rowid "
+            "LEFT JOIN artists a ON a.id = t.artist_id "
+            f"WHERE {search_index.SEARCH_TABLE} MATCH :match"
+            + (" AND t.artist_id = :aid" if artist_id is not None else "")
+            + " ORDER BY score LIMIT :limit"
+        )
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    text(sql),
+                    {
+                        "match": expression,
+                        "aid": artist_id,
+                        "limit": limit,
+                        "open": markers[0],
+                        "close": markers[1],
+                    },
+                ).mappings()
+                return [dict(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Erreur search ({query!r}): {e}")
+            return []
+
+    def rebuild_search_index(self) -> int:
+        """Reconstruit tout l'index plein texte depuis `tracks` et `credits`.
+
+        À lancer après des écritures hors repository (scripts, SQL à la main) ou
+        une restauration de backup. Une transaction. Renvoie le nombre de
+        morceaux indexés.
+        """
+        t0 = time.perf_counter()
+        with self.engine.begin() as conn:
+            indexed = search_index.rebuild(conn)
+        logger.info(
+            f"🔎 Index plein texte reconstruit : {indexed} morceau(x) "
+            f"({time.perf_counter() - t0:.1f}s)"
+        )
+        return indexed
+
     # ──────────────────────────────────────────────────────────────────────────
     # Kworb — streams Spotify
     # ──────────────────────────────────────────────────────────────────────────
@@ -903,6 +1516,7 @@ class TrackRepository:
             )
             with self.engine.begin() as conn:
                 conn.execute(stmt)
+                search_index.reindex_tracks(conn, [track_id])
             return True
         except Exception as e:
             logger.error(f"Erreur rename_track (track_id={track_id}): {e}")
@@ -409,9 +409,12 @@ class UltratopUpdater:
             raise
 
     def _write_clean(self, clean_df):
-        """Écrit le clean `certif_brma.csv` (backup du clean avant, atomique)."""
+        """Écrit le clean `certif_brma.csv` (backup du clean avant, atomique) et
+        publie le delta des lignes pour le matcher (`cert_delta`)."""
         import os
 
+        from src.utils.cert_delta import recording
+
         if self.database_path.exists():
             bdir = self.output_dir / "backups"
             bdir.mkdir(exist_ok=True)
@@ -419,13 +422,14 @@ class UltratopUpdater:
             self.existing_db.to_csv(bf, index=False, encoding="utf-8-sig")
             self.logger.info(f"Backup créé: {bf}")
         tmp_path = self.database_path.with_suffix(".tmp")
-        try:
-            clean_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
-            os.replace(tmp_path, self.database_path)
-        except Exception:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            raise
+        with recording("BRMA", self.database_path):
+            try:
+                clean_df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+                os.replace(tmp_path, self.database_path)
+            except Exception:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
 
     def _clean_from(self, raw_df):
         """Dérive le clean depuis un brut : dédup métier + tri (date desc)."""
@@ -497,6 +497,15 @@ def _write_riaa_meta(source: str = "GLOBAL", count: int | None = None) -> None:
     RIAA_META.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+def _write_clean_csv(clean: pd.DataFrame) -> None:
+    """Écrit le clean certif_riaa.csv et publie le delta des lignes pour le
+    matcher (`cert_delta`)."""
+    from src.utils.cert_delta import recording
+
+    with recording("RIAA", CERTIF_CSV):
+        clean.to_csv(CERTIF_CSV, index=False, encoding="utf-8-sig")
+
+
 def _merge_certif_csv(new_rows: list[dict]) -> tuple:
     """Accumule les lignes scrapées dans le BRUT (riaa_raw.csv, dédup EXACTE) puis
     dérive le CLEAN certif_riaa.csv. Retourne (total_clean, ajoutées_au_brut)."""
@@ -516,7 +525,7 @@ def _merge_certif_csv(new_rows: list[dict]) -> tuple:
         bdir = _RIAA_DIR / "backups"
         bdir.mkdir(exist_ok=True)
         shutil.copy2(CERTIF_CSV, bdir / f"certif_riaa_backup_{datetime.now():%Y%m%d_%H%M%S}.csv")
-    clean.to_csv(CERTIF_CSV, index=False, encoding="utf-8-sig")
+    _write_clean_csv(clean)
     _write_riaa_meta(source="GLOBAL", count=len(clean))
     return (len(clean), len(combined) - before)
 
@@ -554,7 +563,7 @@ def clean_certif_csv() -> tuple:
         bdir.mkdir(exist_ok=True)
         shutil.copy2(CERTIF_CSV, bdir / f"certif_riaa_backup_{datetime.now():%Y%m%d_%H%M%S}.csv")
     clean = _clean_from_raw(raw)
-    clean.to_csv(CERTIF_CSV, index=False, encoding="utf-8-sig")
+    _write_clean_csv(clean)
     _write_riaa_meta(source="CLEAN", count=len(clean))
     print(f"✅ Nettoyage RIAA : {before} → {len(clean)} lignes (-{before - len(clean)})")
     return (before, len(clean))
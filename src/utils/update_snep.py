@@ -351,7 +351,8 @@ def scrape_year(dest_path: Path, year: int, max_pages: int = 400) -> int:
     C'est la brique de backfill / comblement de trous : contrairement au
     rattrapage incrémental (qui s'arrête à la 1re page déjà connue), on
     parcourt toutes les pages de l'année pour garantir la complétude.
-    Retourne le nombre de certifications ajoutées.
+    Retourne le nombre de certifications ajoutées. Voie sync d'UNE année ; le
+    backfill pluriannuel (`backfill_years`) passe par `snep_backfill`.
     """
     session = _get_session()
     header, existing_lines, existing_keys = _load_existing(dest_path)
@@ -481,16 +482,19 @@ def scrape_recent_certifications(dest_path: Path, max_pages: int = 60) -> int:
 
 def _rebuild_canonical(source: str = "GLOBAL") -> tuple[int, int]:
     """Régénère `certif_snep.csv` (+ meta) depuis le brut `certif-.csv` courant
-    (fusion accumulante) et rafraîchit le matcher unifié. Retourne (nb lignes
-    avant, nb lignes après)."""
-    from src.utils.cert_matcher import reset_cert_matcher
+    (fusion accumulante) et publie le delta des lignes (`cert_delta`), que le
+    matcher unifié applique en place (`refresh_cert_matcher`). Retourne (nb
+    lignes avant, nb lignes après)."""
+    from src.utils.cert_delta import recording
     from src.utils.snep_build import read_canonical_csv, rebuild
 
     snep = Path(DATA_PATH) / "certifications" / "snep"
     csv_path = snep / "certif_snep.csv"
     before = len(read_canonical_csv(csv_path)) if csv_path.exists() else 0
-    after = rebuild(snep / "certif-.csv", csv_path, snep / "certif_snep.meta.json", source=source)
-    reset_cert_matcher()
+    with recording("SNEP", csv_path):
+        after = rebuild(
+            snep / "certif-.csv", csv_path, snep / "certif_snep.meta.json", source=source
+        )
     return before, after
 
 
@@ -675,10 +679,16 @@ def fetch_artist_certifications(artist_name: str) -> bool:
     return True
 
 
-def backfill_years(years) -> int:
+def backfill_years(years, concurrency: int | None = None) -> int:
     """Scrape intégralement une ou plusieurs années (filtre ?annee=) dans le
-    CSV maître puis réimporte en base. Brique de comblement de trous.
+    CSV maître puis régénère le clean. Brique de comblement de trous.
+
+    Crawl async concurrent et reprenable (`snep_backfill`) sur la boucle
+    applicative : années en parallèle, jalon par page, fusion unique à la fin.
     """
+    from src.concurrency import async_loop
+    from src.utils.snep_backfill import BACKFILL_CONCURRENCY, backfill
+
     dest_path = Path(DATA_PATH) / "certifications" / "snep" / "certif-.csv"
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -686,9 +696,9 @@ def backfill_years(years) -> int:
     safe_print(f"BACKFILL SNEP — année(s) : {', '.join(str(y) for y in years)}")
     safe_print("=" * 60)
 
-    total = 0
-    for y in years:
-        total += scrape_year(dest_path, int(y))
+    total = async_loop.run_sync(
+        backfill(dest_path, years, concurrency=concurrency or BACKFILL_CONCURRENCY)
+    )
 
     safe_print("\n📄 Régénération du CSV canonique (clean)...")
     _rebuild_canonical(source="SCRAPE")
@@ -726,11 +736,18 @@ def main():
         metavar="AAAA",
         help="Backfill complet d'une année via ?annee= (répétable, ex: --year 2025 --year 2026)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Années scrapées en parallèle pendant un backfill --year (défaut 3)",
+    )
 
     args = parser.parse_args()
 
     if args.year:
-        backfill_years(args.year)
+        backfill_years(args.year, concurrency=args.concurrency)
     elif args.artist:
         fetch_artist_certifications(args.artist)
     elif args.scheduled:
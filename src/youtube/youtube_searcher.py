@@ -1,14 +1,12 @@
 """Recherche YouTube avec fallbacks et cache"""
 
 import difflib
-import pickle
-import sqlite3
-from datetime import datetime, timedelta
 
 import requests
 from ytmusicapi.exceptions import YTMusicError
 
-from src.config import DATA_DIR, YOUTUBE_CACHE_TTL_HOURS
+from src.config import YOUTUBE_CACHE_TTL_HOURS
+from src.persistence.kv_cache import KVCache, default_kv_cache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,9 +15,10 @@ logger = get_logger(__name__)
 class YouTubeSearcher:
     """Recherche YouTube avec ytmusicapi et fallbacks"""
 
-    def __init__(self):
-        self.cache_db = DATA_DIR / "youtube_cache.db"
-        self._init_cache()
+    def __init__(self, cache: KVCache | None = None):
+        self.cache = (cache or default_kv_cache()).namespace(
+            "youtube", ttl=YOUTUBE_CACHE_TTL_HOURS * 3600
+        )
 
         # Tenter d'initialiser ytmusicapi
         try:
@@ -37,28 +36,12 @@ class YouTubeSearcher:
             self.ytmusic = None
             self.ytmusic_available = False
 
-    def _init_cache(self):
-        """Initialise la base de données de cache"""
-        self.cache_db.parent.mkdir(parents=True, exist_ok=True)
-
-        conn = sqlite3.connect(self.cache_db)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS youtube_search_cache (
-                query_hash TEXT PRIMARY KEY,
-                results BLOB,
-                cached_at TIMESTAMP,
-                expires_at TIMESTAMP
-            )
-        """)
-        conn.commit()
-        conn.close()
-
     def search_track(self, artist: str, title: str, max_results: int = 25) -> list[dict]:
         """Recherche principale avec cache et fallbacks"""
 
         # Vérifier le cache d'abord
         cache_key = f"{artist}::{title}".replace(" ", "_").lower()
-        cached_result = self._get_cached_result(cache_key)
+        cached_result = self.cache.get(cache_key)
         if cached_result:
             logger.debug(f"Cache hit pour {artist} - {title}")
             return cached_result
@@ -85,7 +68,7 @@ class YouTubeSearcher:
         if results:
             results = sorted(results, key=lambda x: x.get("relevance_score", 0), reverse=True)
             # Mettre en cache
-            self._cache_result(cache_key, results)
+            self.cache[cache_key] = results
 
         return results
 
@@ -219,37 +202,3 @@ class YouTubeSearcher:
         # Prendre la thumbnail de meilleure qualité
         best_thumb = max(thumbnails, key=lambda x: x.get("width", 0) * x.get("height", 0))
         return best_thumb.get("url")
-
-    def _get_cached_result(self, cache_key: str) -> list[dict] | None:
-        """Récupération depuis le cache"""
-        try:
-            conn = sqlite3.connect(self.cache_db)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT results FROM youtube_search_cache WHERE query_hash = ? AND expires_at > ?",
-                (cache_key, datetime.now()),
-            )
-            result = cursor.fetchone()
-            conn.close()
-
-            if result:
-                return pickle.loads(result[0])
-        except (sqlite3.Error, pickle.PickleError, EOFError, OSError) as e:
-            logger.debug(f"Erreur cache: {e}")
-
-        return None
-
-    def _cache_result(self, cache_key: str, results: list[dict]):
-        """Mise en cache des résultats"""
-        try:
-            conn = sqlite3.connect(self.cache_db)
-            cursor = conn.cursor()
-            expires_at = datetime.now() + timedelta(hours=YOUTUBE_CACHE_TTL_HOURS)
-            cursor.execute(
-                "INSERT OR REPLACE INTO youtube_search_cache (query_hash, results, cached_at, expires_at) VALUES (?, ?, ?, ?)",
-                (cache_key, pickle.dumps(results), datetime.now(), expires_at),
-            )
-            conn.commit()
-            conn.close()
-        except (sqlite3.Error, pickle.PickleError, OSError) as e:
-            logger.debug(f"Erreur mise en cache: {e}")
@@ -18,6 +18,7 @@ from sqlalchemy import create_engine
 from alembic import command
 from src.persistence import schema
 from src.persistence.bootstrap import make_alembic_config
+from src.persistence.search_index import SEARCH_TABLE
 from src.utils.db import Database
 
 
@@ -33,7 +34,8 @@ def _upgrade_head(db_path: str) -> None:
 
 
 def _snapshot(db_path: str) -> dict:
-    """Empreinte du schéma : colonnes (table_info) + UNIQUE, hors alembic_version."""
+    """Empreinte du schéma : colonnes (table_info) + UNIQUE, hors alembic_version
+    et hors index FTS5 `track_search` (e16, non déclarable en MetaData)."""
     with sqlite3.connect(db_path) as conn:
         tables = [
             r[0]
@@ -41,6 +43,7 @@ def _snapshot(db_path: str) -> dict:
                 "SELECT name FROM sqlite_master "
                 "WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name != 'alembic_version'"
             )
+            if r[0] != SEARCH_TABLE and not r[0].startswith(f"{SEARCH_TABLE}_")
         ]
         snap = {}
         for t in sorted(tables):
@@ -278,3 +278,102 @@ def test_e11_backfill_musical_key_orphans(tmp_path):
             "WHERE source = 'legacy' ORDER BY track_id, field"
         ).fetchall()
     assert legacy == [(1, "key", "11"), (1, "mode", "0")]
+
+
+def test_e15_compression_des_paroles_et_retour(tmp_path, monkeypatch):
+    """Compression activée, la révision e15 compresse les paroles/LRC longs déjà
+    en base (tracks + observations lyrics_synced), laisse le reste en clair, et
+    son downgrade restitue le TEXT d'origine."""
+    from alembic import command
+    from src.persistence import text_codec
+    from src.persistence.text_codec import decode_text
+
+    monkeypatch.setattr(text_codec, "DB_TEXT_COMPRESSION", "zlib")
+    path = str(tmp_path / "lyrics.db")
+    _upgrade_to(path, "e14_reconcile_cache")
+    long_lyrics = "Couplet sur plusieurs lignes\n" * 60
+    lrc = "".join(f"[00:{i:02d}.00] ligne {i}\n" for i in range(50))
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO artists (id, name) VALUES (1, 'A')")
+        conn.execute(
+            "INSERT INTO tracks (id, title, artist_id, lyrics, lyrics_synced) "
+            "VALUES (1, 'Long', 1, ?, ?), (2, 'Court', 1, 'deux mots', NULL)",
+            (long_lyrics, lrc),
+        )
+        conn.execute(
+            "INSERT INTO observations (track_id, field, value, source) "
+            "VALUES (1, 'lyrics_synced', ?, 'lrclib'), (1, 'bpm', '120', 'deezer')",
+            (lrc,),
+        )
+        conn.commit()
+
+    _upgrade_to(path, HEAD)  # applique e15
+
+    with sqlite3.connect(path) as conn:
+        types = conn.execute(
+            "SELECT typeof(lyrics), typeof(lyrics_synced) FROM tracks ORDER BY id"
+        ).fetchall()
+        assert types == [("blob", "blob"), ("text", "null")]
+        (lyrics_blob,) = conn.execute("SELECT lyrics FROM tracks WHERE id = 1").fetchone()
+        assert decode_text(lyrics_blob) == long_lyrics
+        obs = dict(conn.execute("SELECT field, typeof(value) FROM observations").fetchall())
+        assert obs == {"lyrics_synced": "blob", "bpm": "text"}
+
+    engine = create_engine(f"sqlite:///{Path(path).as_posix()}")
+    try:
+        with engine.connect() as conn:
+            command.downgrade(make_alembic_config(conn), "e14_reconcile_cache")
+            conn.commit()
+    finally:
+        engine.dispose()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT lyrics, lyrics_synced FROM tracks WHERE id = 1").fetchone() == (
+            long_lyrics,
+            lrc,
+        )
+        assert conn.execute(
+            "SELECT value FROM observations WHERE field = 'lyrics_synced'"
+        ).fetchone() == (lrc,)
+
+
+def test_e16_index_plein_texte_alimente_puis_droppe(tmp_path):
+    """La révision e16 crée `track_search` et y indexe le catalogue existant —
+    paroles compressées (e15) décodées, noms crédités agrégés — ; son downgrade
+    la droppe avec ses tables fantômes."""
+    from alembic import command
+    from src.persistence.text_codec import encode_text
+
+    path = str(tmp_path / "search.db")
+    _upgrade_to(path, "e15_compress_lyrics")
+    lyrics = encode_text("Refrain du papillon bleu\n" * 40, "zlib")
+    assert isinstance(lyrics, bytes)
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO artists (id, name) VALUES (1, 'A')")
+        conn.execute(
+            "INSERT INTO tracks (id, title, artist_id, lyrics) VALUES (1, 'Long', 1, ?)",
+            (lyrics,),
+        )
+        conn.execute("INSERT INTO credits (track_id, name, role) VALUES (1, 'Kore', 'Producer')")
+        conn.commit()
+
+    _upgrade_to(path, HEAD)  # applique e16
+
+    with sqlite3.connect(path) as conn:
+        for term in ("papillon", "kore"):
+            assert conn.execute(
+                "SELECT rowid FROM track_search WHERE track_search MATCH ?", (term,)
+            ).fetchall() == [(1,)]
+
+    engine = create_engine(f"sqlite:///{Path(path).as_posix()}")
+    try:
+        with engine.connect() as conn:
+            command.downgrade(make_alembic_config(conn), "e15_compress_lyrics")
+            conn.commit()
+    finally:
+        engine.dispose()
+
+    with sqlite3.connect(path) as conn:
+        assert not conn.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE 'track_search%'"
+        ).fetchall()
@@ -11,11 +11,14 @@ import httpx
 
 from src.api.async_http import AsyncHttpSession
 from src.api.deezer_api import DeezerAPI
+from src.api.genius_api import GeniusAPI
 from src.api.getsongbpm_api import GetSongBPMFetcher
 from src.api.lrclib_api import LRCLIBAPI
 from src.api.musixmatch_api import MusixmatchAPI
 from src.api.reccobeats_api import ReccoBeatsIntegratedClient
-from src.concurrency.rate_limiter import DomainRateLimiter
+from src.concurrency.rate_limiter import DOMAIN_POLICIES, DomainRateLimiter
+from src.models import Artist
+from src.persistence.kv_cache import KVCache
 
 
 def _http(handler) -> AsyncHttpSession:
@@ -87,13 +90,41 @@ def test_deezer_api_error_payload_gives_none():
     assert asyncio.run(DeezerAPI().get_isrc_async(_http(handler), "X", "Solo")) is None
 
 
+def test_deezer_quota_signale_au_limiteur_puis_redemande():
+    replies = iter(
+        [
+            {"error": {"type": "Exception", "message": "Quota limit exceeded", "code": 4}},
+            {"data": [_DEEZER_HIT]},
+        ]
+    )
+    sleeps = []
+    now = [0.0]
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = DomainRateLimiter(
+        0.0, policies=DOMAIN_POLICIES, clock=lambda: now[0], sleep=fake_sleep
+    )
+    http = AsyncHttpSession(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=next(replies))),
+        limiter=limiter,
+    )
+
+    assert asyncio.run(DeezerAPI().get_isrc_async(http, "X", "Solo")) == "FRXXX2000001"
+    stats = http.rate_stats()["api.deezer.com"]
+    assert (stats.requests, stats.throttled) == (2, 1) and stats.pace < 1.0
+    assert sleeps  # domaine suspendu avant le nouvel essai
+
+
 # ──────────────────────────────────────────────────────────────────────
 # GetSongBPM
 # ──────────────────────────────────────────────────────────────────────
 
 
 def _gsb_fetcher(tmp_path) -> GetSongBPMFetcher:
-    return GetSongBPMFetcher(api_key="k", cache_file=str(tmp_path / "gsb_cache.json"))
+    return GetSongBPMFetcher(api_key="k", cache=KVCache(tmp_path / "cache.db"))
 
 
 def test_getsongbpm_fetch_async_success_and_cache(tmp_path):
@@ -165,7 +196,7 @@ def test_getsongbpm_fetch_async_wrong_artist_rejected(tmp_path):
 
 
 def _recco(tmp_path) -> ReccoBeatsIntegratedClient:
-    return ReccoBeatsIntegratedClient(cache_file=str(tmp_path / "recco_cache.json"))
+    return ReccoBeatsIntegratedClient(cache=KVCache(tmp_path / "cache.db"))
 
 
 def test_recco_get_track_info_async(tmp_path):
@@ -389,3 +420,144 @@ def test_mxm_async_retry_after_envelope_401(monkeypatch, tmp_path):
     assert res["lyrics_synced"] == _MXM_LRC
     assert calls["macro"] == 2  # 1 échec auth + 1 retry OK
     assert calls["token"] == 2  # token initial + refresh forcé
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Genius (discographie + prefill)
+# ──────────────────────────────────────────────────────────────────────
+
+_GENIUS_ARTIST = Artist(name="Isha", genius_id=7)
+
+
+def _genius() -> GeniusAPI:
+    # __init__ exige GENIUS_API_KEY et construit le client lyricsgenius (voie sync)
+    return GeniusAPI.__new__(GeniusAPI)
+
+
+def _genius_song(song_id: int, primary_id: int = 7, **extra) -> dict:
+    return {
+        "id": song_id,
+        "title": f"Titre {song_id}",
+        "url": f"https://genius.com/{song_id}",
+        "primary_artist": {"id": primary_id, "name": "Isha" if primary_id == 7 else "Autre"},
+        **extra,
+    }
+
+
+def _genius_handler(pages: dict[int, list[dict]], details: dict | None = None, calls=None):
+    async def handler(request):
+        path = request.url.path
+        if calls is not None:
+            calls.append(path)
+        await asyncio.sleep(0.01)
+        if path == "/artists/7/songs":
+            songs = pages.get(int(request.url.params["page"]), [])
+            return httpx.Response(200, json={"response": {"songs": songs}})
+        song_id = int(path.rsplit("/", 1)[1])
+        song = (details or {}).get(song_id, {"id": song_id})
+        return httpx.Response(200, json={"response": {"song": song}})
+
+    return handler
+
+
+def test_genius_iter_artist_songs_async_rend_les_pages_dans_l_ordre():
+    pages = {
+        1: [_genius_song(i) for i in range(50)],
+        2: [_genius_song(i) for i in range(50, 100)],
+        3: [_genius_song(i) for i in range(100, 110)],
+    }
+    calls = []
+
+    async def scenario():
+        http = _http(_genius_handler(pages, calls=calls))
+        return [
+            [t.genius_id for t in batch]
+            async for batch in _genius().iter_artist_songs_async(http, _GENIUS_ARTIST, 500)
+        ]
+
+    batches = asyncio.run(scenario())
+    assert [len(b) for b in batches] == [50, 50, 10]
+    assert sum(batches, []) == list(range(110))
+    assert "/artists/7/songs" in calls
+
+
+def test_genius_iter_artist_songs_async_max_songs_et_feats():
+    # Page 1 : un feat (id dans featured_artists), un tag douteux jeté, un primaire
+    feat = _genius_song(2, primary_id=99, featured_artists=[{"id": 7}])
+    page = [_genius_song(1), feat, _genius_song(3, primary_id=99), _genius_song(4)]
+
+    async def scenario(**kw):
+        http = _http(_genius_handler({1: page}))
+        return [
+            t
+            async for batch in _genius().iter_artist_songs_async(http, _GENIUS_ARTIST, **kw)
+            for t in batch
+        ]
+
+    tracks = asyncio.run(scenario(max_songs=10, include_features=True))
+    assert [t.genius_id for t in tracks] == [1, 2, 4]
+    assert tracks[1].is_featuring and tracks[1].primary_artist_name == "Autre"
+    assert [t.genius_id for t in asyncio.run(scenario(max_songs=1))] == [1]
+
+
+def test_genius_roles_secondaires_verifies_au_detail_async():
+    page = [_genius_song(5, primary_id=99), _genius_song(6, primary_id=99)]
+    details = {
+        5: {
+            "id": 5,
+            "custom_performances": [{"label": "Additional Vocals", "artists": [{"id": 7}]}],
+        },
+        6: {"id": 6, "writer_artists": [{"id": 8}]},  # pas NOTRE artiste
+    }
+
+    async def scenario():
+        http = _http(_genius_handler({1: page}, details))
+        return await _genius().get_artist_songs_async(
+            http, _GENIUS_ARTIST, include_features=True, include_secondary=True, prefill=False
+        )
+
+    tracks = asyncio.run(scenario())
+    assert [t.genius_id for t in tracks] == [5]
+    assert tracks[0].secondary_role == "Additional Vocals"
+
+
+def test_genius_get_artist_songs_async_prefill_cible_et_concurrent():
+    page = [_genius_song(i) for i in range(1, 5)]
+    details = {
+        i: {
+            "id": i,
+            "album": {"name": "Album"},
+            "media": [{"provider": "spotify", "native_uri": f"spotify:track:sp{i}"}],
+        }
+        for i in range(1, 5)
+    }
+    calls, in_flight, peak, pages_seen = [], 0, 0, []
+    base = _genius_handler({1: page}, details, calls)
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await base(request)
+        finally:
+            in_flight -= 1
+
+    async def scenario():
+        http = AsyncHttpSession(
+            transport=httpx.MockTransport(handler),
+            limiter=DomainRateLimiter(0.0, policies=DOMAIN_POLICIES),
+        )
+        return await _genius().get_artist_songs_async(
+            http, _GENIUS_ARTIST, known_genius_ids={4}, on_tracks=pages_seen.append
+        )
+
+    tracks = asyncio.run(scenario())
+    assert len(pages_seen) == 1 and len(tracks) == 4
+    assert sorted(c for c in calls if c.startswith("/songs/")) == [
+        "/songs/1",
+        "/songs/2",
+        "/songs/3",
+    ]
+    assert [t.album for t in tracks] == ["Album", "Album", "Album", None]  # 4 : exclu (MàJ)
+    assert peak > 1  # détails en parallèle (budget api.genius.com)
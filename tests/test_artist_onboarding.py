@@ -0,0 +1,123 @@
+"""Tests de l'import en flux d'un artiste (`onboard_artist`) — dépendances factices."""
+
+import asyncio
+
+from src.models import Artist, Track
+from src.utils.artist_onboarding import OnboardingOptions, onboard_artist
+
+
+class _FakeGenius:
+    def __init__(self, pages, log):
+        self.pages, self.log = pages, log
+
+    async def iter_artist_songs_async(self, http, artist, max_songs, **kw):
+        for page in self.pages:
+            await asyncio.sleep(0.001)
+            yield [Track(title=f"T{gid}", artist=artist, genius_id=gid) for gid in page]
+
+    async def prefill_track_async(self, http, track):
+        self.log.append(("prefill", track.genius_id))
+        track.album = "Album"
+        return True
+
+
+class _FakeScraper:
+    def __init__(self, log):
+        self.log = log
+
+    async def scrape_track_credits_async(self, track):
+        self.log.append(("credits", track.genius_id))
+        if track.genius_id == 3:
+            raise RuntimeError("page bloquée")
+        track.lyrics.text, track.lyrics.present = "paroles", True
+        return []
+
+
+class _FakeLyrics:
+    def __init__(self, log):
+        self.log = log
+
+    def enrich(self, track, artist_name, *, need_sync, need_text):
+        self.log.append(("sync", track.genius_id, need_text))
+
+
+class _FakeEnricher:
+    def __init__(self, log):
+        self.log = log
+        self.closed = False
+
+    async def enrich_track_async(self, track, sources=None, artist_tracks=None):
+        self.log.append(("enrich", track.genius_id))
+        return {}
+
+    async def aclose_batch(self):
+        self.closed = True
+
+
+class _FakeDataManager:
+    def __init__(self, log):
+        self.log = log
+        self.batches = []
+
+    def save_tracks(self, tracks):
+        self.batches.append([t.genius_id for t in tracks])
+        for t in tracks:
+            self.log.append(("save", t.genius_id))
+            t.id = 1000 + t.genius_id
+        return [t.id for t in tracks]
+
+
+class _FakeHttp:
+    async def aclose(self):
+        pass
+
+
+def _run(pages, options=None, known=()):
+    log = []
+    artist = Artist(name="Isha", genius_id=7, id=1)
+    artist.tracks = [Track(title=f"T{gid}", artist=artist, genius_id=gid) for gid in known]
+    enricher, dm = _FakeEnricher(log), _FakeDataManager(log)
+    result = asyncio.run(
+        onboard_artist(
+            artist,
+            options or OnboardingOptions(),
+            genius_api=_FakeGenius(pages, log),
+            data_manager=dm,
+            data_enricher=enricher,
+            http=_FakeHttp(),
+            credits_scraper=_FakeScraper(log),
+            lyrics_provider=_FakeLyrics(log),
+        )
+    )
+    return result, log, enricher, dm
+
+
+def test_chaque_nouveau_morceau_traverse_les_etapes_dans_l_ordre():
+    result, log, enricher, dm = _run([[1, 2], [3, 4]], known=[2])
+
+    assert sorted(t.genius_id for t in result.items) == [1, 3, 4]  # 2 : déjà connu
+    for gid in (1, 3, 4):
+        steps = [entry[0] for entry in log if entry[1] == gid]
+        assert steps == ["prefill", "credits", "sync", "enrich", "save"]
+    assert all(t.album == "Album" and t.id for t in result.items)
+    assert enricher.closed
+
+
+def test_echec_de_scrape_n_empeche_pas_le_save():
+    result, log, _, _ = _run([[3]])
+
+    assert result.stats["credits"].failed == 1
+    assert ("save", 3) in log
+    assert ("sync", 3, True) in log  # pas de texte Genius → fallback texte demandé
+
+
+def test_etapes_desactivees_et_ids_ignores():
+    options = OnboardingOptions(
+        credits=False, synced_lyrics=False, enrich_sources=[], skip_genius_ids={1}
+    )
+    result, log, _, dm = _run([[1, 2, 3]], options)
+
+    assert list(result.stats) == ["prefill", "save"]
+    assert sorted(t.genius_id for t in result.items) == [2, 3]
+    assert {entry[0] for entry in log} == {"prefill", "save"}
+    assert sum(dm.batches, []) and 1 not in sum(dm.batches, [])
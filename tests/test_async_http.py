@@ -111,3 +111,22 @@ def test_http_errors_propagate():
         return "not raised"
 
     assert asyncio.run(scenario()) == "raised"
+
+
+def test_429_retry_after_reported_to_limiter():
+    statuses = iter([429, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), headers={"Retry-After": "3"}, json={})
+
+    session, clock = _session(handler)
+
+    async def scenario():
+        first = await session.get("https://api.deezer.com/a")
+        second = await session.get("https://api.deezer.com/a")  # domaine suspendu 3 s
+        return first.status_code, second.status_code
+
+    assert asyncio.run(scenario()) == (429, 200)  # le 429 reste visible de l'appelant
+    assert clock.sleeps == [3.0]
+    stats = session.rate_stats()["api.deezer.com"]
+    assert (stats.requests, stats.throttled) == (2, 1)
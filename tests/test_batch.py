@@ -0,0 +1,155 @@
+"""Tests du batch headless multi-artistes (`src.batch`) — dépendances factices."""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from src.batch import (
+    STEP_ENRICH,
+    STEP_KWORB,
+    STEP_LYRICS,
+    STEP_YTM,
+    BatchOptions,
+    JsonLinesEmitter,
+    build_parser,
+    reserved_stdout,
+    run_batch,
+    split_round_robin,
+)
+from src.models import Artist, Track
+
+
+class _FakeDataManager:
+    def __init__(self, artists):
+        self.artists = artists
+        self.saved = []
+
+    def get_artist_by_name(self, name):
+        if name == "Crash":
+            raise RuntimeError("base verrouillée")
+        return self.artists.get(name)
+
+    def save_tracks(self, tracks):
+        self.saved.extend(t.title for t in tracks)
+        return [t.id for t in tracks]
+
+
+class _FakeEnricher:
+    def __init__(self):
+        self.calls, self.closed = [], False
+
+    async def enrich_track_async(self, track, sources=None, force_update=False, artist_tracks=None):
+        self.calls.append((track.title, sources, force_update))
+        return {}
+
+    async def aclose_batch(self):
+        self.closed = True
+
+
+class _FakeLyrics:
+    def __init__(self):
+        self.calls = []
+
+    def enrich(self, track, artist_name, *, need_sync, need_text):
+        self.calls.append((track.title, artist_name))
+
+
+class _FakeStreams:
+    closed = 0
+
+    def fetch_spotify(self, artist, data_manager):
+        return {"updated": len(artist.tracks), "not_found": ["x"]}
+
+    def fetch_ytm(self, artist, data_manager):
+        return {"error": "quota"}
+
+    def close(self):
+        _FakeStreams.closed += 1
+
+
+def _artiste(name, n):
+    artist = Artist(name=name, id=n)
+    artist.tracks = [Track(title=f"{name}-{i}", artist=artist, id=i + 1) for i in range(n)]
+    return artist
+
+
+def _run(names, options):
+    dm = _FakeDataManager({"Isha": _artiste("Isha", 3), "Damso": _artiste("Damso", 2)})
+    enricher, lyrics, out = _FakeEnricher(), _FakeLyrics(), io.StringIO()
+    reports = asyncio.run(
+        run_batch(
+            names,
+            options,
+            emit=JsonLinesEmitter(out, interval=3600),
+            data_manager=dm,
+            data_enricher=enricher,
+            lyrics=lyrics,
+            streams_factory=_FakeStreams,
+        )
+    )
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    return reports, events, dm, enricher, lyrics
+
+
+def test_chaque_artiste_traverse_les_etapes_et_emet_du_json():
+    options = BatchOptions(
+        steps=(STEP_ENRICH, STEP_LYRICS), sources=["deezer"], artists_concurrency=2
+    )
+    reports, events, dm, enricher, lyrics = _run(["Isha", "Damso"], options)
+
+    assert [r.artist for r in reports] == ["Isha", "Damso"] and all(r.ok for r in reports)
+    assert sorted(dm.saved) == ["Damso-0", "Damso-1", "Isha-0", "Isha-1", "Isha-2"]
+    assert all(c[1:] == (["deezer"], False) for c in enricher.calls) and enricher.closed
+    assert ("Isha-0", "Isha") in lyrics.calls
+    assert reports[0].stages == {
+        "enrich": {"done": 3, "failed": 0},
+        "lyrics": {"done": 3, "failed": 0},
+        "save": {"done": 3, "failed": 0},
+    }
+
+    kinds = [e["event"] for e in events]
+    assert kinds.count("artist_start") == 2 and kinds.count("artist_done") == 2
+    assert kinds.count("progress") == 2  # throttlé : une ligne par artiste
+    assert all("ts" in e for e in events)
+
+
+def test_etapes_streams_et_erreur_isolee_par_artiste():
+    options = BatchOptions(steps=(STEP_KWORB, STEP_YTM))
+    reports, events, dm, enricher, _ = _run(["Crash", "Inconnu", "Isha"], options)
+
+    crash, unknown, isha = reports
+    assert not crash.ok and "verrouillée" in crash.error
+    assert not unknown.ok and "absent" in unknown.error
+    assert isha.steps[STEP_KWORB] == {"status": "ok", "updated": 3}  # listes écartées
+    assert isha.steps[STEP_YTM] == {"status": "error", "error": "quota"}
+    assert not isha.ok and dm.saved == [] and enricher.calls == []
+
+    assert [e["event"] for e in events].count("artist_error") == 2
+    assert [e["step"] for e in events if e["event"] == "step"] == [STEP_KWORB, STEP_YTM]
+
+
+def test_repartition_et_arguments():
+    assert split_round_robin(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+    assert split_round_robin(["a"], 4) == [["a"]]
+
+    args = build_parser().parse_args(["Isha", "--steps", "enrich,ytm", "--processes", "2"])
+    assert args.artists == ["Isha"] and args.steps == ("enrich", "ytm") and args.processes == 2
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["Isha", "--steps", "enrich,inconnue"])
+
+
+def test_stdout_reserve_aux_evenements_json(capsys):
+    with reserved_stdout() as out:
+        emit = JsonLinesEmitter(out)
+        emit("start", artists=["Isha"])
+        print("⏳ Rate limit GetSongBPM, attente 60s")  # print() d'un client API
+        emit("done", ok=1)
+    print("après le run")
+
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert [json.loads(line)["event"] for line in lines[:2]] == ["start", "done"]
+    assert lines[2:] == ["après le run"]  # stdout rendu à la sortie
+    assert "Rate limit GetSongBPM" in captured.err
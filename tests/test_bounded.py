@@ -0,0 +1,88 @@
+"""Tests de la concurrence bornée (`run_bounded`, `KeyedSlots`) — sans réseau."""
+
+import asyncio
+
+import pytest
+
+from src.concurrency.bounded import KeyedSlots, run_bounded
+
+
+class _Probe:
+    """Worker qui rend la main et mesure le pic d'unités en vol."""
+
+    def __init__(self, delays=None):
+        self.in_flight = 0
+        self.peak = 0
+        self.started: list = []
+        self._delays = delays or {}
+
+    async def __call__(self, item):
+        self.started.append(item)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays.get(item, 0.001))
+            return item * 10
+        finally:
+            self.in_flight -= 1
+
+
+def test_resultats_dans_l_ordre_des_elements_et_limite_respectee():
+    # L'élément 0 finit le dernier : l'ordre rendu reste celui des éléments.
+    probe = _Probe(delays={0: 0.02})
+    done = asyncio.run(run_bounded(range(6), probe, limit=3))
+
+    assert done == [(i, i * 10) for i in range(6)]
+    assert probe.peak == 3
+
+
+def test_limite_1_sequentielle():
+    probe = _Probe()
+    asyncio.run(run_bounded(range(4), probe, limit=1))
+    assert probe.peak == 1
+
+
+def test_arret_entre_deux_elements_les_elements_en_vol_finissent():
+    probe = _Probe()
+    verdicts = iter([False, False, False, True])
+    done = asyncio.run(run_bounded(range(10), probe, limit=2, should_stop=lambda: next(verdicts)))
+
+    assert probe.started == [0, 1, 2]
+    assert [item for item, _ in done] == [0, 1, 2]
+
+
+def test_exception_annule_les_autres_et_remonte():
+    cancelled = []
+
+    async def worker(item):
+        if item == 1:
+            raise RuntimeError("panne simulée")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_bounded(range(3), worker, limit=3))
+    assert sorted(cancelled) == [0, 2]
+
+
+def test_slots_par_cle():
+    slots = KeyedSlots()
+    peaks = {"a": 0, "b": 0}
+    in_flight = {"a": 0, "b": 0}
+
+    async def hold(key, limit):
+        async with slots.slot(key, limit):
+            in_flight[key] += 1
+            peaks[key] = max(peaks[key], in_flight[key])
+            await asyncio.sleep(0.001)
+            in_flight[key] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(hold("a", 1) for _ in range(4)), *(hold("b", 3) for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peaks == {"a": 1, "b": 3}
+    asyncio.run(scenario())  # nouvelle boucle : sémaphores neufs, pas de RuntimeError
@@ -0,0 +1,153 @@
+"""Tests des deltas de certifications (`cert_delta`) et de `CertMatcher.refresh`.
+
+CSV SNEP/BRMA minimaux dans un data/ temporaire (`DATA_PATH` redirigé) : les
+updaters y publient leur delta, le matcher l'applique en place — et doit
+alors répondre exactement comme un magasin rechargé depuis les CSV.
+"""
+
+import pandas as pd
+import pytest
+
+from src.models import Artist, Track
+from src.utils import cert_delta, cert_matcher
+from src.utils.cert_matcher import CertMatcher, affected_artists
+from src.utils.certification_enricher import recertify_affected
+
+_HEADER = "artist,title,publisher,category,certification,release_date,certification_date\n"
+_SNEP = (
+    "Damso,Macarena,92i,Singles,Diamant,2017-04-28,2019-07-03\n"
+    "Booba,Dolce Vita,92i,Singles,Or,2021-01-01,2021-06-01\n"
+)
+_BRMA = (
+    "artist,title,category,certification_level,certification_date,detail_url\n"
+    "Angèle,Balance ton quoi,singles,Or,2019-06-01,https://www.ultratop.be/x\n"
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    for body, content in (("snep", _HEADER + _SNEP), ("brma", _BRMA)):
+        folder = tmp_path / "certifications" / body
+        folder.mkdir(parents=True)
+        (folder / f"certif_{body}.csv").write_text(content, encoding="utf-8")
+    monkeypatch.setattr(cert_matcher, "DATA_PATH", str(tmp_path))
+    monkeypatch.setattr(cert_delta, "DATA_PATH", str(tmp_path))
+    return tmp_path
+
+
+def _update_snep(data_dir, rows: str) -> None:
+    """Réécrit le CSV clean SNEP comme un updater : sous `recording`."""
+    csv = data_dir / "certifications" / "snep" / "certif_snep.csv"
+    with cert_delta.recording("SNEP", csv):
+        csv.write_text(_HEADER + rows, encoding="utf-8")
+
+
+def _no_csv(monkeypatch):
+    def fail(self):
+        raise AssertionError("magasin rechargé alors que le delta suffisait")
+
+    monkeypatch.setattr(CertMatcher, "_load_all", fail)
+    monkeypatch.setattr(CertMatcher, "_load_cached", fail)
+
+
+def _same_answers(refreshed: CertMatcher) -> None:
+    fresh = CertMatcher(use_cache=False)
+    assert sorted(refreshed._records, key=str) == sorted(fresh._records, key=str)
+    for artist, title in (("Damso", "Macarena"), ("Jul", "Tchikita"), ("Booba", "Dolce Vita")):
+        assert refreshed.get_track_certifications(artist, title) == (
+            fresh.get_track_certifications(artist, title)
+        )
+        assert refreshed.get_artist_certifications(artist) == (
+            fresh.get_artist_certifications(artist)
+        )
+
+
+def test_recording_publie_lignes_ajoutees_et_retirees(data_dir):
+    _update_snep(data_dir, _SNEP.replace("Or,", "Platine,") + "Jul,Tchikita,,Singles,Or,,2020\n")
+    _update_snep(data_dir, _SNEP.replace("Or,", "Platine,") + "Jul,Tchikita,,Singles,Or,,2020\n")
+
+    entry, same = cert_delta.read_journal()
+    assert entry["body"] == "SNEP" and entry["before"] != entry["after"]
+    assert sorted(r["title"] for r in entry["added"]) == ["Dolce Vita", "Tchikita"]
+    assert [(r["title"], r["certification"]) for r in entry["removed"]] == [("Dolce Vita", "Or")]
+    # Réécriture identique : delta vide, mais publié (chaîne d'empreintes continue)
+    assert same["before"] == entry["after"] and same["added"] == same["removed"] == []
+
+
+def test_refresh_applique_le_delta_en_place(data_dir, monkeypatch):
+    matcher = CertMatcher()
+    assert matcher.get_track_certifications("Jul", "Tchikita") == []
+    _update_snep(data_dir, _SNEP.replace("Or,", "Platine,") + "Jul,Tchikita,,Singles,Or,,2020\n")
+
+    with monkeypatch.context() as m:
+        _no_csv(m)
+        touched = matcher.refresh()
+
+    assert touched == {"JUL", "BOOBA"}
+    assert matcher.version == 1
+    assert matcher.get_track_certifications("Jul", "Tchikita")[0]["certification"] == "Or"
+    assert matcher.get_track_certifications("Booba", "Dolce Vita")[0]["certification"] == (
+        "Platine"
+    )
+    assert matcher.refresh() == set()  # déjà à jour
+    _same_answers(matcher)
+
+
+def test_refresh_retrait_et_chaine_de_deltas(data_dir, monkeypatch):
+    matcher = CertMatcher()
+    _update_snep(data_dir, _SNEP + "Jul,Tchikita,,Singles,Or,,2020\n")
+    _update_snep(data_dir, "Jul,Tchikita,,Singles,Or,,2020\n")  # Damso + Booba retirés
+
+    with monkeypatch.context() as m:
+        _no_csv(m)
+        assert matcher.refresh() == {"JUL", "DAMSO", "BOOBA"}
+    assert matcher.version == 2
+    assert matcher.get_track_certifications("Damso", "Macarena") == []
+    _same_answers(matcher)
+
+
+def test_csv_modifie_hors_journal_recharge_tout(data_dir):
+    matcher = CertMatcher()
+    csv = data_dir / "certifications" / "snep" / "certif_snep.csv"
+    csv.write_text(_HEADER + _SNEP + "Jul,Tchikita,,Singles,Or,,2020\n", encoding="utf-8")
+
+    assert matcher.refresh() is None
+    assert matcher.get_track_certifications("Jul", "Tchikita")[0]["certification"] == "Or"
+
+
+def test_seuls_les_artistes_touches_sont_rematches(data_dir):
+    matcher = CertMatcher()
+    _update_snep(data_dir, _SNEP + "Jul,Tchikita,,Singles,Or,,2020\n")
+    touched = matcher.refresh()
+    assert affected_artists(["Jul", "Damso", "Angèle"], touched) == ["Jul"]
+
+    jul = Artist(name="Jul")
+    jul.tracks = [Track(title="Tchikita", artist=jul)]
+    saved = []
+
+    class _DM:
+        def get_artist_names(self):
+            return ["Angèle", "Damso", "Jul"]
+
+        def get_artist_by_name(self, name):
+            raise AssertionError(f"{name} relu alors qu'il n'est pas touché / déjà chargé")
+
+        def save_tracks(self, tracks):
+            saved.extend(tracks)
+
+    assert recertify_affected(_DM(), matcher, touched, loaded=[jul]) == {"Jul": 1}
+    assert saved == jul.tracks and jul.tracks[0].certs.level == "Or"
+    assert recertify_affected(_DM(), matcher, set()) == {}
+
+
+def test_delta_brma_applique_comme_au_chargement(data_dir, monkeypatch):
+    matcher = CertMatcher()
+    csv = data_dir / "certifications" / "brma" / "certif_brma.csv"
+    with cert_delta.recording("BRMA", csv):
+        pd.read_csv(csv).assign(certification_level="Platine").to_csv(csv, index=False)
+
+    with monkeypatch.context() as m:
+        _no_csv(m)
+        assert matcher.refresh() == {"ANGELE"}
+    (cert,) = matcher.get_track_certifications("Angèle", "Balance ton quoi")
+    assert (cert["certification"], cert["flag"]) == ("Platine", "🇧🇪")
@@ -0,0 +1,191 @@
+"""Tests de l'index du CertMatcher (`_CertIndex`) : stratégies S1→S4 sur un
+magasin contrôlé, puis test DORÉ sur les données réelles de data/ contre les
+anciens masques pandas (référence figée ci-dessous) — mêmes lignes, même ordre.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.config import DATA_PATH
+from src.utils.cert_matcher import _FEAT_RE, CertMatcher, _CertIndex
+from src.utils.cert_normalize import normalize_text as N
+
+
+def _legacy_track_match_indices(df: pd.DataFrame, a: str, t: str) -> list[int]:
+    """Ancien `_track_match_indices` (masques pandas sur tout le magasin)."""
+    if df.empty or not a:
+        return []
+    seen: list[int] = []
+    sset = set()
+
+    def add(sub):
+        for idx in sub.index:
+            if idx not in sset:
+                sset.add(idx)
+                seen.append(idx)
+
+    ac = df["artist_clean"]
+    tc = df["title_clean"]
+    if not t:
+        add(df[(ac == a) & (tc == "")])
+        return seen
+    s1 = df[(ac == a) & (tc == t)]
+    if s1.empty:
+        s1 = df[
+            ac.str.contains(a, regex=False, na=False) & tc.str.contains(t, regex=False, na=False)
+        ]
+    add(s1)
+    m = _FEAT_RE.match(t)
+    if m:
+        main = m.group(1).strip()
+        s2 = df[(ac == a) & (tc == main)]
+        if s2.empty and main:
+            s2 = df[
+                ac.str.contains(a, regex=False, na=False)
+                & tc.str.contains(main, regex=False, na=False)
+            ]
+        add(s2)
+    add(df[ac.str.contains(a, regex=False, na=False) & tc.str.contains(t, regex=False, na=False)])
+    if not seen and len(t) >= 8:
+        cand = df[(ac == a) & tc.str.len().between(8, len(t) - 1)]
+        if not cand.empty:
+            add(cand[cand["title_clean"].apply(lambda x: isinstance(x, str) and t.startswith(x))])
+    return seen
+
+
+def _matcher_with(rows) -> CertMatcher:
+    m = CertMatcher.__new__(CertMatcher)  # bypass __init__ (pas de chargement)
+    m._norm = N
+    m.df = pd.DataFrame(
+        [{"artist_clean": N(a), "title_clean": N(t), "cat": cat} for a, t, cat in rows]
+    )
+    m._index = _CertIndex(m.df)
+    return m
+
+
+_ROWS = [
+    ("Williams", "Happy", "single"),
+    ("IAM", "Petit frère", "single"),
+    ("IAM feat. Jul", "Happy days", "single"),
+    ("Damso", "Macarena", "single"),
+    ("Damso", "Lithopédion", "album"),
+    ("Damso", "Ipséité deluxe", "album"),
+    ("Booba", "Dolce Vita", "single"),
+    ("Ed Sheeran", "÷", "album"),
+    ("Booba", "Petite fille (edi", "single"),  # titre tronqué par la source
+]
+
+
+@pytest.mark.parametrize(
+    ("artist", "title"),
+    [
+        ("IAM", "Petit frère"),  # S1 exact
+        ("IAM", "Happy"),  # S1 substring : « IAM » ⊂ « WILLIAMS » (comportement historique)
+        ("Jul", "Happy days"),  # S3 : artiste en featuring
+        ("Damso", "Macarena feat. Niska"),  # S2 : partie principale
+        ("Booba", "Petite fille (edit radio)"),  # S4 : préfixe tronqué
+        ("Ed Sheeran", "÷"),  # titre vide : exact seulement
+        ("Da", "Macarena"),  # artiste < 3 caractères
+        ("Inconnu", "Macarena"),
+    ],
+)
+def test_strategies_identiques_aux_masques_pandas(artist, title):
+    m = _matcher_with(_ROWS)
+    a, t = N(artist), N(title)
+    assert m._track_match_indices(a, t) == _legacy_track_match_indices(m.df, a, t)
+
+
+def test_index_sert_aussi_artiste_et_album():
+    m = _matcher_with(_ROWS)
+    assert m._index.artist_rows(N("IAM")) == [0, 1, 2]
+    assert m._index.truncated(N("Booba"), N("Petite fille (edit radio)")) == [8]
+    assert m._index.containing(N("Damso"), N("Ipséité")) == [5]
+
+
+_SNEP_CSV = Path(DATA_PATH) / "certifications" / "snep" / "certif_snep.csv"
+
+
+@pytest.fixture(scope="module")
+def real_matcher():
+    if not _SNEP_CSV.exists():
+        pytest.skip("certifications réelles absentes de data/")
+    return CertMatcher(use_cache=False)
+
+
+def _golden_queries(df: pd.DataFrame, step: int = 600) -> list[tuple[str, str]]:
+    """Requêtes couvrant S1→S4 à partir d'un échantillon déterministe du magasin."""
+    queries = []
+    for row in df.iloc[::step].itertuples():
+        a, t = row.artist_clean, row.title_clean
+        first = a.split()[0] if a.split() else a
+        queries += [
+            (a, t),  # exact
+            (first, t),  # substring artiste
+            (a, t[: max(1, len(t) // 2)]),  # substring titre
+            (a, f"{t} FEAT SOMEONE"),  # S2
+            (a, f"{t} VERSION LONGUE"),  # S4 (préfixe)
+        ]
+    return queries
+
+
+def test_dore_sur_les_donnees_reelles(real_matcher):
+    df = real_matcher.df
+    for a, t in _golden_queries(df):
+        expected = _legacy_track_match_indices(df, a, t)
+        assert real_matcher._track_match_indices(a, t) == expected, (a, t)
+        contains = df["artist_clean"].str.contains(a, regex=False, na=False)
+        assert real_matcher._index.artist_rows(a) == list(df.index[contains]), a
+
+
+def _legacy_format(matcher: CertMatcher, idx: list[int]) -> list[dict]:
+    """Ancien `_format` : `iterrows` sur les lignes puis tri pays / niveau / date."""
+    out = [
+        {
+            "certification": r["level"],
+            "title": r["title"],
+            "artist_name": r["artist_name"],
+            "category": r["cat"],
+            "certification_date": r["date"],
+            "release_date": r.get("release_date", ""),
+            "publisher": r.get("publisher", ""),
+            "detail_url": r.get("detail_url", ""),
+            "country": r["country"],
+            "body": r["body"],
+            "flag": r["flag"],
+        }
+        for _, r in matcher.df.loc[idx].iterrows()
+    ]
+    order = {"FR": 0, "BE": 1, "US": 2}
+    out.sort(
+        key=lambda c: (
+            order.get(c["country"], 9),
+            matcher._level_rank(c["certification"]),
+            c["certification_date"] or "",
+        )
+    )
+    return out
+
+
+def test_match_tracks_dore_en_un_appel(real_matcher):
+    df = real_matcher.df
+    rows = df.iloc[::700]
+    tracks = [
+        (title, [artist]) for artist, title in zip(rows["artist_name"], rows["title"], strict=True)
+    ]
+    tracks += [(f"{t} (version longue)", extra) for t, extra in tracks[:5]]  # S4
+    tracks.append(tracks[0])  # répété : résolu une fois
+
+    results = real_matcher.match_tracks("Artiste Inconnu", tracks)
+
+    assert len(results) == len(tracks)
+    for (title, extra), certs in zip(tracks, results, strict=True):
+        candidates = list(dict.fromkeys([N("Artiste Inconnu"), *(N(x) for x in extra or [])]))
+        idx = list(
+            dict.fromkeys(
+                i for a in candidates for i in _legacy_track_match_indices(df, a, N(title))
+            )
+        )
+        assert certs == _legacy_format(real_matcher, idx), title
+    assert results[0] == results[-1] and results[0] is not results[-1]  # copies
@@ -0,0 +1,73 @@
+"""Tests du cache binaire du magasin de certifications (`cert_store_cache`).
+
+Magasin construit sur des CSV SNEP/BRMA minimaux dans un data/ temporaire
+(`DATA_PATH` redirigé) : jamais les fichiers réels de data/.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.utils import cert_matcher
+from src.utils.cert_matcher import STORE_CACHE_NAME, CertMatcher
+
+_SNEP = (
+    "artist,title,publisher,category,certification,release_date,certification_date\n"
+    "Damso,Macarena,92i,Singles,Diamant,2017-04-28,2019-07-03\n"
+    "Booba,Dolce Vita,92i,Singles,Or,2021-01-01,2021-06-01\n"
+)
+_BRMA = (
+    "artist,title,category,certification_level,certification_date,detail_url\n"
+    "Angèle & Justice,What You Want,singles,Or,2026-06-01,https://www.ultratop.be/x\n"
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    for body, content in (("snep", _SNEP), ("brma", _BRMA)):
+        folder = tmp_path / "certifications" / body
+        folder.mkdir(parents=True)
+        (folder / f"certif_{body}.csv").write_text(content, encoding="utf-8")
+    monkeypatch.setattr(cert_matcher, "DATA_PATH", str(tmp_path))
+    return tmp_path
+
+
+def _no_csv(monkeypatch):
+    def fail(self):
+        raise AssertionError("CSV relus alors que le cache est valide")
+
+    monkeypatch.setattr(CertMatcher, "_load_all", fail)
+
+
+def test_cache_relu_a_l_identique_sans_relire_les_csv(data_dir, monkeypatch):
+    built = CertMatcher()
+    assert (data_dir / "certifications" / STORE_CACHE_NAME).exists()
+
+    _no_csv(monkeypatch)
+    cached = CertMatcher()
+
+    pd.testing.assert_frame_equal(cached.df, built.df)
+    assert cached.get_track_certifications("Damso", "Macarena")[0]["certification"] == "Diamant"
+    assert cached.get_track_certifications("Angèle", "What you want")[0]["flag"] == "🇧🇪"
+
+
+def test_csv_modifie_reconstruit_le_magasin(data_dir):
+    CertMatcher()
+    csv = data_dir / "certifications" / "snep" / "certif_snep.csv"
+    csv.write_text(_SNEP + "Jul,Tchikita,D'or et de platine,Singles,Platine,,2020-01-01\n")
+    stat = csv.stat()
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert len(CertMatcher().df) == 4
+
+
+def test_cache_illisible_ou_desactive(data_dir):
+    cache = data_dir / "certifications" / STORE_CACHE_NAME
+    cache.write_bytes(b"pas un npz")
+    assert len(CertMatcher().df) == 3  # reconstruit depuis les CSV
+    assert cache.stat().st_size > 100  # et réécrit
+
+    cache.unlink()
+    CertMatcher(use_cache=False)
+    assert not cache.exists()
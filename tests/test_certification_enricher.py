@@ -64,6 +64,9 @@ class _FakeMatcher:
     def get_track_certifications(self, artist, title, extra_artists=None):
         return self._tracks.get(title, [])
 
+    def match_tracks(self, artist, tracks):
+        return [self.get_track_certifications(artist, t, extra) for t, extra in tracks]
+
     def get_album_certifications(self, artist, album):
         return self._albums.get(album, [])
 
@@ -129,3 +132,22 @@ class TestApplyCertifications:
 
     def test_liste_vide_renvoie_zero(self):
         assert apply_certifications(self._artist(), [], _FakeMatcher()) == 0
+
+    def test_titre_fautif_n_efface_pas_les_autres(self):
+        artist = self._artist()
+
+        class _FragileMatcher(_FakeMatcher):
+            def get_track_certifications(self, a, title, extra_artists=None):
+                if title == "Fautif":
+                    raise ValueError("titre illisible")
+                return super().get_track_certifications(a, title, extra_artists)
+
+        good = Track(title="Mon Titre", artist=artist)
+        bad = Track(title="Fautif", artist=artist)
+        bad.certs.entries = [_match(title="Fautif")]  # certif déjà en base
+        bad.certs.has = True
+
+        n = apply_certifications(artist, [good, bad], _FragileMatcher({"Mon Titre": [_match()]}))
+
+        assert n == 1 and good.certs.entries == [_match()]  # repli morceau par morceau
+        assert bad.certs.entries == [_match(title="Fautif")] and bad.certs.has is True
@@ -137,6 +137,33 @@ def test_ytm_identity_thresholds_read_from_env(monkeypatch):
     assert s.ytm_identity_min_ratio == 0.5
 
 
+def test_db_profile_defaut_legacy(monkeypatch):
+    monkeypatch.delenv("DB_PROFILE", raising=False)
+    assert Settings(_env_file=None).db_profile == "legacy"
+
+
+def test_db_profile_lu_depuis_env(monkeypatch):
+    monkeypatch.setenv("DB_PROFILE", " Performance ")  # normalisé
+    assert Settings(_env_file=None).db_profile == "performance"
+
+
+def test_db_profile_invalide_crashe(monkeypatch):
+    monkeypatch.setenv("DB_PROFILE", "turbo")
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
+def test_db_text_compression_desactivee_par_defaut(monkeypatch):
+    monkeypatch.delenv("DB_TEXT_COMPRESSION", raising=False)
+    assert Settings(_env_file=None).db_text_compression == "none"
+
+
+def test_db_text_compression_invalide_crashe(monkeypatch):
+    monkeypatch.setenv("DB_TEXT_COMPRESSION", "lz4")
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
 def test_derived_paths():
     assert config.DATABASE_URL.endswith("data/music_credits.db")
     assert str(config.DATA_DIR) == config.DATA_PATH
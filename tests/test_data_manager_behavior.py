@@ -12,7 +12,7 @@ Deux rôles :
 import sqlite3
 
 from src.enrichment.observation import Observation
-from src.models import Artist, Track
+from src.models import Artist, Credit, CreditRole, Track
 
 
 def _artiste_sauve(data_manager, name="Artiste Test") -> Artist:
@@ -172,3 +172,51 @@ class TestConversionDuree:
         data_manager.save_track(Track(title="Minimal", artist=artist, duration=228))
         (lu,) = data_manager.get_artist_tracks(artist.id)
         assert lu.duration == 228
+
+
+class TestChargementCredits:
+    """Crédits chargés en UNE requête pour tout l'artiste (ex-N+1 par morceau) :
+    même résultat que l'ancienne lecture morceau par morceau."""
+
+    def test_credits_rattaches_au_bon_morceau_dans_l_ordre(self, data_manager):
+        artist = _artiste_sauve(data_manager)
+        for title, noms in (("A", ["P1", "P2", "P3"]), ("B", ["W1"]), ("C", [])):
+            track = Track(title=title, artist=artist)
+            track.credits = [Credit(n, CreditRole.PRODUCER) for n in noms]
+            data_manager.save_track(track)
+
+        lus = {
+            t.title: [c.name for c in t.credits] for t in data_manager.get_artist_tracks(artist.id)
+        }
+        assert lus == {"A": ["P1", "P2", "P3"], "B": ["W1"], "C": []}
+
+    def test_role_inconnu_et_source_absente(self, data_manager):
+        artist = _artiste_sauve(data_manager)
+        tid = data_manager.save_track(Track(title="Morceau", artist=artist))
+        with sqlite3.connect(data_manager.db_path) as conn:
+            conn.execute(
+                "INSERT INTO credits (track_id, name, role, role_detail, source) "
+                "VALUES (?, 'X', 'Rôle Historique', 'Guitare', NULL)",
+                (tid,),
+            )
+            conn.execute(
+                "INSERT INTO credits (track_id, name, role, source) "
+                "VALUES (?, 'Y', 'Mixing Engineer', 'discogs')",
+                (tid,),
+            )
+
+        (track,) = data_manager.get_artist_tracks(artist.id)
+        x, y = track.credits
+        assert (x.role, x.role_detail, x.source) == (CreditRole.OTHER, "Guitare", "genius")
+        assert (y.role, y.source) == (CreditRole.MIXING_ENGINEER, "discogs")
+
+    def test_credits_d_un_autre_artiste_non_charges(self, data_manager):
+        a1 = _artiste_sauve(data_manager, "Un")
+        a2 = _artiste_sauve(data_manager, "Deux")
+        for artist in (a1, a2):
+            track = Track(title="Même titre", artist=artist)
+            track.credits = [Credit(f"Prod {artist.name}", CreditRole.PRODUCER)]
+            data_manager.save_track(track)
+
+        (track,) = data_manager.get_artist_tracks(a1.id)
+        assert [c.name for c in track.credits] == ["Prod Un"]
@@ -713,6 +713,9 @@ class TestCertificationsPersistence:
             def get_track_certifications(self, a, t, extra_artists=None):
                 return [cert] if t == "Hit" else []
 
+            def match_tracks(self, a, tracks):
+                return [self.get_track_certifications(a, t, extra) for t, extra in tracks]
+
             def get_album_certifications(self, a, alb):
                 return []
 
@@ -0,0 +1,104 @@
+"""Profils de connexion de `Database` (legacy / performance).
+
+`legacy` doit rester le comportement historique exact (NullPool, journal
+rollback). `performance` pose WAL + pragmas sur chaque connexion et garde un
+pool borné ; propriété clé : un lecteur n'est PAS bloqué par une transaction
+d'écriture ouverte (le tableau des morceaux pendant l'enrichissement).
+"""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.utils.db import Database, performance_pragmas
+
+
+@pytest.fixture
+def perf_db(tmp_path):
+    db = Database(str(tmp_path / "perf.db"), profile="performance")
+    yield db
+    db.dispose()
+
+
+def _pragma(conn, name):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_legacy_par_defaut_inchange(tmp_path):
+    db = Database(str(tmp_path / "legacy.db"), profile="legacy")
+    assert isinstance(db.engine.pool, NullPool)
+    with db.engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "delete"
+
+
+def test_performance_pose_les_pragmas(perf_db):
+    assert isinstance(perf_db.engine.pool, QueuePool)
+    with perf_db.engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 1  # NORMAL
+        assert _pragma(conn, "temp_store") == 2  # MEMORY
+        assert _pragma(conn, "cache_size") < 0  # budget en KiB
+
+
+def test_pragmas_mmap_et_cache_en_octets_et_kib():
+    pragmas = performance_pragmas(mmap_size_mb=2, cache_size_mb=3)
+    assert "mmap_size=2097152" in pragmas
+    assert "cache_size=-3072" in pragmas
+    assert pragmas[0] == "journal_mode=WAL"  # avant tout le reste
+
+
+def test_profil_inconnu_refuse(tmp_path):
+    with pytest.raises(ValueError, match="Profil de base inconnu"):
+        Database(str(tmp_path / "x.db"), profile="turbo")
+
+
+def _lire_pendant_ecriture_exclusive(db: Database) -> list[str]:
+    """Lit `artists` pendant qu'une autre connexion tient un verrou EXCLUSIVE
+    (écriture en cours de commit) ; lecteur SANS attente de verrou (timeout=0)."""
+    writer = db.engine.raw_connection()
+    try:
+        writer.driver_connection.isolation_level = None  # transactions manuelles
+        cursor = writer.cursor()
+        cursor.execute("BEGIN EXCLUSIVE")
+        cursor.execute("INSERT INTO artists (name) VALUES ('Pendant')")
+        reader = sqlite3.connect(db.db_path, timeout=0)
+        try:
+            return [r[0] for r in reader.execute("SELECT name FROM artists")]
+        finally:
+            reader.close()
+            cursor.execute("ROLLBACK")
+    finally:
+        writer.close()
+
+
+def test_lecteur_non_bloque_par_une_ecriture_en_cours(perf_db):
+    with perf_db.engine.begin() as conn:
+        conn.execute(text("INSERT INTO artists (name) VALUES ('Avant')"))
+    # WAL : le lecteur voit l'instantané validé, sans l'écriture en cours.
+    assert _lire_pendant_ecriture_exclusive(perf_db) == ["Avant"]
+
+
+def test_legacy_lecteur_bloque_par_une_ecriture_en_cours(tmp_path):
+    # Contraste : en journal rollback, le même lecteur échoue (verrou EXCLUSIVE).
+    db = Database(str(tmp_path / "legacy.db"), profile="legacy")
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        _lire_pendant_ecriture_exclusive(db)
+
+
+def test_repositories_fonctionnent_en_profil_performance(tmp_path, monkeypatch):
+    import src.utils.data_manager as dm_mod
+    import src.utils.db as db_mod
+    from src.models import Artist, Track
+
+    monkeypatch.setattr(dm_mod, "DATABASE_URL", f"sqlite:///{(tmp_path / 'dm.db').as_posix()}")
+    monkeypatch.setattr(db_mod, "DB_PROFILE", "performance")
+    dm = dm_mod.DataManager()
+    try:
+        artist = Artist(name="Artiste")
+        artist.id = dm.save_artist(artist)
+        dm.save_track(Track(title="Morceau", artist=artist))
+        assert [t.title for t in dm.get_artist_tracks(artist.id)] == ["Morceau"]
+    finally:
+        dm.engine.dispose()
@@ -0,0 +1,179 @@
+"""Tests du dirty tracking (instantanés du modèle + écriture minimale).
+
+Modèle : `mark_clean()` / `changed_fields()` sur Track et ses sous-objets.
+Repository : un morceau relu de la base n'écrit que ses colonnes modifiées
+(aucun UPDATE s'il revient inchangé) et synchronise ses crédits par diff ;
+un morceau construit hors base garde l'écriture complète.
+"""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import event
+
+from src.models import Artist, Credit, CreditRole, Track
+from src.models.track import Lyrics
+
+
+def _artiste(dm, name="Artiste Test"):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+def _relire(dm, artist, title):
+    return next(t for t in dm.get_artist_tracks(artist.id) if t.title == title)
+
+
+@pytest.fixture
+def statements(data_manager):
+    """SQL émis sur le moteur (pour vérifier ce que la sauvegarde écrit)."""
+    emitted = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        emitted.append(" ".join(statement.split()))
+
+    event.listen(data_manager.engine, "before_cursor_execute", _capture)
+    return emitted
+
+
+class TestModele:
+    def test_sans_instantane_inconnu(self):
+        assert Track(title="X").changed_fields() is None
+
+    def test_champs_et_sous_objets_en_notation_pointee(self):
+        track = Track(title="X")
+        track.mark_clean()
+        assert track.changed_fields() == set()
+
+        track.album = "Album"
+        track.lyrics.text = "paroles"
+        track.streams.ytm_streams = 12
+        assert track.changed_fields() == {"album", "lyrics.text", "streams.ytm_streams"}
+
+    def test_mutation_en_place_detectee(self):
+        track = Track(title="X")
+        track.mark_clean()
+        track.certs.entries.append({"certification": "Or"})
+        track.credits.append(Credit(name="P", role=CreditRole.PRODUCER))
+        assert track.changed_fields() == {"certs.entries", "credits"}
+
+    def test_sous_objet_remplace_inconnu(self):
+        track = Track(title="X")
+        track.mark_clean()
+        track.lyrics = Lyrics(text="nouveau")
+        assert track.changed_fields() is None
+
+    def test_transitoires_hors_suivi(self):
+        track = Track(title="X")
+        track.mark_clean()
+        track.scraping_errors.append("timeout")
+        track.clear_audio_observations = True
+        assert track.changed_fields() == set()
+
+
+class TestEcritureMinimale:
+    def test_morceau_relu_inchange_aucune_ecriture(self, data_manager, statements):
+        artist = _artiste(data_manager)
+        track = Track(title="Stable", artist=artist, album="A")
+        track.credits = [Credit(name="P", role=CreditRole.PRODUCER)]
+        data_manager.save_track(track)
+        relu = _relire(data_manager, artist, "Stable")
+        statements.clear()
+
+        data_manager.save_track(relu)
+
+        ecritures = [s for s in statements if not s.startswith("SELECT")]
+        assert ecritures == []
+
+    def test_update_limite_aux_colonnes_modifiees(self, data_manager, statements):
+        artist = _artiste(data_manager)
+        data_manager.save_track(Track(title="T", artist=artist, album="A", genre="Rap"))
+        relu = _relire(data_manager, artist, "T")
+        relu.genre = "Pop"
+        relu.lyrics.text = "la la"
+        relu.album = None  # COALESCE : la base garde « A », rien à écrire
+        statements.clear()
+
+        data_manager.save_track(relu)
+
+        updates = [s for s in statements if s.startswith("UPDATE tracks")]
+        assert updates == [
+            "UPDATE tracks SET genre = ?, lyrics = ?, has_lyrics = 1, updated_at = ? WHERE id = ?"
+        ]
+        lu = _relire(data_manager, artist, "T")
+        assert (lu.genre, lu.album, lu.lyrics.text, lu.lyrics.present) == (
+            "Pop",
+            "A",
+            "la la",
+            True,
+        )
+
+    def test_is_featuring_ecrase_meme_a_false(self, data_manager):
+        artist = _artiste(data_manager)
+        data_manager.save_track(Track(title="F", artist=artist, is_featuring=True))
+        relu = _relire(data_manager, artist, "F")
+        relu.is_featuring = False
+
+        data_manager.save_track(relu)
+
+        assert _relire(data_manager, artist, "F").is_featuring is False
+
+    def test_credits_synchronises_par_diff(self, data_manager):
+        artist = _artiste(data_manager)
+        track = Track(title="C", artist=artist)
+        track.credits = [
+            Credit(name="Garde", role=CreditRole.PRODUCER),
+            Credit(name="Retire", role=CreditRole.WRITER),
+        ]
+        tid = data_manager.save_track(track)
+        with sqlite3.connect(data_manager.db_path) as conn:
+            (id_garde,) = conn.execute(
+                "SELECT id FROM credits WHERE track_id = ? AND name = 'Garde'", (tid,)
+            ).fetchone()
+
+        relu = _relire(data_manager, artist, "C")
+        relu.credits = [c for c in relu.credits if c.name != "Retire"]
+        relu.credits.append(Credit(name="Ajout", role=CreditRole.MIXING_ENGINEER))
+        data_manager.save_track(relu)
+
+        with sqlite3.connect(data_manager.db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, name FROM credits WHERE track_id = ? ORDER BY id", (tid,)
+            ).fetchall()
+        assert [name for _id, name in rows] == ["Garde", "Ajout"]
+        assert rows[0][0] == id_garde  # ligne inchangée : ni supprimée ni réinsérée
+
+    def test_sauvegardes_successives_du_meme_objet(self, data_manager, statements):
+        artist = _artiste(data_manager)
+        track = Track(title="Re", artist=artist)
+        data_manager.save_track(track)  # construit hors base : écriture complète
+        track.genre = "Jazz"
+        statements.clear()
+
+        data_manager.save_track(track)  # instantané posé par la 1re sauvegarde
+
+        updates = [s for s in statements if s.startswith("UPDATE tracks")]
+        assert updates == ["UPDATE tracks SET genre = ?, updated_at = ? WHERE id = ?"]
+
+    def test_morceau_hors_base_ecriture_complete(self, data_manager, statements):
+        artist = _artiste(data_manager)
+        data_manager.save_track(Track(title="API", artist=artist, genre="Rap"))
+        statements.clear()
+
+        data_manager.save_track(Track(title="API", artist=artist))
+
+        assert any("album = COALESCE(?, album)" in s for s in statements)
+        assert "DELETE FROM credits WHERE track_id = ?" in statements
+        assert _relire(data_manager, artist, "API").genre == "Rap"
+
+    def test_lot_mixte(self, data_manager):
+        artist = _artiste(data_manager)
+        data_manager.save_track(Track(title="Ancien", artist=artist))
+        relu = _relire(data_manager, artist, "Ancien")
+        relu.genre = "Soul"
+
+        ids = data_manager.save_tracks([relu, Track(title="Neuf", artist=artist)])
+
+        assert all(ids)
+        assert _relire(data_manager, artist, "Ancien").genre == "Soul"
@@ -0,0 +1,122 @@
+"""Tests du moteur ensembliste de détection des doublons (`duplicate_detection`).
+
+Blocage par artiste (titre normalisé, identifiants, tranche de durée), score
+par paire, regroupement : les propositions désignent la fiche la plus complète
+et s'appliquent telles quelles par `merge_tracks`. Les versions distinctes
+(Remix, Live…) et les identifiants contradictoires ne sont jamais proposés.
+"""
+
+import pytest
+
+from src.models import Artist, Credit, CreditRole, Track
+from src.utils.duplicate_detection import (
+    DuplicateCandidate,
+    blocking_keys,
+    find_duplicates,
+    score_pair,
+)
+
+
+def _c(id, title, artist_id=1, **kwargs):
+    return DuplicateCandidate(id=id, artist_id=artist_id, title=title, **kwargs)
+
+
+def _pairs(proposals):
+    return {(p.keep_id, p.delete_id) for p in proposals}
+
+
+def test_variantes_de_titre_meme_artiste():
+    proposals = find_duplicates(
+        [
+            _c(1, "My Love (Acoustic)", duration=200),
+            _c(2, "My love [acoustic]", duration=201, genius_id="42", album="A"),
+            _c(3, "Autre chose", duration=200),
+        ]
+    )
+
+    assert _pairs(proposals) == {(2, 1)}  # la fiche la plus complète est gardée
+    assert "titre normalisé identique" in proposals[0].reasons
+
+
+def test_jamais_entre_artistes():
+    # Featuring enregistré chez les deux artistes : même genius_id, pas un doublon.
+    assert find_duplicates([_c(1, "Feat", 1, genius_id="7"), _c(2, "Feat", 2, genius_id="7")]) == []
+
+
+def test_meme_identifiant_titre_different():
+    proposals = find_duplicates(
+        [_c(1, "Matrix", spotify_id="abc", duration=180), _c(2, "Matrix (Intro)", spotify_id="abc")]
+    )
+    assert _pairs(proposals) == {(1, 2)}
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"title": "Titre"}, {"title": "Titre (Remix)"}),
+        ({"title": "Titre", "spotify_id": "x"}, {"title": "Titre", "spotify_id": "y"}),
+        ({"title": "Titre", "duration": 180}, {"title": "Titre", "duration": 240}),
+    ],
+)
+def test_versions_distinctes_non_proposees(a, b):
+    assert find_duplicates([_c(1, **a), _c(2, **b)]) == []
+
+
+def test_tranches_de_duree_decalees():
+    # 199 s / 200 s : tranches différentes pour l'une des deux grilles seulement.
+    a, b = _c(1, "x", duration=199), _c(2, "y", duration=200)
+    assert set(blocking_keys(a)) & set(blocking_keys(b))
+
+
+def test_groupe_vers_une_seule_fiche_gardee():
+    proposals = find_duplicates(
+        [
+            _c(1, "Bande organisée", duration=270),
+            _c(2, "Bande Organisee", duration=271, credit_count=3),
+            _c(3, "BANDE ORGANISÉE (feat. X)", duration=270),
+        ]
+    )
+    assert _pairs(proposals) == {(2, 1), (2, 3)}
+
+
+def test_score_borne():
+    score, _ = score_pair(
+        _c(1, "T", genius_id="1", spotify_id="s", isrc="I", duration=100),
+        _c(2, "T", genius_id="1", spotify_id="s", isrc="I", duration=100),
+    )
+    assert score == 1.0
+
+
+def test_repository_propositions_applicables(data_manager):
+    artist = Artist(name="Artiste Doublons")
+    artist.id = data_manager.save_artist(artist)
+    keep = Track(title="Pyramide", artist=artist, duration=210, genius_id=99)
+    keep.credits = [Credit("Kore", CreditRole.PRODUCER)]
+    doublon = Track(title="Pyramide (feat. Y)", artist=artist, duration=211)
+    doublon.credits = [Credit("Skread", CreditRole.MIXING_ENGINEER)]
+    remix = Track(title="Pyramide (Remix)", artist=artist, duration=230)
+    data_manager.save_tracks([keep, doublon, remix])
+
+    proposals = data_manager.find_duplicate_candidates()
+
+    assert _pairs(proposals) == {(keep.id, doublon.id)}
+    for p in proposals:
+        assert data_manager.merge_tracks(p.keep_id, p.delete_id)
+    tracks = {t.title: t for t in data_manager.get_artist_tracks(artist.id)}
+    assert set(tracks) == {"Pyramide", "Pyramide (Remix)"}
+    assert {c.name for c in tracks["Pyramide"].credits} == {"Kore", "Skread"}
+    assert data_manager.find_duplicate_candidates(artist.id) == []
+
+
+def test_repository_candidats_par_titre_normalise(data_manager):
+    artist = Artist(name="Artiste Titre")
+    artist.id = data_manager.save_artist(artist)
+    a = Track(title="Pyramide", artist=artist, duration=210)
+    a.credits = [Credit("Kore", CreditRole.PRODUCER)]
+    b = Track(title="PYRAMIDE !", artist=artist)
+    autre = Track(title="Pyramides", artist=artist)
+    data_manager.save_tracks([a, b, autre])
+
+    candidates = data_manager.get_duplicate_candidates(title="pyramide")
+
+    assert {c.id: c.credit_count for c in candidates} == {a.id: 1, b.id: 0}
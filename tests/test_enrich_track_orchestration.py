@@ -235,6 +235,28 @@ def test_consensus_bpm_saute_songbpm():
     assert track.audio.bpm == 100  # vote finalisé sur le consensus
 
 
+def test_force_update_saute_les_sources_couteuses_si_deja_resolu():
+    from src.enrichment.observation import Observation
+
+    def _resolve(name):
+        def inner(track, ctx):
+            ctx.bpm_ballot.add(name, 100)
+            ctx.observations.extend([Observation("key", 5, name), Observation("mode", 1, name)])
+            return True
+
+        return inner
+
+    enricher, fakes, _ = _enricher()
+    fakes["reccobeats"]._on_enrich = _resolve("reccobeats")
+    fakes["getsongbpm"]._on_enrich = _resolve("getsongbpm")
+
+    results = enricher.enrich_track(_track(duration=200), force_update=True)
+
+    assert results["songbpm"] == results["bpmfinder"] == "not_needed"
+    assert fakes["songbpm"].enrich_calls == fakes["bpmfinder"].enrich_calls == 0
+    assert fakes["deezer"].enrich_calls == 1  # métadonnées : jamais sautée
+
+
 def test_force_update_rappelle_le_scraper_spotify_meme_avec_id_valide():
     track_id = "A" * 22
 
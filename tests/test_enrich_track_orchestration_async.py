@@ -3,12 +3,14 @@
 Même harnais que `test_enrich_track_orchestration.py` (fakes héritant des
 providers réels → les VRAIS `gate()` tournent), piloté par `asyncio.run` : la
 voie async doit produire exactement les mêmes ordres d'appel, valeurs de
-résultat, court-circuits et nettoyages que la voie sync.
+résultat, court-circuits et nettoyages que la voie sync — les sources
+indépendantes du graphe `_DEPENDENCIES` y tournent en parallèle.
 """
 
 import asyncio
 import threading
 
+from src.concurrency.bounded import KeyedSlots, run_bounded
 from src.concurrency.serial_worker import SerialWorker
 from src.enrichment.providers.bpmfinder import BpmFinderProvider
 from src.enrichment.providers.deezer import DeezerProvider
@@ -171,6 +173,7 @@ def _enricher(**overrides):
     enricher._discogs_provider = fakes["discogs"]
     enricher._http = None  # les fakes ne touchent pas au réseau
     enricher.sync_runner = SerialWorker(SYNC_THREAD)
+    enricher._slots = KeyedSlots()
     return enricher, fakes, calls
 
 
@@ -343,3 +346,126 @@ def test_pont_sync_execute_sur_le_thread_dedie():
 
     assert results["songbpm"] is True
     assert songbpm.seen_thread == SYNC_THREAD
+
+
+class _InFlight:
+    """Mixin : `enrich_async` qui rend la main et mesure le pic de morceaux en vol."""
+
+    def __init__(self, calls, delay=0.001):
+        super().__init__(calls)
+        self._delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def enrich_async(self, track, ctx):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+            return self.enrich(track, ctx)
+        finally:
+            self.in_flight -= 1
+
+
+class _InFlightSongBpm(_InFlight, SongBpmProvider):
+    def is_available(self):
+        return True
+
+    def enrich(self, track, ctx):
+        return True
+
+
+class _InFlightDeezer(_InFlight, DeezerProvider):
+    def is_available(self):
+        return True
+
+    def enrich(self, track, ctx):
+        return True
+
+
+def test_batch_concurrent_respecte_le_plafond_de_chaque_provider():
+    songbpm, deezer = _InFlightSongBpm([], delay=0.01), _InFlightDeezer([], delay=0.01)
+    enricher, _, _ = _enricher(songbpm=songbpm, deezer=deezer)
+    tracks = [Track(title=f"T{i}", artist=Artist(name="X")) for i in range(12)]
+
+    async def one(track):
+        return await enricher.enrich_track_async(track, sources=["songbpm", "deezer"])
+
+    done = asyncio.run(run_bounded(tracks, one, limit=8))
+
+    assert [t.title for t, _ in done] == [t.title for t in tracks]  # ordre de la sélection
+    assert all(results == {"songbpm": True, "deezer": True} for _, results in done)
+    assert 1 <= songbpm.peak <= SongBpmProvider.max_concurrency  # pool de pages
+    assert 1 < deezer.peak <= DeezerProvider.max_concurrency
+
+
+class _Timed:
+    """Mixin : `enrich_async` qui dure `delay` et journalise début/fin."""
+
+    def __init__(self, calls, events, delay=0.01):
+        super().__init__(calls)
+        self._events = events
+        self._delay = delay
+
+    async def enrich_async(self, track, ctx):
+        self._events.append(("start", self.name))
+        await asyncio.sleep(self._delay)
+        self._events.append(("end", self.name))
+        return self.enrich(track, ctx)
+
+
+def _timed_enricher():
+    events = []
+
+    def fake(base):
+        return type(f"_Timed{base.__name__}", (_Timed, base), {})
+
+    overrides = {
+        "spotify_id": fake(_FakeSpotify)([], events),
+        "reccobeats": fake(_FakeRecco)([], events),
+        "getsongbpm": fake(_FakeGetSongBpm)([], events),
+        "songbpm": fake(_FakeSongBpm)([], events),
+        "bpmfinder": fake(_FakeBpmFinder)([], events),
+        "deezer": fake(_FakeDeezer)([], events),
+    }
+    enricher, _, _ = _enricher(**overrides)
+    return enricher, events
+
+
+def test_dag_sources_independantes_en_parallele_dependances_respectees():
+    enricher, events = _timed_enricher()
+
+    results = _run(enricher, _track())
+
+    index = {event: i for i, event in enumerate(events)}
+    # getsongbpm (indépendante) démarre avant la fin du scrape Spotify
+    assert index[("start", "getsongbpm")] < index[("end", "spotify_id")]
+    for name, deps in DataEnricher._DEPENDENCIES.items():
+        for dep in deps:
+            assert index[("end", dep)] < index[("start", name)], (dep, name)
+    # bpmfinder et deezer n'attendent que songbpm : en vol ensemble
+    assert index[("start", "deezer")] < index[("end", "bpmfinder")]
+    # Rapport stable : résultats dans l'ordre du pipeline, pas de complétion
+    assert list(results) == ALL_SOURCES
+
+
+def test_dag_arret_anticipe_en_force_update():
+    from src.enrichment.observation import Observation
+
+    def _resolve(name):
+        def inner(track, ctx):
+            ctx.bpm_ballot.add(name, 100)
+            ctx.observations.extend([Observation("key", 5, name), Observation("mode", 1, name)])
+            return True
+
+        return inner
+
+    enricher, fakes, _ = _enricher()
+    fakes["reccobeats"]._on_enrich = _resolve("reccobeats")
+    fakes["getsongbpm"]._on_enrich = _resolve("getsongbpm")
+
+    results = _run(enricher, _track(duration=200), force_update=True)
+
+    assert results["songbpm"] == results["bpmfinder"] == "not_needed"
+    assert fakes["songbpm"].enrich_calls == fakes["bpmfinder"].enrich_calls == 0
+    assert results["deezer"] is True
@@ -0,0 +1,203 @@
+"""Tests du cache HTTP et de la coalescence de l'AsyncHttpSession — zéro réseau."""
+
+import asyncio
+
+import httpx
+
+from src.api.async_http import AsyncHttpSession
+from src.api.http_cache import CacheTTL, ResponseCache
+from src.concurrency.rate_limiter import DomainRateLimiter
+
+TTLS = {"api.deezer.com": CacheTTL(ok=100.0, negative=10.0)}
+
+
+class Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def _cache(tmp_path, clock=None, **kwargs):
+    return ResponseCache(tmp_path / "http.db", ttls=TTLS, clock=clock or Clock(), **kwargs)
+
+
+def _session(handler, cache=None):
+    return AsyncHttpSession(
+        transport=httpx.MockTransport(handler), limiter=DomainRateLimiter(0.0), cache=cache
+    )
+
+
+def _get_all(session, *urls):
+    async def scenario():
+        return [await session.get(url) for url in urls]
+
+    return asyncio.run(scenario())
+
+
+def test_reponse_servie_du_cache_puis_perimee(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"id": len(calls)})
+
+    clock = Clock()
+    session = _session(handler, _cache(tmp_path, clock))
+    first, second = _get_all(
+        session, "https://api.deezer.com/track/1", "https://api.deezer.com/track/1"
+    )
+    assert first.json() == second.json() == {"id": 1}
+    assert session.cache_stats["hits"] == 1
+
+    clock.t += 101  # TTL positif écoulé : retour au réseau
+    (third,) = _get_all(session, "https://api.deezer.com/track/1")
+    assert third.json() == {"id": 2}
+    assert len(calls) == 2
+
+
+def test_cache_persistant_entre_sessions_et_domaines_exclus(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        return httpx.Response(200, json={"ok": True})
+
+    _get_all(
+        _session(handler, _cache(tmp_path)),
+        "https://api.deezer.com/a",
+        "https://x.musixmatch.com/a",
+    )
+    # Nouvelle session, même fichier (relance après crash) : Deezer vient du disque
+    _get_all(
+        _session(handler, _cache(tmp_path)),
+        "https://api.deezer.com/a",
+        "https://x.musixmatch.com/a",
+    )
+    assert calls == ["api.deezer.com", "x.musixmatch.com", "x.musixmatch.com"]
+
+
+def test_ttl_negatif_plus_court(tmp_path):
+    def handler(request):
+        if request.url.path == "/search":
+            return httpx.Response(200, json={"data": [], "total": 0})
+        return httpx.Response(404)
+
+    clock = Clock()
+    cache = _cache(tmp_path, clock)
+    session = _session(handler, cache)
+    _get_all(session, "https://api.deezer.com/search", "https://api.deezer.com/absent")
+    clock.t += 11
+    assert cache.lookup(session_key(session, "https://api.deezer.com/search")).fresh is False
+    assert cache.lookup(session_key(session, "https://api.deezer.com/absent")).fresh is False
+
+
+def test_erreur_applicative_en_200_jamais_stockee(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if len(calls) == 1:  # quota Deezer dépassé, servi en HTTP 200
+            return httpx.Response(
+                200, json={"error": {"type": "Exception", "message": "Quota limit", "code": 4}}
+            )
+        return httpx.Response(200, json={"data": [{"id": 7}], "total": 1})
+
+    cache = _cache(tmp_path)
+    session = _session(handler, cache)
+    url = "https://api.deezer.com/search?q=damso"
+    error, retry = _get_all(session, url, url)
+
+    assert "error" in error.json()
+    assert retry.json()["data"] == [{"id": 7}]  # redemandé au réseau, pas resservi
+    assert len(calls) == 2
+    assert cache.lookup(session_key(session, url)).fresh is True
+
+
+def session_key(session, url):
+    from src.api.http_cache import request_key
+
+    return request_key(session._ensure_client().build_request("GET", url))
+
+
+def test_revalidation_conditionnelle_304(tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"v": 1})
+
+    clock = Clock()
+    session = _session(handler, _cache(tmp_path, clock))
+    _get_all(session, "https://api.deezer.com/x")
+    clock.t += 101
+    (revalidated,) = _get_all(session, "https://api.deezer.com/x")
+    (fresh_again,) = _get_all(session, "https://api.deezer.com/x")
+
+    assert seen == [None, '"v1"']  # 3ᵉ appel : prolongé par le 304, pas de requête
+    assert revalidated.status_code == 200 and revalidated.json() == {"v": 1}
+    assert fresh_again.json() == {"v": 1}
+    assert session.cache_stats["revalidated"] == 1
+
+
+def test_eviction_lru_bornee(tmp_path):
+    def handler(request):
+        return httpx.Response(200, content=b"x" * 400)
+
+    clock = Clock()
+    cache = _cache(tmp_path, clock, max_bytes=1000)
+    session = _session(handler, cache)
+    for name in ("a", "b"):
+        _get_all(session, f"https://api.deezer.com/{name}")
+        clock.t += 1
+    _get_all(session, "https://api.deezer.com/a")  # a relu : b devient le moins récent
+    clock.t += 1
+    _get_all(session, "https://api.deezer.com/c")
+
+    assert cache.size_bytes <= 900
+    assert cache.lookup(session_key(session, "https://api.deezer.com/b")) is None
+    assert cache.lookup(session_key(session, "https://api.deezer.com/a")) is not None
+
+
+def test_coalescence_des_requetes_identiques_en_vol():
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"q": request.url.params["q"]})
+
+    session = _session(handler)
+
+    async def scenario():
+        return await asyncio.gather(
+            session.get("https://lrclib.net/api/search", params={"q": "x"}),
+            session.get("https://lrclib.net/api/search", params={"q": "x"}),
+            session.get("https://lrclib.net/api/search", params={"q": "y"}),
+        )
+
+    a, b, c = asyncio.run(scenario())
+    assert a is b and c.json() == {"q": "y"}
+    assert len(calls) == 2
+    assert session.cache_stats["coalesced"] == 1
+
+
+def test_annuler_un_appelant_n_annule_pas_les_autres():
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={})
+
+    session = _session(handler)
+
+    async def scenario():
+        first = asyncio.create_task(session.get("https://api.deezer.com/x"))
+        second = asyncio.create_task(session.get("https://api.deezer.com/x"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        return (await second).status_code, first
+
+    status, first = asyncio.run(scenario())
+    assert status == 200 and first.cancelled()
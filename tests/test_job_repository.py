@@ -0,0 +1,128 @@
+"""Tests des jobs de batch reprenables (`JobRepository`, `JobCheckpoint`, e17)."""
+
+from src.gui.workers.enrichment import spotify_id_reset_targets
+from src.gui.workers.resume import describe_job
+from src.models import Artist, Track
+from src.utils.job_repository import (
+    ITEM_DONE,
+    ITEM_FAILED,
+    JOB_ENRICHMENT,
+    JOB_STREAMS,
+    JobCheckpoint,
+)
+
+
+def _artiste_et_morceaux(dm, n=3, name="Isha"):
+    artist = Artist(name=name)
+    artist.id = dm.save_artist(artist)
+    tracks = [Track(title=f"T{i}", artist=artist) for i in range(n)]
+    dm.save_tracks(tracks)
+    return artist, tracks
+
+
+def _job(dm, artist, tracks, sources=("deezer", "reccobeats")):
+    return dm.create_job(
+        JOB_ENRICHMENT,
+        artist.id,
+        [(t.id, s) for t in tracks for s in sources],
+        {"sources": list(sources), "force_update": True},
+    )
+
+
+def test_seules_les_paires_en_attente_sont_reprises(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager)
+    job_id = _job(data_manager, artist, tracks)
+
+    data_manager.mark_job_items(
+        job_id,
+        [
+            (tracks[0].id, "deezer", ITEM_DONE),
+            (tracks[0].id, "reccobeats", ITEM_FAILED),  # tenté : jamais rejoué
+            (tracks[1].id, "deezer", ITEM_DONE),
+        ],
+    )
+
+    (job,) = data_manager.unfinished_jobs()
+    assert job.id == job_id and job.artist_name == "Isha"
+    assert job.options == {"sources": ["deezer", "reccobeats"], "force_update": True}
+    assert job.pending == {tracks[1].id: ["reccobeats"], tracks[2].id: ["deezer", "reccobeats"]}
+    assert job.pending_count == 3
+    assert not data_manager.finish_job(job_id)  # encore des paires en attente
+
+
+def test_job_termine_ou_abandonne_n_est_plus_propose(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=1)
+    done_id = _job(data_manager, artist, tracks, sources=("deezer",))
+    data_manager.mark_job_items(done_id, [(tracks[0].id, "deezer", ITEM_DONE)])
+    assert data_manager.finish_job(done_id)
+
+    abandoned_id = _job(data_manager, artist, tracks)
+    data_manager.abandon_job(abandoned_id)
+
+    assert data_manager.unfinished_jobs() == []
+
+
+def test_morceau_supprime_ignore_et_etapes_artiste(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=2)
+    job_id = _job(data_manager, artist, tracks, sources=("deezer",))
+    data_manager.delete_track(tracks[0].id)
+    streams_id = data_manager.create_job(JOB_STREAMS, artist.id, [(None, "spotify"), (None, "ytm")])
+    data_manager.mark_job_items(streams_id, [(None, "spotify", ITEM_DONE)])
+
+    jobs = {job.id: job for job in data_manager.unfinished_jobs()}
+    assert jobs[job_id].pending == {tracks[1].id: ["deezer"]}
+    assert jobs[streams_id].pending == {None: ["ytm"]}
+    assert list(jobs) == [streams_id, job_id]  # le plus récent d'abord
+
+    data_manager.delete_track(tracks[1].id)
+    assert [job.id for job in data_manager.unfinished_jobs()] == [streams_id]  # job vidé → clos
+
+
+def test_checkpoint_sauvegarde_puis_marque_par_lots(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=3)
+    job_id = _job(data_manager, artist, tracks, sources=("genius",))
+    saved = []
+
+    def save(batch):
+        saved.append([t.title for t in batch])
+        data_manager.save_tracks(batch)
+
+    checkpoint = JobCheckpoint(data_manager, job_id, save=save, every=2)
+    checkpoint.record(tracks[0], "genius")
+    assert saved == [] and len(data_manager.pending_job_items(job_id)) == 3
+    checkpoint.record(tracks[1], "genius", ok=False)
+    assert saved == [["T0", "T1"]]
+    assert data_manager.pending_job_items(job_id) == {tracks[2].id: ["genius"]}
+
+    checkpoint.record(tracks[2], "genius")
+    checkpoint.flush(save=False)
+    assert saved == [["T0", "T1"]]
+    assert data_manager.finish_job(job_id)
+
+
+def test_suppression_artiste_purge_ses_jobs(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=1)
+    _job(data_manager, artist, tracks)
+    assert data_manager.delete_artist("Isha")
+    assert data_manager.unfinished_jobs() == []
+
+
+def test_message_de_reprise(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=2)
+    _job(data_manager, artist, tracks)
+
+    message = describe_job(data_manager.unfinished_jobs()[0])
+    assert "Enrichissement de Isha" in message
+    assert "2 morceau(x), 4 appel(s) source" in message
+    assert "deezer, reccobeats" in message
+
+
+def test_reprise_ne_reset_que_les_spotify_id_en_attente(data_manager):
+    artist, tracks = _artiste_et_morceaux(data_manager, n=2)
+    job_id = _job(data_manager, artist, tracks, sources=("spotify_id", "reccobeats"))
+    # Morceau 0 : ID déjà re-scrapé et sauvé, seul reccobeats reste à faire
+    data_manager.mark_job_items(job_id, [(tracks[0].id, "spotify_id", ITEM_DONE)])
+
+    (job,) = data_manager.unfinished_jobs()
+    assert spotify_id_reset_targets(tracks, job) == [tracks[1]]
+    assert spotify_id_reset_targets(tracks, None) == tracks  # premier lancement : tous
@@ -0,0 +1,156 @@
+"""Tests du cache clé-valeur partagé (`src/persistence/kv_cache.py`)."""
+
+import json
+import sqlite3
+
+import pytest
+
+from src.persistence.kv_cache import KVCache, is_negative_value
+
+
+class Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+@pytest.fixture()
+def clock():
+    return Clock()
+
+
+def _cache(tmp_path, clock, **kwargs):
+    return KVCache(tmp_path / "cache.db", clock=clock, **kwargs)
+
+
+def test_espace_de_noms_se_comporte_comme_un_dict(tmp_path, clock):
+    ns = _cache(tmp_path, clock).namespace("recco")
+    ns["a"] = {"bpm": 120}
+    ns["b"] = "not_found"
+
+    assert ns["a"] == {"bpm": 120}
+    assert "b" in ns and "z" not in ns
+    assert ns.get("z") is None
+    assert sorted(ns) == ["a", "b"] and len(ns) == 2
+    del ns["a"]
+    assert "a" not in ns
+    with pytest.raises(KeyError):
+        del ns["a"]
+
+
+def test_espaces_isoles(tmp_path, clock):
+    cache = _cache(tmp_path, clock)
+    cache.namespace("spotify_id")["k"] = "ID1"
+    cache.namespace("getsongbpm")["k"] = {"bpm": 90}
+
+    assert cache.namespace("spotify_id")["k"] == "ID1"
+    assert cache.namespace("getsongbpm")["k"] == {"bpm": 90}
+
+
+def test_ttl_positif_et_negatif(tmp_path, clock):
+    ns = _cache(tmp_path, clock).namespace("yt", ttl=100.0, negative_ttl=10.0)
+    ns["ok"] = [{"video_id": "x"}]
+    ns["absent"] = {"error": "not_found"}
+
+    clock.t += 11
+    assert "absent" not in ns  # négatif expiré : le client retentera
+    assert ns["ok"] == [{"video_id": "x"}]
+    clock.t += 90
+    assert "ok" not in ns and len(ns) == 0
+
+
+def test_detection_des_entrees_negatives():
+    assert is_negative_value("not_found")
+    assert is_negative_value({"error": "Morceau introuvable"})
+    assert not is_negative_value({"error": None, "bpm": 120})
+    assert not is_negative_value("6xIDZPcKh7x070OUZkt7Fr")
+
+
+def test_chaque_ecriture_est_commitee_aussitot(tmp_path, clock):
+    cache = _cache(tmp_path, clock)
+    ns = cache.namespace("recco")
+
+    def committed() -> int:
+        with sqlite3.connect(cache.path) as other:
+            return other.execute("SELECT COUNT(*) FROM kv_entries").fetchone()[0]
+
+    ns["a"] = 1
+    assert committed() == 1  # visible des autres connexions sans flush
+    del ns["a"]
+    assert committed() == 0
+    assert not cache._conn.in_transaction
+
+
+def test_deux_processus_ecrivent_sans_se_bloquer(tmp_path, clock):
+    # GUI + `python -m src.batch` (ou ses --processes) sur le même data/cache.db
+    gui = _cache(tmp_path, clock, busy_timeout=0.2).namespace("recco")
+    batch = _cache(tmp_path, clock, busy_timeout=0.2).namespace("recco")
+
+    gui["a"] = 1
+    batch["b"] = 2
+    gui["c"] = 3
+    assert dict(gui) == dict(batch) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_base_verrouillee_ecriture_ignoree_sans_erreur(tmp_path, clock):
+    cache = _cache(tmp_path, clock, busy_timeout=0.05)
+    ns = cache.namespace("getsongbpm")
+    ns["avant"] = 1
+    holder = sqlite3.connect(cache.path, isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")  # autre écrivain qui garde le verrou
+    try:
+        ns["pendant"] = {"bpm": 120}  # best-effort : pas d'OperationalError
+        del ns["avant"]
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+
+    assert "pendant" not in ns and ns["avant"] == 1
+    ns["apres"] = 2
+    assert ns["apres"] == 2
+
+
+def test_persistance_entre_instances(tmp_path, clock):
+    cache = _cache(tmp_path, clock)
+    cache.namespace("bpmfinder")["vid"] = {"bpm": 87, "key": "C"}
+    cache.close()
+
+    assert _cache(tmp_path, clock).namespace("bpmfinder")["vid"] == {"bpm": 87, "key": "C"}
+
+
+def test_purge_et_eviction(tmp_path, clock):
+    cache = _cache(tmp_path, clock)
+    old = cache.namespace("old", ttl=10.0)
+    recent = cache.namespace("recent")
+    old["a"] = "x" * 100
+    clock.t += 50
+    recent["b"] = "y" * 100
+    recent["c"] = "z" * 100
+
+    assert cache.stats()["old"]["expired"] == 1
+    assert cache.purge_expired() == 1
+    assert "old" not in cache.stats()
+
+    clock.t += 50
+    recent["d"] = "w" * 100
+    assert cache.evict(max_age=40.0) == 2  # b et c ont 50 s, d vient d'être écrite
+    recent["e"] = "v" * 100
+    assert cache.evict(max_bytes=150) == 1  # la plus ancienne d'abord
+    assert list(recent) == ["e"]
+
+
+def test_import_json_garde_les_entrees_existantes(tmp_path, clock):
+    legacy = tmp_path / "spotify_ids_cache.json"
+    legacy.write_text(
+        json.dumps({"a::t1": "ID1", "a::t2": "not_found", "a::t3": "OLD"}), encoding="utf-8"
+    )
+    cache = _cache(tmp_path, clock)
+    ns = cache.namespace("spotify_id")
+    ns["a::t3"] = "NEW"
+
+    assert ns.import_json(legacy) == 2
+    assert ns["a::t1"] == "ID1" and ns["a::t3"] == "NEW"
+    assert cache.stats()["spotify_id"]["negative"] == 1
+    assert ns.import_json(legacy) == 0
@@ -0,0 +1,147 @@
+"""Tests du chargement par projection (`get_artist_tracks(lazy=True)`, E7d).
+
+Paroles, LRC retenu et anecdotes restent en base jusqu'au premier accès, puis
+sont chargés par lots (observations `lyrics_synced` réconciliées à ce moment).
+Invariant central : valeurs réconciliées IDENTIQUES au chargement complet.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from src.enrichment.observation import Observation
+from src.models import Artist, Track
+
+_LRC_COURT = "[00:01.00] un\n[00:02.00] deux"
+_LRC_LONG = "[00:01.00] un\n[00:02.00] deux\n[00:03.00] trois\n[03:20.00] fin"
+
+
+def _artiste(dm, name="Artiste Test"):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+def _valeurs(track):
+    return (
+        track.lyrics.text,
+        track.lyrics.synced,
+        track.lyrics.synced_source,
+        track.lyrics.synced_confidence,
+        track.anecdotes,
+    )
+
+
+@pytest.fixture
+def catalogue(data_manager):
+    """Artiste avec paroles, LRC en colonne ou en observations concurrentes."""
+    artist = _artiste(data_manager)
+    complet = Track(title="Complet", artist=artist, duration=200, anecdotes="Anecdote")
+    complet.lyrics.text = "paroles\ncomplètes"
+    complet.observations = [
+        Observation("lyrics_synced", _LRC_COURT, "ytmusic"),
+        Observation("lyrics_synced", _LRC_LONG, "lrclib"),
+        Observation("bpm", 120, "songbpm"),
+    ]
+    colonne = Track(title="Colonne", artist=artist)
+    colonne.lyrics.text = "   "  # blancs seuls : pas de « vraies » paroles
+    colonne.lyrics.synced = _LRC_COURT
+    colonne.lyrics.synced_source = "lrclib"
+    vide = Track(title="Vide", artist=artist)
+    data_manager.save_tracks([complet, colonne, vide])
+    return artist
+
+
+@pytest.fixture
+def selects(data_manager):
+    emitted = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT"):
+            emitted.append(" ".join(statement.split()))
+
+    event.listen(data_manager.engine, "before_cursor_execute", _capture)
+    return emitted
+
+
+def test_valeurs_reconciliees_identiques_au_chargement_complet(data_manager, catalogue):
+    eager = {t.title: t for t in data_manager.get_artist_tracks(catalogue.id, lazy=False)}
+    lazy = {t.title: t for t in data_manager.get_artist_tracks(catalogue.id)}
+
+    assert set(lazy) == set(eager)
+    for title, track in lazy.items():
+        assert _valeurs(track) == _valeurs(eager[title]), title
+        assert track.audio.bpm == eager[title].audio.bpm
+    assert lazy["Complet"].lyrics.synced_source is not None
+
+
+def test_indices_sans_chargement(data_manager, catalogue, selects):
+    tracks = {t.title: t for t in data_manager.get_artist_tracks(catalogue.id)}
+    selects.clear()
+
+    indices = {title: (t.lyrics.has_text, t.lyrics.has_synced) for title, t in tracks.items()}
+
+    assert indices == {
+        "Complet": (True, True),
+        "Colonne": (False, True),
+        "Vide": (False, False),
+    }
+    assert selects == []  # aucun contenu rapatrié pour les vues liste
+    assert "text" not in vars(tracks["Complet"].lyrics)
+
+
+def test_chargement_par_lots_croissants(data_manager, selects):
+    artist = _artiste(data_manager)
+    batch = []
+    for i in range(40):
+        track = Track(title=f"T{i:02d}", artist=artist)
+        track.lyrics.text = f"paroles {i}"
+        batch.append(track)
+    data_manager.save_tracks(batch)
+    tracks = data_manager.get_artist_tracks(artist.id)
+    selects.clear()
+
+    assert [t.lyrics.text for t in tracks] == [f"paroles {i}" for i in range(40)]
+
+    # Lots 1, 2, 4, 8, 16, 32 → 6 lots de 2 requêtes pour 40 morceaux.
+    assert len(selects) == 12
+
+
+def test_sauvegarde_sans_acces_preserve_le_contenu(data_manager, catalogue, selects):
+    track = next(t for t in data_manager.get_artist_tracks(catalogue.id) if t.title == "Complet")
+    track.genre = "Rap"
+    selects.clear()
+
+    data_manager.save_track(track)
+
+    assert not any("lyrics_synced" in s for s in selects)  # aucun chargement forcé
+    relu = next(
+        t for t in data_manager.get_artist_tracks(catalogue.id, lazy=False) if t.title == "Complet"
+    )
+    assert relu.genre == "Rap"
+    assert relu.lyrics.text == "paroles\ncomplètes"
+    assert relu.anecdotes == "Anecdote"
+
+
+def test_propre_apres_chargement_differe(data_manager, catalogue):
+    tracks = data_manager.get_artist_tracks(catalogue.id)
+    for track in tracks:
+        _valeurs(track)
+
+    assert all(t.changed_fields() == set() for t in tracks if t.title != "Complet")
+    # Verdict LRC ≠ colonne (vide) : même écart que le chargement complet.
+    complet = next(t for t in tracks if t.title == "Complet")
+    eager = next(
+        t for t in data_manager.get_artist_tracks(catalogue.id, lazy=False) if t.title == "Complet"
+    )
+    assert complet.changed_fields() == eager.changed_fields()
+
+
+def test_affectation_avant_chargement_prioritaire(data_manager, catalogue):
+    tracks = data_manager.get_artist_tracks(catalogue.id)
+    complet = next(t for t in tracks if t.title == "Complet")
+    complet.anecdotes = "Nouvelle"
+    complet.lyrics.text = "réécrites"
+
+    assert complet.lyrics.synced  # déclenche le chargement du lot
+    assert (complet.anecdotes, complet.lyrics.text) == ("Nouvelle", "réécrites")
+    assert complet.changed_fields() >= {"anecdotes", "lyrics.text"}
@@ -0,0 +1,218 @@
+"""Tests du pool de pages Playwright async — browser/contexte/pages factices."""
+
+import asyncio
+
+import pytest
+
+from src.scrapers.page_pool import PagePool
+
+
+class FakePage:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(len(self.pages))
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.connected = False
+
+
+def _pool(size=2, max_uses=50, warm=None):
+    browsers = []
+
+    async def launch():
+        browser = FakeBrowser()
+        browsers.append(browser)
+        return browser
+
+    async def new_context(browser):
+        context = FakeContext()
+        browser.contexts.append(context)
+        return context
+
+    return (
+        PagePool(
+            "test", launch=launch, new_context=new_context, warm=warm, size=size, max_uses=max_uses
+        ),
+        browsers,
+    )
+
+
+def test_page_reutilisee_entre_deux_prets():
+    async def scenario():
+        pool, browsers = _pool()
+        async with pool.lease() as p1:
+            pass
+        async with pool.lease() as p2:
+            pass
+        return pool, browsers, p1, p2
+
+    pool, browsers, p1, p2 = asyncio.run(scenario())
+    assert p1 is p2 and not p1.closed
+    assert len(browsers) == 1
+    assert pool.stats == {"leases": 2, "created": 1, "recycled": 0, "relaunched": 0}
+
+
+def test_concurrence_bornee_par_la_taille():
+    in_flight = peak = 0
+
+    async def scenario():
+        pool, browsers = _pool(size=3)
+
+        async def job(_):
+            nonlocal in_flight, peak
+            async with pool.lease():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(job(i) for i in range(10)))
+        return pool, browsers
+
+    pool, browsers = asyncio.run(scenario())
+    assert peak == 3
+    assert pool.stats["created"] == 3  # pages réutilisées, jamais plus que `size`
+    assert len(browsers[0].contexts) == 1  # un seul contexte partagé
+
+
+def test_page_recyclee_apres_max_uses():
+    async def scenario():
+        pool, _ = _pool(size=1, max_uses=2)
+        pages = []
+        for _ in range(3):
+            async with pool.lease() as page:
+                pages.append(page)
+        return pool, pages
+
+    pool, pages = asyncio.run(scenario())
+    assert pages[0] is pages[1] and pages[0].closed
+    assert pages[2] is not pages[0]
+    assert pool.stats["recycled"] == 1
+
+
+def test_exception_ou_discard_ne_recyclent_que_la_page_fautive():
+    async def scenario():
+        pool, browsers = _pool(size=3)
+        await pool.prewarm()
+        pages = list(browsers[0].contexts[0].pages)
+        with pytest.raises(RuntimeError):
+            async with pool.lease() as doomed:
+                raise RuntimeError("boom")
+        async with pool.lease() as discarded:
+            pool.discard(discarded)
+        async with pool.lease() as reused:
+            pass
+        return pool, browsers, pages, doomed, discarded, reused
+
+    pool, browsers, pages, doomed, discarded, reused = asyncio.run(scenario())
+    assert doomed.closed and discarded.closed and doomed is not discarded
+    assert [p.closed for p in pages].count(False) == 1
+    assert reused in pages and not reused.closed
+    assert len(browsers) == 1 and browsers[0].connected
+    assert pool.stats["recycled"] == 2
+
+
+def test_annulation_recycle_la_page():
+    async def scenario():
+        pool, _ = _pool(size=1)
+        seen = []
+
+        async def slow():
+            async with pool.lease() as page:
+                seen.append(page)
+                await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await slow()
+        async with pool.lease() as fresh:
+            pass
+        return seen[0], fresh
+
+    cancelled, fresh = asyncio.run(scenario())
+    assert cancelled.closed
+    assert fresh is not cancelled
+
+
+def test_browser_deconnecte_relance():
+    async def scenario():
+        pool, browsers = _pool(size=1)
+        async with pool.lease() as first:
+            pass
+        browsers[0].connected = False  # crash du browser
+        async with pool.lease() as second:
+            pass
+        return pool, browsers, first, second
+
+    pool, browsers, first, second = asyncio.run(scenario())
+    assert len(browsers) == 2
+    assert second is not first
+    assert pool.stats["relaunched"] == 1
+
+
+def test_echec_du_warm_ferme_la_page():
+    calls = []
+
+    async def warm(page):
+        calls.append(page)
+        if len(calls) == 1:
+            raise RuntimeError("page d'accueil injoignable")
+
+    async def scenario():
+        pool, _ = _pool(size=1, warm=warm)
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                pass
+        async with pool.lease() as page:
+            pass
+        return pool, page
+
+    pool, page = asyncio.run(scenario())
+    assert calls[0].closed
+    assert page is calls[1] and not page.closed
+    assert pool.stats["created"] == 1
+
+
+def test_prewarm_puis_aclose():
+    async def scenario():
+        pool, browsers = _pool(size=3)
+        await pool.prewarm()
+        await pool.prewarm()  # déjà plein : rien de plus
+        created = pool.stats["created"]
+        await pool.aclose()
+        return created, browsers
+
+    created, browsers = asyncio.run(scenario())
+    assert created == 3
+    context = browsers[0].contexts[0]
+    assert all(page.closed for page in context.pages)
+    assert context.closed and not browsers[0].connected
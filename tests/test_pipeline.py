@@ -0,0 +1,162 @@
+"""Tests du pipeline par étages (`run_pipeline`) — sans réseau."""
+
+import asyncio
+
+import pytest
+
+from src.concurrency.pipeline import Stage, run_pipeline
+
+
+class _Probe:
+    """Worker d'étage : rend la main, journalise et mesure le pic en vol."""
+
+    def __init__(self, name, log, delay=0.001, fail_on=()):
+        self.name, self.log, self.delay, self.fail_on = name, log, delay, set(fail_on)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, item):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if item in self.fail_on:
+                raise RuntimeError(f"{self.name} {item}")
+            self.log.append((self.name, item))
+            return item
+        finally:
+            self.in_flight -= 1
+
+
+def test_chaque_element_traverse_tous_les_etages_avec_leur_concurrence():
+    log = []
+    a, b = _Probe("a", log), _Probe("b", log, delay=0.005)
+    result = asyncio.run(
+        run_pipeline(range(20), [Stage("a", a, concurrency=2), Stage("b", b, concurrency=4)])
+    )
+
+    assert sorted(result.items) == list(range(20))
+    assert a.peak == 2 and b.peak == 4
+    assert {name: s.done for name, s in result.stats.items()} == {"a": 20, "b": 20}
+    assert not result.stopped
+
+
+def test_flux_continu_le_premier_element_sort_avant_la_fin_de_la_source():
+    log = []
+
+    async def source():
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            log.append(("source", i))
+            yield i
+
+    asyncio.run(run_pipeline(source(), [Stage("save", _Probe("save", log))]))
+    assert log.index(("save", 0)) < log.index(("source", 4))
+
+
+def test_backpressure_la_source_attend_l_etage_lent():
+    pulled = 0
+
+    def source():
+        nonlocal pulled
+        for i in range(50):
+            pulled += 1
+            yield i
+
+    seen_ahead = []
+
+    async def slow(item):
+        seen_ahead.append(pulled - item)
+        await asyncio.sleep(0.001)
+        return item
+
+    asyncio.run(run_pipeline(source(), [Stage("slow", slow, queue_size=3)]))
+    # Jamais plus que la file (3) + l'élément en main de la source d'avance
+    assert max(seen_ahead) <= 5
+
+
+def test_echec_compte_et_l_element_poursuit():
+    log = []
+    stages = [
+        Stage("scrape", _Probe("scrape", log, fail_on={3})),
+        Stage("save", _Probe("save", log)),
+    ]
+    result = asyncio.run(run_pipeline(range(5), stages))
+
+    assert sorted(result.items) == list(range(5))
+    assert result.stats["scrape"].failed == 1
+    assert ("save", 3) in log
+
+
+def test_none_ecarte_l_element():
+    async def keep_even(item):
+        return item if item % 2 == 0 else None
+
+    result = asyncio.run(run_pipeline(range(6), [Stage("filtre", keep_even)]))
+    assert sorted(result.items) == [0, 2, 4]
+
+
+def test_etage_par_lots():
+    batches = []
+
+    async def save(batch):
+        batches.append(list(batch))
+
+    result = asyncio.run(run_pipeline(range(23), [Stage("save", save, batch_size=10)]))
+
+    assert sorted(result.items) == list(range(23))
+    assert all(len(b) <= 10 for b in batches)
+    assert sorted(sum(batches, [])) == list(range(23))
+    assert result.stats["save"].done == 23
+
+
+def test_should_stop_draine_les_elements_en_vol():
+    log = []
+    pulled = []
+
+    def source():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    result = asyncio.run(
+        run_pipeline(
+            source(),
+            [Stage("a", _Probe("a", log)), Stage("save", _Probe("save", log))],
+            should_stop=lambda: len(pulled) > 5,
+        )
+    )
+
+    assert result.stopped
+    assert len(pulled) < 100
+    # Tout ce qui est entré est allé jusqu'au bout
+    assert sorted(result.items) == sorted(i for name, i in log if name == "a")
+
+
+def test_progression_par_etage():
+    snapshots = []
+    stages = [Stage("a", _Probe("a", [])), Stage("b", _Probe("b", []))]
+    asyncio.run(run_pipeline(range(3), stages, on_progress=snapshots.append))
+
+    assert len(snapshots) == 6
+    assert snapshots[-1]["a"].done == 3 and snapshots[-1]["b"].done == 3
+
+
+def test_annulation_arrete_tous_les_etages():
+    started = []
+
+    async def forever(item):
+        started.append(item)
+        await asyncio.sleep(10)
+
+    async def scenario():
+        task = asyncio.ensure_future(
+            run_pipeline(range(10), [Stage("lent", forever, concurrency=2)])
+        )
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert len(started) == 2
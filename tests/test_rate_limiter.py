@@ -4,7 +4,12 @@ import asyncio
 
 import pytest
 
-from src.concurrency.rate_limiter import DomainRateLimiter
+from src.concurrency.rate_limiter import (
+    DOMAIN_POLICIES,
+    DomainPolicy,
+    DomainRateLimiter,
+    parse_retry_after,
+)
 
 
 class FakeClock:
@@ -22,9 +27,12 @@ class FakeClock:
         self.t += seconds
 
 
-def make_limiter(min_delay: float = 1.0) -> tuple[DomainRateLimiter, FakeClock]:
+def make_limiter(
+    min_delay: float = 1.0, policies: dict | None = None
+) -> tuple[DomainRateLimiter, FakeClock]:
     clock = FakeClock()
-    return DomainRateLimiter(min_delay, clock=clock.now, sleep=clock.sleep), clock
+    limiter = DomainRateLimiter(min_delay, policies=policies, clock=clock.now, sleep=clock.sleep)
+    return limiter, clock
 
 
 async def _request(limiter, domain, clock=None, duration=0.0):
@@ -181,3 +189,93 @@ def test_default_delay_comes_from_config():
     from src.config import DELAY_BETWEEN_REQUESTS
 
     assert DomainRateLimiter().min_delay == DELAY_BETWEEN_REQUESTS
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Politiques par domaine, Retry-After, AIMD, statistiques
+# ──────────────────────────────────────────────────────────────────────
+
+BUCKET = {"api.deezer.com": DomainPolicy(rate=10.0, burst=2, max_concurrency=4, min_delay=0.0)}
+
+
+def test_token_bucket_burst_then_sustained_rate():
+    limiter, clock = make_limiter(policies=BUCKET)
+
+    async def scenario():
+        for _ in range(4):
+            await _request(limiter, "api.deezer.com")
+
+    asyncio.run(scenario())
+    # 2 jetons de rafale, puis un jeton toutes les 0,1 s
+    assert clock.sleeps == [pytest.approx(0.1), pytest.approx(0.1)]
+
+
+def test_policy_concurrency_and_subdomains():
+    limiter, _ = make_limiter(min_delay=0.0, policies=BUCKET)
+    inside = max_inside = 0
+
+    async def one():
+        nonlocal inside, max_inside
+        async with limiter.limit("API.deezer.com:443"):
+            inside += 1
+            max_inside = max(max_inside, inside)
+            await asyncio.sleep(0)
+            inside -= 1
+
+    async def scenario():
+        await asyncio.gather(*(one() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert max_inside == 4  # max_concurrency de la politique (≠ Semaphore(1) historique)
+    assert limiter.policy("www.lrclib.net") == DomainPolicy()  # pas dans BUCKET
+    assert DomainRateLimiter(0.0, policies=DOMAIN_POLICIES).policy("www.lrclib.net").rate
+
+
+def test_retry_after_suspends_domain_and_halves_pace():
+    limiter, clock = make_limiter(policies=BUCKET)
+
+    async def scenario():
+        async with limiter.limit("api.deezer.com"):
+            limiter.observe("api.deezer.com", 429, "5")
+        await _request(limiter, "api.deezer.com")
+        await _request(limiter, "api.genius.com")  # autre domaine : pas suspendu
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [pytest.approx(5.0)]
+    stats = limiter.stats()["api.deezer.com"]
+    assert stats.throttled == 1
+    assert stats.pace == pytest.approx(0.5)
+    assert stats.max_wait == pytest.approx(5.0)
+    assert stats.mean_wait == pytest.approx(2.5)
+
+
+def test_aimd_backoff_without_retry_after_and_recovery():
+    limiter, clock = make_limiter(min_delay=1.0)
+
+    async def scenario():
+        for status in (429, 429):
+            async with limiter.limit("a.com"):
+                limiter.observe("a.com", status)
+        assert limiter.stats()["a.com"].pace == pytest.approx(0.25)
+        for _ in range(20):
+            async with limiter.limit("a.com"):
+                limiter.observe("a.com", 200)
+
+    asyncio.run(scenario())
+    assert limiter.stats()["a.com"].pace == 1.0  # plafonnée à la politique
+    # Après le 2ᵉ 429 : repli 1 s / 0,25 = 4 s (délai mini 1 s / 0,25 absorbé)
+    assert clock.sleeps[1] == pytest.approx(4.0)
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("bientôt") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412500.0) == 10.0
+    assert parse_retry_after("99999") == 120.0  # plafonné
+
+
+def test_politique_deezer_tient_le_quota_de_50_par_5s():
+    # Pire cas : seau plein puis 5 s de recharge ≤ 50 requêtes
+    deezer = DOMAIN_POLICIES["api.deezer.com"]
+    assert deezer.burst + deezer.rate * 5 <= 50
@@ -0,0 +1,178 @@
+"""Tests du cache de réconciliation (`reconcile_cache`, révision e14).
+
+Le verdict de `reconcile()` est persisté par morceau avec l'empreinte de ses
+observations : un chargement d'artiste le reprend tel quel tant qu'elles n'ont
+pas changé. Invariants : mêmes valeurs qu'un vote complet, override manuel
+toujours gagnant, invalidation par toute écriture d'observation (repository OU
+SQL direct), reconstruction complète par `rebuild_reconcile_cache`.
+"""
+
+import sqlite3
+
+import pytest
+
+import src.enrichment.reconcile_cache as reconcile_cache
+from src.enrichment.observation import Observation
+from src.enrichment.reconcile import MANUAL_SOURCE, reconcile
+from src.enrichment.reconcile_cache import ResolutionCache, fingerprint
+from src.models import Artist, Track
+
+_LRC = "[00:01.00] un\n[00:02.00] deux"
+
+
+def _artiste(dm, name="Artiste Test"):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+def _audio(track):
+    a = track.audio
+    return (a.bpm, a.bpm_alt, a.bpm_source, a.key, a.mode, a.musical_key, a.key_mode_source)
+
+
+def _charger(dm, artist, **kwargs):
+    return {t.title: t for t in dm.get_artist_tracks(artist.id, **kwargs)}
+
+
+def _entrees(dm):
+    with sqlite3.connect(dm.db_path) as conn:
+        return conn.execute("SELECT track_id FROM reconcile_cache ORDER BY track_id").fetchall()
+
+
+@pytest.fixture
+def votes(monkeypatch):
+    """Nombre d'appels au moteur depuis le cache (re-votes effectifs)."""
+    calls = []
+    original = reconcile_cache.reconcile
+
+    def _counting(observations, **kwargs):
+        calls.append(len(observations))
+        return original(observations, **kwargs)
+
+    monkeypatch.setattr(reconcile_cache, "reconcile", _counting)
+    return calls
+
+
+@pytest.fixture
+def artiste(data_manager):
+    artist = _artiste(data_manager)
+    vote = Track(title="Vote", artist=artist, duration=200)
+    vote.observations = [
+        Observation("bpm", 120, "deezer", 1),
+        Observation("bpm", 121, "reccobeats", 1),
+        Observation("bpm", 60, "getsongbpm", 1),
+        Observation("key", 5, "reccobeats"),
+        Observation("mode", 0, "reccobeats"),
+        Observation("key", 7, "getsongbpm"),  # paire incomplète : battue
+        Observation("lyrics_synced", _LRC, "lrclib"),
+    ]
+    simple = Track(title="Simple", artist=artist)
+    simple.observations = [Observation("bpm", 95, "deezer", 1)]
+    data_manager.save_tracks([vote, simple, Track(title="Sans obs", artist=artist)])
+    return artist
+
+
+def test_second_chargement_sans_revote(data_manager, artiste, votes):
+    premier = _charger(data_manager, artiste)
+    assert votes  # cache vide : vote puis écriture
+    assert len(_entrees(data_manager)) == 2  # morceau sans observation : pas d'entrée
+    votes.clear()
+
+    second = _charger(data_manager, artiste)
+
+    assert votes == []
+    for title, track in second.items():
+        assert _audio(track) == _audio(premier[title]), title
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_valeurs_identiques_au_vote_complet(data_manager, artiste, lazy):
+    _charger(data_manager, artiste)  # remplit le cache
+    cached = _charger(data_manager, artiste, lazy=lazy)
+
+    track = cached["Vote"]
+    expected = reconcile(data_manager.get_observations(track.id), track_duration=200)
+    assert track.audio.bpm == expected["bpm"].value
+    assert track.audio.bpm_source == expected["bpm"].source
+    assert (track.audio.key, track.audio.mode) == (5, 0)
+    assert track.lyrics.synced == _LRC  # hors cache, réconcilié à part
+    assert track.lyrics.synced_source == expected["lyrics_synced"].source
+
+
+def test_override_manuel_invalide_et_gagne(data_manager, artiste):
+    track = _charger(data_manager, artiste)["Vote"]
+
+    data_manager.upsert_observations(track.id, [Observation("bpm", 99, MANUAL_SOURCE)])
+
+    assert track.id not in {tid for (tid,) in _entrees(data_manager)}
+    relu = _charger(data_manager, artiste)["Vote"]
+    assert (relu.audio.bpm, relu.audio.bpm_source) == (99, MANUAL_SOURCE)
+
+
+def test_ecriture_hors_repository_detectee_par_empreinte(data_manager, artiste, votes):
+    tid = _charger(data_manager, artiste)["Simple"].id
+    with sqlite3.connect(data_manager.db_path) as conn:
+        conn.execute(
+            "UPDATE observations SET value = '140' WHERE track_id = ? AND field = 'bpm'", (tid,)
+        )
+    votes.clear()
+
+    relu = _charger(data_manager, artiste)
+
+    assert relu["Simple"].audio.bpm == 140
+    assert votes == [1]  # seul le morceau modifié est re-voté
+
+
+def test_suppression_d_observations_lyrics_garde_le_cache(data_manager, artiste):
+    tid = _charger(data_manager, artiste)["Vote"].id
+
+    data_manager.delete_observations(tid, "lyrics_synced")
+    assert tid in {t for (t,) in _entrees(data_manager)}
+
+    data_manager.delete_observations(tid, "key")
+    assert tid not in {t for (t,) in _entrees(data_manager)}
+
+
+def test_fusion_invalide_le_morceau_conserve(data_manager, artiste):
+    loaded = _charger(data_manager, artiste)
+    keep, dup = loaded["Simple"].id, loaded["Vote"].id
+
+    assert data_manager.merge_tracks(keep, dup)
+
+    assert _entrees(data_manager) == []
+    relu = _charger(data_manager, artiste)
+    assert set(relu) == {"Simple", "Sans obs"}
+    assert relu["Simple"].audio.key == 5  # paire key/mode héritée du doublon
+
+
+def test_reconstruction_complete(data_manager, artiste, votes):
+    with sqlite3.connect(data_manager.db_path) as conn:
+        conn.execute(
+            "INSERT INTO reconcile_cache (track_id, obs_hash, resolutions) VALUES (999, 'x', '[]')"
+        )
+
+    assert data_manager.rebuild_reconcile_cache() == 2
+
+    assert len(_entrees(data_manager)) == 2  # orpheline 999 purgée
+    votes.clear()
+    _charger(data_manager, artiste)
+    assert votes == []
+
+
+def test_empreinte_stable_et_versionnee(monkeypatch):
+    a = [Observation("bpm", 120, "deezer", 1), Observation("key", 5, "reccobeats")]
+    b = [Observation("key", "5", "reccobeats"), Observation("bpm", "120", "deezer", 1.0)]
+    assert fingerprint(a) == fingerprint(b)  # ordre et forme TEXT indifférents
+
+    digest = fingerprint(a)
+    monkeypatch.setattr(reconcile_cache, "CACHE_VERSION", reconcile_cache.CACHE_VERSION + 1)
+    assert fingerprint(a) != digest
+
+
+def test_cache_seul_lyrics_rien_a_ecrire():
+    cache = ResolutionCache()
+    resolutions = cache.resolve(1, [Observation("lyrics_synced", _LRC, "lrclib")])
+
+    assert "lyrics_synced" in resolutions
+    assert cache.stale == {}
@@ -0,0 +1,118 @@
+"""Tests de la sauvegarde par LOT (`TrackRepository.save_tracks`).
+
+Même sémantique que `save_track` (UPDATE non-destructif, crédits remplacés,
+observations upsertées) mais une seule transaction pour tout le lot, ids
+existants résolus en une requête et isolation par SAVEPOINT : un morceau en
+échec est annulé seul, le reste du lot est commité.
+"""
+
+import sqlite3
+
+from sqlalchemy import event
+
+from src.enrichment.observation import Observation
+from src.models import Artist, Credit, CreditRole, Track
+
+
+def _artiste(dm, name="Artiste Test"):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+def _rows(dm, sql, params=()):
+    with sqlite3.connect(dm.db_path) as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def test_lot_equivalent_a_save_track(data_manager):
+    artist = _artiste(data_manager)
+    track = Track(title="Lot", artist=artist, album="Album")
+    track.credits = [
+        Credit(name="Prod A", role=CreditRole.PRODUCER, role_detail="Beat"),
+        Credit(name="Prod A", role=CreditRole.PRODUCER, role_detail="Beat"),  # doublon
+        Credit(name="Ingé", role=CreditRole.MIXING_ENGINEER, source="discogs"),
+    ]
+    track.scraping_errors = ["timeout", "404"]
+    track.observations = [Observation("bpm", 128, "songbpm")]
+
+    ids = data_manager.save_tracks([track, Track(title="Autre", artist=artist)])
+
+    assert ids == [track.id, ids[1]] and all(ids)
+    lu = {t.title: t for t in data_manager.get_artist_tracks(artist.id)}
+    assert lu["Lot"].album == "Album"
+    assert lu["Lot"].audio.bpm == 128
+    assert [(c.name, c.role) for c in lu["Lot"].credits] == [
+        ("Prod A", CreditRole.PRODUCER),
+        ("Ingé", CreditRole.MIXING_ENGINEER),
+    ]
+    assert _rows(
+        data_manager, "SELECT COUNT(*) FROM scraping_errors WHERE track_id = ?", ids[:1]
+    ) == [(2,)]
+
+
+def test_ids_existants_resolus_et_update_non_destructif(data_manager):
+    artist = _artiste(data_manager)
+    existant = Track(title="Déjà là", artist=artist)
+    existant.lyrics.text = "paroles"
+    tid = data_manager.save_track(existant)
+
+    refetch = Track(title="Déjà là", artist=artist, album="Nouvel album")
+    ids = data_manager.save_tracks([refetch, Track(title="Nouveau", artist=artist)])
+
+    assert ids[0] == tid and refetch.id == tid
+    lu = {t.title: t for t in data_manager.get_artist_tracks(artist.id)}
+    assert len(lu) == 2
+    assert lu["Déjà là"].album == "Nouvel album"
+    assert lu["Déjà là"].lyrics.text == "paroles"  # COALESCE : préservées
+
+
+def test_doublon_dans_le_lot_met_a_jour_le_premier(data_manager):
+    artist = _artiste(data_manager)
+    ids = data_manager.save_tracks(
+        [Track(title="Bis", artist=artist), Track(title="Bis", artist=artist, genre="Rap")]
+    )
+
+    assert ids[0] == ids[1]
+    tracks = data_manager.get_artist_tracks(artist.id)
+    assert len(tracks) == 1 and tracks[0].genre == "Rap"
+
+
+def test_echec_isole_par_savepoint(data_manager):
+    artist = _artiste(data_manager)
+    casse = Track(title="Cassé", artist=artist)
+    # field NULL → NOT NULL violé APRÈS l'INSERT du morceau : tout doit être annulé.
+    casse.observations = [Observation(None, 1, "songbpm")]
+
+    ids = data_manager.save_tracks(
+        [Track(title="Avant", artist=artist), casse, Track(title="Après", artist=artist)]
+    )
+
+    assert ids[0] and ids[1] is None and ids[2]
+    assert casse.id is None  # l'id de l'INSERT annulé n'a pas survécu
+    titres = {t.title for t in data_manager.get_artist_tracks(artist.id)}
+    assert titres == {"Avant", "Après"}
+
+
+def test_morceau_sans_artiste_persiste_ignore(data_manager):
+    artist = _artiste(data_manager)
+    ids = data_manager.save_tracks(
+        [Track(title="Orphelin", artist=Artist(name="Inconnu")), Track(title="Ok", artist=artist)]
+    )
+
+    assert ids[0] is None and ids[1]
+
+
+def test_un_seul_commit_pour_le_lot(data_manager):
+    artist = _artiste(data_manager)
+    commits = []
+    event.listen(data_manager.engine, "commit", lambda conn: commits.append(1))
+
+    data_manager.save_tracks([Track(title=f"T{i}", artist=artist) for i in range(50)])
+
+    assert len(commits) == 1
+    assert len(data_manager.get_artist_tracks(artist.id)) == 50
+
+
+def test_lot_vide(data_manager):
+    assert data_manager.save_tracks([]) == []
@@ -16,6 +16,7 @@ import sqlite3
 from sqlalchemy.dialects import sqlite
 
 from src.persistence import schema
+from src.persistence.search_index import SEARCH_TABLE
 from src.utils.db import Database
 
 _SQLITE = sqlite.dialect()
@@ -24,11 +25,13 @@ _SQLITE = sqlite.dialect()
 def _db_tables(conn) -> set[str]:
     # alembic_version (créée par le bootstrap E1d) n'appartient pas au schéma
     # métier décrit par schema.py : on l'exclut de la comparaison.
+    # Idem pour l'index FTS5 (e16) : table virtuelle + tables fantômes
+    # `track_search_*`, hors MetaData (cf. src/persistence/search_index.py).
     rows = conn.execute(
         "SELECT name FROM sqlite_master "
         "WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name != 'alembic_version'"
     ).fetchall()
-    return {r[0] for r in rows}
+    return {r[0] for r in rows if r[0] != SEARCH_TABLE and not r[0].startswith(f"{SEARCH_TABLE}_")}
 
 
 def _db_columns(conn, table: str) -> dict[str, str]:
@@ -92,3 +95,37 @@ def test_metadata_couvre_les_46_migrations(tmp_path):
             assert len(table.columns) == len(
                 _db_columns(conn, name)
             ), f"Nombre de colonnes différent sur '{name}'"
+
+
+def _db_secondary_indexes(conn, table: str) -> dict[str, tuple[str, ...]]:
+    """{nom_index: colonnes} des index NOMMÉS (hors autoindex UNIQUE/PK)."""
+    return {
+        idx[1]: tuple(ic[2] for ic in conn.execute(f"PRAGMA index_info({idx[1]})"))
+        for idx in conn.execute(f"PRAGMA index_list({table})").fetchall()
+        if not idx[1].startswith("sqlite_autoindex")
+    }
+
+
+def test_index_secondaires_identiques(tmp_path):
+    # e13 : les index déclarés dans schema.py existent en base (upgrade head),
+    # mêmes noms, mêmes colonnes, dans le même ordre.
+    db = _fresh_db(tmp_path)
+    with sqlite3.connect(db.db_path) as conn:
+        for name, table in schema.metadata.tables.items():
+            declared = {i.name: tuple(c.name for c in i.columns) for i in table.indexes}
+            assert declared == _db_secondary_indexes(conn, name), f"Divergence index sur '{name}'"
+
+
+def test_chargement_artiste_sans_scan_de_table(tmp_path):
+    # Requête chaude de get_artist_tracks : filtrée par l'index (artist_id, title),
+    # plus de SCAN de la table entière (l'UNIQUE(title, artist_id) ne servait pas).
+    db = _fresh_db(tmp_path)
+    with sqlite3.connect(db.db_path) as conn:
+        plan = " | ".join(
+            r[3]
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tracks WHERE artist_id = 1 ORDER BY title"
+            )
+        )
+    assert "ix_tracks_artist_id_title" in plan
+    assert "SCAN" not in plan
@@ -0,0 +1,148 @@
+"""Tests de l'index plein texte (`track_search`, révision e16).
+
+Recherche tous artistes confondus dans titres, paroles (compressées en base),
+anecdotes et noms crédités. Invariants : l'index suit chaque écriture du
+repository (sauvegarde complète ou par diff, suppression, fusion, renommage,
+suppression d'artiste), la requête utilisateur n'est jamais interprétée comme
+syntaxe FTS5, et `rebuild_search_index` rattrape une écriture hors repository.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.models import Artist, Credit, CreditRole, Track
+from src.persistence import text_codec
+from src.persistence.search_index import match_expression
+
+_PAROLES = "Sous le ciel de Marseille, un papillon s'envole\n" * 30  # > seuil de compression
+
+
+def _artiste(dm, name):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+def _ids(hits):
+    return [h["track_id"] for h in hits]
+
+
+@pytest.fixture
+def catalogue(data_manager, monkeypatch):
+    monkeypatch.setattr(text_codec, "DB_TEXT_COMPRESSION", "zlib")  # opt-in (défaut : clair)
+    a, b = _artiste(data_manager, "Artiste A"), _artiste(data_manager, "Artiste B")
+    papillon = Track(title="Papillon", artist=a, album="Envol")
+    papillon.lyrics.text = _PAROLES
+    papillon.credits = [
+        Credit("Kore", CreditRole.PRODUCER),
+        Credit("Kore", CreditRole.COMPOSER),
+    ]
+    cafe = Track(title="Café crème", artist=a, anecdotes="Enregistré à Montréal en une nuit.")
+    autre = Track(title="Nuit blanche", artist=b)
+    autre.lyrics.text = "Un papillon passe dans la nuit"
+    autre.credits = [
+        Credit("Kore", CreditRole.PRODUCER),
+        Credit("Skread", CreditRole.MIXING_ENGINEER),
+    ]
+    data_manager.save_tracks([papillon, cafe, autre])
+    return {"a": a, "b": b, "papillon": papillon, "cafe": cafe, "autre": autre}
+
+
+def test_paroles_compressees_indexees_avec_extrait(data_manager, catalogue):
+    with sqlite3.connect(data_manager.db_path) as conn:
+        (stored,) = conn.execute(
+            "SELECT typeof(lyrics) FROM tracks WHERE id = ?", (catalogue["papillon"].id,)
+        ).fetchone()
+    assert stored == "blob"
+
+    hits = data_manager.search("marseille")
+
+    assert _ids(hits) == [catalogue["papillon"].id]
+    assert hits[0]["artist_name"] == "Artiste A"
+    assert hits[0]["album"] == "Envol"
+    assert "[Marseille]" in hits[0]["snippet"]
+
+
+def test_accents_casse_et_prefixe(data_manager, catalogue):
+    assert _ids(data_manager.search("CAFE")) == [catalogue["cafe"].id]
+    assert _ids(data_manager.search("montr")) == [catalogue["cafe"].id]  # préfixe
+    assert data_manager.search("  ") == []
+
+
+def test_credits_tous_artistes_et_colonne(data_manager, catalogue):
+    hits = data_manager.search("kore", column="credits")
+
+    assert set(_ids(hits)) == {catalogue["papillon"].id, catalogue["autre"].id}
+    assert {h["artist_name"] for h in hits} == {"Artiste A", "Artiste B"}
+    assert data_manager.search("papillon", column="credits") == []
+    with pytest.raises(ValueError):
+        data_manager.search("kore", column="bpm")
+
+
+def test_filtre_artiste_et_classement(data_manager, catalogue):
+    hits = data_manager.search("papillon")
+    # Titre (poids fort) avant une simple mention dans les paroles.
+    assert _ids(hits) == [catalogue["papillon"].id, catalogue["autre"].id]
+    assert _ids(data_manager.search("papillon", artist_id=catalogue["b"].id)) == [
+        catalogue["autre"].id
+    ]
+    assert len(data_manager.search("papillon", limit=1)) == 1
+
+
+@pytest.mark.parametrize(
+    "query", ['papillon "', "NEAR(papillon", "papillon:", "papillon*", "-papillon ^"]
+)
+def test_syntaxe_fts5_jamais_interpretee(data_manager, catalogue, query):
+    # Ponctuation ignorée, opérateurs pris comme de simples mots : pas d'erreur.
+    expected = [] if "NEAR" in query else [catalogue["papillon"].id, catalogue["autre"].id]
+    assert _ids(data_manager.search(query)) == expected
+
+
+def test_sauvegarde_par_diff_reindexe(data_manager, catalogue):
+    track = {t.title: t for t in data_manager.get_artist_tracks(catalogue["a"].id)}["Café crème"]
+    track.anecdotes = "Écrit à Lisbonne."
+    track.credits = [Credit("Ponce", CreditRole.WRITER)]
+    data_manager.save_track(track)
+
+    assert data_manager.search("montreal") == []
+    assert _ids(data_manager.search("lisbonne")) == [track.id]
+    assert _ids(data_manager.search("ponce", column="credits")) == [track.id]
+
+
+def test_suppression_fusion_renommage(data_manager, catalogue):
+    papillon, autre, cafe = catalogue["papillon"], catalogue["autre"], catalogue["cafe"]
+
+    assert data_manager.merge_tracks(papillon.id, autre.id)
+    assert _ids(data_manager.search("skread")) == [papillon.id]  # crédit transféré
+    assert _ids(data_manager.search("blanche")) == []
+
+    assert data_manager.rename_track(cafe.id, "Thé vert")
+    assert _ids(data_manager.search("the vert")) == [cafe.id]
+
+    assert data_manager.delete_track(cafe.id)
+    assert data_manager.search("lisbonne montreal") == []
+    assert data_manager.search("vert") == []
+
+    assert data_manager.delete_artist("Artiste A")
+    assert data_manager.search("papillon") == []
+
+
+def test_reconstruction_apres_ecriture_hors_repository(data_manager, catalogue):
+    with sqlite3.connect(data_manager.db_path) as conn:
+        conn.execute(
+            "UPDATE tracks SET anecdotes = 'Clip tourné à Dakar' WHERE id = ?",
+            (catalogue["autre"].id,),
+        )
+    assert data_manager.search("dakar") == []
+
+    assert data_manager.rebuild_search_index() == 3
+
+    assert _ids(data_manager.search("dakar")) == [catalogue["autre"].id]
+    assert len(data_manager.search("papillon")) == 2
+
+
+def test_expression_match():
+    assert match_expression('il a dit "stop"') == '"il" "a" "dit" "stop"*'
+    assert match_expression("kore", "credits") == 'credits : ("kore"*)'
+    assert match_expression("*:()") is None
@@ -0,0 +1,148 @@
+"""Tests du backfill SNEP concurrent et reprenable (`snep_backfill`).
+
+Site simulé par un `httpx.MockTransport` (pages HTML construites en ligne,
+zéro réseau), CSV maître dans tmp_path.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.api.async_http import AsyncHttpSession
+from src.concurrency.rate_limiter import DomainRateLimiter
+from src.utils import snep_backfill
+from src.utils.snep_backfill import backfill, checkpoint_path, staging_path
+from src.utils.update_snep import _CSV_HEADER, _parse_certifications_page
+
+_PAGES = 3
+
+
+def _page_html(year: int, page: int) -> str:
+    blocks = "".join(f"""
+        <div class="certification">
+          <div class="description">
+            <div class="categorie">Singles</div>
+            <div class="titre">Titre {year}-{page}-{i}</div>
+            <div class="artiste">ARTISTE {i}</div>
+            <div class="editeur">Label</div>
+          </div>
+          <div class="certif icon-or">Or</div>
+          <div class="block_dates">
+            <div class="date">01/01/{year} <span>Date de sortie</span></div>
+            <div class="date">15/06/{year} <span>Date de constat</span></div>
+          </div>
+        </div>""" for i in range(2))
+    links = "".join(f'<a href="/les-certifications/page/{n}?annee={year}">{n}</a>' for n in (2, 3))
+    return f"<html><body>{blocks}{links}</body></html>"
+
+
+def _page_of(request: httpx.Request) -> tuple[int, int]:
+    year = int(request.url.params["annee"])
+    path = request.url.path.rstrip("/")
+    page = int(path.rsplit("/", 1)[1]) if "/page/" in path else 1
+    return year, page
+
+
+class _Site:
+    """Site SNEP simulé ; `failing` : pages (année, page) en erreur 500."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requested: list[tuple[int, int]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        year, page = _page_of(request)
+        self.requested.append((year, page))
+        if (year, page) in self.failing:
+            return httpx.Response(500)
+        return httpx.Response(200, text=_page_html(year, page))
+
+
+@pytest.fixture
+def master(tmp_path, monkeypatch):
+    monkeypatch.setattr(snep_backfill, "DELAY_BETWEEN_REQUESTS", 0)
+    monkeypatch.setattr(snep_backfill, "MAX_RETRIES", 2)
+    dest = tmp_path / "certif-.csv"
+    known = _parse_certifications_page(_page_html(2020, 1))[0]
+    dest.write_text("﻿" + _CSV_HEADER + "\n" + known + "\n", encoding="utf-8")
+    return dest
+
+
+def _run(dest, years, site: _Site) -> int:
+    http = AsyncHttpSession(transport=httpx.MockTransport(site), limiter=DomainRateLimiter(0.0))
+
+    async def scenario():
+        try:
+            return await backfill(dest, years, http=http, concurrency=2)
+        finally:
+            await http.aclose()
+
+    return asyncio.run(scenario())
+
+
+def _expected_rows(years) -> list[str]:
+    return [
+        row
+        for year in years
+        for page in range(1, _PAGES + 1)
+        for row in _parse_certifications_page(_page_html(year, page))
+    ]
+
+
+def test_annees_concurrentes_fusionnees_une_fois(master):
+    site = _Site()
+    added = _run(master, [2021, 2020], site)
+
+    lines = master.read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0] == _CSV_HEADER
+    assert sorted(lines[1:]) == sorted(_expected_rows([2020, 2021]))  # dédup _row_key
+    assert added == 2 * _PAGES * 2 - 1  # la ligne déjà connue n'est pas recomptée
+    assert sorted(site.requested) == [(y, p) for y in (2020, 2021) for p in range(1, _PAGES + 1)]
+    assert not staging_path(master).exists() and not checkpoint_path(master).exists()
+
+
+def test_reprise_apres_interruption_depuis_le_jalon(master):
+    first = _Site(failing={(2021, 2)})
+    _run(master, [2020, 2021], first)
+
+    # 2020 terminée et fusionnée ; 2021 : page 1 fusionnée, jalon conservé
+    assert json.loads(checkpoint_path(master).read_text()) == {
+        "2020": {"page": _PAGES, "last_page": _PAGES, "done": True},
+        "2021": {"page": 1, "last_page": _PAGES},
+    }
+    assert first.requested.count((2021, 2)) == 2  # retries épuisés
+
+    second = _Site()
+    _run(master, [2020, 2021], second)
+
+    assert second.requested == [(2021, 2), (2021, 3)]  # ni 2020 ni la page 1 refaites
+    lines = master.read_text(encoding="utf-8-sig").splitlines()[1:]
+    assert sorted(lines) == sorted(_expected_rows([2020, 2021]))
+    assert not checkpoint_path(master).exists()
+
+
+def test_page_rejouee_absorbee_par_la_dedup(master):
+    # Crash entre staging et jalon : la page 1 est déjà stagée mais sera refaite
+    staging_path(master).write_text(
+        "\n".join(_parse_certifications_page(_page_html(2022, 1))) + "\n", encoding="utf-8"
+    )
+    _run(master, [2022], _Site())
+
+    lines = master.read_text(encoding="utf-8-sig").splitlines()[1:]
+    assert len(lines) == len(set(lines)) == 1 + 2 * _PAGES
+
+
+def test_page_vide_laisse_l_annee_reprenable(master):
+    class _EmptySite(_Site):
+        def __call__(self, request):
+            self.requested.append(_page_of(request))
+            return httpx.Response(200, text="<html><body>maintenance</body></html>")
+
+    _run(master, [2023], _EmptySite())
+    assert not checkpoint_path(master).exists()  # année ni terminée ni jalonnée
+
+    second = _Site()
+    _run(master, [2023], second)
+    assert second.requested == [(2023, p) for p in range(1, _PAGES + 1)]  # retentée
@@ -5,6 +5,7 @@ logique d'extraction étant partagée)."""
 
 import pytest
 
+from src.persistence.kv_cache import KVCache
 from src.scrapers.spotify_id_scraper_v2 import SpotifyIDScraper
 
 TRACK_ID = "6xIDZPcKh7x070OUZkt7Fr"
@@ -13,7 +14,7 @@ ARTIST_ID = "0OQMxt6l70FM2YlLwYDiEn"
 
 @pytest.fixture()
 def scraper(tmp_path):
-    return SpotifyIDScraper(cache_file=str(tmp_path / "cache.json"))
+    return SpotifyIDScraper(cache=KVCache(tmp_path / "cache.db"))
 
 
 @pytest.mark.parametrize(
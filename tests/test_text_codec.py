@@ -0,0 +1,102 @@
+"""Tests de la compression transparente des paroles / LRC (`text_codec`, e15).
+
+Codec : aller-retour zlib, textes courts/blancs laissés en clair, lignes legacy
+TEXT lues telles quelles, charge corrompue → None. Repository : paroles, LRC en
+colonne et observations `lyrics_synced` stockés en BLOB marqué, relus en clair
+par tous les chemins (chargement complet, projection, `get_observations`).
+"""
+
+import sqlite3
+
+import pytest
+
+from src.enrichment.observation import Observation
+from src.models import Artist, Track
+from src.persistence import text_codec
+from src.persistence.text_codec import MAGIC, decode_text, encode_text, is_compressed
+
+_LONG = "Refrain qui revient encore et encore\n" * 40
+_LRC = "".join(f"[00:{i:02d}.00] ligne synchronisée {i}\n" for i in range(60))
+
+
+class TestCodec:
+    def test_aller_retour_zlib(self):
+        blob = encode_text(_LONG, "zlib")
+        assert is_compressed(blob) and blob[len(MAGIC) : len(MAGIC) + 1] == b"z"
+        assert len(blob) < len(_LONG.encode("utf-8")) / 3
+        assert decode_text(blob) == _LONG
+
+    @pytest.mark.parametrize("value", [None, "", "   \n" * 300, "court", 42])
+    def test_valeurs_laissees_telles_quelles(self, value):
+        assert encode_text(value, "zlib") is value
+
+    def test_codec_none(self):
+        assert encode_text(_LONG, "none") is _LONG
+
+    def test_desactivee_par_defaut(self, monkeypatch):
+        monkeypatch.setattr(text_codec, "DB_TEXT_COMPRESSION", "none")
+        assert encode_text(_LONG) is _LONG
+
+    def test_legacy_texte_lu_tel_quel(self):
+        assert decode_text(_LRC) == _LRC
+        assert decode_text(_LRC.encode("utf-8")) == _LRC  # BLOB non marqué
+
+    def test_charge_corrompue(self):
+        assert decode_text(MAGIC + b"z" + b"pas du zlib") is None
+
+    def test_zstd_absent_repli_zlib(self, monkeypatch):
+        monkeypatch.setattr(text_codec, "zstandard", None)
+        assert text_codec.resolve_codec("auto") == "zlib"
+        assert text_codec.resolve_codec("zstd") == "zlib"
+
+
+def _artiste(dm, name="Artiste Test"):
+    a = Artist(name=name)
+    a.id = dm.save_artist(a)
+    return a
+
+
+@pytest.fixture
+def stocke(data_manager, monkeypatch):
+    monkeypatch.setattr(text_codec, "DB_TEXT_COMPRESSION", "zlib")
+    artist = _artiste(data_manager)
+    track = Track(title="Long", artist=artist, duration=200)
+    track.lyrics.text = _LONG
+    track.lyrics.synced = _LRC
+    track.observations = [Observation("lyrics_synced", _LRC, "lrclib")]
+    data_manager.save_track(track)
+    return artist, track.id
+
+
+def test_stockage_compresse(data_manager, stocke):
+    _artist, tid = stocke
+    with sqlite3.connect(data_manager.db_path) as conn:
+        row = conn.execute(
+            "SELECT typeof(lyrics), typeof(lyrics_synced) FROM tracks WHERE id = ?", (tid,)
+        ).fetchone()
+        obs = conn.execute(
+            "SELECT typeof(value) FROM observations WHERE track_id = ?", (tid,)
+        ).fetchone()
+    assert row == ("blob", "blob")
+    assert obs == ("blob",)
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_relecture_en_clair(data_manager, stocke, lazy):
+    artist, tid = stocke
+    (track,) = data_manager.get_artist_tracks(artist.id, lazy=lazy)
+
+    assert track.lyrics.has_text
+    assert track.lyrics.text == _LONG
+    assert track.lyrics.synced == _LRC
+    assert data_manager.get_observations(tid)[0].value == _LRC
+
+
+def test_ligne_legacy_en_clair_lisible(data_manager, stocke):
+    artist, tid = stocke
+    with sqlite3.connect(data_manager.db_path) as conn:
+        conn.execute("UPDATE tracks SET lyrics = ? WHERE id = ?", (_LONG, tid))
+
+    (track,) = data_manager.get_artist_tracks(artist.id)
+
+    assert track.lyrics.text == _LONG